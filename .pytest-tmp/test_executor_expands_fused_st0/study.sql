@@ -0,0 +1,2 @@
+WITH slice AS MATERIALIZED (SELECT 1)
+SELECT 1;
@@ -0,0 +1,96 @@
+-- =============================================================================
+-- Study: LID-v1.0 Distributional Analysis (Run-Scoped, psql form)
+-- Run ID: p1_test_001 | Symbol: GBPUSD | Dates: 2024-02-01 to 2024-02-05
+-- Time predicate (UTC day bounds): bar_close_ms >= 1706745600000 AND bar_close_ms < 1707177600000
+-- =============================================================================
+
+-- FROZEN SCORE VERSION: LID-v1.0
+-- SOURCE VIEW: derived.v_path1_evidence_lid_v1_0
+--
+-- Reproduces outputs/study_*.txt with `psql -q -f`: same slice and studies as
+-- the fused statement, one SELECT per study.
+
+CREATE TEMP TABLE slice AS
+SELECT
+    lid_v1_0_raw AS score,
+    outcome_category,
+    outcome_ret
+FROM derived.v_path1_evidence_lid_v1_0
+WHERE lid_v1_0_raw IS NOT NULL
+  AND sym = 'GBPUSD'
+  AND bar_close_ms >= 1706745600000 AND bar_close_ms < 1707177600000;
+
+-- -----------------------------------------------------------------------------
+-- Study 1: Overall LID-v1.0 Score Distribution
+-- -----------------------------------------------------------------------------
+SELECT
+    'LID-v1.0' AS score_version,
+        'p1_test_001' AS run_id,
+        COUNT(*) AS n_observations,
+        AVG(score) AS mean_score,
+        STDDEV(score) AS stddev_score,
+        MIN(score) AS min_score,
+        PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY score) AS p25_score,
+        PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY score) AS p50_score,
+        PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY score) AS p75_score,
+        MAX(score) AS max_score
+FROM slice;
+
+-- -----------------------------------------------------------------------------
+-- Study 2: LID-v1.0 Score Distribution Conditioned on Outcome Category
+-- -----------------------------------------------------------------------------
+SELECT
+    outcome_category,
+        COUNT(*) AS n_observations,
+        AVG(score) AS mean_score,
+        STDDEV(score) AS stddev_score,
+        MIN(score) AS min_score,
+        PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY score) AS p25_score,
+        PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY score) AS p50_score,
+        PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY score) AS p75_score,
+        MAX(score) AS max_score
+FROM slice
+WHERE outcome_category IS NOT NULL
+GROUP BY outcome_category
+ORDER BY outcome_category;
+
+-- -----------------------------------------------------------------------------
+-- Study 3: Outcome Frequency Conditioned on LID-v1.0 Score Quantiles
+-- -----------------------------------------------------------------------------
+WITH score_quantiles AS (
+    SELECT
+        score,
+        outcome_category,
+        NTILE(4) OVER (ORDER BY score) AS score_quartile
+    FROM slice
+    WHERE outcome_category IS NOT NULL
+)
+SELECT
+    score_quartile,
+        outcome_category,
+        COUNT(*) AS n_observations,
+        ROUND(100.0 * COUNT(*) / SUM(COUNT(*)) OVER (PARTITION BY score_quartile), 2) AS pct_within_quartile
+FROM score_quantiles
+GROUP BY score_quartile, outcome_category
+ORDER BY score_quartile, outcome_category;
+
+-- -----------------------------------------------------------------------------
+-- Study 4: Outcome Value Statistics by LID-v1.0 Score Quantile
+-- -----------------------------------------------------------------------------
+WITH score_quantiles AS (
+    SELECT
+        score,
+        outcome_ret,
+        NTILE(4) OVER (ORDER BY score) AS score_quartile
+    FROM slice
+    WHERE outcome_ret IS NOT NULL
+)
+SELECT
+    score_quartile,
+        COUNT(*) AS n_observations,
+        AVG(outcome_ret) AS mean_outcome_ret,
+        STDDEV(outcome_ret) AS stddev_outcome_ret,
+        PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY outcome_ret) AS median_outcome_ret
+FROM score_quantiles
+GROUP BY score_quartile
+ORDER BY score_quartile;
@@ -0,0 +1,147 @@
+-- =============================================================================
+-- Study: LID-v1.0 Distributional Analysis (Run-Scoped)
+-- Run ID: p1_test_002 | Symbol: GBPUSD | Dates: 2024-03-01 to 2024-03-05
+-- Time predicate (UTC day bounds): bar_close_ms >= 1709251200000 AND bar_close_ms < 1709683200000
+-- =============================================================================
+
+-- FROZEN SCORE VERSION: LID-v1.0
+-- SOURCE VIEW: derived.v_path1_evidence_lid_v1_0
+--
+-- Fused single-scan form: the filtered slice is materialized once and all four
+-- studies are computed from it. Columns are grouped per study (s<k>__*) and
+-- tagged by study_id; the runner splits them back into four result sets.
+
+WITH slice AS MATERIALIZED (
+    SELECT
+        lid_v1_0_raw AS score,
+        outcome_category,
+        outcome_ret
+    FROM derived.v_path1_evidence_lid_v1_0
+    WHERE lid_v1_0_raw IS NOT NULL
+      AND sym = 'GBPUSD'
+      AND bar_close_ms >= 1709251200000 AND bar_close_ms < 1709683200000
+),
+-- -----------------------------------------------------------------------------
+-- Study 1: Overall LID-v1.0 Score Distribution
+-- -----------------------------------------------------------------------------
+study1 AS (
+    SELECT
+        1 AS study_id,
+        'LID-v1.0' AS score_version,
+        'p1_test_002' AS run_id,
+        COUNT(*) AS n_observations,
+        AVG(score) AS mean_score,
+        STDDEV(score) AS stddev_score,
+        MIN(score) AS min_score,
+        PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY score) AS p25_score,
+        PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY score) AS p50_score,
+        PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY score) AS p75_score,
+        MAX(score) AS max_score
+    FROM slice
+),
+-- -----------------------------------------------------------------------------
+-- Study 2: LID-v1.0 Score Distribution Conditioned on Outcome Category
+-- -----------------------------------------------------------------------------
+study2 AS (
+    SELECT
+        2 AS study_id,
+        outcome_category,
+        COUNT(*) AS n_observations,
+        AVG(score) AS mean_score,
+        STDDEV(score) AS stddev_score,
+        MIN(score) AS min_score,
+        PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY score) AS p25_score,
+        PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY score) AS p50_score,
+        PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY score) AS p75_score,
+        MAX(score) AS max_score
+    FROM slice
+    WHERE outcome_category IS NOT NULL
+    GROUP BY outcome_category
+),
+-- -----------------------------------------------------------------------------
+-- Study 3: Outcome Frequency Conditioned on LID-v1.0 Score Quantiles
+-- -----------------------------------------------------------------------------
+score_quantiles_3 AS (
+    SELECT
+        score,
+        outcome_category,
+        NTILE(4) OVER (ORDER BY score) AS score_quartile
+    FROM slice
+    WHERE outcome_category IS NOT NULL
+),
+study3 AS (
+    SELECT
+        3 AS study_id,
+        score_quartile,
+        outcome_category,
+        COUNT(*) AS n_observations,
+        ROUND(100.0 * COUNT(*) / SUM(COUNT(*)) OVER (PARTITION BY score_quartile), 2) AS pct_within_quartile
+    FROM score_quantiles_3
+    GROUP BY score_quartile, outcome_category
+),
+-- -----------------------------------------------------------------------------
+-- Study 4: Outcome Value Statistics by LID-v1.0 Score Quantile
+-- -----------------------------------------------------------------------------
+score_quantiles_4 AS (
+    SELECT
+        score,
+        outcome_ret,
+        NTILE(4) OVER (ORDER BY score) AS score_quartile
+    FROM slice
+    WHERE outcome_ret IS NOT NULL
+),
+study4 AS (
+    SELECT
+        4 AS study_id,
+        score_quartile,
+        COUNT(*) AS n_observations,
+        AVG(outcome_ret) AS mean_outcome_ret,
+        STDDEV(outcome_ret) AS stddev_outcome_ret,
+        PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY outcome_ret) AS median_outcome_ret
+    FROM score_quantiles_4
+    GROUP BY score_quartile
+)
+-- -----------------------------------------------------------------------------
+-- Stack the studies: study_ids never match, so every output row carries exactly
+-- one study's columns (FULL JOIN keeps each study's own column types).
+-- -----------------------------------------------------------------------------
+SELECT
+    COALESCE(s1.study_id, s2.study_id, s3.study_id, s4.study_id) AS study_id,
+    s1.score_version AS s1__score_version,
+    s1.run_id AS s1__run_id,
+    s1.n_observations AS s1__n_observations,
+    s1.mean_score AS s1__mean_score,
+    s1.stddev_score AS s1__stddev_score,
+    s1.min_score AS s1__min_score,
+    s1.p25_score AS s1__p25_score,
+    s1.p50_score AS s1__p50_score,
+    s1.p75_score AS s1__p75_score,
+    s1.max_score AS s1__max_score,
+    s2.outcome_category AS s2__outcome_category,
+    s2.n_observations AS s2__n_observations,
+    s2.mean_score AS s2__mean_score,
+    s2.stddev_score AS s2__stddev_score,
+    s2.min_score AS s2__min_score,
+    s2.p25_score AS s2__p25_score,
+    s2.p50_score AS s2__p50_score,
+    s2.p75_score AS s2__p75_score,
+    s2.max_score AS s2__max_score,
+    s3.score_quartile AS s3__score_quartile,
+    s3.outcome_category AS s3__outcome_category,
+    s3.n_observations AS s3__n_observations,
+    s3.pct_within_quartile AS s3__pct_within_quartile,
+    s4.score_quartile AS s4__score_quartile,
+    s4.n_observations AS s4__n_observations,
+    s4.mean_outcome_ret AS s4__mean_outcome_ret,
+    s4.stddev_outcome_ret AS s4__stddev_outcome_ret,
+    s4.median_outcome_ret AS s4__median_outcome_ret
+FROM study1 s1
+FULL JOIN study2 s2 ON s2.study_id = s1.study_id
+FULL JOIN study3 s3 ON s3.study_id = COALESCE(s1.study_id, s2.study_id)
+FULL JOIN study4 s4 ON s4.study_id = COALESCE(s1.study_id, s2.study_id, s3.study_id)
+ORDER BY
+    study_id,
+    s2__outcome_category,
+    s3__score_quartile,
+    s3__outcome_category,
+    s4__score_quartile;
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the v0.3 overlay primitives on year-long synthetic M15 series.
+
+Times detect_displacement_candles() (v0.3-B) against the previous
+per-candle statistics.median() implementation, detect_mitigation_events()
+against the previous full-scan search, and the per-block modules (v0.3-A,
+v0.3-C) serially against the process-pool runner, checking that each pair
+returns identical results. Synthetic data only; no database access.
+
+Usage:
+    python scripts/path1/bench_overlays_v0_3.py [--days 365] [--seed 7] [--repeat 3] [--workers 4]
+"""
+
+import argparse
+import copy
+import random
+import sys
+import time
+from pathlib import Path
+from statistics import median
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import overlays_v0_3 as overlays  # noqa: E402
+
+M15_STEP_MS = 15 * 60 * 1000
+BARS_PER_DAY = 96
+BARS_PER_BLOCK = 8
+
+
+def synthetic_m15(days: int, seed: int) -> List[Dict]:
+    """Random-walk M15 candles with occasional wide-range bars."""
+    rnd = random.Random(seed)
+    start_ms = 1672610400000  # 2023-01-01T22:00:00Z
+    px = 1.25
+    candles = []
+    for i in range(days * BARS_PER_DAY):
+        o = px
+        c = o + rnd.gauss(0, 4e-4) * (4 if rnd.random() < 0.02 else 1)
+        h = max(o, c) + abs(rnd.gauss(0, 2e-4))
+        l = min(o, c) - abs(rnd.gauss(0, 2e-4))
+        px = c
+        bar_start_ms = start_ms + i * M15_STEP_MS
+        candles.append(
+            {
+                "bar_start_ms": bar_start_ms,
+                "bar_close_ms": bar_start_ms + M15_STEP_MS,
+                "o": round(o, 5),
+                "h": round(h, 5),
+                "l": round(l, 5),
+                "c": round(c, 5),
+                "volume": rnd.randint(1, 999),
+            }
+        )
+    return candles
+
+
+def displacement_reference(
+    candles: List[Dict],
+    window: int = overlays.DISPLACEMENT_WINDOW,
+    threshold: float = overlays.DISPLACEMENT_THRESHOLD_MULTIPLIER,
+) -> List[Dict]:
+    """The pre-rolling-median implementation (statistics.median per candle)."""
+    if len(candles) < window:
+        return []
+    displacements = []
+    for i in range(window, len(candles)):
+        ranges = [overlays.safe_float(c["h"]) - overlays.safe_float(c["l"]) for c in candles[i - window:i]]
+        rolling_median = median(ranges)
+        current = candles[i]
+        current_range = overlays.safe_float(current["h"]) - overlays.safe_float(current["l"])
+        if rolling_median > 0 and current_range > threshold * rolling_median:
+            displacements.append({
+                "bar_start_ms": int(current["bar_start_ms"]),
+                "bar_close_ms": int(current["bar_close_ms"]),
+                "range": overlays.quantize(current_range),
+                "rolling_median": overlays.quantize(rolling_median),
+                "ratio": overlays.quantize(current_range / rolling_median, precision=2),
+                "bullish": overlays.safe_float(current["c"]) > overlays.safe_float(current["o"]),
+            })
+    return displacements
+
+
+def synthetic_blocks(candles: List[Dict]) -> tuple:
+    """Consecutive 2H blocks of BARS_PER_BLOCK candles: (blocks, m15_by_block)."""
+    blocks = []
+    m15_by_block = {}
+    for i in range(0, len(candles) - BARS_PER_BLOCK + 1, BARS_PER_BLOCK):
+        span = candles[i:i + BARS_PER_BLOCK]
+        block_id = f"B{i // BARS_PER_BLOCK:06d}-SYN"
+        blocks.append({"block_id": block_id, "bar_open_ms": span[0]["bar_start_ms"], "bar_close_ms": span[-1]["bar_close_ms"]})
+        m15_by_block[block_id] = span
+    return blocks, m15_by_block
+
+
+def mitigation_reference(fvgs: List[Dict], candles: List[Dict]) -> List[Dict]:
+    """The pre-index implementation (scan all candles for every FVG)."""
+    for fvg in fvgs:
+        for candle in candles:
+            bar_ms = int(candle["bar_start_ms"])
+            if bar_ms <= fvg["end_bar_ms"]:
+                continue
+            if overlays.safe_float(candle["l"]) <= fvg["gap_high"] and overlays.safe_float(candle["h"]) >= fvg["gap_low"]:
+                fvg["mitigated"] = True
+                fvg["mitigation_bar_ms"] = bar_ms
+                break
+    return fvgs
+
+
+def best_of(repeat: int, fn: Callable, *args) -> tuple:
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark v0.3 overlay primitives")
+    parser.add_argument("--days", type=int, default=365, help="Days of synthetic M15 candles (default: 365)")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed (default: 7)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed repetitions; best is reported (default: 3)")
+    parser.add_argument("--workers", type=int, default=4, help="Process-pool size for per-block modules (default: 4)")
+    args = parser.parse_args()
+
+    candles = synthetic_m15(args.days, args.seed)
+    print(f"M15 candles: {len(candles)} ({args.days} days)")
+
+    ref_s, reference = best_of(args.repeat, displacement_reference, candles)
+    new_s, events = best_of(args.repeat, overlays.detect_displacement_candles, candles)
+    identical = events == reference
+    print(f"detect_displacement_candles: reference {ref_s:.3f}s, rolling median {new_s:.3f}s "
+          f"({ref_s / new_s:.1f}x), {len(events)} events, identical={identical}")
+
+    fvgs = overlays.detect_fair_value_gaps(candles)
+    ref_s, reference = best_of(args.repeat, lambda: mitigation_reference(copy.deepcopy(fvgs), candles))
+    new_s, mitigated = best_of(args.repeat, lambda: overlays.detect_mitigation_events(copy.deepcopy(fvgs), candles))
+    mitigation_identical = mitigated == reference
+    open_count = sum(1 for fvg in mitigated if not fvg["mitigated"])
+    print(f"detect_mitigation_events: reference {ref_s:.3f}s, sparse-table index {new_s:.3f}s "
+          f"({ref_s / new_s:.1f}x), {len(fvgs)} FVGs ({open_count} unmitigated), identical={mitigation_identical}")
+
+    blocks, m15_by_block = synthetic_blocks(candles)
+    ref_s, serial = best_of(args.repeat, overlays.compute_per_block_overlays, blocks, m15_by_block)
+    timing = {}
+    new_s, pooled = best_of(args.repeat, overlays.compute_per_block_overlays, blocks, m15_by_block, args.workers, timing)
+    per_block_identical = pooled == serial
+    print(f"compute_per_block_overlays: serial {ref_s:.3f}s, {timing['workers']} workers {new_s:.3f}s "
+          f"({ref_s / new_s:.1f}x), {len(blocks)} blocks, identical={per_block_identical}")
+    return 0 if identical and mitigation_identical and per_block_identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark for trajectory family DTW on synthetic fingerprint feature vectors.
+
+Times pairwise_dtw() (vectorized anti-diagonal DP) at several N against the
+previous pure-Python double loop. The reference is timed on a random sample of
+pairs and extrapolated to N(N-1)/2; the sampled pairs must match the vectorized
+matrix exactly. Optionally also times a Sakoe-Chiba band and an LB_Keogh
+cutoff. Synthetic data only.
+
+Usage:
+    python scripts/path1/bench_trajectory_dtw.py [--sizes 250 1000 5000] [--features 26] [--window 3] [--cutoff-quantile 0.1]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from trajectory_families.distance import pairwise_dtw  # noqa: E402
+
+
+def synthetic_features(n: int, features: int, seed: int) -> np.ndarray:
+    """Z-scored random feature rows (same normalization as the cluster command)."""
+    rng = np.random.default_rng(seed)
+    X = rng.standard_normal((n, features)) * rng.uniform(0.2, 5.0, size=features)
+    mean = X.mean(axis=0)
+    std = X.std(axis=0)
+    std[std == 0] = 1.0
+    return (X - mean) / std
+
+
+def dtw_reference(x: np.ndarray, y: np.ndarray) -> float:
+    """Previous dtw_distance(): pure-Python double loop."""
+    n, m = len(x), len(y)
+    dtw = np.full((n + 1, m + 1), np.inf)
+    dtw[0, 0] = 0.0
+    for i in range(1, n + 1):
+        for j in range(1, m + 1):
+            cost = abs(x[i - 1] - y[j - 1])
+            dtw[i, j] = cost + min(dtw[i - 1, j], dtw[i, j - 1], dtw[i - 1, j - 1])
+    return float(dtw[n, m])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark trajectory family DTW")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[250, 1000, 5000], help="Sample counts N (default: 250 1000 5000)")
+    parser.add_argument("--features", type=int, default=26, help="Feature vector length (default: 26)")
+    parser.add_argument("--sample-pairs", type=int, default=2000, help="Pairs timed with the reference loop (default: 2000)")
+    parser.add_argument("--window", type=int, default=None, help="Also time a Sakoe-Chiba band of this radius")
+    parser.add_argument("--cutoff-quantile", type=float, default=None,
+                        help="Also time an LB_Keogh/early-abandon cutoff at this quantile of D")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed (default: 7)")
+    args = parser.parse_args()
+
+    all_identical = True
+    for n in args.sizes:
+        X = synthetic_features(n, args.features, args.seed)
+        pairs = n * (n - 1) // 2
+
+        started = time.perf_counter()
+        D = pairwise_dtw(X)
+        new_s = time.perf_counter() - started
+
+        rng = np.random.default_rng(args.seed)
+        sample = min(args.sample_pairs, pairs)
+        i = rng.integers(0, n, size=sample * 2)
+        j = rng.integers(0, n, size=sample * 2)
+        keep = i != j
+        i, j = i[keep][:sample], j[keep][:sample]
+        started = time.perf_counter()
+        reference = [dtw_reference(X[a], X[b]) for a, b in zip(i, j)]
+        ref_s = (time.perf_counter() - started) / len(reference) * pairs
+        identical = bool(np.array_equal(D[i, j], np.array(reference)))
+        all_identical &= identical
+        print(f"N={n}: reference ~{ref_s:.1f}s (extrapolated from {len(reference)} pairs), "
+              f"vectorized {new_s:.2f}s ({ref_s / new_s:.0f}x), identical={identical}")
+
+        if args.window is not None:
+            started = time.perf_counter()
+            pairwise_dtw(X, window=args.window)
+            print(f"  window={args.window}: {time.perf_counter() - started:.2f}s")
+        if args.cutoff_quantile is not None:
+            upper = D[np.triu_indices(n, 1)]
+            cutoff = float(np.quantile(upper, args.cutoff_quantile))
+            started = time.perf_counter()
+            Dc = pairwise_dtw(X, window=args.window, cutoff=cutoff)
+            kept = int(np.isfinite(Dc[np.triu_indices(n, 1)]).sum())
+            print(f"  cutoff={cutoff:.3f} (q={args.cutoff_quantile}): {time.perf_counter() - started:.2f}s, "
+                  f"{kept}/{pairs} pairs within cutoff")
+    return 0 if all_identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
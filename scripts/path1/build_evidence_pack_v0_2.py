@@ -9,20 +9,25 @@ Daylight Saving Time transitions at the NY session boundary (17:00 America/New_Y
 import argparse
 import csv
 import hashlib
+import io
 import json
 import os
 import subprocess
+import threading
 import traceback
 from collections import defaultdict
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-
-import bisect
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
 
+import numpy as np
 import psycopg2
 from psycopg2.extras import RealDictCursor
 
+from study_executor import utc_date_bounds_ms
+
 try:
     from zoneinfo import ZoneInfo
 except ImportError:
@@ -38,12 +43,31 @@ FOUR_H_MS = 4 * 60 * 60 * 1000
 
 DEFAULT_TOLERANCE = float(os.environ.get("EVIDENCE_PACK_OHLC_TOL", "1e-6"))
 
-# DST stress test date ranges (NY dates)
+# Upper bound for the strip/context writer thread pool (--workers default)
+DEFAULT_MAX_WORKERS = 8
+
+# Part of every strip cache key; bump when strip CSV rendering or strip QC changes
+STRIP_CACHE_VERSION = "evidence_pack_v0_2/strip_cache_v1"
+
+# Default strip cache location, relative to --repo-root
+DEFAULT_STRIP_CACHE_DIR = Path(".cache") / "path1" / "evidence_pack_v0_2" / "strips"
+
+# M15 fields a strip is rendered and QC'd from (the strip's content hash input)
+M15_CONTENT_KEYS = ("bar_start_ms", "bar_close_ms", "o", "h", "l", "c", "volume")
+
+# qc_report categories filled by the per-strip checks (cached with each strip)
+STRIP_QC_CATEGORIES = ("continuity", "ohlc_sanity", "aggregation_match")
+
+# DST stress test date ranges (NY dates); used when run_dst_audit() gets no
+# date range. With one, windows come from dst_transition_windows().
 DST_RANGES = {
     "spring": ["2023-03-10", "2023-03-11", "2023-03-12", "2023-03-13", "2023-03-14"],
     "fall": ["2023-11-03", "2023-11-04", "2023-11-05", "2023-11-06", "2023-11-07"],
 }
 
+# NY dates audited on each side of a DST transition date
+DST_WINDOW_PAD_DAYS = 2
+
 NY_TZ = ZoneInfo("America/New_York")
 UTC_TZ = timezone.utc
 
@@ -103,7 +127,57 @@ def is_data_file(rel_path: str) -> bool:
     return False
 
 
-def build_manifest(pack_root: Path, data_only: bool = False) -> dict:
+class PackWriter:
+    """
+    Writes evidence pack files and records each file's size and SHA-256 as it is written.
+
+    Manifests built with a writer take digests from this record instead of
+    reading the pack back; files not written through it (or changed since) are
+    still hashed from disk. Safe to share between writer threads.
+    """
+
+    def __init__(self, pack_root: Path):
+        self.pack_root = pack_root
+        self._records: Dict[str, Tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+
+    def write_bytes(self, rel_path: str, data: bytes, digest: Optional[str] = None) -> Path:
+        """Write data; digest, if given, is the caller's already-verified SHA-256 of data."""
+        path = self.pack_root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        if digest is None:
+            digest = hashlib.sha256(data).hexdigest()
+        mtime_ns = path.stat().st_mtime_ns
+        with self._lock:
+            self._records[Path(rel_path).as_posix()] = (len(data), mtime_ns, digest)
+        return path
+
+    def write_text(self, rel_path: str, text: str, newline: Optional[str] = None) -> Path:
+        """Write UTF-8 text with the same bytes as open(path, "w", newline=newline)."""
+        if newline is None:
+            text = text.replace("\n", os.linesep)
+        elif newline not in ("", "\n"):
+            text = text.replace("\n", newline)
+        return self.write_bytes(rel_path, text.encode("utf-8"))
+
+    def sha256(self, rel_path: str) -> str:
+        with self._lock:
+            return self._records[rel_path][2]
+
+    def recorded_entry(self, rel_path: str, stat_result: os.stat_result) -> Optional[dict]:
+        """Manifest entry from the write record, if the file is unchanged since it was written."""
+        with self._lock:
+            record = self._records.get(rel_path)
+        if record is None:
+            return None
+        size, mtime_ns, digest = record
+        if stat_result.st_size != size or stat_result.st_mtime_ns != mtime_ns:
+            return None
+        return {"bytes": size, "relative_path": rel_path, "sha256": digest}
+
+
+def build_manifest(pack_root: Path, data_only: bool = False, writer: Optional[PackWriter] = None) -> dict:
     """
     Build manifest of files in pack_root.
 
@@ -111,6 +185,7 @@ def build_manifest(pack_root: Path, data_only: bool = False) -> dict:
         pack_root: Root directory of the evidence pack
         data_only: If True, only include deterministic data files (backbone, strips, context)
                    If False, include all files (for build manifest)
+        writer: Optional PackWriter whose recorded digests are used instead of re-reading
     """
     entries = []
     for path in pack_root.rglob("*"):
@@ -121,13 +196,15 @@ def build_manifest(pack_root: Path, data_only: bool = False) -> dict:
             continue
         if data_only and not is_data_file(rel_path):
             continue
-        entries.append(
-            {
-                "bytes": path.stat().st_size,
+        stat_result = path.stat()
+        entry = writer.recorded_entry(rel_path, stat_result) if writer is not None else None
+        if entry is None:
+            entry = {
+                "bytes": stat_result.st_size,
                 "relative_path": rel_path,
                 "sha256": compute_file_sha256(path),
             }
-        )
+        entries.append(entry)
     entries.sort(key=lambda item: item["relative_path"])
     return {"files": entries}
 
@@ -140,50 +217,60 @@ def compute_pack_sha256(manifest: dict) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
-def write_manifest_files(pack_root: Path) -> dict:
+def write_manifest_files(pack_root: Path, writer: Optional[PackWriter] = None, verify: bool = False) -> dict:
     """
     Write both data manifest (stable) and build manifest (includes timestamps).
 
+    Digests come from `writer` for files it wrote; the pack is listed once and
+    the data manifest is the data-file subset of the build manifest. With
+    verify=True every file is re-read afterwards and checked against the
+    manifests (see verify_manifest_files).
+
     Returns dict with all hash values for ledger recording.
     """
-    # Build data manifest (deterministic candle data only)
-    data_manifest = build_manifest(pack_root, data_only=True)
-    data_manifest_path = pack_root / "data_manifest.json"
+    if writer is None:
+        writer = PackWriter(pack_root)
+
+    # Build full manifest once (all files including meta.json, qc_report.json);
+    # the manifest/hash outputs below are excluded, so writing them does not change it
+    build_manifest_dict = build_manifest(pack_root, data_only=False, writer=writer)
+    data_manifest = {
+        "files": [entry for entry in build_manifest_dict["files"] if is_data_file(entry["relative_path"])]
+    }
+
+    # Data manifest (deterministic candle data only)
     data_manifest_text = json.dumps(data_manifest, sort_keys=True, separators=(",", ":")) + "\n"
-    data_manifest_path.write_text(data_manifest_text, encoding="utf-8")
+    writer.write_text("data_manifest.json", data_manifest_text)
 
     data_sha256 = compute_pack_sha256(data_manifest)
-    (pack_root / "data_sha256.txt").write_text(data_sha256 + "\n", encoding="utf-8")
+    writer.write_text("data_sha256.txt", data_sha256 + "\n")
 
-    data_manifest_sha256 = compute_file_sha256(data_manifest_path)
-    (pack_root / "data_manifest_sha256.txt").write_text(data_manifest_sha256 + "\n", encoding="utf-8")
+    data_manifest_sha256 = writer.sha256("data_manifest.json")
+    writer.write_text("data_manifest_sha256.txt", data_manifest_sha256 + "\n")
 
-    # Build full manifest (all files including meta.json, qc_report.json)
-    build_manifest_dict = build_manifest(pack_root, data_only=False)
-    build_manifest_path = pack_root / "build_manifest.json"
+    # Build manifest
     build_manifest_text = json.dumps(build_manifest_dict, sort_keys=True, separators=(",", ":")) + "\n"
-    build_manifest_path.write_text(build_manifest_text, encoding="utf-8")
+    writer.write_text("build_manifest.json", build_manifest_text)
 
     build_sha256 = compute_pack_sha256(build_manifest_dict)
-    (pack_root / "build_sha256.txt").write_text(build_sha256 + "\n", encoding="utf-8")
+    writer.write_text("build_sha256.txt", build_sha256 + "\n")
 
-    build_manifest_sha256 = compute_file_sha256(build_manifest_path)
-    (pack_root / "build_manifest_sha256.txt").write_text(build_manifest_sha256 + "\n", encoding="utf-8")
+    build_manifest_sha256 = writer.sha256("build_manifest.json")
+    writer.write_text("build_manifest_sha256.txt", build_manifest_sha256 + "\n")
 
     # Legacy compatibility: also write old manifest files
     # (manifest.json = build_manifest, pack_sha256 = build_sha256)
     manifest = build_manifest_dict
-    manifest_path = pack_root / "manifest.json"
     manifest_text = json.dumps(manifest, sort_keys=True, separators=(",", ":")) + "\n"
-    manifest_path.write_text(manifest_text, encoding="utf-8")
+    writer.write_text("manifest.json", manifest_text)
 
     pack_sha256 = build_sha256
-    (pack_root / "pack_sha256.txt").write_text(pack_sha256 + "\n", encoding="utf-8")
+    writer.write_text("pack_sha256.txt", pack_sha256 + "\n")
 
-    manifest_sha256 = compute_file_sha256(manifest_path)
-    (pack_root / "manifest_sha256.txt").write_text(manifest_sha256 + "\n", encoding="utf-8")
+    manifest_sha256 = writer.sha256("manifest.json")
+    writer.write_text("manifest_sha256.txt", manifest_sha256 + "\n")
 
-    return {
+    hashes = {
         # New data/build separation
         "data_manifest_sha256": data_manifest_sha256,
         "data_sha256": data_sha256,
@@ -194,6 +281,54 @@ def write_manifest_files(pack_root: Path) -> dict:
         "manifest_sha256": manifest_sha256,
         "pack_sha256": pack_sha256,
     }
+    if verify:
+        verify_manifest_files(pack_root, hashes)
+    return hashes
+
+
+def verify_manifest_files(pack_root: Path, hashes: dict) -> None:
+    """
+    Re-read the pack from disk and check it against the written manifests.
+
+    Raises RuntimeError listing every mismatch (file content, manifest file or
+    recorded hash).
+    """
+    problems = []
+    on_disk = build_manifest(pack_root, data_only=False)
+    expected = {entry["relative_path"]: entry for entry in hashes["manifest"]["files"]}
+    actual = {entry["relative_path"]: entry for entry in on_disk["files"]}
+    for rel_path in sorted(set(expected) | set(actual)):
+        if expected.get(rel_path) != actual.get(rel_path):
+            problems.append(f"file {rel_path}: manifest {expected.get(rel_path)} != disk {actual.get(rel_path)}")
+
+    checks = [
+        ("data_manifest.json", hashes["data_manifest_sha256"]),
+        ("build_manifest.json", hashes["build_manifest_sha256"]),
+        ("manifest.json", hashes["manifest_sha256"]),
+    ]
+    for rel_path, recorded in checks:
+        actual_sha = compute_file_sha256(pack_root / rel_path)
+        if actual_sha != recorded:
+            problems.append(f"{rel_path}: sha256 {actual_sha} != recorded {recorded}")
+
+    hash_files = [
+        ("data_sha256.txt", hashes["data_sha256"]),
+        ("data_manifest_sha256.txt", hashes["data_manifest_sha256"]),
+        ("build_sha256.txt", hashes["build_sha256"]),
+        ("build_manifest_sha256.txt", hashes["build_manifest_sha256"]),
+        ("pack_sha256.txt", hashes["pack_sha256"]),
+        ("manifest_sha256.txt", hashes["manifest_sha256"]),
+    ]
+    for rel_path, recorded in hash_files:
+        text = (pack_root / rel_path).read_text(encoding="utf-8").strip()
+        if text != recorded:
+            problems.append(f"{rel_path}: contains {text} != recorded {recorded}")
+
+    if compute_pack_sha256(on_disk) != hashes["build_sha256"]:
+        problems.append("build_sha256 does not match manifest recomputed from disk")
+
+    if problems:
+        raise RuntimeError("Evidence pack verification failed:\n  " + "\n  ".join(problems))
 
 
 def append_jsonl(path: Path, obj: dict) -> None:
@@ -421,6 +556,150 @@ def check_continuity(
     return issues
 
 
+# =============================================================================
+# Columnar M15
+# =============================================================================
+
+
+class M15Frame:
+    """
+    M15 candles held as one NumPy array per column, in bar_start_ms order.
+
+    volume is BIGINT NULL in the source table: NULLs are stored as 0 with
+    volume_valid False. Rows are only materialized as dicts (Python int/float,
+    None volume, same values as the database rows) for the spans that need
+    them, through M15Span.
+    """
+
+    def __init__(
+        self,
+        bar_start_ms: np.ndarray,
+        bar_close_ms: np.ndarray,
+        o: np.ndarray,
+        h: np.ndarray,
+        l: np.ndarray,
+        c: np.ndarray,
+        volume: np.ndarray,
+        volume_valid: np.ndarray,
+    ):
+        self.bar_start_ms = bar_start_ms
+        self.bar_close_ms = bar_close_ms
+        self.o = o
+        self.h = h
+        self.l = l
+        self.c = c
+        self.volume = volume
+        self.volume_valid = volume_valid
+
+    @classmethod
+    def from_records(cls, records: Sequence[tuple]) -> "M15Frame":
+        """Build from (bar_start_ms, bar_close_ms, o, h, l, c, volume) tuples."""
+        n = len(records)
+        start, close, o, h, l, c, volume = (list(col) for col in zip(*records)) if n else ([],) * 7
+        valid = np.fromiter((v is not None for v in volume), dtype=bool, count=n)
+        return cls(
+            np.array(start, dtype=np.int64).reshape(n),
+            np.array(close, dtype=np.int64).reshape(n),
+            np.array(o, dtype=np.float64).reshape(n),
+            np.array(h, dtype=np.float64).reshape(n),
+            np.array(l, dtype=np.float64).reshape(n),
+            np.array(c, dtype=np.float64).reshape(n),
+            np.fromiter((0 if v is None else v for v in volume), dtype=np.int64, count=n),
+            valid,
+        )
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Dict]) -> "M15Frame":
+        return cls.from_records([tuple(row.get(key) for key in M15_CONTENT_KEYS) for row in rows])
+
+    def __len__(self) -> int:
+        return len(self.bar_start_ms)
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        return {
+            "bar_start_ms": self.bar_start_ms,
+            "bar_close_ms": self.bar_close_ms,
+            "o": self.o,
+            "h": self.h,
+            "l": self.l,
+            "c": self.c,
+        }
+
+    def span(self, start: int, end: int) -> "M15Span":
+        return M15Span(self, start, end)
+
+    def rows(self, start: int, end: int) -> List[Dict]:
+        """Materialize rows start..end-1 as dicts."""
+        values = [
+            col[start:end].tolist()
+            for col in (self.bar_start_ms, self.bar_close_ms, self.o, self.h, self.l, self.c)
+        ]
+        values.append(
+            [v if ok else None for v, ok in zip(self.volume[start:end].tolist(), self.volume_valid[start:end].tolist())]
+        )
+        return [dict(zip(M15_CONTENT_KEYS, row)) for row in zip(*values)]
+
+
+class M15Span(Sequence):
+    """
+    Read-only row sequence over frame[start:end].
+
+    Behaves like the list of row dicts it replaces; rows are materialized on
+    access and not retained.
+    """
+
+    __slots__ = ("frame", "start", "end")
+
+    def __init__(self, frame: M15Frame, start: int, end: int):
+        self.frame = frame
+        self.start = start
+        self.end = end
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.tolist()[index]
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("M15Span index out of range")
+        return self.frame.rows(self.start + index, self.start + index + 1)[0]
+
+    def __iter__(self) -> Iterator[Dict]:
+        return iter(self.tolist())
+
+    def tolist(self) -> List[Dict]:
+        return self.frame.rows(self.start, self.end)
+
+
+class M15BlockView(Mapping):
+    """block_id -> M15Span mapping over one frame (what m15_by_block dicts used to hold)."""
+
+    def __init__(self, frame: M15Frame):
+        self.frame = frame
+        self._spans: Dict[str, Tuple[int, int]] = {}
+
+    def add(self, block_id: str, start: int, end: int) -> None:
+        self._spans[block_id] = (start, end)
+
+    def __getitem__(self, block_id: str) -> M15Span:
+        start, end = self._spans[block_id]
+        return M15Span(self.frame, start, end)
+
+    def bounds(self, block_id: str) -> Tuple[int, int]:
+        """(start, end) frame rows of block_id's span; (0, 0) if the block has none."""
+        return self._spans.get(block_id, (0, 0))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._spans)
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+
 def fetch_blocks(conn, symbol: str, date_from: str, date_to: str) -> List[Dict]:
     sql = f"""
         SELECT
@@ -438,15 +717,18 @@ def fetch_blocks(conn, symbol: str, date_from: str, date_to: str) -> List[Dict]:
             ON e.block_id = m.block_id
            AND e.sym = m.sym
         WHERE e.sym = %s
-          AND to_timestamp(e.bar_close_ms / 1000)::date BETWEEN %s AND %s
+          AND e.bar_close_ms >= %s
+          AND e.bar_close_ms < %s
         ORDER BY e.bar_close_ms;
     """
+    # Sargable UTC day bounds (same rows as to_timestamp(bar_close_ms/1000)::date BETWEEN)
+    start_ms, end_ms = utc_date_bounds_ms(date_from, date_to)
     with conn.cursor(cursor_factory=RealDictCursor) as cur:
-        cur.execute(sql, (symbol, date_from, date_to))
+        cur.execute(sql, (symbol, start_ms, end_ms))
         return list(cur.fetchall())
 
 
-def fetch_m15_range(conn, symbol: str, min_needed_ms: int, max_needed_ms: int) -> List[Dict]:
+def fetch_m15_range(conn, symbol: str, min_needed_ms: int, max_needed_ms: int) -> M15Frame:
     sql = f"""
         SELECT
             bar_start_ms,
@@ -462,47 +744,536 @@ def fetch_m15_range(conn, symbol: str, min_needed_ms: int, max_needed_ms: int) -
           AND bar_start_ms < %s
         ORDER BY bar_start_ms;
     """
-    with conn.cursor(cursor_factory=RealDictCursor) as cur:
+    # Plain tuples, not RealDictCursor rows: the frame keeps columns only
+    with conn.cursor() as cur:
         cur.execute(sql, (symbol, min_needed_ms, max_needed_ms))
-        return list(cur.fetchall())
+        return M15Frame.from_records(cur.fetchall())
+
+
+CANDLE_COLUMNS = [
+    "idx",
+    "time_utc",
+    "bar_start_ms",
+    "bar_close_ms",
+    "o",
+    "h",
+    "l",
+    "c",
+    "volume",
+]
+
+
+def render_candles_csv(rows: List[Dict]) -> str:
+    """Render candle rows as strip/context CSV text (csv module dialect, CRLF rows)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CANDLE_COLUMNS)
+    for idx, row in enumerate(rows, start=1):
+        volume = row.get("volume")
+        writer.writerow(
+            [
+                idx,
+                format_time_utc(row["bar_start_ms"]),
+                row["bar_start_ms"],
+                row["bar_close_ms"],
+                row["o"],
+                row["h"],
+                row["l"],
+                row["c"],
+                "" if volume is None else volume,
+            ]
+        )
+    return buffer.getvalue()
 
 
 def write_candles_csv(rows: List[Dict], path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            "idx",
-            "time_utc",
-            "bar_start_ms",
-            "bar_close_ms",
-            "o",
-            "h",
-            "l",
-            "c",
-            "volume",
-        ])
-        for idx, row in enumerate(rows, start=1):
-            volume = row.get("volume")
-            writer.writerow(
-                [
-                    idx,
-                    format_time_utc(row["bar_start_ms"]),
-                    row["bar_start_ms"],
-                    row["bar_close_ms"],
-                    row["o"],
-                    row["h"],
-                    row["l"],
-                    row["c"],
-                    "" if volume is None else volume,
-                ]
-            )
+    path.write_bytes(render_candles_csv(rows).encode("utf-8"))
+
+
+@dataclass
+class CandleFileJob:
+    """
+    One strip or context CSV to emit: pack-relative path and its candle rows.
+
+    data/sha256 carry bytes reused from the strip cache; otherwise the rows are
+    rendered. cache_key/qc mark a rendered strip to store in the cache.
+    """
+
+    rel_path: str
+    rows: Sequence[Dict]
+    data: Optional[bytes] = None
+    sha256: Optional[str] = None
+    cache_key: Optional[str] = None
+    qc: Optional[Dict[str, List[Dict]]] = None
+
+
+# =============================================================================
+# Strip cache (content-addressed, shared across runs)
+# =============================================================================
+
+
+def m15_content_sha256(rows: Sequence[Dict]) -> str:
+    """SHA-256 over the exact M15 values (including their types) of a strip."""
+    values = [tuple(row.get(key) for key in M15_CONTENT_KEYS) for row in rows]
+    return hashlib.sha256(repr(values).encode("utf-8")).hexdigest()
+
+
+def strip_cache_key(block: Dict, m15_sha256: str, tolerance: float) -> str:
+    """
+    Cache key for one 2H strip.
+
+    Covers symbol, block_id, the M15 content hash and STRIP_CACHE_VERSION, plus
+    the spine OHLC and tolerance the aggregation check compares against, so a
+    cached QC result is only reused for identical inputs.
+    """
+    payload = (
+        STRIP_CACHE_VERSION,
+        block.get("sym"),
+        block["block_id"],
+        int(block["bar_close_ms"]),
+        m15_sha256,
+        tuple(block[key] for key in ("o", "h", "l", "c")),
+        tolerance,
+    )
+    return hashlib.sha256(repr(payload).encode("utf-8")).hexdigest()
+
+
+class StripCache:
+    """
+    Content-addressed store of rendered 2H strip CSVs and their QC entries.
+
+    Historical candles do not change, so packs for repeated or overlapping
+    ranges reuse entries; any change to a strip's inputs changes its key.
+    Entries are written atomically and checked against their SHA-256 on read;
+    unreadable or corrupt entries count as misses. Failing to store an entry
+    never fails the build.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.hits = 0
+        self.misses = 0
+        self.write_errors = 0
+        self._lock = threading.Lock()
+
+    def path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached {"data", "sha256", "qc"} for key, or None."""
+        try:
+            entry = json.loads(self.path(key).read_text(encoding="utf-8"))
+            data = entry["csv"].encode("utf-8")
+            if entry["key"] != key or hashlib.sha256(data).hexdigest() != entry["sha256"]:
+                raise ValueError("strip cache entry does not match its key or digest")
+            qc = {category: list(entry["qc"][category]) for category in STRIP_QC_CATEGORIES}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return {"data": data, "sha256": entry["sha256"], "qc": qc}
+
+    def put(self, key: str, data: bytes, digest: str, qc: Dict[str, List[Dict]]) -> None:
+        path = self.path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        entry = {"key": key, "sha256": digest, "csv": data.decode("utf-8"), "qc": qc}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(entry), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            with self._lock:
+                self.write_errors += 1
+            tmp_path.unlink(missing_ok=True)
+
+
+def default_workers() -> int:
+    return min(DEFAULT_MAX_WORKERS, os.cpu_count() or 1)
+
+
+def write_candle_files(
+    writer: PackWriter, jobs: List[CandleFileJob], workers: int = 1, cache: Optional[StripCache] = None
+) -> None:
+    """
+    Emit strip/context CSVs, rendering and writing each file in one buffered write.
+
+    File bytes depend only on each job's rows, so the result is identical for
+    any worker count or completion order. Jobs with cached bytes are written
+    as-is; rendered strips with a cache_key are stored in cache.
+    """
+    for parent in sorted({(writer.pack_root / job.rel_path).parent for job in jobs}):
+        parent.mkdir(parents=True, exist_ok=True)
+
+    def emit(job: CandleFileJob) -> None:
+        if job.data is not None:
+            writer.write_bytes(job.rel_path, job.data, digest=job.sha256)
+            return
+        data = render_candles_csv(job.rows).encode("utf-8")
+        writer.write_bytes(job.rel_path, data)
+        if cache is not None and job.cache_key is not None:
+            cache.put(job.cache_key, data, writer.sha256(job.rel_path), job.qc or {})
+
+    if workers <= 1 or len(jobs) <= 1:
+        for job in jobs:
+            emit(job)
+        return
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # list() surfaces the first write error, if any
+        list(pool.map(emit, jobs))
 
 
 def unique_values(items: List[Dict], key: str) -> int:
     return len({item.get(key) for item in items if item.get(key) is not None})
 
 
+# =============================================================================
+# Strip / Context QC (columnar pass, no file I/O)
+# =============================================================================
+
+
+@dataclass
+class StripPlan:
+    """Result of the 2H strip QC pass: backbone rows and strip files to emit."""
+
+    m15_by_block: M15BlockView
+    m15_by_block_all: M15BlockView
+    backbone_rows: List[Dict] = field(default_factory=list)
+    jobs: List[CandleFileJob] = field(default_factory=list)
+
+
+@dataclass
+class ContextPlan:
+    """Result of the 4H context QC pass: context files to emit and granularity counts."""
+
+    windows_total: int = 0
+    m30: int = 0
+    h1: int = 0
+    jobs: List[CandleFileJob] = field(default_factory=list)
+
+
+def _sane_mask(o: np.ndarray, h: np.ndarray, l: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """Vectorized ohlc_sane() for finite inputs (max/min(o, c) as Python picks them)."""
+    hi_oc = np.where(c > o, c, o)
+    lo_oc = np.where(c < o, c, o)
+    return (h >= l) & (h >= hi_oc) & (l <= lo_oc)
+
+
+def clean_strip_mask(
+    cols: Dict[str, np.ndarray],
+    start_idx: np.ndarray,
+    block_close_ms: np.ndarray,
+    spine: Dict[str, np.ndarray],
+    tolerance: float,
+) -> np.ndarray:
+    """
+    True for 8-candle strips that produce no QC entry at all.
+
+    Covers continuity, per-candle and aggregate OHLC sanity and the spine
+    aggregation match. Strips with non-finite values are never "clean", so they
+    take the scalar qc_strip_block() path and report exactly as before.
+    """
+    idx = start_idx[:, None] + np.arange(8)
+    start = cols["bar_start_ms"][idx]
+    close = cols["bar_close_ms"][idx]
+    o, h, l, c = (cols[key][idx] for key in ("o", "h", "l", "c"))
+
+    finite = (np.isfinite(o) & np.isfinite(h) & np.isfinite(l) & np.isfinite(c)).all(axis=1)
+    for key in ("o", "h", "l", "c"):
+        finite &= np.isfinite(spine[key])
+
+    continuous = (
+        (start[:, 0] == block_close_ms - TWO_H_MS)
+        & (np.diff(start, axis=1) == M15_STEP_MS).all(axis=1)
+        & ((close - start) == M15_STEP_MS).all(axis=1)
+        & (close[:, -1] == block_close_ms)
+    )
+
+    agg_o = o[:, 0]
+    agg_c = c[:, -1]
+    agg_h = h.max(axis=1)
+    agg_l = l.min(axis=1)
+    sane = _sane_mask(o, h, l, c).all(axis=1) & _sane_mask(agg_o, agg_h, agg_l, agg_c)
+
+    matched = (
+        (np.abs(agg_o - spine["o"]) <= tolerance)
+        & (np.abs(agg_h - spine["h"]) <= tolerance)
+        & (np.abs(agg_l - spine["l"]) <= tolerance)
+        & (np.abs(agg_c - spine["c"]) <= tolerance)
+    )
+    return finite & continuous & sane & matched
+
+
+def qc_strip_block(block: Dict, m15_rows: List[Dict], tolerance: float, qc_report: Dict) -> None:
+    """Scalar QC for one 8-candle strip; appends continuity/sanity/aggregation entries."""
+    block_id = block["block_id"]
+    bar_close_ms = int(block["bar_close_ms"])
+    start_ms = bar_close_ms - TWO_H_MS
+
+    continuity_issues = check_continuity(
+        m15_rows, M15_STEP_MS, expected_start_ms=start_ms, expected_end_ms=bar_close_ms
+    )
+    for issue in continuity_issues:
+        qc_report["continuity"].append(
+            {
+                "scope": "2h",
+                "block_id": block_id,
+                **issue,
+            }
+        )
+
+    for idx, row in enumerate(m15_rows):
+        if not ohlc_sane(row["o"], row["h"], row["l"], row["c"]):
+            qc_report["ohlc_sanity"].append(
+                {
+                    "scope": "2h",
+                    "block_id": block_id,
+                    "idx": idx + 1,
+                    "o": row["o"],
+                    "h": row["h"],
+                    "l": row["l"],
+                    "c": row["c"],
+                }
+            )
+
+    agg_o = m15_rows[0]["o"]
+    agg_c = m15_rows[-1]["c"]
+    agg_h = max(r["h"] for r in m15_rows)
+    agg_l = min(r["l"] for r in m15_rows)
+
+    spine_o = block["o"]
+    spine_h = block["h"]
+    spine_l = block["l"]
+    spine_c = block["c"]
+
+    if not ohlc_sane(agg_o, agg_h, agg_l, agg_c):
+        qc_report["ohlc_sanity"].append(
+            {
+                "scope": "2h_aggregate",
+                "block_id": block_id,
+                "o": agg_o,
+                "h": agg_h,
+                "l": agg_l,
+                "c": agg_c,
+            }
+        )
+
+    mismatch = []
+    if abs(agg_o - spine_o) > tolerance:
+        mismatch.append("o")
+    if abs(agg_h - spine_h) > tolerance:
+        mismatch.append("h")
+    if abs(agg_l - spine_l) > tolerance:
+        mismatch.append("l")
+    if abs(agg_c - spine_c) > tolerance:
+        mismatch.append("c")
+    if mismatch:
+        qc_report["aggregation_match"].append(
+            {
+                "block_id": block_id,
+                "mismatch": mismatch,
+                "tolerance": tolerance,
+                "agg": {"o": agg_o, "h": agg_h, "l": agg_l, "c": agg_c},
+                "spine": {"o": spine_o, "h": spine_h, "l": spine_l, "c": spine_c},
+            }
+        )
+
+
+def plan_strips(
+    blocks: List[Dict],
+    m15: M15Frame,
+    tolerance: float,
+    qc_report: Dict,
+    cache: Optional[StripCache] = None,
+) -> StripPlan:
+    """
+    QC every 2H block against its M15 strip and collect the strip files to write.
+
+    Strip boundaries are located for all blocks at once with searchsorted over
+    the M15 close column, and strips are kept as spans of the frame; clean strips are screened in one vectorized pass and
+    only strips that raise QC entries go through the scalar checks. QC entries
+    are appended in block order, as before.
+
+    With a cache, 8-candle strips found in it reuse their stored bytes and QC
+    entries and skip QC entirely; the rest are checked as above and marked to
+    be stored once rendered.
+    """
+    plan = StripPlan(m15_by_block=M15BlockView(m15), m15_by_block_all=M15BlockView(m15))
+    cols = m15.columns()
+    close_ms = np.fromiter((int(b["bar_close_ms"]) for b in blocks), dtype=np.int64, count=len(blocks))
+    start_idx = np.searchsorted(cols["bar_close_ms"], close_ms - TWO_H_MS, side="right")
+    end_idx = np.searchsorted(cols["bar_close_ms"], close_ms, side="right")
+
+    full = np.flatnonzero(end_idx - start_idx == 8)
+    cache_keys: Dict[int, str] = {}
+    cached: Dict[int, Dict[str, Any]] = {}
+    if cache is not None:
+        for i in full.tolist():
+            rows = m15.rows(int(start_idx[i]), int(end_idx[i]))
+            cache_keys[i] = strip_cache_key(blocks[i], m15_content_sha256(rows), tolerance)
+            entry = cache.get(cache_keys[i])
+            if entry is not None:
+                cached[i] = entry
+        if cached:
+            full = np.array([i for i in full.tolist() if i not in cached], dtype=np.int64)
+
+    clean = np.zeros(len(blocks), dtype=bool)
+    if full.size:
+        spine = {
+            key: np.fromiter((float(blocks[i][key]) for i in full), dtype=np.float64, count=full.size)
+            for key in ("o", "h", "l", "c")
+        }
+        clean[full] = clean_strip_mask(cols, start_idx[full], close_ms[full], spine, tolerance)
+
+    for i, block in enumerate(blocks):
+        block_id = block["block_id"]
+        start, end = int(start_idx[i]), int(end_idx[i])
+        m15_rows = m15.span(start, end)
+        m15_count = len(m15_rows)
+        plan.m15_by_block_all.add(block_id, start, end)
+
+        strip_rel = (Path("strips/2h") / f"{block_id}.csv").as_posix()
+        plan.backbone_rows.append(
+            {
+                "block_id": block_id,
+                "bar_close_ms": int(close_ms[i]),
+                "strip_path": strip_rel if m15_count == 8 else "",
+                "m15_count": m15_count,
+            }
+        )
+
+        if m15_count != 8:
+            qc_report["candle_count"].append(
+                {
+                    "scope": "2h",
+                    "block_id": block_id,
+                    "expected": 8,
+                    "actual": m15_count,
+                }
+            )
+            continue
+
+        plan.m15_by_block.add(block_id, start, end)
+        entry = cached.get(i)
+        if entry is not None:
+            for category in STRIP_QC_CATEGORIES:
+                qc_report[category].extend(entry["qc"][category])
+            plan.jobs.append(CandleFileJob(strip_rel, m15_rows, data=entry["data"], sha256=entry["sha256"]))
+            continue
+
+        block_qc = {category: [] for category in STRIP_QC_CATEGORIES}
+        if not clean[i]:
+            qc_strip_block(block, m15_rows.tolist(), tolerance, block_qc)
+            for category in STRIP_QC_CATEGORIES:
+                qc_report[category].extend(block_qc[category])
+        if cache is None:
+            plan.jobs.append(CandleFileJob(strip_rel, m15_rows))
+        else:
+            plan.jobs.append(CandleFileJob(strip_rel, m15_rows, cache_key=cache_keys[i], qc=block_qc))
+
+    return plan
+
+
+def plan_context(blocks: List[Dict], m15_by_block: Mapping[str, Sequence[Dict]], qc_report: Dict) -> ContextPlan:
+    """QC 4H context windows (pairs of 2H strips) and collect the context files to write."""
+    groups: Dict[tuple, List[Dict]] = defaultdict(list)
+    for block in blocks:
+        groups[(block["date_ny"], block["block4h"])].append(block)
+
+    plan = ContextPlan(windows_total=len(groups))
+
+    for (date_ny, block4h), block_group in groups.items():
+        block_group.sort(key=lambda b: b["bar_close_ms"])
+        window_end_ms = int(block_group[-1]["bar_close_ms"])
+        window_start_ms = window_end_ms - FOUR_H_MS
+        m15_rows = []
+        missing_blocks = []
+        for block in block_group:
+            block_id = block["block_id"]
+            if block_id not in m15_by_block:
+                missing_blocks.append(block_id)
+                continue
+            m15_rows.extend(m15_by_block[block_id])
+
+        if missing_blocks:
+            qc_report["context"].append(
+                {
+                    "date_ny": str(date_ny),
+                    "block4h": block4h,
+                    "issue": "missing_blocks",
+                    "blocks": missing_blocks,
+                }
+            )
+            continue
+
+        if len(m15_rows) != 16:
+            qc_report["context"].append(
+                {
+                    "date_ny": str(date_ny),
+                    "block4h": block4h,
+                    "issue": "m15_count",
+                    "expected": 16,
+                    "actual": len(m15_rows),
+                }
+            )
+            continue
+
+        m15_rows.sort(key=lambda r: r["bar_start_ms"])
+        continuity_issues = check_continuity(
+            m15_rows, M15_STEP_MS, expected_start_ms=window_start_ms, expected_end_ms=window_end_ms
+        )
+        if continuity_issues:
+            qc_report["context"].append(
+                {
+                    "date_ny": str(date_ny),
+                    "block4h": block4h,
+                    "issue": "continuity",
+                    "details": continuity_issues,
+                }
+            )
+            continue
+
+        m30_rows = aggregate_rows(m15_rows, 2, M15_STEP_MS)
+        granularity = None
+        context_rows = None
+
+        if m30_rows and len(m30_rows) == 8:
+            granularity = "M30"
+            context_rows = m30_rows
+            plan.m30 += 1
+        else:
+            h1_rows = aggregate_rows(m15_rows, 4, M15_STEP_MS)
+            if h1_rows and len(h1_rows) == 4:
+                granularity = "H1"
+                context_rows = h1_rows
+                plan.h1 += 1
+
+        if not context_rows:
+            qc_report["context"].append(
+                {
+                    "date_ny": str(date_ny),
+                    "block4h": block4h,
+                    "issue": "aggregate_failed",
+                }
+            )
+            continue
+
+        plan.jobs.append(
+            CandleFileJob((Path("context/4h") / f"{block4h}_{date_ny}.csv").as_posix(), context_rows)
+        )
+        qc_report["context"].append(
+            {
+                "date_ny": str(date_ny),
+                "block4h": block4h,
+                "issue": "ok",
+                "granularity": granularity,
+                "count": len(context_rows),
+            }
+        )
+
+    return plan
+
+
 # =============================================================================
 # DST Audit Functions
 # =============================================================================
@@ -687,6 +1458,7 @@ def validate_aggregation_match(
 
 def validate_session_boundary(
     blocks_by_date: Dict[str, List[Dict]],
+    session_starts_ms: Optional[Dict[str, int]] = None,
 ) -> Tuple[int, List[Dict]]:
     """
     Validate Invariant C: Session boundary coherence.
@@ -697,6 +1469,7 @@ def validate_session_boundary(
 
     Args:
         blocks_by_date: Dict mapping date_ny to list of block dicts
+        session_starts_ms: Optional precomputed ny_session_starts_ms() result
 
     Returns:
         Tuple of (failure_count: int, anomalies: list)
@@ -705,10 +1478,10 @@ def validate_session_boundary(
     failure_count = 0
 
     for date_ny, blocks in sorted(blocks_by_date.items()):
+        letters = [extract_block_letter(b["block_id"]) for b in blocks]
+
         # Check block count (should be 12 for complete day)
-        block_letters = sorted(
-            {letter for letter in (extract_block_letter(b["block_id"]) for b in blocks) if letter}
-        )
+        block_letters = sorted({letter for letter in letters if letter})
         if len(block_letters) != 12:
             failure_count += 1
             expected_letters = set("ABCDEFGHIJKL")
@@ -727,18 +1500,20 @@ def validate_session_boundary(
             })
 
         # Find A-block
-        a_blocks = [b for b in blocks if extract_block_letter(b["block_id"]) == "A"]
-        if not a_blocks:
+        if "A" not in letters:
             # No A-block in this date - skip session boundary check
             continue
 
-        a_block = a_blocks[0]
+        a_block = blocks[letters.index("A")]
         actual_bar_close_ms = int(a_block["bar_close_ms"])
         # A-block spans 17:00-19:00 NY, so bar_open_ms = bar_close_ms - 2H
         actual_start_ms = actual_bar_close_ms - TWO_H_MS
 
         # Compute expected start from NY 17:00
-        expected_start_ms = ny_17_to_epoch_ms(date_ny)
+        if session_starts_ms is not None and date_ny in session_starts_ms:
+            expected_start_ms = session_starts_ms[date_ny]
+        else:
+            expected_start_ms = ny_17_to_epoch_ms(date_ny)
 
         if actual_start_ms != expected_start_ms:
             failure_count += 1
@@ -758,27 +1533,140 @@ def validate_session_boundary(
     return (failure_count, anomalies)
 
 
+def ny_session_starts_ms(dates_ny: Iterable[str]) -> Dict[str, int]:
+    """17:00 America/New_York epoch ms for each distinct NY date, converted once per date."""
+    return {date_ny: ny_17_to_epoch_ms(date_ny) for date_ny in sorted(set(dates_ny))}
+
+
+def dst_transition_windows(
+    date_from: str, date_to: str, pad_days: int = DST_WINDOW_PAD_DAYS
+) -> Dict[str, Dict[str, List[str]]]:
+    """
+    NY DST transitions whose audit window overlaps date_from..date_to.
+
+    A transition date is the first NY date whose 17:00 UTC offset differs
+    from the previous date's ("spring" if the offset grew, "fall" otherwise);
+    its window is the transition date +/- pad_days. Offsets are computed once
+    per calendar date across the padded range.
+
+    Returns:
+        {"spring": {transition_date: window_dates}, "fall": {...}}
+    """
+    first = date.fromisoformat(date_from) - timedelta(days=pad_days + 1)
+    last = date.fromisoformat(date_to) + timedelta(days=pad_days)
+    days = [first + timedelta(days=i) for i in range((last - first).days + 1)]
+    offsets = np.array(
+        [datetime(d.year, d.month, d.day, 17, tzinfo=NY_TZ).utcoffset().total_seconds() for d in days]
+    )
+    windows: Dict[str, Dict[str, List[str]]] = {"spring": {}, "fall": {}}
+    for i in (np.flatnonzero(np.diff(offsets) != 0) + 1).tolist():
+        kind = "spring" if offsets[i] > offsets[i - 1] else "fall"
+        windows[kind][days[i].isoformat()] = [
+            (days[i] + timedelta(days=k)).isoformat() for k in range(-pad_days, pad_days + 1)
+        ]
+    return windows
+
+
+def dst_audit_target_dates(
+    dst_range: str, date_from: Optional[str] = None, date_to: Optional[str] = None
+) -> Tuple[List[str], List[str]]:
+    """
+    (transition dates, NY dates to audit) for --dst-audit-range.
+
+    dst_range is "spring", "fall" or "all". Without a date range the
+    hardcoded 2023 DST_RANGES windows are used, as before.
+    """
+    kinds = ["spring", "fall"] if dst_range == "all" else [dst_range]
+    if date_from is None or date_to is None:
+        dates = sorted({d for kind in kinds for d in DST_RANGES[kind]})
+        return sorted(DST_RANGES[kind][len(DST_RANGES[kind]) // 2] for kind in kinds), dates
+    windows = dst_transition_windows(date_from, date_to)
+    transitions = sorted(t for kind in kinds for t in windows[kind])
+    dates = sorted({d for kind in kinds for window in windows[kind].values() for d in window})
+    return transitions, dates
+
+
+def screen_dst_strips(
+    frame: M15Frame, spans: np.ndarray, close_ms: np.ndarray, spine: Dict[str, np.ndarray], tolerance: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Columnwise Invariant A/B screen for 8-candle strips.
+
+    Returns (clean, worst_metric, worst_value): clean is True for strips with
+    finite values, 900000ms steps, aligned close and an aggregation match, so
+    they raise no anomaly; worst_metric/worst_value are the largest OHLC
+    deviation (first of o, h, l, c on ties), as validate_aggregation_match()
+    reports it. Other strips are re-checked by the scalar validators.
+    """
+    idx = spans[:, 0][:, None] + np.arange(8)
+    start = frame.bar_start_ms[idx]
+    o, h, l, c = (getattr(frame, key)[idx] for key in ("o", "h", "l", "c"))
+    aligned = (np.diff(start, axis=1) == M15_STEP_MS).all(axis=1) & (frame.bar_close_ms[idx[:, -1]] == close_ms)
+
+    deviations = np.stack(
+        [
+            np.abs(o[:, 0] - spine["o"]),
+            np.abs(h.max(axis=1) - spine["h"]),
+            np.abs(l.min(axis=1) - spine["l"]),
+            np.abs(c[:, -1] - spine["c"]),
+        ],
+        axis=1,
+    )
+    finite = np.isfinite(np.concatenate([o, h, l, c], axis=1)).all(axis=1) & np.isfinite(deviations).all(axis=1)
+    clean = finite & aligned & (deviations <= tolerance).all(axis=1)
+    worst_metric = deviations.argmax(axis=1)
+    worst_value = deviations[np.arange(len(spans)), worst_metric]
+    return clean, worst_metric, worst_value
+
+
+def _dst_audit_spans(blocks: List[Dict], m15_by_block: Mapping[str, Sequence[Dict]]) -> Tuple[M15Frame, np.ndarray]:
+    """One frame plus per-block (start, end) rows for the audited blocks."""
+    if isinstance(m15_by_block, M15BlockView):
+        bounds = [m15_by_block.bounds(b["block_id"]) for b in blocks]
+        return m15_by_block.frame, np.array(bounds, dtype=np.int64).reshape(len(blocks), 2)
+    rows: List[Dict] = []
+    bounds = []
+    for block in blocks:
+        block_rows = m15_by_block.get(block["block_id"], [])
+        bounds.append((len(rows), len(rows) + len(block_rows)))
+        rows.extend(block_rows)
+    return M15Frame.from_rows(rows), np.array(bounds, dtype=np.int64).reshape(len(blocks), 2)
+
+
 def run_dst_audit(
     blocks: List[Dict],
-    m15_by_block: Dict[str, List[Dict]],
+    m15_by_block: Mapping[str, Sequence[Dict]],
     tolerance: float,
     dst_range: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Run DST audit on blocks, validating all three invariants.
 
+    Strip counts, contiguity and aggregation are screened columnwise over the
+    M15 arrays and NY session starts are computed once per date; only blocks
+    the screen flags go through validate_strip_integrity() and
+    validate_aggregation_match(), so anomalies are reported exactly as before.
+
     Args:
         blocks: List of block dicts from the pack build
-        m15_by_block: Dict mapping block_id to list of M15 candles
+        m15_by_block: Mapping of block_id to its M15 candles (lists or M15Span views)
         tolerance: OHLC comparison tolerance
-        dst_range: Optional filter ("spring", "fall", or None for all)
+        dst_range: Optional filter ("spring", "fall", "all", or None for all blocks)
+        date_from: Optional pack start date; with date_to, dst_range covers every
+            DST transition in the range instead of the 2023 DST_RANGES
+        date_to: Optional pack end date (inclusive)
 
     Returns:
         DST audit report dict matching dst_audit.json schema
     """
     # Filter blocks to DST dates if range specified
-    if dst_range and dst_range in DST_RANGES:
-        target_dates = set(DST_RANGES[dst_range])
+    transitions: Optional[List[str]] = None
+    requested_dates: List[str] = []
+    if dst_range:
+        transitions, requested_dates = dst_audit_target_dates(dst_range, date_from, date_to)
+        target_dates = set(requested_dates)
         blocks = [b for b in blocks if str(b.get("date_ny")) in target_dates]
 
     # Deterministic ordering
@@ -796,26 +1684,39 @@ def run_dst_audit(
     for date_ny in blocks_by_date:
         blocks_by_date[date_ny].sort(key=lambda b: b["bar_close_ms"])
 
+    # Columnwise screen of every 8-candle strip
+    frame, spans = _dst_audit_spans(blocks, m15_by_block)
+    counts = spans[:, 1] - spans[:, 0]
+    full = np.flatnonzero(counts == 8)
+    clean = np.zeros(len(blocks), dtype=bool)
+    worst_metric = np.zeros(len(blocks), dtype=np.int64)
+    worst_value = np.zeros(len(blocks), dtype=np.float64)
+    if full.size:
+        values = np.array([[blocks[i][key] for key in ("o", "h", "l", "c")] for i in full], dtype=np.float64)
+        close_ms = np.array([int(blocks[i]["bar_close_ms"]) for i in full], dtype=np.int64)
+        spine = {key: values[:, k] for k, key in enumerate(("o", "h", "l", "c"))}
+        clean[full], worst_metric[full], worst_value[full] = screen_dst_strips(
+            frame, spans[full], close_ms, spine, tolerance
+        )
+
     # Initialize counters
-    blocks_checked = 0
+    blocks_checked = len(blocks)
     strip_count_failures = 0
     continuity_failures = 0
     aggregation_failures = 0
     all_anomalies: List[Dict] = []
-    worst_agg_deviation: Optional[Dict] = None
+    scalar_deviations: Dict[int, Dict] = {}
 
-    # Validate each block
-    for block in blocks:
+    # Scalar validators for the blocks the screen flagged, in block order
+    for i in np.flatnonzero(~clean).tolist():
+        block = blocks[i]
         block_id = block["block_id"]
         date_ny = str(block["date_ny"])
-        bar_close_ms = int(block["bar_close_ms"])
-        blocks_checked += 1
-
-        m15_rows = m15_by_block.get(block_id, [])
+        m15_rows = frame.rows(int(spans[i, 0]), int(spans[i, 1]))
 
         # Invariant A: Strip integrity
         strip_ok, strip_issues = validate_strip_integrity(
-            m15_rows, block_id, bar_close_ms
+            m15_rows, block_id, int(block["bar_close_ms"])
         )
         for issue in strip_issues:
             issue["date_ny"] = date_ny
@@ -836,27 +1737,39 @@ def run_dst_audit(
             agg_ok, deviation, agg_anomaly = validate_aggregation_match(
                 m15_rows, spine_ohlc, block_id, tolerance
             )
-            if deviation:
-                if (
-                    worst_agg_deviation is None
-                    or deviation["value"] > worst_agg_deviation["value"]
-                ):
-                    worst_agg_deviation = deviation
+            scalar_deviations[i] = deviation
+            worst_value[i] = deviation["value"]
             if agg_anomaly:
                 agg_anomaly["date_ny"] = date_ny
                 aggregation_failures += 1
                 all_anomalies.append(agg_anomaly)
 
+    # Worst deviation: the first block holding the maximum, as a running
+    # "strictly greater" scan picks it (a NaN first value is never replaced)
+    worst_agg_deviation: Optional[Dict] = None
+    if full.size:
+        candidate_values = worst_value[full]
+        if np.isnan(candidate_values[0]):
+            worst = int(full[0])
+        else:
+            worst = int(full[np.nanargmax(candidate_values)])
+        if worst in scalar_deviations:
+            worst_agg_deviation = scalar_deviations[worst]
+        else:
+            worst_agg_deviation = {
+                "block_id": blocks[worst]["block_id"],
+                "metric": ("o", "h", "l", "c")[worst_metric[worst]],
+                "value": float(worst_value[worst]),
+            }
+
     # Invariant C: Session boundary coherence
-    session_failures, session_anomalies = validate_session_boundary(blocks_by_date)
+    session_failures, session_anomalies = validate_session_boundary(
+        blocks_by_date, ny_session_starts_ms(blocks_by_date)
+    )
     all_anomalies.extend(session_anomalies)
 
     # Check for missing DST dates if range was specified
-    missing_dates: List[str] = []
-    if dst_range and dst_range in DST_RANGES:
-        requested_dates = set(DST_RANGES[dst_range])
-        actual_dates = set(dates_tested)
-        missing_dates = sorted(requested_dates - actual_dates)
+    missing_dates = sorted(set(requested_dates) - set(dates_tested))
 
     return {
         "dates_tested": dates_tested,
@@ -868,26 +1781,28 @@ def run_dst_audit(
         "worst_aggregation_deviation": worst_agg_deviation,
         "anomalies": all_anomalies,
         "dst_range_requested": dst_range,
+        "dst_transitions": transitions,
         "missing_dates": missing_dates if missing_dates else None,
     }
 
 
-def write_dst_audit(pack_dir: Path, audit_result: Dict[str, Any]) -> Path:
+def write_dst_audit(pack_dir: Path, audit_result: Dict[str, Any], writer: Optional[PackWriter] = None) -> Path:
     """
     Write dst_audit.json to the evidence pack directory.
 
     Args:
         pack_dir: Evidence pack directory
         audit_result: DST audit result dict
+        writer: Optional PackWriter recording the file's digest
 
     Returns:
         Path to written dst_audit.json
     """
+    text = json.dumps(audit_result, indent=2, sort_keys=True, default=str)
+    if writer is not None:
+        return writer.write_text("dst_audit.json", text)
     dst_audit_path = pack_dir / "dst_audit.json"
-    dst_audit_path.write_text(
-        json.dumps(audit_result, indent=2, sort_keys=True, default=str),
-        encoding="utf-8",
-    )
+    dst_audit_path.write_text(text, encoding="utf-8")
     return dst_audit_path
 
 
@@ -906,9 +1821,33 @@ def main() -> None:
     )
     parser.add_argument(
         "--dst-audit-range",
-        choices=["spring", "fall"],
+        choices=["spring", "fall", "all"],
         default=None,
-        help="Filter DST audit to specific range: spring (2023-03-10..14) or fall (2023-11-03..07)",
+        help=(
+            "Filter DST audit to the NY dates within 2 days of each spring, fall or any "
+            "DST transition in --date-from..--date-to"
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=default_workers(),
+        help="Threads for writing strip/context CSVs (default: min(8, CPU count); 1 = serial)",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Re-read every pack file after writing and check it against the manifests",
+    )
+    parser.add_argument(
+        "--strip-cache-dir",
+        default=None,
+        help=f"Strip cache directory (default: <repo-root>/{DEFAULT_STRIP_CACHE_DIR.as_posix()})",
+    )
+    parser.add_argument(
+        "--no-strip-cache",
+        action="store_true",
+        help="Render and QC every strip without reading or writing the strip cache",
     )
     args = parser.parse_args()
 
@@ -929,6 +1868,12 @@ def main() -> None:
     pack_dir.mkdir(parents=True, exist_ok=True)
     strips_dir.mkdir(parents=True, exist_ok=True)
     context_dir.mkdir(parents=True, exist_ok=True)
+    writer = PackWriter(pack_dir)
+    strip_cache = None
+    if not args.no_strip_cache:
+        strip_cache = StripCache(
+            Path(args.strip_cache_dir).resolve() if args.strip_cache_dir else repo_root / DEFAULT_STRIP_CACHE_DIR
+        )
 
     qc_report = {
         "run_id": args.run_id,
@@ -944,10 +1889,7 @@ def main() -> None:
         "summary": {},
     }
 
-    backbone_rows = []
-    m15_by_block: Dict[str, List[Dict]] = {}
-    m15_by_block_all: Dict[str, List[Dict]] = {}
-    strips_written = 0
+    m15_by_block_all: Mapping[str, Sequence[Dict]] = {}
     hashes = {
         "data_manifest_sha256": None,
         "data_sha256": None,
@@ -994,14 +1936,10 @@ def main() -> None:
                     "tolerance": args.tolerance,
                     "m15_scope": qc_report.get("m15_scope", {}),
                 }
-                (pack_dir / "meta.json").write_text(json.dumps(meta, indent=2, sort_keys=True), encoding="utf-8")
-                (pack_dir / "qc_report.json").write_text(
-                    json.dumps(qc_report, indent=2, sort_keys=True), encoding="utf-8"
-                )
-                (pack_dir / "backbone_2h.csv").write_text(
-                    "block_id,bar_close_ms,strip_path,m15_count\n", encoding="utf-8"
-                )
-                hashes = write_manifest_files(pack_dir)
+                writer.write_text("meta.json", json.dumps(meta, indent=2, sort_keys=True))
+                writer.write_text("qc_report.json", json.dumps(qc_report, indent=2, sort_keys=True))
+                writer.write_text("backbone_2h.csv", "block_id,bar_close_ms,strip_path,m15_count\n")
+                hashes = write_manifest_files(pack_dir, writer=writer, verify=args.verify)
                 append_pack_ledger(
                     ledger_path,
                     run_id=args.run_id,
@@ -1023,232 +1961,42 @@ def main() -> None:
             block_start_ms_values = [int(block["bar_close_ms"]) - TWO_H_MS for block in blocks]
             min_needed_ms = min(block_start_ms_values)
             max_needed_ms = max(int(block["bar_close_ms"]) for block in blocks)
-            m15_rows_all = fetch_m15_range(conn, symbol, min_needed_ms, max_needed_ms)
-            m15_close_ms = [int(row["bar_close_ms"]) for row in m15_rows_all]
+            m15 = fetch_m15_range(conn, symbol, min_needed_ms, max_needed_ms)
 
             qc_report["m15_scope"] = {
                 "min_needed_ms": min_needed_ms,
                 "max_needed_ms": max_needed_ms,
-                "rows_loaded": len(m15_rows_all),
+                "rows_loaded": len(m15),
             }
 
-            for block in blocks:
-                block_id = block["block_id"]
-                bar_close_ms = int(block["bar_close_ms"])
-                start_ms = bar_close_ms - TWO_H_MS
-                start_idx = bisect.bisect_right(m15_close_ms, start_ms)
-                end_idx = bisect.bisect_right(m15_close_ms, bar_close_ms)
-                m15_rows = m15_rows_all[start_idx:end_idx]
-                m15_count = len(m15_rows)
-                m15_by_block_all[block_id] = m15_rows
-
-                strip_rel = Path("strips/2h") / f"{block_id}.csv"
-                strip_path = pack_dir / strip_rel
-                backbone_rows.append(
-                    {
-                        "block_id": block_id,
-                        "bar_close_ms": bar_close_ms,
-                        "strip_path": strip_rel.as_posix() if m15_count == 8 else "",
-                        "m15_count": m15_count,
-                    }
-                )
-
-                if m15_count != 8:
-                    qc_report["candle_count"].append(
-                        {
-                            "scope": "2h",
-                            "block_id": block_id,
-                            "expected": 8,
-                            "actual": m15_count,
-                        }
-                    )
-                    continue
-
-                continuity_issues = check_continuity(
-                    m15_rows, M15_STEP_MS, expected_start_ms=start_ms, expected_end_ms=bar_close_ms
+            # QC pass (columnar, no file I/O), then emit strip/context files
+            strip_plan = plan_strips(blocks, m15, args.tolerance, qc_report, cache=strip_cache)
+            context_plan = plan_context(blocks, strip_plan.m15_by_block, qc_report)
+            m15_by_block_all = strip_plan.m15_by_block_all
+            strips_written = len(strip_plan.jobs)
+            context_written = len(context_plan.jobs)
+
+            write_candle_files(writer, strip_plan.jobs + context_plan.jobs, workers=args.workers, cache=strip_cache)
+            if strip_cache is not None:
+                print(
+                    f"Strip cache: {strip_cache.hits} hit(s), {strip_cache.misses} miss(es)"
+                    + (f", {strip_cache.write_errors} write error(s)" if strip_cache.write_errors else "")
                 )
-                for issue in continuity_issues:
-                    qc_report["continuity"].append(
-                        {
-                            "scope": "2h",
-                            "block_id": block_id,
-                            **issue,
-                        }
-                    )
-
-                for idx, row in enumerate(m15_rows):
-                    if not ohlc_sane(row["o"], row["h"], row["l"], row["c"]):
-                        qc_report["ohlc_sanity"].append(
-                            {
-                                "scope": "2h",
-                                "block_id": block_id,
-                                "idx": idx + 1,
-                                "o": row["o"],
-                                "h": row["h"],
-                                "l": row["l"],
-                                "c": row["c"],
-                            }
-                        )
-
-                agg_o = m15_rows[0]["o"]
-                agg_c = m15_rows[-1]["c"]
-                agg_h = max(r["h"] for r in m15_rows)
-                agg_l = min(r["l"] for r in m15_rows)
-
-                spine_o = block["o"]
-                spine_h = block["h"]
-                spine_l = block["l"]
-                spine_c = block["c"]
-
-                if not ohlc_sane(agg_o, agg_h, agg_l, agg_c):
-                    qc_report["ohlc_sanity"].append(
-                        {
-                            "scope": "2h_aggregate",
-                            "block_id": block_id,
-                            "o": agg_o,
-                            "h": agg_h,
-                            "l": agg_l,
-                            "c": agg_c,
-                        }
-                    )
-
-                mismatch = []
-                if abs(agg_o - spine_o) > args.tolerance:
-                    mismatch.append("o")
-                if abs(agg_h - spine_h) > args.tolerance:
-                    mismatch.append("h")
-                if abs(agg_l - spine_l) > args.tolerance:
-                    mismatch.append("l")
-                if abs(agg_c - spine_c) > args.tolerance:
-                    mismatch.append("c")
-                if mismatch:
-                    qc_report["aggregation_match"].append(
-                        {
-                            "block_id": block_id,
-                            "mismatch": mismatch,
-                            "tolerance": args.tolerance,
-                            "agg": {"o": agg_o, "h": agg_h, "l": agg_l, "c": agg_c},
-                            "spine": {"o": spine_o, "h": spine_h, "l": spine_l, "c": spine_c},
-                        }
-                    )
-
-                write_candles_csv(m15_rows, strip_path)
-                strips_written += 1
-                m15_by_block[block_id] = m15_rows
 
             # Write backbone
-            backbone_path = pack_dir / "backbone_2h.csv"
-            with backbone_path.open("w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(["block_id", "bar_close_ms", "strip_path", "m15_count"])
-                for row in backbone_rows:
-                    writer.writerow(
-                        [
-                            row["block_id"],
-                            row["bar_close_ms"],
-                            row["strip_path"],
-                            row["m15_count"],
-                        ]
-                    )
-
-            # Build 4H context
-            groups: Dict[tuple, List[Dict]] = defaultdict(list)
-            for block in blocks:
-                groups[(block["date_ny"], block["block4h"])].append(block)
-
-            context_written = 0
-            context_m30 = 0
-            context_h1 = 0
-
-            for (date_ny, block4h), block_group in groups.items():
-                block_group.sort(key=lambda b: b["bar_close_ms"])
-                window_end_ms = int(block_group[-1]["bar_close_ms"])
-                window_start_ms = window_end_ms - FOUR_H_MS
-                m15_rows = []
-                missing_blocks = []
-                for block in block_group:
-                    block_id = block["block_id"]
-                    if block_id not in m15_by_block:
-                        missing_blocks.append(block_id)
-                        continue
-                    m15_rows.extend(m15_by_block[block_id])
-
-                if missing_blocks:
-                    qc_report["context"].append(
-                        {
-                            "date_ny": str(date_ny),
-                            "block4h": block4h,
-                            "issue": "missing_blocks",
-                            "blocks": missing_blocks,
-                        }
-                    )
-                    continue
-
-                if len(m15_rows) != 16:
-                    qc_report["context"].append(
-                        {
-                            "date_ny": str(date_ny),
-                            "block4h": block4h,
-                            "issue": "m15_count",
-                            "expected": 16,
-                            "actual": len(m15_rows),
-                        }
-                    )
-                    continue
-
-                m15_rows.sort(key=lambda r: r["bar_start_ms"])
-                continuity_issues = check_continuity(
-                    m15_rows, M15_STEP_MS, expected_start_ms=window_start_ms, expected_end_ms=window_end_ms
-                )
-                if continuity_issues:
-                    qc_report["context"].append(
-                        {
-                            "date_ny": str(date_ny),
-                            "block4h": block4h,
-                            "issue": "continuity",
-                            "details": continuity_issues,
-                        }
-                    )
-                    continue
-
-                m30_rows = aggregate_rows(m15_rows, 2, M15_STEP_MS)
-                granularity = None
-                context_rows = None
-
-                if m30_rows and len(m30_rows) == 8:
-                    granularity = "M30"
-                    context_rows = m30_rows
-                    context_m30 += 1
-                else:
-                    h1_rows = aggregate_rows(m15_rows, 4, M15_STEP_MS)
-                    if h1_rows and len(h1_rows) == 4:
-                        granularity = "H1"
-                        context_rows = h1_rows
-                        context_h1 += 1
-
-                if not context_rows:
-                    qc_report["context"].append(
-                        {
-                            "date_ny": str(date_ny),
-                            "block4h": block4h,
-                            "issue": "aggregate_failed",
-                        }
-                    )
-                    continue
-
-                context_path = context_dir / f"{block4h}_{date_ny}.csv"
-                write_candles_csv(context_rows, context_path)
-                context_written += 1
-
-                qc_report["context"].append(
-                    {
-                        "date_ny": str(date_ny),
-                        "block4h": block4h,
-                        "issue": "ok",
-                        "granularity": granularity,
-                        "count": len(context_rows),
-                    }
+            backbone = io.StringIO()
+            backbone_writer = csv.writer(backbone)
+            backbone_writer.writerow(["block_id", "bar_close_ms", "strip_path", "m15_count"])
+            for row in strip_plan.backbone_rows:
+                backbone_writer.writerow(
+                    [
+                        row["block_id"],
+                        row["bar_close_ms"],
+                        row["strip_path"],
+                        row["m15_count"],
+                    ]
                 )
+            writer.write_text("backbone_2h.csv", backbone.getvalue(), newline="")
 
             summary = {
                 "blocks_total": len(blocks),
@@ -1257,10 +2005,10 @@ def main() -> None:
                 "blocks_with_continuity_issues": unique_values(qc_report["continuity"], "block_id"),
                 "blocks_with_ohlc_issues": unique_values(qc_report["ohlc_sanity"], "block_id"),
                 "blocks_with_agg_mismatch": unique_values(qc_report["aggregation_match"], "block_id"),
-                "context_windows_total": len(groups),
+                "context_windows_total": context_plan.windows_total,
                 "context_written": context_written,
-                "context_m30": context_m30,
-                "context_h1": context_h1,
+                "context_m30": context_plan.m30,
+                "context_h1": context_plan.h1,
             }
             qc_report["summary"] = summary
 
@@ -1307,10 +2055,8 @@ def main() -> None:
                 ],
             }
 
-            (pack_dir / "meta.json").write_text(json.dumps(meta, indent=2, sort_keys=True), encoding="utf-8")
-            (pack_dir / "qc_report.json").write_text(
-                json.dumps(qc_report, indent=2, sort_keys=True), encoding="utf-8"
-            )
+            writer.write_text("meta.json", json.dumps(meta, indent=2, sort_keys=True))
+            writer.write_text("qc_report.json", json.dumps(qc_report, indent=2, sort_keys=True))
 
             # Run DST audit if requested
             if args.dst_audit:
@@ -1320,8 +2066,10 @@ def main() -> None:
                     m15_by_block=m15_by_block_all,
                     tolerance=args.tolerance,
                     dst_range=args.dst_audit_range,
+                    date_from=args.date_from,
+                    date_to=args.date_to,
                 )
-                dst_audit_path = write_dst_audit(pack_dir, dst_audit_result)
+                dst_audit_path = write_dst_audit(pack_dir, dst_audit_result, writer=writer)
                 print(f"DST audit complete: {dst_audit_path}")
 
                 # Report summary
@@ -1334,7 +2082,9 @@ def main() -> None:
                 if dst_audit_result.get("missing_dates"):
                     print(f"  Missing dates (from requested range): {dst_audit_result['missing_dates']}")
 
-        hashes = write_manifest_files(pack_dir)
+        hashes = write_manifest_files(pack_dir, writer=writer, verify=args.verify)
+        if args.verify:
+            print("Manifest verification passed (all files re-read).")
         append_pack_ledger(
             ledger_path,
             run_id=args.run_id,
@@ -18,14 +18,23 @@ Hardening:
 - Parameter provenance captured in meta.json
 """
 
+import argparse
 import json
 import hashlib
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
+from bisect import bisect_left, bisect_right, insort
 from collections import defaultdict
-from statistics import median
 import math
 
+import numpy as np
+
 
 # ============================================================================
 # Configuration & Constants
@@ -61,6 +70,29 @@ FVG_RULE = "3_candle"
 # Computation scope (intrablock only, no cross-block lookbacks)
 INTRABLOCK_ONLY = True
 
+# Output layouts for per-block modules (v0.3-A, v0.3-C):
+# "files"  - one pretty-printed JSON file per block (micro/<dir>/<block_id>.json)
+# "packed" - one canonical JSONL per module, sorted by block_id, plus an offset
+#            index (micro/<dir>.jsonl + micro/<dir>.index.json)
+OVERLAY_LAYOUTS = ("files", "packed")
+
+# Per-block module -> output directory under overlays_v0_3/
+PER_BLOCK_MODULE_DIRS = {
+    "v0.3-A": "micro/2h",
+    "v0.3-C": "micro/liquidity_gradient",
+}
+
+# Packed container format identifier (stored in each index)
+PACKED_FORMAT = "overlays_v0_3_packed_v1"
+
+# M15 candle fields read by the per-block modules; the process-pool runner
+# ships only these to workers, as shared-memory int64/float64 columns
+OVERLAY_TIME_FIELDS = ("bar_start_ms", "bar_close_ms")
+OVERLAY_PRICE_FIELDS = ("o", "h", "l", "c")
+
+# Shards per worker for the process-pool runner (smooths uneven block sizes)
+SHARDS_PER_WORKER = 4
+
 
 # ============================================================================
 # Numeric Determinism Utilities
@@ -133,6 +165,68 @@ def compute_event_id(event_data: Dict) -> str:
     return hashlib.sha1(canonical_string.encode("utf-8")).hexdigest()
 
 
+# ============================================================================
+# Columnar Candles & Rolling Extremes
+# ============================================================================
+
+@dataclass
+class CandleColumns:
+    """M15 candles as parallel lists, validated and converted once."""
+    bar_start_ms: List[int]
+    bar_close_ms: List[int]
+    o: List[float]
+    h: List[float]
+    l: List[float]
+    c: List[float]
+
+    @classmethod
+    def from_candles(cls, candles: List[Dict]) -> "CandleColumns":
+        return cls(
+            bar_start_ms=[int(candle["bar_start_ms"]) for candle in candles],
+            bar_close_ms=[int(candle["bar_close_ms"]) for candle in candles],
+            o=[safe_float(candle["o"]) for candle in candles],
+            h=[safe_float(candle["h"]) for candle in candles],
+            l=[safe_float(candle["l"]) for candle in candles],
+            c=[safe_float(candle["c"]) for candle in candles],
+        )
+
+    def __len__(self) -> int:
+        return len(self.bar_start_ms)
+
+
+def _rolling_extreme(values: List[float], window: Optional[int], beats) -> List[float]:
+    # Monotonic deque of indices; an entry is dropped only when strictly
+    # beaten, so ties resolve to the earliest value as max()/min() do.
+    result = []
+    candidates = deque()
+    for j, value in enumerate(values):
+        while candidates and beats(value, values[candidates[-1]]):
+            candidates.pop()
+        candidates.append(j)
+        if window is not None and candidates[0] <= j - window:
+            candidates.popleft()
+        result.append(values[candidates[0]])
+    return result
+
+
+def rolling_max(values: List[float], window: Optional[int] = None) -> List[float]:
+    """
+    max(values[j - window + 1:j + 1]) for every j (clamped at 0), in O(n).
+
+    window=None gives the running (expanding) maximum.
+    """
+    return _rolling_extreme(values, window, lambda a, b: a > b)
+
+
+def rolling_min(values: List[float], window: Optional[int] = None) -> List[float]:
+    """
+    min(values[j - window + 1:j + 1]) for every j (clamped at 0), in O(n).
+
+    window=None gives the running (expanding) minimum.
+    """
+    return _rolling_extreme(values, window, lambda a, b: a < b)
+
+
 # ============================================================================
 # v0.3-A: Wick & Sweep Microstructure Overlay
 # ============================================================================
@@ -147,11 +241,13 @@ def classify_wick_dominance(candle: Dict) -> str:
     Returns:
         "wick_top", "wick_bot", "balanced", or "no_wick"
     """
-    o = safe_float(candle["o"])
-    h = safe_float(candle["h"])
-    l = safe_float(candle["l"])
-    c = safe_float(candle["c"])
+    return wick_dominance(
+        safe_float(candle["o"]), safe_float(candle["h"]), safe_float(candle["l"]), safe_float(candle["c"])
+    )
 
+
+def wick_dominance(o: float, h: float, l: float, c: float) -> str:
+    """classify_wick_dominance() for already-converted prices."""
     body_top = max(o, c)
     body_bot = min(o, c)
 
@@ -170,7 +266,9 @@ def classify_wick_dominance(candle: Dict) -> str:
         return "balanced"
 
 
-def detect_sweeps(candles: List[Dict], lookback: int = SWEEP_LOOKBACK) -> List[Dict]:
+def detect_sweeps(
+    candles: List[Dict], lookback: int = SWEEP_LOOKBACK, columns: Optional[CandleColumns] = None
+) -> List[Dict]:
     """
     Detect sweep events where a candle takes out prior highs/lows.
 
@@ -182,29 +280,33 @@ def detect_sweeps(candles: List[Dict], lookback: int = SWEEP_LOOKBACK) -> List[D
     Args:
         candles: List of M15 candles sorted by bar_start_ms
         lookback: Number of prior candles to check
+        columns: Optional CandleColumns of candles (built if omitted)
 
     Returns:
         List of sweep events with metadata
     """
+    cols = columns if columns is not None else CandleColumns.from_candles(candles)
     sweeps = []
+    if len(cols) <= lookback:
+        return sweeps
 
-    for i in range(lookback, len(candles)):
-        current = candles[i]
-        prior_candles = candles[i - lookback:i]
+    window_highs = rolling_max(cols.h, lookback)
+    window_lows = rolling_min(cols.l, lookback)
 
-        prior_high = max(safe_float(c["h"]) for c in prior_candles)
-        prior_low = min(safe_float(c["l"]) for c in prior_candles)
+    for i in range(lookback, len(cols)):
+        prior_high = window_highs[i - 1]
+        prior_low = window_lows[i - 1]
 
-        curr_h = safe_float(current["h"])
-        curr_l = safe_float(current["l"])
+        curr_h = cols.h[i]
+        curr_l = cols.l[i]
 
         swept_high = curr_h > prior_high
         swept_low = curr_l < prior_low
 
         if swept_high or swept_low:
             sweeps.append({
-                "bar_start_ms": int(current["bar_start_ms"]),
-                "bar_close_ms": int(current["bar_close_ms"]),
+                "bar_start_ms": cols.bar_start_ms[i],
+                "bar_close_ms": cols.bar_close_ms[i],
                 "swept_high": swept_high,
                 "swept_low": swept_low,
                 "prior_high": quantize(prior_high) if swept_high else None,
@@ -216,7 +318,12 @@ def detect_sweeps(candles: List[Dict], lookback: int = SWEEP_LOOKBACK) -> List[D
     return sweeps
 
 
-def detect_raid_reclaim(candles: List[Dict], block_range: float, threshold: float = RAID_RECLAIM_THRESHOLD) -> List[Dict]:
+def detect_raid_reclaim(
+    candles: List[Dict],
+    block_range: float,
+    threshold: float = RAID_RECLAIM_THRESHOLD,
+    columns: Optional[CandleColumns] = None,
+) -> List[Dict]:
     """
     Detect raid-then-reclaim patterns within block.
 
@@ -228,6 +335,7 @@ def detect_raid_reclaim(candles: List[Dict], block_range: float, threshold: floa
         candles: List of M15 candles sorted by bar_start_ms
         block_range: Full range of the 2H block
         threshold: Fraction of block range for reclaim tolerance
+        columns: Optional CandleColumns of candles (built if omitted)
 
     Returns:
         List of raid-reclaim events
@@ -235,32 +343,32 @@ def detect_raid_reclaim(candles: List[Dict], block_range: float, threshold: floa
     if not candles or block_range == 0:
         return []
 
+    cols = columns if columns is not None else CandleColumns.from_candles(candles)
     reclaim_tolerance = threshold * block_range
     raid_reclaims = []
 
-    # Track running highs and lows
-    for i in range(1, len(candles)):
-        current = candles[i]
-        prior_candles = candles[:i]
+    # Running highs and lows: prior extremes for candle i are at i - 1
+    running_highs = rolling_max(cols.h)
+    running_lows = rolling_min(cols.l)
+    closes = cols.c
 
-        prior_high = max(safe_float(c["h"]) for c in prior_candles)
-        prior_low = min(safe_float(c["l"]) for c in prior_candles)
+    for i in range(1, len(cols)):
+        prior_high = running_highs[i - 1]
+        prior_low = running_lows[i - 1]
 
-        curr_h = safe_float(current["h"])
-        curr_l = safe_float(current["l"])
-        curr_c = safe_float(current["c"])
+        curr_h = cols.h[i]
+        curr_l = cols.l[i]
 
         # Check for raid high then reclaim
         if curr_h > prior_high:
             # Check if any subsequent candle closes back near prior high
-            for j in range(i + 1, len(candles)):
-                later = candles[j]
-                later_c = safe_float(later["c"])
+            for j in range(i + 1, len(cols)):
+                later_c = closes[j]
                 if abs(later_c - prior_high) <= reclaim_tolerance:
                     raid_reclaims.append({
                         "type": "raid_high_reclaim",
-                        "raid_bar_start_ms": int(current["bar_start_ms"]),
-                        "reclaim_bar_start_ms": int(later["bar_start_ms"]),
+                        "raid_bar_start_ms": cols.bar_start_ms[i],
+                        "reclaim_bar_start_ms": cols.bar_start_ms[j],
                         "prior_high": quantize(prior_high),
                         "raid_high": quantize(curr_h),
                         "reclaim_close": quantize(later_c),
@@ -269,14 +377,13 @@ def detect_raid_reclaim(candles: List[Dict], block_range: float, threshold: floa
 
         # Check for raid low then reclaim
         if curr_l < prior_low:
-            for j in range(i + 1, len(candles)):
-                later = candles[j]
-                later_c = safe_float(later["c"])
+            for j in range(i + 1, len(cols)):
+                later_c = closes[j]
                 if abs(later_c - prior_low) <= reclaim_tolerance:
                     raid_reclaims.append({
                         "type": "raid_low_reclaim",
-                        "raid_bar_start_ms": int(current["bar_start_ms"]),
-                        "reclaim_bar_start_ms": int(later["bar_start_ms"]),
+                        "raid_bar_start_ms": cols.bar_start_ms[i],
+                        "reclaim_bar_start_ms": cols.bar_start_ms[j],
                         "prior_low": quantize(prior_low),
                         "raid_low": quantize(curr_l),
                         "reclaim_close": quantize(later_c),
@@ -310,26 +417,28 @@ def compute_microstructure_overlay(block_id: str, candles: List[Dict], block_met
     # Ensure candles are sorted
     sorted_candles = sorted(candles, key=lambda c: int(c["bar_start_ms"]))
 
+    columns = CandleColumns.from_candles(sorted_candles)
+
     # Compute block range
-    all_highs = [safe_float(c["h"]) for c in sorted_candles]
-    all_lows = [safe_float(c["l"]) for c in sorted_candles]
-    block_high = max(all_highs)
-    block_low = min(all_lows)
+    block_high = max(columns.h)
+    block_low = min(columns.l)
     block_range = block_high - block_low
 
     # Wick dominance sequence
     wick_sequence = []
-    for candle in sorted_candles:
+    for i, bar_start_ms in enumerate(columns.bar_start_ms):
         wick_sequence.append({
-            "bar_start_ms": int(candle["bar_start_ms"]),
-            "wick_dominance": classify_wick_dominance(candle),
+            "bar_start_ms": bar_start_ms,
+            "wick_dominance": wick_dominance(columns.o[i], columns.h[i], columns.l[i], columns.c[i]),
         })
 
     # Sweep detection
-    sweeps = detect_sweeps(sorted_candles, lookback=SWEEP_LOOKBACK)
+    sweeps = detect_sweeps(sorted_candles, lookback=SWEEP_LOOKBACK, columns=columns)
 
     # Raid-reclaim detection
-    raid_reclaims = detect_raid_reclaim(sorted_candles, block_range, threshold=RAID_RECLAIM_THRESHOLD)
+    raid_reclaims = detect_raid_reclaim(
+        sorted_candles, block_range, threshold=RAID_RECLAIM_THRESHOLD, columns=columns
+    )
 
     return {
         "block_id": block_id,
@@ -410,6 +519,64 @@ def detect_fair_value_gaps(candles: List[Dict], min_gap_size: float = FVG_MIN_SI
     return fvgs
 
 
+class MitigationIndex:
+    """
+    First-overlap search over columnar M15 candles for FVG mitigation.
+
+    Holds bar_start_ms, low and high columns plus sparse tables of range-min
+    lows and range-max highs (level k covers windows of 2**k candles). A query
+    bisects to the first candle after formation, then binary-lifts through the
+    tables to the first candle with low <= gap_high and to the first with
+    high >= gap_low; when these differ, price jumped clean across the zone and
+    the search resumes from the later one. Each step is O(log N).
+
+    Candles must be sorted by bar_start_ms.
+    """
+
+    def __init__(self, candles: List[Dict]):
+        self.bar_start_ms = [int(candle["bar_start_ms"]) for candle in candles]
+        self.lows = [safe_float(candle["l"]) for candle in candles]
+        self.highs = [safe_float(candle["h"]) for candle in candles]
+        self.low_min = self._sparse_table(self.lows, min)
+        self.high_max = self._sparse_table(self.highs, max)
+
+    @staticmethod
+    def _sparse_table(values: List[float], op) -> List[List[float]]:
+        levels = [values]
+        step = 1
+        while 2 * step <= len(values):
+            prev = levels[-1]
+            levels.append(list(map(op, prev, prev[step:])))
+            step *= 2
+        return levels
+
+    def _first_low_at_most(self, pos: int, price: float) -> int:
+        for k in range(len(self.low_min) - 1, -1, -1):
+            level = self.low_min[k]
+            if pos < len(level) and level[pos] > price:
+                pos += 1 << k
+        return pos
+
+    def _first_high_at_least(self, pos: int, price: float) -> int:
+        for k in range(len(self.high_max) - 1, -1, -1):
+            level = self.high_max[k]
+            if pos < len(level) and level[pos] < price:
+                pos += 1 << k
+        return pos
+
+    def first_overlap_ms(self, after_ms: int, gap_low: float, gap_high: float) -> Optional[int]:
+        """bar_start_ms of the first candle after after_ms overlapping [gap_low, gap_high], else None."""
+        n = len(self.bar_start_ms)
+        pos = bisect_right(self.bar_start_ms, after_ms)
+        while pos < n:
+            below = self._first_low_at_most(pos, gap_high)
+            above = self._first_high_at_least(pos, gap_low)
+            if below == above:
+                return self.bar_start_ms[below] if below < n else None
+            pos = max(below, above)
+        return None
+
+
 def detect_mitigation_events(fvgs: List[Dict], candles: List[Dict]) -> List[Dict]:
     """
     Detect when FVGs are mitigated (price revisits gap zone).
@@ -423,27 +590,48 @@ def detect_mitigation_events(fvgs: List[Dict], candles: List[Dict]) -> List[Dict
     Returns:
         Updated FVG list with mitigation flags
     """
+    if not fvgs:
+        return fvgs
+
+    index = MitigationIndex(candles)
     for fvg in fvgs:
-        gap_low = fvg["gap_low"]
-        gap_high = fvg["gap_high"]
-        end_bar_ms = fvg["end_bar_ms"]
+        mitigation_bar_ms = index.first_overlap_ms(fvg["end_bar_ms"], fvg["gap_low"], fvg["gap_high"])
+        if mitigation_bar_ms is not None:
+            fvg["mitigated"] = True
+            fvg["mitigation_bar_ms"] = mitigation_bar_ms
+
+    return fvgs
 
-        # Check all candles after FVG formation
-        for candle in candles:
-            bar_ms = int(candle["bar_start_ms"])
-            if bar_ms <= end_bar_ms:
-                continue
 
-            candle_h = safe_float(candle["h"])
-            candle_l = safe_float(candle["l"])
+def rolling_median(values: List[float], window: int) -> List[float]:
+    """
+    Median of every full window values[j:j + window], for j = 0..len(values) - window.
 
-            # Check if candle range overlaps gap zone
-            if candle_l <= gap_high and candle_h >= gap_low:
-                fvg["mitigated"] = True
-                fvg["mitigation_bar_ms"] = bar_ms
-                break
+    Keeps one sorted window, updated with bisect insort/remove, instead of
+    sorting each window from scratch: O(n log w) comparisons. Each result is
+    computed exactly as statistics.median() computes it for that window.
 
-    return fvgs
+    Args:
+        values: Input series
+        window: Window size (>= 1)
+
+    Returns:
+        List of len(values) - window + 1 medians (empty if the series is shorter)
+    """
+    if window < 1 or len(values) < window:
+        return []
+
+    ordered = sorted(values[:window])
+    mid = window // 2
+    odd = window % 2 == 1
+    medians = []
+    for j in range(window, len(values) + 1):
+        medians.append(ordered[mid] if odd else (ordered[mid - 1] + ordered[mid]) / 2)
+        if j == len(values):
+            break
+        del ordered[bisect_left(ordered, values[j - window])]
+        insort(ordered, values[j])
+    return medians
 
 
 def detect_displacement_candles(candles: List[Dict], window: int = DISPLACEMENT_WINDOW, threshold: float = DISPLACEMENT_THRESHOLD_MULTIPLIER) -> List[Dict]:
@@ -460,26 +648,29 @@ def detect_displacement_candles(candles: List[Dict], window: int = DISPLACEMENT_
     Returns:
         List of displacement events
     """
-    if len(candles) < window:
+    # A series of exactly `window` candles has no candle after its first window
+    if len(candles) <= window:
         return []
 
     displacements = []
 
+    ranges = [safe_float(c["h"]) - safe_float(c["l"]) for c in candles]
+    # medians[k] covers ranges[k:k + window], i.e. the window before candle k + window
+    medians = rolling_median(ranges, window)
+
     for i in range(window, len(candles)):
-        window_candles = candles[i - window:i]
-        ranges = [safe_float(c["h"]) - safe_float(c["l"]) for c in window_candles]
-        rolling_median = median(ranges)
+        rolling_median_value = medians[i - window]
 
         current = candles[i]
-        current_range = safe_float(current["h"]) - safe_float(current["l"])
+        current_range = ranges[i]
 
-        if rolling_median > 0 and current_range > threshold * rolling_median:
+        if rolling_median_value > 0 and current_range > threshold * rolling_median_value:
             displacements.append({
                 "bar_start_ms": int(current["bar_start_ms"]),
                 "bar_close_ms": int(current["bar_close_ms"]),
                 "range": quantize(current_range),
-                "rolling_median": quantize(rolling_median),
-                "ratio": quantize(current_range / rolling_median, precision=2),
+                "rolling_median": quantize(rolling_median_value),
+                "ratio": quantize(current_range / rolling_median_value, precision=2),
                 "bullish": safe_float(current["c"]) > safe_float(current["o"]),
             })
 
@@ -556,23 +747,24 @@ def quantize_price(price: float, bucket_size: float = LIQUIDITY_BUCKET_SIZE) ->
     return round(price / bucket_size) * bucket_size
 
 
-def detect_repeated_touches(candles: List[Dict], threshold: float = TOUCH_THRESHOLD) -> Dict[float, int]:
+def detect_repeated_touches(
+    candles: List[Dict], threshold: float = TOUCH_THRESHOLD, columns: Optional[CandleColumns] = None
+) -> Dict[float, int]:
     """
     Detect repeated touches at price levels (liquidity pools).
 
     Args:
         candles: List of M15 candles sorted by bar_start_ms
         threshold: Price tolerance for counting as same level
+        columns: Optional CandleColumns of candles (built if omitted)
 
     Returns:
         Dict mapping quantized price level to touch count
     """
+    cols = columns if columns is not None else CandleColumns.from_candles(candles)
     level_touches = defaultdict(int)
 
-    for candle in candles:
-        h = safe_float(candle["h"])
-        l = safe_float(candle["l"])
-
+    for h, l in zip(cols.h, cols.l):
         # Count high and low as touches
         high_level = quantize_price(h, LIQUIDITY_BUCKET_SIZE)
         low_level = quantize_price(l, LIQUIDITY_BUCKET_SIZE)
@@ -583,7 +775,9 @@ def detect_repeated_touches(candles: List[Dict], threshold: float = TOUCH_THRESH
     return dict(level_touches)
 
 
-def detect_compression_zones(candles: List[Dict], min_cluster_size: int = 3) -> List[Dict]:
+def detect_compression_zones(
+    candles: List[Dict], min_cluster_size: int = 3, columns: Optional[CandleColumns] = None
+) -> List[Dict]:
     """
     Detect compression zones (reduced range clusters).
 
@@ -592,6 +786,7 @@ def detect_compression_zones(candles: List[Dict], min_cluster_size: int = 3) ->
     Args:
         candles: List of M15 candles sorted by bar_start_ms
         min_cluster_size: Minimum consecutive candles to qualify as compression
+        columns: Optional CandleColumns of candles (built if omitted)
 
     Returns:
         List of compression zone events
@@ -599,7 +794,8 @@ def detect_compression_zones(candles: List[Dict], min_cluster_size: int = 3) ->
     if len(candles) < min_cluster_size:
         return []
 
-    ranges = [safe_float(c["h"]) - safe_float(c["l"]) for c in candles]
+    cols = columns if columns is not None else CandleColumns.from_candles(candles)
+    ranges = [h - l for h, l in zip(cols.h, cols.l)]
     avg_range = sum(ranges) / len(ranges)
     threshold = avg_range * 0.5  # Below 50% of average
 
@@ -639,37 +835,42 @@ def detect_compression_zones(candles: List[Dict], min_cluster_size: int = 3) ->
     return compressions
 
 
-def detect_breakout_failures(candles: List[Dict], lookback: int = 5) -> List[Dict]:
+def detect_breakout_failures(
+    candles: List[Dict], lookback: int = 5, columns: Optional[CandleColumns] = None
+) -> List[Dict]:
     """
     Detect breakout-failure events (take high/low then reverse).
 
     Args:
         candles: List of M15 candles sorted by bar_start_ms
         lookback: Number of candles to look back for prior high/low
+        columns: Optional CandleColumns of candles (built if omitted)
 
     Returns:
         List of breakout-failure events
     """
+    cols = columns if columns is not None else CandleColumns.from_candles(candles)
     failures = []
+    if len(cols) <= lookback + 1:
+        return failures
 
-    for i in range(lookback, len(candles) - 1):  # Need at least one candle after
-        current = candles[i]
-        prior = candles[i - lookback:i]
-        next_candle = candles[i + 1]
+    window_highs = rolling_max(cols.h, lookback)
+    window_lows = rolling_min(cols.l, lookback)
 
-        prior_high = max(safe_float(c["h"]) for c in prior)
-        prior_low = min(safe_float(c["l"]) for c in prior)
+    for i in range(lookback, len(cols) - 1):  # Need at least one candle after
+        prior_high = window_highs[i - 1]
+        prior_low = window_lows[i - 1]
 
-        curr_h = safe_float(current["h"])
-        curr_l = safe_float(current["l"])
-        next_c = safe_float(next_candle["c"])
+        curr_h = cols.h[i]
+        curr_l = cols.l[i]
+        next_c = cols.c[i + 1]
 
         # Breakout high then failure (next candle closes below prior high)
         if curr_h > prior_high and next_c < prior_high:
             failures.append({
                 "type": "breakout_high_failure",
-                "breakout_bar_ms": int(current["bar_start_ms"]),
-                "failure_bar_ms": int(next_candle["bar_start_ms"]),
+                "breakout_bar_ms": cols.bar_start_ms[i],
+                "failure_bar_ms": cols.bar_start_ms[i + 1],
                 "prior_high": quantize(prior_high),
                 "breakout_high": quantize(curr_h),
                 "failure_close": quantize(next_c),
@@ -679,8 +880,8 @@ def detect_breakout_failures(candles: List[Dict], lookback: int = 5) -> List[Dic
         if curr_l < prior_low and next_c > prior_low:
             failures.append({
                 "type": "breakout_low_failure",
-                "breakout_bar_ms": int(current["bar_start_ms"]),
-                "failure_bar_ms": int(next_candle["bar_start_ms"]),
+                "breakout_bar_ms": cols.bar_start_ms[i],
+                "failure_bar_ms": cols.bar_start_ms[i + 1],
                 "prior_low": quantize(prior_low),
                 "breakout_low": quantize(curr_l),
                 "failure_close": quantize(next_c),
@@ -713,14 +914,16 @@ def compute_liquidity_gradient(block_id: str, candles: List[Dict], block_meta: D
     # Ensure sorted
     sorted_candles = sorted(candles, key=lambda c: int(c["bar_start_ms"]))
 
+    columns = CandleColumns.from_candles(sorted_candles)
+
     # Repeated touches (liquidity pools)
-    level_histogram = detect_repeated_touches(sorted_candles, threshold=TOUCH_THRESHOLD)
+    level_histogram = detect_repeated_touches(sorted_candles, threshold=TOUCH_THRESHOLD, columns=columns)
 
     # Compression zones
-    compressions = detect_compression_zones(sorted_candles, min_cluster_size=3)
+    compressions = detect_compression_zones(sorted_candles, min_cluster_size=3, columns=columns)
 
     # Breakout failures
-    failures = detect_breakout_failures(sorted_candles, lookback=5)
+    failures = detect_breakout_failures(sorted_candles, lookback=5, columns=columns)
 
     # Convert level histogram to sorted list for deterministic output
     level_histogram_list = [
@@ -743,7 +946,316 @@ def compute_liquidity_gradient(block_id: str, candles: List[Dict], block_meta: D
 # Overlay Orchestration
 # ============================================================================
 
-def write_overlay_outputs(pack_root: Path, blocks: List[Dict], m15_by_block: Dict[str, List[Dict]], all_m15_candles: List[Dict]) -> Dict[str, int]:
+def pretty_json(obj: Dict) -> str:
+    """Per-block file encoding ("files" layout)."""
+    return json.dumps(obj, indent=2, sort_keys=True, separators=(",", ":"))
+
+
+def canonical_json(obj: Dict) -> str:
+    """Compact canonical encoding (JSONL records, indexes)."""
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"))
+
+
+def packed_paths(overlays_root: Path, module: str) -> tuple:
+    """(records JSONL, offset index) paths of a per-block module's packed container."""
+    module_dir = overlays_root / PER_BLOCK_MODULE_DIRS[module]
+    return (
+        module_dir.with_name(f"{module_dir.name}.jsonl"),
+        module_dir.with_name(f"{module_dir.name}.index.json"),
+    )
+
+
+def write_packed_module(overlays_root: Path, module: str, records: List[Dict]) -> int:
+    """
+    Write one per-block module as a packed container.
+
+    Records are sorted by block_id and written as canonical JSONL; the index
+    maps each block_id to the byte offset and length of its line.
+
+    Returns:
+        Number of records written
+    """
+    jsonl_path, index_path = packed_paths(overlays_root, module)
+    jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+
+    entries = []
+    offset = 0
+    with jsonl_path.open("wb") as f:
+        for record in sorted(records, key=lambda r: r["block_id"]):
+            line = canonical_json(record).encode("utf-8")
+            entries.append([record["block_id"], offset, len(line)])
+            f.write(line + b"\n")
+            offset += len(line) + 1
+
+    index = {
+        "format": PACKED_FORMAT,
+        "module": module,
+        "records_file": jsonl_path.name,
+        "records": entries,
+    }
+    index_path.write_text(canonical_json(index) + "\n", encoding="utf-8")
+    return len(entries)
+
+
+class PackedOverlayReader:
+    """
+    Random access to a packed per-block module by block_id.
+
+    Usage:
+        with PackedOverlayReader(pack_root, "v0.3-A") as reader:
+            overlay = reader.get("20221211-A-GBPUSD")
+    """
+
+    def __init__(self, pack_root: Path, module: str):
+        overlays_root = Path(pack_root) / "overlays_v0_3"
+        self.jsonl_path, self.index_path = packed_paths(overlays_root, module)
+        index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        if index.get("format") != PACKED_FORMAT or index.get("module") != module:
+            raise ValueError(f"Not a {PACKED_FORMAT} index for {module}: {self.index_path}")
+        self.module = module
+        self._offsets = {block_id: (offset, length) for block_id, offset, length in index["records"]}
+        self._order = [entry[0] for entry in index["records"]]
+        self._handle = None
+
+    def __enter__(self) -> "PackedOverlayReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, block_id: str) -> bool:
+        return block_id in self._offsets
+
+    def block_ids(self) -> List[str]:
+        return list(self._order)
+
+    def get(self, block_id: str) -> Dict:
+        """Overlay record for block_id (KeyError if absent)."""
+        offset, length = self._offsets[block_id]
+        if self._handle is None:
+            self._handle = self.jsonl_path.open("rb")
+        self._handle.seek(offset)
+        return json.loads(self._handle.read(length).decode("utf-8"))
+
+    def __iter__(self) -> Iterator[Dict]:
+        """All records in block_id order (sequential read)."""
+        with self.jsonl_path.open("r", encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line)
+
+
+def read_block_overlay(pack_root: Path, module: str, block_id: str) -> Dict:
+    """Read one block's v0.3-A/v0.3-C overlay from either layout (packed preferred)."""
+    overlays_root = Path(pack_root) / "overlays_v0_3"
+    if packed_paths(overlays_root, module)[1].exists():
+        with PackedOverlayReader(pack_root, module) as reader:
+            return reader.get(block_id)
+    path = overlays_root / PER_BLOCK_MODULE_DIRS[module] / f"{block_id}.json"
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def unpack_overlay_outputs(pack_root: Path, remove_packed: bool = False) -> Dict[str, int]:
+    """
+    Convert packed per-block modules to the "files" layout.
+
+    Records are re-encoded with pretty_json(), so the files are byte-identical
+    to a "files" layout build of the same inputs.
+
+    Returns:
+        Dict with files written per module
+    """
+    overlays_root = Path(pack_root) / "overlays_v0_3"
+    counts = {}
+    for module, rel_dir in PER_BLOCK_MODULE_DIRS.items():
+        jsonl_path, index_path = packed_paths(overlays_root, module)
+        if not index_path.exists():
+            continue
+        out_dir = overlays_root / rel_dir
+        out_dir.mkdir(parents=True, exist_ok=True)
+        counts[module] = 0
+        with PackedOverlayReader(pack_root, module) as reader:
+            for record in reader:
+                (out_dir / f"{record['block_id']}.json").write_text(pretty_json(record), encoding="utf-8")
+                counts[module] += 1
+        if remove_packed:
+            jsonl_path.unlink()
+            index_path.unlink()
+    return counts
+
+
+def pack_overlay_outputs(pack_root: Path, remove_files: bool = False) -> Dict[str, int]:
+    """
+    Convert "files" layout per-block modules to packed containers.
+
+    Returns:
+        Dict with records packed per module
+    """
+    overlays_root = Path(pack_root) / "overlays_v0_3"
+    counts = {}
+    for module, rel_dir in PER_BLOCK_MODULE_DIRS.items():
+        module_dir = overlays_root / rel_dir
+        if not module_dir.is_dir():
+            continue
+        paths = sorted(module_dir.glob("*.json"))
+        records = [json.loads(path.read_text(encoding="utf-8")) for path in paths]
+        counts[module] = write_packed_module(overlays_root, module, records)
+        if remove_files:
+            for path in paths:
+                path.unlink()
+            if not any(module_dir.iterdir()):
+                module_dir.rmdir()
+    return counts
+
+
+def compute_block_overlays(block: Dict, candles: List[Dict]) -> tuple:
+    """(v0.3-A overlay, v0.3-C gradient) for one block."""
+    return (
+        compute_microstructure_overlay(block_id=block["block_id"], candles=candles, block_meta=block),
+        compute_liquidity_gradient(block_id=block["block_id"], candles=candles, block_meta=block),
+    )
+
+
+def _shared_column_views(buf, total: int) -> tuple:
+    times = np.ndarray((len(OVERLAY_TIME_FIELDS), total), dtype=np.int64, buffer=buf)
+    prices = np.ndarray((len(OVERLAY_PRICE_FIELDS), total), dtype=np.float64, buffer=buf, offset=times.nbytes)
+    return times, prices
+
+
+def _read_shared_columns(shm_name: str, total: int, lo: int, hi: int) -> List[list]:
+    """Copy candle columns [lo, hi) out of the shared segment (views released before close)."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        times, prices = _shared_column_views(shm.buf, total)
+        columns = times[:, lo:hi].tolist() + prices[:, lo:hi].tolist()
+        del times, prices
+        return columns
+    finally:
+        shm.close()
+
+
+def _compute_block_shard(shm_name: str, total: int, shard: List[tuple]) -> tuple:
+    """
+    Process-pool task: per-block overlays for (block, start, end) spans of the
+    shared candle columns.
+
+    Returns:
+        (list of (v0.3-A, v0.3-C) records in shard order, compute seconds)
+    """
+    started = time.perf_counter()
+    lo = shard[0][1]
+    columns = _read_shared_columns(shm_name, total, lo, shard[-1][2])
+    fields = OVERLAY_TIME_FIELDS + OVERLAY_PRICE_FIELDS
+    records = []
+    for block, start, end in shard:
+        candles = [dict(zip(fields, values)) for values in zip(*(col[start - lo:end - lo] for col in columns))]
+        records.append(compute_block_overlays(block, candles))
+    return records, time.perf_counter() - started
+
+
+def compute_per_block_overlays(
+    blocks: List[Dict],
+    m15_by_block: Dict[str, List[Dict]],
+    workers: int = 1,
+    timing: Optional[Dict] = None,
+) -> tuple:
+    """
+    Compute v0.3-A and v0.3-C records for every block, in block order.
+
+    Both modules are intrablock-only, so blocks are independent. With
+    workers > 1, blocks are sharded (contiguously, in order) across a process
+    pool; candles are copied once into a shared-memory segment of int64/float64
+    columns (OVERLAY_TIME_FIELDS, OVERLAY_PRICE_FIELDS) instead of pickling the
+    dict lists. Shard results are gathered in submission order, so records are
+    identical to the serial path.
+
+    Args:
+        blocks: List of 2H block metadata dicts
+        m15_by_block: Dict mapping block_id to list of M15 candles
+        workers: Process count (1 = serial, in-process)
+        timing: Optional dict filled with workers, wall_seconds,
+            worker_seconds (summed per-shard compute) and
+            parallel_efficiency_estimate (worker_seconds / wall_seconds). The
+            estimate is not a measured speedup: no serial baseline is run.
+            All values are wall-clock, so recording them in meta.json makes
+            it non-reproducible.
+
+    Returns:
+        (list of v0.3-A overlays, list of v0.3-C gradients)
+    """
+    started = time.perf_counter()
+    workers = max(1, min(workers, len(blocks)))
+    results = []
+
+    if workers == 1:
+        for block in blocks:
+            results.append(compute_block_overlays(block, m15_by_block.get(block["block_id"], [])))
+        worker_seconds = time.perf_counter() - started
+    else:
+        spans = []
+        offset = 0
+        for block in blocks:
+            count = len(m15_by_block.get(block["block_id"], []))
+            spans.append((block, offset, offset + count))
+            offset += count
+        total = offset
+
+        width = len(OVERLAY_TIME_FIELDS) + len(OVERLAY_PRICE_FIELDS)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, 8 * width * total))
+        try:
+            times, prices = _shared_column_views(shm.buf, total)
+            for block, start, end in spans:
+                candles = m15_by_block.get(block["block_id"], [])
+                for row, field in enumerate(OVERLAY_TIME_FIELDS):
+                    times[row, start:end] = [int(candle[field]) for candle in candles]
+                for row, field in enumerate(OVERLAY_PRICE_FIELDS):
+                    prices[row, start:end] = [float(candle[field]) for candle in candles]
+            del times, prices
+
+            shard_count = min(len(spans), workers * SHARDS_PER_WORKER)
+            bounds = [len(spans) * i // shard_count for i in range(shard_count + 1)]
+            shards = [spans[bounds[i]:bounds[i + 1]] for i in range(shard_count)]
+            worker_seconds = 0.0
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_compute_block_shard, shm.name, total, shard) for shard in shards]
+                for future in futures:
+                    shard_records, seconds = future.result()
+                    results.extend(shard_records)
+                    worker_seconds += seconds
+        finally:
+            shm.close()
+            shm.unlink()
+
+    if timing is not None:
+        wall_seconds = time.perf_counter() - started
+        timing.update({
+            "workers": workers,
+            "wall_seconds": round(wall_seconds, 3),
+            "worker_seconds": round(worker_seconds, 3),
+            "parallel_efficiency_estimate": (
+                round(worker_seconds / wall_seconds, 2) if wall_seconds > 0 else 1.0
+            ),
+        })
+
+    return [record[0] for record in results], [record[1] for record in results]
+
+
+def write_overlay_outputs(
+    pack_root: Path,
+    blocks: List[Dict],
+    m15_by_block: Dict[str, List[Dict]],
+    all_m15_candles: List[Dict],
+    layout: str = "files",
+    workers: int = 1,
+    timing: Optional[Dict] = None,
+) -> Dict[str, int]:
     """
     Write all v0.3 overlay outputs to disk.
 
@@ -752,10 +1264,19 @@ def write_overlay_outputs(pack_root: Path, blocks: List[Dict], m15_by_block: Dic
         blocks: List of 2H block metadata dicts
         m15_by_block: Dict mapping block_id to list of M15 candles
         all_m15_candles: All M15 candles sorted by bar_start_ms (for v0.3-B)
+        layout: "files" (one JSON file per block) or "packed" (one JSONL +
+            index per per-block module); see OVERLAY_LAYOUTS
+        workers: Processes for v0.3-A/v0.3-C (see compute_per_block_overlays);
+            output is identical for any worker count
+        timing: Optional dict filled with per-block compute timing, for
+            build_overlay_metadata()
 
     Returns:
         Dict with counts of outputs written per module
     """
+    if layout not in OVERLAY_LAYOUTS:
+        raise ValueError(f"Unknown overlay layout: {layout!r} (expected one of {OVERLAY_LAYOUTS})")
+
     overlays_root = pack_root / "overlays_v0_3"
     overlays_root.mkdir(exist_ok=True)
 
@@ -765,23 +1286,21 @@ def write_overlay_outputs(pack_root: Path, blocks: List[Dict], m15_by_block: Dic
         "v0.3-C": 0,
     }
 
-    # v0.3-A: Microstructure overlay (per-block)
-    micro_dir = overlays_root / "micro" / "2h"
-    micro_dir.mkdir(parents=True, exist_ok=True)
-
-    for block in blocks:
-        block_id = block["block_id"]
-        candles = m15_by_block.get(block_id, [])
+    def emit_per_block(module: str, records: List[Dict]) -> None:
+        if layout == "packed":
+            counts[module] = write_packed_module(overlays_root, module, records)
+            return
+        module_dir = overlays_root / PER_BLOCK_MODULE_DIRS[module]
+        module_dir.mkdir(parents=True, exist_ok=True)
+        for record in records:
+            output_path = module_dir / f"{record['block_id']}.json"
+            output_path.write_text(pretty_json(record), encoding="utf-8")
+            counts[module] += 1
 
-        overlay = compute_microstructure_overlay(
-            block_id=block_id,
-            candles=candles,
-            block_meta=block
-        )
+    micro_overlays, gradients = compute_per_block_overlays(blocks, m15_by_block, workers=workers, timing=timing)
 
-        output_path = micro_dir / f"{block_id}.json"
-        output_path.write_text(json.dumps(overlay, indent=2, sort_keys=True, separators=(",", ":")), encoding="utf-8")
-        counts["v0.3-A"] += 1
+    # v0.3-A: Microstructure overlay (per-block)
+    emit_per_block("v0.3-A", micro_overlays)
 
     # v0.3-B: Displacement overlay (global JSONL)
     events_dir = overlays_root / "events"
@@ -792,37 +1311,31 @@ def write_overlay_outputs(pack_root: Path, blocks: List[Dict], m15_by_block: Dic
     displacement_path = events_dir / "displacement_fvg.jsonl"
     with displacement_path.open("w", encoding="utf-8") as f:
         for event in displacement_events:
-            f.write(json.dumps(event, sort_keys=True, separators=(",", ":")) + "\n")
+            f.write(canonical_json(event) + "\n")
     counts["v0.3-B"] = len(displacement_events)
 
     # v0.3-C: Liquidity gradient (per-block)
-    liquidity_dir = overlays_root / "micro" / "liquidity_gradient"
-    liquidity_dir.mkdir(parents=True, exist_ok=True)
-
-    for block in blocks:
-        block_id = block["block_id"]
-        candles = m15_by_block.get(block_id, [])
-
-        gradient = compute_liquidity_gradient(
-            block_id=block_id,
-            candles=candles,
-            block_meta=block
-        )
-
-        output_path = liquidity_dir / f"{block_id}.json"
-        output_path.write_text(json.dumps(gradient, indent=2, sort_keys=True, separators=(",", ":")), encoding="utf-8")
-        counts["v0.3-C"] += 1
+    emit_per_block("v0.3-C", gradients)
 
     return counts
 
 
-def build_overlay_metadata(enabled: bool, counts: Optional[Dict[str, int]] = None) -> Dict:
+def build_overlay_metadata(
+    enabled: bool,
+    counts: Optional[Dict[str, int]] = None,
+    layout: str = "files",
+    timing: Optional[Dict] = None,
+) -> Dict:
     """
     Build overlay metadata for meta.json with parameter provenance.
 
     Args:
         enabled: Whether overlays are enabled
         counts: Optional dict with counts per module
+        layout: Output layout passed to write_overlay_outputs(); recorded
+            only when not the default "files", so default meta is unchanged
+        timing: Optional per-block compute timing from write_overlay_outputs();
+            recorded as "per_block_compute" (wall-clock, so not reproducible)
 
     Returns:
         Overlay metadata dict with params section documenting all constants
@@ -834,7 +1347,7 @@ def build_overlay_metadata(enabled: bool, counts: Optional[Dict[str, int]] = Non
             "modules": [],
         }
 
-    return {
+    meta = {
         "enabled": True,
         "version": "0.3",
         "modules": ["v0.3-A", "v0.3-B", "v0.3-C"],
@@ -852,3 +1365,34 @@ def build_overlay_metadata(enabled: bool, counts: Optional[Dict[str, int]] = Non
             "intrablock_only": INTRABLOCK_ONLY,
         },
     }
+    if layout != "files":
+        meta["layout"] = layout
+    if timing:
+        meta["per_block_compute"] = dict(timing)
+    return meta
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Convert v0.3 per-block overlays between the files and packed layouts"
+    )
+    parser.add_argument("direction", choices=["pack", "unpack"], help="pack: files -> packed; unpack: packed -> files")
+    parser.add_argument("pack_root", help="Evidence pack directory containing overlays_v0_3/")
+    parser.add_argument("--remove-source", action="store_true", help="Delete the converted source layout")
+    args = parser.parse_args()
+
+    pack_root = Path(args.pack_root)
+    if not (pack_root / "overlays_v0_3").is_dir():
+        print(f"ERROR: No overlays_v0_3/ under {pack_root}")
+        return 1
+    if args.direction == "pack":
+        counts = pack_overlay_outputs(pack_root, remove_files=args.remove_source)
+    else:
+        counts = unpack_overlay_outputs(pack_root, remove_packed=args.remove_source)
+    for module, count in sorted(counts.items()):
+        print(f"{module}: {count} block(s) {args.direction}ed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Path 1 Base Table Refresh (incremental, per symbol)
+
+Maintains derived.path1_base_v0_1 (sql/09_derived_path1_base_v0_1.sql), the
+materialized C1/C2 + Option C outcome rows behind the Path 1 score and
+evidence views.
+
+Incremental refresh is driven by a per-symbol bar_close_ms watermark:
+  - Blocks closing after the watermark are new and are inserted.
+  - Forward outcomes of the last OUTCOME_HORIZON_BARS materialized rows were
+    computed with an incomplete forward window, so those rows are restated.
+  - Earlier rows are final: C1/C2/C3 features only look back, and their
+    outcome windows are already complete.
+A symbol is rebuilt in full when it has no watermark yet, when --full is
+given, or when history at or before the watermark changed:
+  - the source view has a different number of rows there than the base table
+    (late backfill, or blocks dropped from C1/C2), or
+  - max(ingest_ts) of the blocks there moved. Backfills upsert with
+    ON CONFLICT DO UPDATE ... ingest_ts = now(), so corrected OHLC for an
+    existing block keeps the row count but not the ingest timestamp.
+
+Each symbol is refreshed in its own transaction under an advisory lock, so
+readers never see a half-refreshed symbol.
+
+Usage:
+    python scripts/path1/refresh_path1_base.py [--symbol SYM ...] [--full] [--dry-run] [--skip-if-missing]
+    python scripts/path1/refresh_path1_base.py --check-parity [--symbol SYM ...]
+
+Environment:
+    DATABASE_URL or NEON_DSN: PostgreSQL connection string
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+BASE_TABLE = "derived.path1_base_v0_1"
+SOURCE_VIEW = "derived.v_path1_base_source_v0_1"
+WATERMARK_TABLE = "derived.path1_base_watermarks_v0_1"
+BLOCKS_TABLE = "ovc.ovc_blocks_v01_1_min"
+MIGRATION_FILE = "sql/09_derived_path1_base_v0_1.sql"
+
+# Longest forward window in derived.v_ovc_c_outcomes_v0_1 (fwd_ret_6, mfe_6, mae_6, rvol_6)
+OUTCOME_HORIZON_BARS = 6
+
+
+@dataclass
+class RefreshPlan:
+    """What a refresh will do for one symbol."""
+
+    sym: str
+    mode: str  # 'full', 'incremental' or 'noop'
+    reason: str
+    restate_from_ms: Optional[int] = None
+
+
+@dataclass
+class RefreshResult:
+    sym: str
+    mode: str
+    rows_written: int
+    watermark_ms: Optional[int]
+    row_count: int
+
+
+@dataclass
+class ParityResult:
+    """Rows in the base table but not the live source (stale) and vice versa (missing)."""
+
+    sym: str
+    stale_rows: int
+    missing_rows: int
+
+    @property
+    def ok(self) -> bool:
+        return self.stale_rows == 0 and self.missing_rows == 0
+
+
+def validate_environment() -> str:
+    db_url = os.environ.get("DATABASE_URL") or os.environ.get("NEON_DSN")
+    if not db_url:
+        raise RuntimeError("DATABASE_URL or NEON_DSN environment variable not set")
+    return db_url
+
+
+# ============================================================================
+# PLANNING
+# ============================================================================
+
+def decide_refresh(
+    sym: str,
+    watermark: Optional[tuple],
+    source_max_ms: Optional[int],
+    source_rows_to_watermark: int,
+    source_ingest_ts,
+    restate_from_ms: Optional[int],
+    force_full: bool = False,
+) -> RefreshPlan:
+    """
+    Pure refresh decision for one symbol.
+
+    watermark: (watermark_ms, row_count, source_ingest_ts) from the watermark
+        table, or None.
+    source_max_ms: max bar_close_ms of the symbol's canonical blocks.
+    source_rows_to_watermark: source view rows with bar_close_ms <= watermark_ms
+        (compared with the base row_count).
+    source_ingest_ts: max ingest_ts of the canonical blocks with
+        bar_close_ms <= watermark_ms.
+    restate_from_ms: bar_close_ms of the OUTCOME_HORIZON_BARS-th newest base
+        row, or None if the symbol has fewer base rows than that.
+    """
+    if force_full:
+        return RefreshPlan(sym, "full", "forced")
+    if watermark is None:
+        return RefreshPlan(sym, "full", "no watermark")
+    watermark_ms, row_count, watermark_ingest_ts = watermark
+    if source_rows_to_watermark != row_count:
+        return RefreshPlan(
+            sym, "full",
+            f"source rows at or before watermark changed ({row_count} -> {source_rows_to_watermark})",
+        )
+    if watermark_ingest_ts is None or source_ingest_ts != watermark_ingest_ts:
+        return RefreshPlan(
+            sym, "full",
+            f"blocks at or before watermark re-ingested ({watermark_ingest_ts} -> {source_ingest_ts})",
+        )
+    if source_max_ms is None or source_max_ms <= watermark_ms:
+        return RefreshPlan(sym, "noop", "up to date")
+    if restate_from_ms is None:
+        return RefreshPlan(sym, "full", f"fewer than {OUTCOME_HORIZON_BARS} materialized rows")
+    return RefreshPlan(
+        sym, "incremental", f"new blocks after {watermark_ms}", restate_from_ms=restate_from_ms
+    )
+
+
+def plan_refresh(cur, sym: str, force_full: bool = False) -> RefreshPlan:
+    cur.execute(
+        f"SELECT watermark_ms, row_count, source_ingest_ts FROM {WATERMARK_TABLE} WHERE sym = %s",
+        (sym,),
+    )
+    row = cur.fetchone()
+    watermark = (int(row[0]), int(row[1]), row[2]) if row else None
+
+    cur.execute(f"SELECT MAX(bar_close_ms) FROM {BLOCKS_TABLE} WHERE sym = %s", (sym,))
+    source_max_ms = cur.fetchone()[0]
+
+    source_rows_to_watermark = 0
+    source_ingest_ts = None
+    restate_from_ms = None
+    if watermark is not None:
+        cur.execute(
+            f"SELECT COUNT(*) FROM {SOURCE_VIEW} WHERE sym = %s AND bar_close_ms <= %s",
+            (sym, watermark[0]),
+        )
+        source_rows_to_watermark = int(cur.fetchone()[0])
+        source_ingest_ts = _source_ingest_ts(cur, sym, watermark[0])
+        cur.execute(
+            f"SELECT bar_close_ms FROM {BASE_TABLE} WHERE sym = %s "
+            f"ORDER BY bar_close_ms DESC OFFSET %s LIMIT 1",
+            (sym, OUTCOME_HORIZON_BARS - 1),
+        )
+        row = cur.fetchone()
+        restate_from_ms = int(row[0]) if row else None
+
+    return decide_refresh(
+        sym, watermark, source_max_ms, source_rows_to_watermark, source_ingest_ts,
+        restate_from_ms, force_full,
+    )
+
+
+def _source_ingest_ts(cur, sym: str, watermark_ms: int):
+    """Latest ingest_ts among the symbol's blocks at or before watermark_ms."""
+    cur.execute(
+        f"SELECT MAX(ingest_ts) FROM {BLOCKS_TABLE} WHERE sym = %s AND bar_close_ms <= %s",
+        (sym, watermark_ms),
+    )
+    return cur.fetchone()[0]
+
+
+# ============================================================================
+# REFRESH
+# ============================================================================
+
+def apply_refresh(cur, plan: RefreshPlan) -> int:
+    """Restate the planned rows for plan.sym; returns rows written."""
+    if plan.mode == "noop":
+        return 0
+    if plan.mode == "full":
+        cur.execute(f"DELETE FROM {BASE_TABLE} WHERE sym = %s", (plan.sym,))
+        cur.execute(
+            f"INSERT INTO {BASE_TABLE} SELECT * FROM {SOURCE_VIEW} WHERE sym = %s",
+            (plan.sym,),
+        )
+    else:
+        cur.execute(
+            f"DELETE FROM {BASE_TABLE} WHERE sym = %s AND bar_close_ms >= %s",
+            (plan.sym, plan.restate_from_ms),
+        )
+        cur.execute(
+            f"INSERT INTO {BASE_TABLE} SELECT * FROM {SOURCE_VIEW} "
+            f"WHERE sym = %s AND bar_close_ms >= %s",
+            (plan.sym, plan.restate_from_ms),
+        )
+    return cur.rowcount
+
+
+def refresh_symbol(conn, sym: str, force_full: bool = False, dry_run: bool = False) -> RefreshResult:
+    """Plan and apply one symbol's refresh in a single transaction."""
+    with conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", (f"{BASE_TABLE}:{sym}",))
+            plan = plan_refresh(cur, sym, force_full)
+            print(f"  {sym}: {plan.mode} ({plan.reason})")
+            if dry_run or plan.mode == "noop":
+                return RefreshResult(sym, plan.mode, 0, None, 0)
+
+            rows_written = apply_refresh(cur, plan)
+            cur.execute(
+                f"SELECT MAX(bar_close_ms), COUNT(*) FROM {BASE_TABLE} WHERE sym = %s",
+                (sym,),
+            )
+            watermark_ms, row_count = cur.fetchone()
+            if watermark_ms is None:
+                cur.execute(f"DELETE FROM {WATERMARK_TABLE} WHERE sym = %s", (sym,))
+            else:
+                source_ingest_ts = _source_ingest_ts(cur, sym, watermark_ms)
+                cur.execute(
+                    f"""
+                    INSERT INTO {WATERMARK_TABLE}
+                        (sym, watermark_ms, row_count, source_ingest_ts, refresh_mode,
+                         restated_from_ms, refreshed_at)
+                    VALUES (%s, %s, %s, %s, %s, %s, now())
+                    ON CONFLICT (sym) DO UPDATE SET
+                        watermark_ms = EXCLUDED.watermark_ms,
+                        row_count = EXCLUDED.row_count,
+                        source_ingest_ts = EXCLUDED.source_ingest_ts,
+                        refresh_mode = EXCLUDED.refresh_mode,
+                        restated_from_ms = EXCLUDED.restated_from_ms,
+                        refreshed_at = EXCLUDED.refreshed_at
+                    """,
+                    (sym, watermark_ms, row_count, source_ingest_ts, plan.mode, plan.restate_from_ms),
+                )
+    return RefreshResult(sym, plan.mode, rows_written, watermark_ms, int(row_count))
+
+
+# ============================================================================
+# PARITY
+# ============================================================================
+
+def check_parity(conn, sym: str) -> ParityResult:
+    """Compare the base table with the live source view for one symbol (EXCEPT ALL both ways)."""
+    with conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT
+                    (SELECT COUNT(*) FROM (
+                        SELECT * FROM {BASE_TABLE} WHERE sym = %(sym)s
+                        EXCEPT ALL
+                        SELECT * FROM {SOURCE_VIEW} WHERE sym = %(sym)s
+                    ) stale),
+                    (SELECT COUNT(*) FROM (
+                        SELECT * FROM {SOURCE_VIEW} WHERE sym = %(sym)s
+                        EXCEPT ALL
+                        SELECT * FROM {BASE_TABLE} WHERE sym = %(sym)s
+                    ) missing)
+                """,
+                {"sym": sym},
+            )
+            stale_rows, missing_rows = cur.fetchone()
+    return ParityResult(sym, int(stale_rows), int(missing_rows))
+
+
+def missing_relations(conn) -> List[str]:
+    """Base/watermark tables that do not exist yet (migration 09 not applied)."""
+    with conn:
+        with conn.cursor() as cur:
+            missing = []
+            for relation in (BASE_TABLE, WATERMARK_TABLE):
+                cur.execute("SELECT to_regclass(%s)", (relation,))
+                if cur.fetchone()[0] is None:
+                    missing.append(relation)
+            return missing
+
+
+def refresh_before_study(db_url: str, symbols: Iterable[str]) -> None:
+    """
+    Refresh the given symbols before a runner queries the evidence views.
+
+    Prints a notice and does nothing until the migration is applied (the views
+    then still compute from live sources).
+    """
+    import psycopg2
+
+    conn = psycopg2.connect(db_url)
+    try:
+        missing = missing_relations(conn)
+        if missing:
+            print(f"NOTICE: {', '.join(missing)} not found; evidence views read live sources.")
+            return
+        print(f"Refreshing {BASE_TABLE} before studies")
+        for sym in sorted(set(symbols)):
+            refresh_symbol(conn, sym)
+    finally:
+        conn.close()
+
+
+def list_symbols(conn) -> List[str]:
+    with conn:
+        with conn.cursor() as cur:
+            cur.execute(f"SELECT DISTINCT sym FROM {BLOCKS_TABLE} ORDER BY sym")
+            return [row[0] for row in cur.fetchall()]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Refresh the Path 1 materialized base table")
+    parser.add_argument(
+        "--symbol", action="append", dest="symbols",
+        help="Symbol to refresh (repeatable; default: all symbols in the blocks table)",
+    )
+    parser.add_argument("--full", action="store_true", help="Rebuild the selected symbols in full")
+    parser.add_argument("--dry-run", action="store_true", help="Print the refresh plan only")
+    parser.add_argument(
+        "--check-parity", action="store_true",
+        help="Compare the base table with the live source view instead of refreshing",
+    )
+    parser.add_argument(
+        "--skip-if-missing", action="store_true",
+        help=f"Exit 0 with a notice when {BASE_TABLE} does not exist ({MIGRATION_FILE} not applied)",
+    )
+    args = parser.parse_args()
+
+    try:
+        db_url = validate_environment()
+    except RuntimeError as exc:
+        print(f"ERROR: {exc}")
+        return 1
+
+    import psycopg2
+
+    try:
+        conn = psycopg2.connect(db_url)
+    except Exception as exc:
+        print(f"ERROR: Failed to connect to database: {exc}")
+        return 1
+
+    try:
+        missing = missing_relations(conn)
+        if missing:
+            status = "SKIP" if args.skip_if_missing else "ERROR"
+            print(
+                f"{status}: {', '.join(missing)} not found; apply {MIGRATION_FILE} first. "
+                f"Until then the Path 1 score and evidence views compute from live sources "
+                f"and need no refresh."
+            )
+            return 0 if args.skip_if_missing else 1
+
+        symbols = args.symbols or list_symbols(conn)
+        if args.check_parity:
+            print(f"Parity check: {BASE_TABLE} vs {SOURCE_VIEW}")
+            failed = 0
+            for sym in symbols:
+                result = check_parity(conn, sym)
+                status = "OK" if result.ok else "MISMATCH"
+                print(f"  {sym}: {status} (stale={result.stale_rows}, missing={result.missing_rows})")
+                failed += not result.ok
+            return 1 if failed else 0
+
+        print(f"Refreshing {BASE_TABLE} ({len(symbols)} symbols)")
+        for sym in symbols:
+            result = refresh_symbol(conn, sym, force_full=args.full, dry_run=args.dry_run)
+            if result.rows_written:
+                print(
+                    f"    wrote {result.rows_written} rows; "
+                    f"watermark={result.watermark_ms} rows={result.row_count}"
+                )
+    except psycopg2.Error as exc:
+        print(f"ERROR: {(exc.pgerror or str(exc)).strip()}")
+        return 1
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
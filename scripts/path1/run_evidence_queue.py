@@ -8,8 +8,8 @@ Replicates exact behavior of manual Runs 001-003:
 - Environment validation
 - Data availability check (with substitution)
 - SQL wrapper generation
-- psql study execution
-- Output capture
+- Study execution (in-process, one psycopg2 connection; see study_executor.py)
+- Output capture (rendered in psql aligned format)
 - Report generation (RUN.md, evidence markdowns)
 - INDEX.md append-only update
 
@@ -30,6 +30,15 @@ from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+import refresh_path1_base
+import study_engine
+from study_executor import (
+    StudyExecutionError,
+    StudyExecutor,
+    bar_close_range_sql,
+    utc_day_of_ms,
+)
+
 
 # ============================================================================
 # SAFEGUARD FUNCTIONS
@@ -110,15 +119,12 @@ def validate_environment() -> str:
         print("ERROR: DATABASE_URL or NEON_DSN environment variable not set")
         sys.exit(1)
     
-    # Test psql availability
+    # Test psycopg2 availability (studies execute in-process, not via psql)
     try:
-        result = subprocess.run(
-            ["psql", "--version"],
-            capture_output=True, text=True, check=True
-        )
-        print(f"psql available: {result.stdout.strip()}")
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("ERROR: psql command not found")
+        import psycopg2
+        print(f"psycopg2 available: {psycopg2.__version__}")
+    except ImportError:
+        print("ERROR: psycopg2 is not installed")
         sys.exit(1)
     
     return db_url
@@ -202,40 +208,23 @@ def update_queue_status(queue_path: Path, completed_runs: dict):
     print(f"Queue file updated: {queue_path}")
 
 
-def run_sql_query(db_url: str, sql: str) -> str:
-    """Execute SQL via psql and return output."""
-    result = subprocess.run(
-        ["psql", db_url, "-t", "-A", "-c", sql],
-        capture_output=True, text=True, check=True
-    )
-    return result.stdout.strip()
-
-
-def run_sql_file(db_url: str, sql_file: Path, output_file: Path) -> str:
-    """Execute SQL file via psql and capture output.
+def run_sql_file(executor: StudyExecutor, sql_file: Path, output_file: Path) -> None:
+    """Execute a study SQL file in-process and capture psql-format output.
     
     Raises:
-        subprocess.CalledProcessError: If psql returns non-zero exit code.
+        StudyExecutionError: If a statement fails (partial output is still written).
     """
-    result = subprocess.run(
-        ["psql", db_url, "-f", str(sql_file)],
-        capture_output=True, text=True
-    )
-    output = result.stdout + result.stderr
-    output_file.write_text(output, encoding="utf-8", newline="\n")
-    
-    # Fail-fast: propagate psql failures (Task A remediation)
-    # WARNING: Prior runs in this batch are already committed to filesystem.
-    # This exception stops the batch but does NOT roll back completed runs.
-    if result.returncode != 0:
-        print(f"ERROR: psql failed with exit code {result.returncode}")
+    try:
+        executor.run_sql_file(sql_file, output_file)
+    except StudyExecutionError as exc:
+        # Fail-fast: propagate study failures (Task A remediation)
+        # WARNING: Prior runs in this batch are already committed to filesystem.
+        # This exception stops the batch but does NOT roll back completed runs.
+        output = exc.output
+        print("ERROR: study execution failed")
         print(f"SQL file: {sql_file}")
         print(f"Output: {output[:2000]}" if len(output) > 2000 else f"Output: {output}")
-        raise subprocess.CalledProcessError(
-            result.returncode, result.args, result.stdout, result.stderr
-        )
-    
-    return output
+        raise
 
 
 def truthy_env(value: Optional[str]) -> bool:
@@ -377,32 +366,45 @@ def build_evidence_pack_v0_2(
         print("Evidence pack v0.2 build complete.")
 
 
-def check_data_availability(db_url: str, symbol: str, date_start: str, date_end: str) -> int:
+def check_data_availability(executor: StudyExecutor, symbol: str, date_start: str, date_end: str) -> int:
     """Check row count for given date range."""
+    time_predicate = bar_close_range_sql(date_start, date_end)
     sql = f"""
     SELECT COUNT(*)
     FROM derived.v_path1_evidence_dis_v1_1
     WHERE sym = '{symbol}'
-      AND to_timestamp(bar_close_ms/1000)::date BETWEEN '{date_start}' AND '{date_end}';
+      AND {time_predicate};
     """
-    result = run_sql_query(db_url, sql)
+    result = executor.query_scalar(sql)
     return int(result) if result else 0
 
 
-def find_substitute_range(
-    db_url: str, symbol: str, requested_start: str, requested_end: str,
-    existing_ranges: list
-) -> Tuple[Optional[str], Optional[str], int]:
+def fetch_daily_counts(
+    executor: StudyExecutor, symbol: str, date_start: str, date_end: str
+) -> Dict[str, int]:
+    """Return {YYYY-MM-DD: row_count} for every UTC day with data in [date_start, date_end]."""
+    time_predicate = bar_close_range_sql(date_start, date_end)
+    sql = f"""
+    SELECT bar_close_ms / 86400000 AS utc_day, COUNT(*) AS n
+    FROM derived.v_path1_evidence_dis_v1_1
+    WHERE sym = '{symbol}'
+      AND {time_predicate}
+    GROUP BY 1
+    ORDER BY 1;
     """
-    Find substitute 5-day weekday range if requested range has no data.
-    Search backwards in 7-day increments until data found.
-    Avoids overlapping with existing runs.
+    result = executor.query(sql)
+    return {utc_day_of_ms(day): int(n) for day, n in result.rows}
+
+
+def substitute_candidates(requested_start: str) -> List[Tuple[str, str]]:
     """
-    from datetime import date
+    Candidate 5-weekday windows, nearest first.
     
+    Walks back from requested_start in 7-day increments for up to 1 year; each
+    candidate is the 5 weekdays ending on (requested_start - offset).
+    """
     start_dt = datetime.strptime(requested_start, "%Y-%m-%d").date()
-    
-    # Search backwards up to 1 year
+    candidates = []
     for offset in range(7, 366, 7):
         candidate_end = start_dt - timedelta(days=offset)
         
@@ -416,10 +418,19 @@ def find_substitute_range(
         
         if len(weekdays_found) < 5:
             continue
-            
-        sub_start = weekdays_found[0].strftime("%Y-%m-%d")
-        sub_end = weekdays_found[-1].strftime("%Y-%m-%d")
         
+        candidates.append((
+            weekdays_found[0].strftime("%Y-%m-%d"),
+            weekdays_found[-1].strftime("%Y-%m-%d"),
+        ))
+    return candidates
+
+
+def pick_substitute_range(
+    candidates: List[Tuple[str, str]], daily_counts: Dict[str, int], existing_ranges: list
+) -> Tuple[Optional[str], Optional[str], int]:
+    """Pick the first candidate that avoids existing runs and has data (in memory)."""
+    for sub_start, sub_end in candidates:
         # Check not overlapping with existing runs
         overlaps = False
         for ex_start, ex_end in existing_ranges:
@@ -430,14 +441,36 @@ def find_substitute_range(
         if overlaps:
             continue
         
-        # Check data availability
-        row_count = check_data_availability(db_url, symbol, sub_start, sub_end)
+        # Row count over the inclusive calendar range (same as BETWEEN)
+        row_count = sum(n for day, n in daily_counts.items() if sub_start <= day <= sub_end)
         if row_count > 0:
             return sub_start, sub_end, row_count
     
     return None, None, 0
 
 
+def find_substitute_range(
+    executor: StudyExecutor, symbol: str, requested_start: str, requested_end: str,
+    existing_ranges: list
+) -> Tuple[Optional[str], Optional[str], int]:
+    """
+    Find substitute 5-day weekday range if requested range has no data.
+    Search backwards in 7-day increments until data found.
+    Avoids overlapping with existing runs.
+    
+    Per-day counts for the whole search window are fetched in one grouped
+    query; candidates are then resolved in memory.
+    """
+    candidates = substitute_candidates(requested_start)
+    if not candidates:
+        return None, None, 0
+    
+    window_start = min(start for start, _ in candidates)
+    window_end = max(end for _, end in candidates)
+    daily_counts = fetch_daily_counts(executor, symbol, window_start, window_end)
+    return pick_substitute_range(candidates, daily_counts, existing_ranges)
+
+
 # ============================================================================
 # SQL GENERATION (exact replication of manual runs)
 # ============================================================================
@@ -446,183 +479,26 @@ def generate_study_sql(
     run_id: str, symbol: str, date_start: str, date_end: str,
     score_name: str, score_config: dict
 ) -> str:
-    """Generate study SQL matching exact format of Run 002/003."""
-    version = score_config["version"]
-    column = score_config["column"]
-    view = score_config["view"]
-    version_str = f"{score_name}-{version}"
-    
-    return f"""-- =============================================================================
--- Study: {version_str} Distributional Analysis (Run-Scoped)
--- Run ID: {run_id} | Symbol: {symbol} | Dates: {date_start} to {date_end}
--- =============================================================================
-
--- FROZEN SCORE VERSION: {version_str}
--- SOURCE VIEW: {view}
-
--- -----------------------------------------------------------------------------
--- Study 1: Overall {version_str} Score Distribution
--- -----------------------------------------------------------------------------
-SELECT
-    '{version_str}' AS score_version,
-    '{run_id}' AS run_id,
-    COUNT(*) AS n_observations,
-    AVG({column}) AS mean_score,
-    STDDEV({column}) AS stddev_score,
-    MIN({column}) AS min_score,
-    PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY {column}) AS p25_score,
-    PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY {column}) AS p50_score,
-    PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY {column}) AS p75_score,
-    MAX({column}) AS max_score
-FROM {view}
-WHERE {column} IS NOT NULL
-  AND sym = '{symbol}'
-  AND to_timestamp(bar_close_ms/1000)::date BETWEEN '{date_start}' AND '{date_end}';
-
--- -----------------------------------------------------------------------------
--- Study 2: {version_str} Score Distribution Conditioned on Outcome Category
--- -----------------------------------------------------------------------------
-SELECT
-    outcome_category,
-    COUNT(*) AS n_observations,
-    AVG({column}) AS mean_score,
-    STDDEV({column}) AS stddev_score,
-    MIN({column}) AS min_score,
-    PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY {column}) AS p25_score,
-    PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY {column}) AS p50_score,
-    PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY {column}) AS p75_score,
-    MAX({column}) AS max_score
-FROM {view}
-WHERE {column} IS NOT NULL
-  AND outcome_category IS NOT NULL
-  AND sym = '{symbol}'
-  AND to_timestamp(bar_close_ms/1000)::date BETWEEN '{date_start}' AND '{date_end}'
-GROUP BY outcome_category
-ORDER BY outcome_category;
-
--- -----------------------------------------------------------------------------
--- Study 3: Outcome Frequency Conditioned on {version_str} Score Quantiles
--- -----------------------------------------------------------------------------
-WITH score_quantiles AS (
-    SELECT
-        block_id,
-        sym,
-        {column},
-        outcome_category,
-        NTILE(4) OVER (ORDER BY {column}) AS score_quartile
-    FROM {view}
-    WHERE {column} IS NOT NULL
-      AND outcome_category IS NOT NULL
-      AND sym = '{symbol}'
-      AND to_timestamp(bar_close_ms/1000)::date BETWEEN '{date_start}' AND '{date_end}'
-)
-SELECT
-    score_quartile,
-    outcome_category,
-    COUNT(*) AS n_observations,
-    ROUND(100.0 * COUNT(*) / SUM(COUNT(*)) OVER (PARTITION BY score_quartile), 2) AS pct_within_quartile
-FROM score_quantiles
-GROUP BY score_quartile, outcome_category
-ORDER BY score_quartile, outcome_category;
-
--- -----------------------------------------------------------------------------
--- Study 4: Outcome Value Statistics by {version_str} Score Quantile
--- -----------------------------------------------------------------------------
-WITH score_quantiles AS (
-    SELECT
-        {column},
-        outcome_ret,
-        NTILE(4) OVER (ORDER BY {column}) AS score_quartile
-    FROM {view}
-    WHERE {column} IS NOT NULL
-      AND outcome_ret IS NOT NULL
-      AND sym = '{symbol}'
-      AND to_timestamp(bar_close_ms/1000)::date BETWEEN '{date_start}' AND '{date_end}'
-)
-SELECT
-    score_quartile,
-    COUNT(*) AS n_observations,
-    AVG(outcome_ret) AS mean_outcome_ret,
-    STDDEV(outcome_ret) AS stddev_outcome_ret,
-    PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY outcome_ret) AS median_outcome_ret
-FROM score_quantiles
-GROUP BY score_quartile
-ORDER BY score_quartile;
-"""
+    """Generate the fused single-scan study SQL (see study_engine.py)."""
+    return study_engine.generate_study_sql(
+        run_id, symbol, date_start, date_end, score_name, score_config
+    )
 
 
 # ============================================================================
 # REPORT GENERATION
 # ============================================================================
 
-def parse_study_output(output_text: str) -> dict:
-    """
-    Parse psql output into structured data.
-    Returns dict with study1, study2, study3, study4 keys.
-    """
-    studies = {}
-    current_study = None
-    header = None
-    rows = []
-    
-    for line in output_text.split('\n'):
-        line = line.strip()
-        
-        # Detect study boundaries from SQL comments in output
-        if 'Study 1:' in line:
-            if current_study and rows:
-                studies[current_study] = {'header': header, 'rows': rows}
-            current_study = 'study1'
-            header = None
-            rows = []
-        elif 'Study 2:' in line:
-            if current_study and rows:
-                studies[current_study] = {'header': header, 'rows': rows}
-            current_study = 'study2'
-            header = None
-            rows = []
-        elif 'Study 3:' in line:
-            if current_study and rows:
-                studies[current_study] = {'header': header, 'rows': rows}
-            current_study = 'study3'
-            header = None
-            rows = []
-        elif 'Study 4:' in line:
-            if current_study and rows:
-                studies[current_study] = {'header': header, 'rows': rows}
-            current_study = 'study4'
-            header = None
-            rows = []
-        elif current_study and line and not line.startswith('-') and not line.startswith('('):
-            # Parse table row
-            if '|' in line:
-                parts = [p.strip() for p in line.split('|')]
-                if header is None and any(p.lower() in ['score_version', 'outcome_category', 'score_quartile', 'n_observations'] for p in parts):
-                    header = parts
-                elif header is not None:
-                    rows.append(parts)
-    
-    # Save last study
-    if current_study and rows:
-        studies[current_study] = {'header': header, 'rows': rows}
-    
-    return studies
-
-
 def generate_evidence_md(
     run_id: str, symbol: str, date_start: str, date_end: str,
-    n_obs: int, score_name: str, score_config: dict, 
-    study_output: str
+    n_obs: int, score_name: str, score_config: dict
 ) -> str:
     """Generate evidence markdown matching exact format of Run 002."""
     version = score_config["version"]
     version_str = f"{score_name}-{version}"
     view = score_config["view"]
     
-    # Parse output to extract study data
-    # For now, include raw output as we did in manual runs
-    # This ensures exact replication of behavior
-    
+    # Study tables stay in the raw output file (exact replication of manual runs)
     output_filename = f"study_{score_name.lower()}_{version.replace('.', '_')}.txt"
     
     return f"""# {version_str} Evidence Report
@@ -700,24 +576,28 @@ def generate_run_md(
 
 ```bash
 # Data availability check
-psql $DATABASE_URL -c "SELECT COUNT(*) AS rows_in_range FROM derived.v_path1_evidence_dis_v1_1 WHERE sym = '{symbol}' AND to_timestamp(bar_close_ms/1000)::date BETWEEN '{date_start_requested}' AND '{date_end_requested}';"
+psql $DATABASE_URL -c "SELECT COUNT(*) AS rows_in_range FROM derived.v_path1_evidence_dis_v1_1 WHERE sym = '{symbol}' AND {bar_close_range_sql(date_start_requested, date_end_requested)};"
 """
     
     if was_substituted:
         commands_section += f"""
 # Substitute range check
-psql $DATABASE_URL -c "SELECT COUNT(*) AS rows_in_range FROM derived.v_path1_evidence_dis_v1_1 WHERE sym = '{symbol}' AND to_timestamp(bar_close_ms/1000)::date BETWEEN '{date_start_actual}' AND '{date_end_actual}';"
+psql $DATABASE_URL -c "SELECT COUNT(*) AS rows_in_range FROM derived.v_path1_evidence_dis_v1_1 WHERE sym = '{symbol}' AND {bar_close_range_sql(date_start_actual, date_end_actual)};"
 """
     
     commands_section += f"""
+# Execute studies. The runner executes the fused study_*.sql in process and
+# splits its result into four blocks; the *_psql.sql scripts run the same
+# studies as four SELECTs and reproduce outputs/study_*.txt under psql.
+
 # Execute DIS-v1.1 study
-psql $DATABASE_URL -f "sql/path1/evidence/runs/{run_id}/study_dis_v1_1.sql" | tee "reports/path1/evidence/runs/{run_id}/outputs/study_dis_v1_1.txt"
+psql -q $DATABASE_URL -f "sql/path1/evidence/runs/{run_id}/study_dis_v1_1_psql.sql" | tee "reports/path1/evidence/runs/{run_id}/outputs/study_dis_v1_1.txt"
 
 # Execute RES-v1.0 study
-psql $DATABASE_URL -f "sql/path1/evidence/runs/{run_id}/study_res_v1_0.sql" | tee "reports/path1/evidence/runs/{run_id}/outputs/study_res_v1_0.txt"
+psql -q $DATABASE_URL -f "sql/path1/evidence/runs/{run_id}/study_res_v1_0_psql.sql" | tee "reports/path1/evidence/runs/{run_id}/outputs/study_res_v1_0.txt"
 
 # Execute LID-v1.0 study
-psql $DATABASE_URL -f "sql/path1/evidence/runs/{run_id}/study_lid_v1_0.sql" | tee "reports/path1/evidence/runs/{run_id}/outputs/study_lid_v1_0.txt"
+psql -q $DATABASE_URL -f "sql/path1/evidence/runs/{run_id}/study_lid_v1_0_psql.sql" | tee "reports/path1/evidence/runs/{run_id}/outputs/study_lid_v1_0.txt"
 ```
 """
 
@@ -858,16 +738,24 @@ def update_index_md(index_path: Path, run_id: str, date_range: str, symbol: str,
 # MAIN EXECUTION
 # ============================================================================
 
-def execute_single_run(
-    db_url: str, repo_root: Path, run_id: str, symbol: str,
+def prepare_run(
+    executor: StudyExecutor, repo_root: Path, run_id: str, symbol: str,
     date_start: str, date_end: str, existing_ranges: list,
     dry_run: bool = False,
     build_pack_v0_2: bool = False,
     force_overwrite: bool = False,
-) -> Tuple[bool, bool, str, str, str, int]:
+) -> Tuple[Optional[tuple], Optional[dict], Optional[tuple]]:
     """
-    Execute a single evidence run.
-    Returns (success, did_execute, message, date_start_actual, date_end_actual, rows_processed).
+    Resolve a queued run: folder checks, data availability and substitution.
+    
+    Returns (result, plan, index_entry):
+      - result: final result tuple if the run ends here (skip, dry run, failure)
+      - plan: dict for materialize_run() if the run must execute
+      - index_entry: (run_id, date_range, symbol, n_obs) for commit_index_entry()
+    
+    Does not write INDEX.md; the caller commits index entries in queue order.
+    The resolved range is appended to existing_ranges so later queue entries
+    never substitute into it.
     """
     print(f"\n{'='*60}")
     print(f"EXECUTING RUN: {run_id}")
@@ -877,14 +765,11 @@ def execute_single_run(
     
     # SAFEGUARD: Validate date format (catch Excel corruption)
     if not validate_date_format(date_start, 'date_start'):
-        return False, f"Invalid date_start format: {date_start}", date_start, date_end
+        return (False, False, f"Invalid date_start format: {date_start}", date_start, date_end, 0), None, None
     if not validate_date_format(date_end, 'date_end'):
-        return False, f"Invalid date_end format: {date_end}", date_start, date_end
+        return (False, False, f"Invalid date_end format: {date_end}", date_start, date_end, 0), None, None
     
-    # Create directories
-    sql_dir = repo_root / "sql" / "path1" / "evidence" / "runs" / run_id
     report_dir = repo_root / "reports" / "path1" / "evidence" / "runs" / run_id
-    output_dir = report_dir / "outputs"
     
     # Check if run artifacts already exist (possible re-run)
     if report_dir.exists():
@@ -898,7 +783,7 @@ def execute_single_run(
             else:
                 print("DRY RUN: Would quarantine non-directory run folder.")
             if dry_run:
-                return True, False, "DRY RUN: non-directory run folder handled", date_start, date_end, 0
+                return (True, False, "DRY RUN: non-directory run folder handled", date_start, date_end, 0), None, None
         else:
             is_complete, missing = check_run_completeness(report_dir, build_pack_v0_2)
             if is_complete:
@@ -906,25 +791,17 @@ def execute_single_run(
                 date_start_actual = metadata["date_start_actual"] or date_start
                 date_end_actual = metadata["date_end_actual"] or date_end
                 n_obs = int(metadata["n_obs"]) if metadata["n_obs"] else 0
+                index_entry = None
                 if not dry_run:
                     if metadata["symbol"] and metadata["n_obs"] and date_start_actual and date_end_actual:
                         date_range_str = f"{date_start_actual} to {date_end_actual}"
-                        index_path = repo_root / "reports" / "path1" / "evidence" / "INDEX.md"
-                        if index_path.exists():
-                            update_index_md(
-                                index_path,
-                                run_id,
-                                date_range_str,
-                                metadata["symbol"],
-                                int(metadata["n_obs"]),
-                            )
-                        else:
-                            print(f"WARNING: INDEX.md missing, cannot update: {index_path}")
+                        index_entry = (run_id, date_range_str, metadata["symbol"], int(metadata["n_obs"]))
                     else:
                         print("WARNING: Unable to parse RUN.md metadata for INDEX update.")
                 existing_ranges.append((date_start_actual, date_end_actual))
                 print(f"SKIP: folder already complete for {run_id}")
-                return True, False, "SKIP: folder already complete", date_start_actual, date_end_actual, n_obs
+                result = (True, False, "SKIP: folder already complete", date_start_actual, date_end_actual, n_obs)
+                return result, None, index_entry
             if not force_overwrite and not dry_run:
                 quarantine_dir = quarantine_run_folder(report_dir, missing)
                 print(f"QUARANTINE: Existing run moved to {quarantine_dir}")
@@ -933,10 +810,10 @@ def execute_single_run(
             else:
                 print("DRY RUN: Would quarantine incomplete run folder.")
             if dry_run:
-                return True, False, "DRY RUN: incomplete run folder handled", date_start, date_end, 0
+                return (True, False, "DRY RUN: incomplete run folder handled", date_start, date_end, 0), None, None
 
     # Check data availability
-    row_count = check_data_availability(db_url, symbol, date_start, date_end)
+    row_count = check_data_availability(executor, symbol, date_start, date_end)
     print(f"Rows in requested range: {row_count}")
     
     # Substitution logic
@@ -947,10 +824,10 @@ def execute_single_run(
     if row_count == 0:
         print("Zero rows - searching for substitute range...")
         sub_start, sub_end, sub_count = find_substitute_range(
-            db_url, symbol, date_start, date_end, existing_ranges
+            executor, symbol, date_start, date_end, existing_ranges
         )
         if sub_start is None:
-            return False, False, "No substitute range found with data", date_start, date_end, 0
+            return (False, False, "No substitute range found with data", date_start, date_end, 0), None, None
         
         date_start_actual = sub_start
         date_end_actual = sub_end
@@ -965,14 +842,49 @@ def execute_single_run(
     
     if dry_run:
         print("[DRY RUN] Would execute studies and generate artifacts")
-        return True, False, f"DRY RUN: {row_count} rows", date_start_actual, date_end_actual, row_count
+        return (True, False, f"DRY RUN: {row_count} rows", date_start_actual, date_end_actual, row_count), None, None
+    
+    # Reserve the range so later queue entries avoid overlapping it
+    existing_ranges.append((date_start_actual, date_end_actual))
+    
+    plan = {
+        "run_id": run_id,
+        "symbol": symbol,
+        "date_start": date_start,
+        "date_end": date_end,
+        "date_start_actual": date_start_actual,
+        "date_end_actual": date_end_actual,
+        "row_count": row_count,
+        "was_substituted": was_substituted,
+    }
+    index_entry = (run_id, f"{date_start_actual} to {date_end_actual}", symbol, row_count)
+    return None, plan, index_entry
+
+
+def materialize_run(
+    db_url: str, executor: StudyExecutor, repo_root: Path, plan: dict,
+    build_pack_v0_2: bool = False,
+) -> Tuple[bool, bool, str, str, str, int]:
+    """
+    Execute studies and write all artifacts for a resolved run.
+    
+    Touches only the run's own folders, so independent runs may materialize
+    concurrently (each with its own executor/connection).
+    """
+    run_id = plan["run_id"]
+    symbol = plan["symbol"]
+    date_start_actual = plan["date_start_actual"]
+    date_end_actual = plan["date_end_actual"]
+    row_count = plan["row_count"]
+    
+    sql_dir = repo_root / "sql" / "path1" / "evidence" / "runs" / run_id
+    report_dir = repo_root / "reports" / "path1" / "evidence" / "runs" / run_id
+    output_dir = report_dir / "outputs"
     
     sql_dir.mkdir(parents=True, exist_ok=True)
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Generate and execute studies for each score
-    study_outputs = {}
-    
     for score_name, score_config in SCORE_CONFIGS.items():
         version = score_config["version"].replace(".", "_")
         sql_filename = f"study_{score_name.lower()}_{version}.sql"
@@ -986,12 +898,22 @@ def execute_single_run(
         sql_path = sql_dir / sql_filename
         sql_path.write_text(sql_content, encoding="utf-8", newline="\n")
         print(f"Generated: {sql_path}")
+
+        # psql-reproducible form referenced by RUN.md
+        psql_path = sql_dir / f"study_{score_name.lower()}_{version}_psql.sql"
+        psql_path.write_text(
+            study_engine.generate_study_psql_script(
+                run_id, symbol, date_start_actual, date_end_actual,
+                score_name, score_config
+            ),
+            encoding="utf-8", newline="\n",
+        )
+        print(f"Generated: {psql_path}")
         
         # Execute study
         output_path = output_dir / output_filename
         print(f"Executing: {sql_filename}...")
-        output = run_sql_file(db_url, sql_path, output_path)
-        study_outputs[score_name] = output
+        run_sql_file(executor, sql_path, output_path)
         print(f"Output saved: {output_path}")
     
     # Generate evidence reports
@@ -1001,7 +923,7 @@ def execute_single_run(
         
         evidence_content = generate_evidence_md(
             run_id, symbol, date_start_actual, date_end_actual,
-            row_count, score_name, score_config, study_outputs[score_name]
+            row_count, score_name, score_config
         )
         evidence_path = report_dir / evidence_filename
         evidence_path.write_text(evidence_content, encoding="utf-8", newline="\n")
@@ -1010,9 +932,9 @@ def execute_single_run(
     # Generate RUN.md
     run_md_content = generate_run_md(
         run_id, symbol,
-        date_start, date_end,
+        plan["date_start"], plan["date_end"],
         date_start_actual, date_end_actual,
-        row_count, was_substituted
+        row_count, plan["was_substituted"]
     )
     run_md_path = report_dir / "RUN.md"
     run_md_path.write_text(run_md_content, encoding="utf-8", newline="\n")
@@ -1028,17 +950,108 @@ def execute_single_run(
             date_end=date_end_actual,
         )
     
-    # Update INDEX.md
+    return True, True, f"Completed: {row_count} rows ({date_start_actual} to {date_end_actual})", date_start_actual, date_end_actual, row_count
+
+
+def commit_index_entry(repo_root: Path, index_entry: Optional[tuple]) -> None:
+    """Append one run to INDEX.md (callers commit entries in queue order)."""
+    if index_entry is None:
+        return
     index_path = repo_root / "reports" / "path1" / "evidence" / "INDEX.md"
-    if index_path.exists():
-        date_range_str = f"{date_start_actual} to {date_end_actual}"
-        update_index_md(index_path, run_id, date_range_str, symbol, row_count)
-        print(f"Updated: {index_path}")
+    if not index_path.exists():
+        print(f"WARNING: INDEX.md missing, cannot update: {index_path}")
+        return
+    run_id, date_range_str, symbol, n_obs = index_entry
+    update_index_md(index_path, run_id, date_range_str, symbol, n_obs)
+    print(f"Updated: {index_path}")
+
+
+def execute_single_run(
+    db_url: str, executor: StudyExecutor, repo_root: Path, run_id: str, symbol: str,
+    date_start: str, date_end: str, existing_ranges: list,
+    dry_run: bool = False,
+    build_pack_v0_2: bool = False,
+    force_overwrite: bool = False,
+) -> Tuple[bool, bool, str, str, str, int]:
+    """
+    Execute a single evidence run.
+    Returns (success, did_execute, message, date_start_actual, date_end_actual, rows_processed).
+    """
+    result, plan, index_entry = prepare_run(
+        executor, repo_root, run_id, symbol, date_start, date_end, existing_ranges,
+        dry_run=dry_run,
+        build_pack_v0_2=build_pack_v0_2,
+        force_overwrite=force_overwrite,
+    )
+    if plan is not None:
+        result = materialize_run(db_url, executor, repo_root, plan, build_pack_v0_2=build_pack_v0_2)
+    commit_index_entry(repo_root, index_entry)
+    return result
+
+
+def execute_runs_parallel(
+    db_url: str, executor: StudyExecutor, repo_root: Path, runs_to_execute: list,
+    existing_ranges: list, parallel: int,
+    build_pack_v0_2: bool = False,
+    force_overwrite: bool = False,
+) -> List[tuple]:
+    """
+    Execute queue entries concurrently.
     
-    # Add to existing ranges to avoid future overlap
-    existing_ranges.append((date_start_actual, date_end_actual))
+    1. Resolve every run (folder checks, substitution) sequentially in queue
+       order, so substitute ranges are identical to a sequential batch.
+    2. Materialize resolved runs on a thread pool; each run gets its own
+       connection and writes only its own run folders.
+    3. Commit INDEX.md entries in queue order. A failed run stops the commit
+       cursor: later runs keep their folders on disk but are not indexed, the
+       same ledger state a sequential batch leaves behind.
     
-    return True, True, f"Completed: {row_count} rows ({date_start_actual} to {date_end_actual})", date_start_actual, date_end_actual, row_count
+    Returns result tuples in queue order (see main() for the contract).
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    prepared = []
+    for run_spec in runs_to_execute:
+        result, plan, index_entry = prepare_run(
+            executor, repo_root, run_spec['run_id'], run_spec['symbol'],
+            run_spec['date_start'], run_spec['date_end'], existing_ranges,
+            build_pack_v0_2=build_pack_v0_2,
+            force_overwrite=force_overwrite,
+        )
+        prepared.append((run_spec, result, plan, index_entry))
+    
+    def materialize_isolated(plan: dict):
+        with StudyExecutor(db_url) as run_executor:
+            return materialize_run(db_url, run_executor, repo_root, plan, build_pack_v0_2=build_pack_v0_2)
+    
+    n_plans = sum(1 for _, _, plan, _ in prepared if plan is not None)
+    print(f"\nMaterializing {n_plans} run(s) with --parallel {parallel}")
+    
+    with ThreadPoolExecutor(max_workers=parallel) as pool:
+        futures = [
+            pool.submit(materialize_isolated, plan) if plan is not None else None
+            for _, _, plan, _ in prepared
+        ]
+        
+        results = []
+        for (run_spec, result, plan, index_entry), future in zip(prepared, futures):
+            if future is not None:
+                try:
+                    result = future.result()
+                except Exception:
+                    for pending in futures:
+                        if pending is not None:
+                            pending.cancel()
+                    print(f"ERROR: {run_spec['run_id']} failed; INDEX.md not updated for it or later runs.")
+                    raise
+            commit_index_entry(repo_root, index_entry)
+            success, did_execute, message, actual_start, actual_end, rows_processed = result
+            results.append((
+                run_spec['run_id'], success, did_execute, message,
+                run_spec['date_start'], run_spec['date_end'],
+                actual_start, actual_end, rows_processed,
+            ))
+    return results
 
 
 def parse_existing_runs(index_path: Path) -> list:
@@ -1099,6 +1112,11 @@ def main():
         action='store_true',
         help='Allow overwriting an existing run folder (default: abort if run exists)'
     )
+    parser.add_argument(
+        '--parallel', '-p',
+        type=int, default=1,
+        help='Execute up to N queue runs concurrently (default: 1 = sequential)'
+    )
     parser.add_argument(
         '--repo-root',
         default='.',
@@ -1113,16 +1131,24 @@ def main():
     args = parser.parse_args()
     if args.once:
         args.max_runs = 1
+    if args.parallel < 1:
+        parser.error("--parallel must be >= 1")
     
     print("=" * 60)
     print("PATH 1 EVIDENCE QUEUE RUNNER")
     print("=" * 60)
-    print("NOTE: Runs execute sequentially. On failure, prior runs remain")
-    print("      on disk and in INDEX.md. There is no rollback.")
+    if args.parallel > 1:
+        print(f"NOTE: Up to {args.parallel} runs execute concurrently. INDEX.md is")
+        print("      updated in queue order; on failure, prior runs remain")
+        print("      on disk and in INDEX.md. There is no rollback.")
+    else:
+        print("NOTE: Runs execute sequentially. On failure, prior runs remain")
+        print("      on disk and in INDEX.md. There is no rollback.")
     print("      Queue status is LOCAL ONLY and not auto-committed.")
     
     # Validate environment
     db_url = validate_environment()
+    executor = StudyExecutor(db_url)
     print(f"Database: connected")
     
     repo_root = Path(args.repo_root).resolve()
@@ -1185,33 +1211,45 @@ def main():
     
     enable_pack_v0_2 = args.evidence_pack_v0_2 or truthy_env(os.environ.get("EVIDENCE_PACK_V0_2"))
 
+    # Bring the materialized base table up to date before any study query
+    if not args.dry_run:
+        refresh_path1_base.refresh_before_study(db_url, [run['symbol'] for run in runs_to_execute])
+
     # Execute runs
-    results = []
-    for run_spec in runs_to_execute:
-        run_id = run_spec['run_id']
-        symbol = run_spec['symbol']
-        date_start = run_spec['date_start']
-        date_end = run_spec['date_end']
-        
-        success, did_execute, message, actual_start, actual_end, rows_processed = execute_single_run(
-            db_url, repo_root, run_id, symbol,
-            date_start, date_end, existing_ranges,
-            dry_run=args.dry_run,
+    if args.parallel > 1 and not args.dry_run:
+        results = execute_runs_parallel(
+            db_url, executor, repo_root, runs_to_execute, existing_ranges, args.parallel,
             build_pack_v0_2=enable_pack_v0_2,
             force_overwrite=args.force_overwrite,
         )
-        # Results tuple contract (append-only):
-        #   [0] run_id
-        #   [1] success
-        #   [2] did_execute
-        #   [3] message
-        #   [4] req_start
-        #   [5] req_end
-        #   [6] actual_start
-        #   [7] actual_end
-        #   [8] rows_processed
-        # Append-only rule: new fields may be appended; existing indices must not change.
-        results.append((run_id, success, did_execute, message, date_start, date_end, actual_start, actual_end, rows_processed))
+    else:
+        results = []
+        for run_spec in runs_to_execute:
+            run_id = run_spec['run_id']
+            symbol = run_spec['symbol']
+            date_start = run_spec['date_start']
+            date_end = run_spec['date_end']
+        
+            success, did_execute, message, actual_start, actual_end, rows_processed = execute_single_run(
+                db_url, executor, repo_root, run_id, symbol,
+                date_start, date_end, existing_ranges,
+                dry_run=args.dry_run,
+                build_pack_v0_2=enable_pack_v0_2,
+                force_overwrite=args.force_overwrite,
+            )
+            # Results tuple contract (append-only):
+            #   [0] run_id
+            #   [1] success
+            #   [2] did_execute
+            #   [3] message
+            #   [4] req_start
+            #   [5] req_end
+            #   [6] actual_start
+            #   [7] actual_end
+            #   [8] rows_processed
+            # Append-only rule: new fields may be appended; existing indices must not change.
+            results.append((run_id, success, did_execute, message, date_start, date_end, actual_start, actual_end, rows_processed))
+    executor.close()
     
     # Summary
     passed = 0
@@ -10,6 +10,10 @@ from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Dict, Tuple
 
+import refresh_path1_base
+import study_engine
+from study_executor import StudyExecutionError, StudyExecutor, bar_close_range_sql
+
 
 SCORE_CONFIGS = {
     "DIS": {
@@ -94,9 +98,9 @@ def validate_environment() -> str:
     if not db_url:
         raise RuntimeError("DATABASE_URL or NEON_DSN environment variable not set")
     try:
-        subprocess.run(["psql", "--version"], capture_output=True, check=True, text=True)
-    except (subprocess.CalledProcessError, FileNotFoundError) as exc:
-        raise RuntimeError("psql command not found") from exc
+        import psycopg2  # noqa: F401
+    except ImportError as exc:
+        raise RuntimeError("psycopg2 is not installed") from exc
     return db_url
 
 
@@ -127,135 +131,13 @@ def compute_run_id(
     return f"p1_{created}_{symbol}_{end_compact}_len{length_days}d_{short_hash}"
 
 
-def run_sql_query(db_url: str, sql: str) -> str:
-    result = subprocess.run(
-        ["psql", db_url, "-t", "-A", "-c", sql],
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    return result.stdout.strip()
-
-
-def run_sql_file(db_url: str, sql_file: Path, output_file: Path) -> None:
-    result = subprocess.run(
-        ["psql", db_url, "-f", str(sql_file)],
-        capture_output=True,
-        text=True,
-    )
-    output = result.stdout + result.stderr
-    output_file.write_text(output, encoding="utf-8", newline="\n")
-    if result.returncode != 0:
-        raise subprocess.CalledProcessError(
-            result.returncode, result.args, result.stdout, result.stderr
-        )
-
-
 def generate_study_sql(
     run_id: str, symbol: str, date_start: str, date_end: str, score_name: str, score_config: Dict
 ) -> str:
-    version = score_config["version"]
-    column = score_config["column"]
-    view = score_config["view"]
-    version_str = f"{score_name}-{version}"
-
-    return f"""-- =============================================================================
--- Study: {version_str} Distributional Analysis (Run-Scoped)
--- Run ID: {run_id} | Symbol: {symbol} | Dates: {date_start} to {date_end}
--- =============================================================================
-
--- FROZEN SCORE VERSION: {version_str}
--- SOURCE VIEW: {view}
-
--- -----------------------------------------------------------------------------
--- Study 1: Overall {version_str} Score Distribution
--- -----------------------------------------------------------------------------
-SELECT
-    '{version_str}' AS score_version,
-    '{run_id}' AS run_id,
-    COUNT(*) AS n_observations,
-    AVG({column}) AS mean_score,
-    STDDEV({column}) AS stddev_score,
-    MIN({column}) AS min_score,
-    PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY {column}) AS p25_score,
-    PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY {column}) AS p50_score,
-    PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY {column}) AS p75_score,
-    MAX({column}) AS max_score
-FROM {view}
-WHERE {column} IS NOT NULL
-  AND sym = '{symbol}'
-  AND to_timestamp(bar_close_ms/1000)::date BETWEEN '{date_start}' AND '{date_end}';
-
--- -----------------------------------------------------------------------------
--- Study 2: {version_str} Score Distribution Conditioned on Outcome Category
--- -----------------------------------------------------------------------------
-SELECT
-    outcome_category,
-    COUNT(*) AS n_observations,
-    AVG({column}) AS mean_score,
-    STDDEV({column}) AS stddev_score,
-    MIN({column}) AS min_score,
-    PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY {column}) AS p25_score,
-    PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY {column}) AS p50_score,
-    PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY {column}) AS p75_score,
-    MAX({column}) AS max_score
-FROM {view}
-WHERE {column} IS NOT NULL
-  AND outcome_category IS NOT NULL
-  AND sym = '{symbol}'
-  AND to_timestamp(bar_close_ms/1000)::date BETWEEN '{date_start}' AND '{date_end}'
-GROUP BY outcome_category
-ORDER BY outcome_category;
-
--- -----------------------------------------------------------------------------
--- Study 3: Outcome Frequency Conditioned on {version_str} Score Quantiles
--- -----------------------------------------------------------------------------
-WITH score_quantiles AS (
-    SELECT
-        block_id,
-        sym,
-        {column},
-        outcome_category,
-        NTILE(4) OVER (ORDER BY {column}) AS score_quartile
-    FROM {view}
-    WHERE {column} IS NOT NULL
-      AND outcome_category IS NOT NULL
-      AND sym = '{symbol}'
-      AND to_timestamp(bar_close_ms/1000)::date BETWEEN '{date_start}' AND '{date_end}'
-)
-SELECT
-    score_quartile,
-    outcome_category,
-    COUNT(*) AS n_observations,
-    ROUND(100.0 * COUNT(*) / SUM(COUNT(*)) OVER (PARTITION BY score_quartile), 2) AS pct_within_quartile
-FROM score_quantiles
-GROUP BY score_quartile, outcome_category
-ORDER BY score_quartile, outcome_category;
-
--- -----------------------------------------------------------------------------
--- Study 4: Outcome Value Statistics by {version_str} Score Quantile
--- -----------------------------------------------------------------------------
-WITH score_quantiles AS (
-    SELECT
-        {column},
-        outcome_ret,
-        NTILE(4) OVER (ORDER BY {column}) AS score_quartile
-    FROM {view}
-    WHERE {column} IS NOT NULL
-      AND outcome_ret IS NOT NULL
-      AND sym = '{symbol}'
-      AND to_timestamp(bar_close_ms/1000)::date BETWEEN '{date_start}' AND '{date_end}'
-)
-SELECT
-    score_quartile,
-    COUNT(*) AS n_observations,
-    AVG(outcome_ret) AS mean_outcome_ret,
-    STDDEV(outcome_ret) AS stddev_outcome_ret,
-    PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY outcome_ret) AS median_outcome_ret
-FROM score_quantiles
-GROUP BY score_quartile
-ORDER BY score_quartile;
-"""
+    """Generate the fused single-scan study SQL (see study_engine.py)."""
+    return study_engine.generate_study_sql(
+        run_id, symbol, date_start, date_end, score_name, score_config
+    )
 
 
 def generate_evidence_md(
@@ -457,46 +339,58 @@ def main() -> int:
         return 1
 
     try:
-        count_sql = (
-            "SELECT COUNT(*) FROM derived.v_path1_evidence_dis_v1_1 "
-            f"WHERE sym = '{args.symbol}' "
-            f"AND to_timestamp(bar_close_ms/1000)::date BETWEEN '{date_range.start}' "
-            f"AND '{date_range.end}';"
-        )
-        n_obs = int(run_sql_query(db_url, count_sql) or "0")
+        refresh_path1_base.refresh_before_study(db_url, [args.symbol])
     except Exception as exc:
-        print(f"ERROR: Failed to count rows in range: {exc}")
+        print(f"ERROR: Failed to refresh the Path 1 base table: {exc}")
         return 1
 
-    for score_name, score_config in SCORE_CONFIGS.items():
-        version = score_config["version"].replace(".", "_")
-        sql_filename = f"study_{score_name.lower()}_{version}.sql"
-        output_filename = f"study_{score_name.lower()}_{version}.txt"
-
-        sql_content = generate_study_sql(
-            run_id, args.symbol, date_range.start, date_range.end, score_name, score_config
-        )
-        sql_path = sql_dir / sql_filename
-        sql_path.write_text(sql_content, encoding="utf-8", newline="\n")
+    try:
+        executor = StudyExecutor(db_url)
+    except Exception as exc:
+        print(f"ERROR: Failed to connect to database: {exc}")
+        return 1
 
-        output_path = output_dir / output_filename
+    with executor:
         try:
-            run_sql_file(db_url, sql_path, output_path)
-        except subprocess.CalledProcessError as exc:
-            print(f"ERROR: psql failed for {sql_filename} (exit {exc.returncode})")
+            count_sql = (
+                "SELECT COUNT(*) FROM derived.v_path1_evidence_dis_v1_1 "
+                f"WHERE sym = '{args.symbol}' "
+                f"AND {bar_close_range_sql(date_range.start, date_range.end)};"
+            )
+            n_obs = int(executor.query_scalar(count_sql) or 0)
+        except Exception as exc:
+            print(f"ERROR: Failed to count rows in range: {exc}")
             return 1
 
-        evidence_md = generate_evidence_md(
-            run_id,
-            args.symbol,
-            date_range.start,
-            date_range.end,
-            n_obs,
-            score_name,
-            score_config,
-        )
-        evidence_path = report_dir / f"{score_name}_{version}_evidence.md"
-        evidence_path.write_text(evidence_md, encoding="utf-8", newline="\n")
+        for score_name, score_config in SCORE_CONFIGS.items():
+            version = score_config["version"].replace(".", "_")
+            sql_filename = f"study_{score_name.lower()}_{version}.sql"
+            output_filename = f"study_{score_name.lower()}_{version}.txt"
+
+            sql_content = generate_study_sql(
+                run_id, args.symbol, date_range.start, date_range.end, score_name, score_config
+            )
+            sql_path = sql_dir / sql_filename
+            sql_path.write_text(sql_content, encoding="utf-8", newline="\n")
+
+            output_path = output_dir / output_filename
+            try:
+                executor.run_sql_file(sql_path, output_path)
+            except StudyExecutionError as exc:
+                print(f"ERROR: study execution failed for {sql_filename}: {exc}")
+                return 1
+
+            evidence_md = generate_evidence_md(
+                run_id,
+                args.symbol,
+                date_range.start,
+                date_range.end,
+                n_obs,
+                score_name,
+                score_config,
+            )
+            evidence_path = report_dir / f"{score_name}_{version}_evidence.md"
+            evidence_path.write_text(evidence_md, encoding="utf-8", newline="\n")
 
     template_path = evidence_root / "EVIDENCE_RUN_TEMPLATE.md"
     template_text = template_path.read_text(encoding="utf-8")
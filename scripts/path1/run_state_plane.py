@@ -12,9 +12,8 @@ import json
 import math
 import os
 import re
-import struct
 import sys
-import zlib
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
@@ -42,6 +41,7 @@ from ovc_ops.run_envelope_v0_1 import (  # noqa: E402
     seal_dir,
     write_run_json,
 )
+from state_plane_png import render_trajectory_png  # noqa: E402
 
 
 def validate_date(value: str, field_name: str) -> str:
@@ -69,6 +69,11 @@ def iter_dates(start: date, end: date) -> Iterable[date]:
 
 
 def next_run_id(runs_root: Path) -> str:
+    return allocate_run_ids(runs_root, 1)[0]
+
+
+def allocate_run_ids(runs_root: Path, count: int) -> List[str]:
+    """Next `count` run IDs for today, from a single scan of runs_root."""
     today = datetime.utcnow().strftime("%Y%m%d")
     prefix = f"p1_{today}_"
     existing = []
@@ -79,10 +84,11 @@ def next_run_id(runs_root: Path) -> str:
                 if len(parts) >= 3 and parts[2].isdigit():
                     existing.append(int(parts[2]))
     seq = max(existing, default=0) + 1
-    return f"{prefix}{seq:03d}"
+    return [f"{prefix}{seq + i:03d}" for i in range(count)]
 
 
-def fetch_state_plane_blocks(conn, symbol: str, date_ny: str) -> List[Dict]:
+def fetch_state_plane_range(conn, symbol: str, date_from: str, date_to: str) -> Dict[str, List[Dict]]:
+    """All state plane rows for symbol in [date_from, date_to], grouped by date_ny (one query)."""
     sql = f"""
         SELECT
             block_id,
@@ -99,12 +105,20 @@ def fetch_state_plane_blocks(conn, symbol: str, date_ny: str) -> List[Dict]:
             threshold_pack_hash
         FROM {STATE_PLANE_VIEW}
         WHERE sym = %s
-          AND date_ny = %s
-        ORDER BY bar_close_ms;
+          AND date_ny BETWEEN %s AND %s
+        ORDER BY date_ny, bar_close_ms;
     """
+    points_by_date: Dict[str, List[Dict]] = {}
     with conn.cursor(cursor_factory=RealDictCursor) as cur:
-        cur.execute(sql, (symbol, date_ny))
-        return list(cur.fetchall())
+        cur.execute(sql, (symbol, date_from, date_to))
+        for row in cur.fetchall():
+            points_by_date.setdefault(str(row["date_ny"]), []).append(row)
+    return points_by_date
+
+
+def fetch_state_plane_blocks(conn, symbol: str, date_ny: str) -> List[Dict]:
+    """State plane rows for one day (single-day form of fetch_state_plane_range)."""
+    return fetch_state_plane_range(conn, symbol, date_ny, date_ny).get(date_ny, [])
 
 
 def fetch_thresholds(conn, pack_id: str, pack_version: int) -> Tuple[Optional[float], Optional[float]]:
@@ -125,6 +139,19 @@ def fetch_thresholds(conn, pack_id: str, pack_version: int) -> Tuple[Optional[fl
     return thresholds.get("E_hi"), thresholds.get("S_hi")
 
 
+def resolve_thresholds(
+    conn, points_by_date: Dict[str, List[Dict]]
+) -> Dict[Tuple[str, int], Tuple[Optional[float], Optional[float]]]:
+    """(E_hi, S_hi) for each distinct threshold pack referenced by a day, fetched once per pack."""
+    thresholds = {}
+    for points in points_by_date.values():
+        pack_id = points[0].get("threshold_pack_id")
+        pack_version = points[0].get("threshold_pack_version")
+        if pack_id and pack_version is not None and (pack_id, pack_version) not in thresholds:
+            thresholds[(pack_id, pack_version)] = fetch_thresholds(conn, pack_id, pack_version)
+    return thresholds
+
+
 def format_float(value: Optional[float]) -> str:
     if value is None:
         return ""
@@ -212,124 +239,6 @@ def write_metrics_json(metrics: Dict, output_path: Path) -> None:
     output_path.write_text(json.dumps(metrics, indent=2, sort_keys=True), encoding="utf-8")
 
 
-def set_pixel(pixels: bytearray, width: int, height: int, x: int, y: int,
-              color: Tuple[int, int, int]) -> None:
-    if x < 0 or y < 0 or x >= width or y >= height:
-        return
-    idx = (y * width + x) * 3
-    pixels[idx:idx + 3] = bytes(color)
-
-
-def draw_line(pixels: bytearray, width: int, height: int, x0: int, y0: int, x1: int, y1: int,
-              color: Tuple[int, int, int]) -> None:
-    dx = abs(x1 - x0)
-    dy = abs(y1 - y0)
-    sx = 1 if x0 < x1 else -1
-    sy = 1 if y0 < y1 else -1
-    err = dx - dy
-    x, y = x0, y0
-    while True:
-        if 0 <= x < width and 0 <= y < height:
-            set_pixel(pixels, width, height, x, y, color)
-        if x == x1 and y == y1:
-            break
-        e2 = 2 * err
-        if e2 > -dy:
-            err -= dy
-            x += sx
-        if e2 < dx:
-            err += dx
-            y += sy
-
-
-def draw_point(pixels: bytearray, width: int, height: int, x: int, y: int,
-               color: Tuple[int, int, int]) -> None:
-    for dx in (-1, 0, 1):
-        for dy in (-1, 0, 1):
-            px = x + dx
-            py = y + dy
-            if 0 <= px < width and 0 <= py < height:
-                set_pixel(pixels, width, height, px, py, color)
-
-
-def write_png(path: Path, width: int, height: int, pixels: bytearray) -> None:
-    # Minimal PNG writer to avoid external plotting dependencies.
-    raw = bytearray()
-    stride = width * 3
-    for y in range(height):
-        raw.append(0)
-        row_start = y * stride
-        raw.extend(pixels[row_start:row_start + stride])
-    compressed = zlib.compress(raw, level=9)
-
-    def chunk(chunk_type: bytes, data: bytes) -> bytes:
-        length = struct.pack(">I", len(data))
-        crc = zlib.crc32(chunk_type + data) & 0xFFFFFFFF
-        return length + chunk_type + data + struct.pack(">I", crc)
-
-    header = b"\x89PNG\r\n\x1a\n"
-    ihdr = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
-    data = (
-        header +
-        chunk(b"IHDR", ihdr) +
-        chunk(b"IDAT", compressed) +
-        chunk(b"IEND", b"")
-    )
-    path.write_bytes(data)
-
-
-def render_trajectory_png(points: List[Dict], output_path: Path,
-                          e_hi: Optional[float], s_hi: Optional[float]) -> None:
-    width, height = 640, 640
-    margin = 50
-    pixels = bytearray([255, 255, 255] * width * height)
-
-    def to_pixel(x: float, y: float) -> Tuple[int, int]:
-        px = int(round(margin + x * (width - 2 * margin)))
-        norm_y = (y + 1.0) / 2.0
-        py = int(round(margin + (1.0 - norm_y) * (height - 2 * margin)))
-        return px, py
-
-    border_color = (200, 200, 200)
-    axis_color = (180, 180, 180)
-    threshold_color = (220, 220, 220)
-    path_color = (30, 110, 200)
-    point_color = (10, 10, 10)
-
-    draw_line(pixels, width, height, margin, margin, width - margin, margin, border_color)
-    draw_line(pixels, width, height, margin, height - margin, width - margin, height - margin, border_color)
-    draw_line(pixels, width, height, margin, margin, margin, height - margin, border_color)
-    draw_line(pixels, width, height, width - margin, margin, width - margin, height - margin, border_color)
-
-    y_zero = to_pixel(0.0, 0.0)[1]
-    draw_line(pixels, width, height, margin, y_zero, width - margin, y_zero, axis_color)
-
-    if e_hi is not None:
-        x_e, _ = to_pixel(e_hi, 0.0)
-        draw_line(pixels, width, height, x_e, margin, x_e, height - margin, threshold_color)
-    if s_hi is not None:
-        _, y_pos = to_pixel(0.0, s_hi)
-        _, y_neg = to_pixel(0.0, -s_hi)
-        draw_line(pixels, width, height, margin, y_pos, width - margin, y_pos, threshold_color)
-        draw_line(pixels, width, height, margin, y_neg, width - margin, y_neg, threshold_color)
-
-    prev_px = None
-    for p in points:
-        x_val = p.get("x_energy")
-        y_val = p.get("y_shift")
-        if x_val is None or y_val is None:
-            prev_px = None
-            continue
-        px = to_pixel(x_val, y_val)
-        if prev_px is not None:
-            draw_line(pixels, width, height, prev_px[0], prev_px[1], px[0], px[1], path_color)
-        draw_point(pixels, width, height, px[0], px[1], point_color)
-        prev_px = px
-
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    write_png(output_path, width, height, pixels)
-
-
 def write_run_md(
     output_dir: Path,
     run_id: str,
@@ -404,15 +313,17 @@ Output location: {output_dir}
     (output_dir / "RUN.md").write_text(run_md, encoding="utf-8")
 
 
-def run_for_date(conn, repo_root: Path, symbol: str, date_ny: str, run_id: Optional[str]) -> None:
-    points = fetch_state_plane_blocks(conn, symbol, date_ny)
-    if not points:
-        print(f"WARNING: No rows for {symbol} on {date_ny}")
-        return
-
-    if run_id is None:
-        run_id = next_run_id(repo_root / "reports" / "path1" / "evidence" / "runs")
-
+def emit_run(
+    repo_root: Path,
+    symbol: str,
+    date_ny: str,
+    run_id: str,
+    points: List[Dict],
+    e_hi: Optional[float],
+    s_hi: Optional[float],
+    git_state: Tuple[Optional[str], Optional[str]],
+) -> str:
+    """Write, describe and seal one day's run folder (no database access)."""
     run_dir = repo_root / "reports" / "path1" / "evidence" / "runs" / run_id
     output_dir = run_dir / "outputs" / OUTPUT_SUBDIR
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -423,9 +334,6 @@ def run_for_date(conn, repo_root: Path, symbol: str, date_ny: str, run_id: Optio
     pack_id = points[0].get("threshold_pack_id")
     pack_version = points[0].get("threshold_pack_version")
     pack_hash = points[0].get("threshold_pack_hash")
-    e_hi, s_hi = (None, None)
-    if pack_id and pack_version is not None:
-        e_hi, s_hi = fetch_thresholds(conn, pack_id, pack_version)
 
     write_trajectory_csv(points, output_dir / "trajectory.csv")
     write_quadrant_string(quadrant_string, output_dir / "quadrant_string.txt")
@@ -449,7 +357,7 @@ def run_for_date(conn, repo_root: Path, symbol: str, date_ny: str, run_id: Optio
         command_text,
     )
 
-    git_commit, working_tree_state = get_git_state()
+    git_commit, working_tree_state = git_state
     outputs = [
         "RUN.md",
         f"outputs/{OUTPUT_SUBDIR}/trajectory.csv",
@@ -486,8 +394,67 @@ def run_for_date(conn, repo_root: Path, symbol: str, date_ny: str, run_id: Optio
             "run.json",
         ],
     )
+    return run_id
+
+
+def run_range(
+    conn,
+    repo_root: Path,
+    symbol: str,
+    date_list: List[str],
+    run_id: Optional[str] = None,
+    workers: int = 1,
+) -> List[str]:
+    """
+    Generate state plane runs for every date in date_list (sorted YYYY-MM-DD).
+
+    Rows for the whole range come from one query, each referenced threshold
+    pack is fetched once, run IDs are allocated from one scan of the runs
+    root (in date order, as consecutive single-date runs would get them), and
+    per-date folders are emitted on a process pool when workers > 1.
+
+    Returns:
+        Run IDs written, in date order
+    """
+    points_by_date = fetch_state_plane_range(conn, symbol, date_list[0], date_list[-1])
+    dates_with_rows = [d for d in date_list if points_by_date.get(d)]
+    thresholds = resolve_thresholds(conn, points_by_date)
+    if run_id is not None:
+        run_ids = [run_id] * len(dates_with_rows)
+    else:
+        run_ids = allocate_run_ids(repo_root / "reports" / "path1" / "evidence" / "runs", len(dates_with_rows))
+    git_state = get_git_state()
+
+    jobs = {}
+    for date_ny, date_run_id in zip(dates_with_rows, run_ids):
+        points = [dict(row) for row in points_by_date[date_ny]]
+        pack_key = (points[0].get("threshold_pack_id"), points[0].get("threshold_pack_version"))
+        e_hi, s_hi = thresholds.get(pack_key, (None, None))
+        jobs[date_ny] = (repo_root, symbol, date_ny, date_run_id, points, e_hi, s_hi, git_state)
+
+    completed = []
+
+    def report(date_ny: str, result) -> None:
+        if date_ny not in jobs:
+            print(f"WARNING: No rows for {symbol} on {date_ny}")
+            return
+        completed.append(result)
+        print(f"Run complete: {result} ({symbol} {date_ny})")
+
+    if workers <= 1 or len(jobs) <= 1:
+        for date_ny in date_list:
+            report(date_ny, emit_run(*jobs[date_ny]) if date_ny in jobs else None)
+        return completed
 
-    print(f"Run complete: {run_id} ({symbol} {date_ny})")
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {date_ny: pool.submit(emit_run, *job) for date_ny, job in jobs.items()}
+        for date_ny in date_list:
+            report(date_ny, futures[date_ny].result() if date_ny in futures else None)
+    return completed
+
+
+def run_for_date(conn, repo_root: Path, symbol: str, date_ny: str, run_id: Optional[str]) -> None:
+    run_range(conn, repo_root, symbol, [date_ny], run_id=run_id)
 
 
 def main() -> None:
@@ -498,7 +465,15 @@ def main() -> None:
     parser.add_argument("--end-date", dest="end_date", help="Range end (YYYY-MM-DD)")
     parser.add_argument("--run-id", dest="run_id", help="Optional run_id (single-date only)")
     parser.add_argument("--repo-root", default=".", help="Repository root (default: .)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes emitting per-date run folders in range mode (default: 1)",
+    )
     args = parser.parse_args()
+    if args.workers < 1:
+        raise SystemExit("--workers must be >= 1")
 
     if args.date:
         validate_date(args.date, "--date")
@@ -520,8 +495,7 @@ def main() -> None:
 
     repo_root = Path(args.repo_root).resolve()
     with get_connection() as conn:
-        for date_ny in date_list:
-            run_for_date(conn, repo_root, args.symbol, date_ny, args.run_id)
+        run_range(conn, repo_root, args.symbol, date_list, run_id=args.run_id, workers=args.workers)
 
 
 if __name__ == "__main__":
@@ -28,17 +28,27 @@ REPO_ROOT = SCRIPT_DIR.parent.parent
 sys.path.insert(0, str(REPO_ROOT))
 
 from trajectory_families import (
+    TrajectoryIndex,
     compute_fingerprint,
+    default_index_path,
     get_dominant_quadrant,
     is_valid_fingerprint,
     load_params,
     load_trajectory_csv,
+    open_trajectory_index,
     write_fingerprint_json,
 )
+from trajectory_families.fingerprint_store import (
+    STORE_FILENAME,
+    FingerprintStore,
+    open_fingerprint_store,
+    sync_fingerprint_store,
+)
 
 DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 DEFAULT_OUTPUT_DIR = REPO_ROOT / "reports" / "path1" / "trajectory_families"
 DEFAULT_EVIDENCE_DIR = REPO_ROOT / "reports" / "path1" / "evidence" / "runs"
+DEFAULT_TRAJECTORY_INDEX_DIR = REPO_ROOT / ".cache" / "path1" / "trajectory_families" / "locator"
 
 
 def validate_date(value: str, field_name: str) -> str:
@@ -56,48 +66,26 @@ def iter_dates(start: date, end: date) -> Iterable[date]:
         current += timedelta(days=1)
 
 
+def load_trajectory_index(evidence_dir: Path) -> TrajectoryIndex:
+    """Open the persisted trajectory index for evidence_dir, refreshed by run-folder mtime."""
+    return open_trajectory_index(evidence_dir, default_index_path(evidence_dir, DEFAULT_TRAJECTORY_INDEX_DIR))
+
+
 def find_trajectory_csv(
     evidence_dir: Path,
     symbol: str,
     date_ny: str,
+    index: Optional[TrajectoryIndex] = None,
 ) -> Optional[Path]:
     """
     Find trajectory.csv for a given symbol and date.
 
-    Searches through evidence runs for matching state_plane_v0_2 output.
+    Looks up state_plane_v0_2 output in the trajectory index (the newest
+    matching run wins); opens the persisted index if none is given.
     """
-    date_compact = date_ny.replace("-", "")
-
-    # Search all run directories
-    if not evidence_dir.exists():
-        return None
-
-    for run_dir in sorted(evidence_dir.iterdir(), reverse=True):
-        if not run_dir.is_dir():
-            continue
-
-        # Check state_plane_v0_2 subdirectory
-        trajectory_path = run_dir / "outputs" / "state_plane_v0_2" / "trajectory.csv"
-        if not trajectory_path.exists():
-            continue
-
-        # Verify this trajectory matches our date/symbol
-        try:
-            with open(trajectory_path, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    block_id = row.get("block_id", "")
-                    if block_id:
-                        # Format: YYYYMMDD-X-SYMBOL
-                        parts = block_id.split("-")
-                        if len(parts) >= 3:
-                            if parts[0] == date_compact and parts[2] == symbol:
-                                return trajectory_path
-                    break  # Only check first row
-        except Exception:
-            continue
-
-    return None
+    if index is None:
+        index = load_trajectory_index(evidence_dir)
+    return index.find(symbol, date_ny)
 
 
 def compute_relative_path(path: Path, base: Path) -> str:
@@ -114,6 +102,25 @@ def get_index_csv_path(output_dir: Path) -> Path:
     return output_dir / "v0.1" / "fingerprints" / "index.csv"
 
 
+def get_fingerprint_store_path(output_dir: Path) -> Path:
+    """Get path to the columnar fingerprint store (next to index.csv)."""
+    return output_dir / "v0.1" / "fingerprints" / STORE_FILENAME
+
+
+def update_fingerprint_store(output_dir: Path) -> Dict[str, int]:
+    """Sync the fingerprint store with index.csv (parses only new/changed fingerprint JSONs)."""
+    index = load_index_csv(get_index_csv_path(output_dir))
+    return sync_fingerprint_store(index.values(), output_dir / "v0.1", get_fingerprint_store_path(output_dir))
+
+
+def load_fingerprint_store(store_path: Path) -> FingerprintStore:
+    """Open a fingerprint store or exit with an error."""
+    store = open_fingerprint_store(store_path)
+    if store is None:
+        raise SystemExit(f"Fingerprint store not found or unreadable: {store_path}")
+    return store
+
+
 def load_index_csv(index_path: Path) -> Dict[str, Dict]:
     """Load existing index.csv into dict keyed by fingerprint_id."""
     if not index_path.exists():
@@ -168,6 +175,7 @@ def emit_fingerprint(
     evidence_dir: Path,
     output_dir: Path,
     params: Dict,
+    index: Optional[TrajectoryIndex] = None,
 ) -> Tuple[bool, str, Optional[Dict]]:
     """
     Emit fingerprint for a single day.
@@ -176,7 +184,7 @@ def emit_fingerprint(
     """
     # Find trajectory CSV if not provided
     if trajectory_csv is None:
-        trajectory_csv = find_trajectory_csv(evidence_dir, symbol, date_ny)
+        trajectory_csv = find_trajectory_csv(evidence_dir, symbol, date_ny, index=index)
         if trajectory_csv is None:
             return False, f"No trajectory.csv found for {symbol} {date_ny}", None
 
@@ -258,7 +266,7 @@ def emit_fingerprint(
 
 def emit_fingerprint_worker(args: Tuple) -> Tuple[str, str, bool, str]:
     """Worker function for parallel fingerprint emission."""
-    symbol, date_ny, evidence_dir, output_dir, params = args
+    symbol, date_ny, evidence_dir, output_dir, params, index = args
     success, message, _ = emit_fingerprint(
         symbol=symbol,
         date_ny=date_ny,
@@ -266,6 +274,7 @@ def emit_fingerprint_worker(args: Tuple) -> Tuple[str, str, bool, str]:
         evidence_dir=evidence_dir,
         output_dir=output_dir,
         params=params,
+        index=index,
     )
     return symbol, date_ny, success, message
 
@@ -291,6 +300,7 @@ def batch_fingerprints(
         raise ValueError("date_from must be <= date_to")
 
     dates = [d.strftime("%Y-%m-%d") for d in iter_dates(start, end)]
+    index = load_trajectory_index(evidence_dir)
     success_count = 0
     skip_count = 0
     errors = []
@@ -298,7 +308,7 @@ def batch_fingerprints(
     if parallel > 1:
         # Parallel execution
         work_items = [
-            (symbol, date_ny, evidence_dir, output_dir, params)
+            (symbol, date_ny, evidence_dir, output_dir, params, index)
             for date_ny in dates
         ]
 
@@ -329,6 +339,7 @@ def batch_fingerprints(
                 evidence_dir=evidence_dir,
                 output_dir=output_dir,
                 params=params,
+                index=index,
             )
 
             if success:
@@ -338,6 +349,10 @@ def batch_fingerprints(
                 skip_count += 1
                 errors.append(f"{date_ny}: {message}")
 
+    store_stats = update_fingerprint_store(output_dir)
+    print(f"  Fingerprint store: {store_stats['added']} added, {store_stats['updated']} updated, "
+          f"{store_stats['kept']} kept, {store_stats['removed']} removed")
+
     return success_count, skip_count, errors
 
 
@@ -366,6 +381,8 @@ def cmd_emit_fingerprint(args: argparse.Namespace) -> int:
     )
 
     print(message)
+    if success:
+        update_fingerprint_store(output_dir)
     return 0 if success else 1
 
 
@@ -476,14 +493,37 @@ def main() -> int:
         help="Cluster fingerprints into trajectory families (v0.1) and emit canonical outputs",
     )
     cluster_parser.add_argument(
-        "--index", required=True, help="Path to fingerprints/index.csv"
+        "--index", help="Path to fingerprints/index.csv"
+    )
+    cluster_parser.add_argument(
+        "--fingerprints-dir", help="Directory containing fingerprint JSONs"
     )
     cluster_parser.add_argument(
-        "--fingerprints-dir", required=True, help="Directory containing fingerprint JSONs"
+        "--fingerprint-store",
+        help="Path to fingerprints/fingerprints.npz (replaces --index/--fingerprints-dir)",
     )
     cluster_parser.add_argument(
         "--out-dir", required=True, help="Output directory for family artifacts"
     )
+    cluster_parser.add_argument(
+        "--distance-cache",
+        help="Directory of the on-disk DTW distance store (default: compute D in memory)",
+    )
+    cluster_parser.add_argument(
+        "--reuse-zscore",
+        action="store_true",
+        help="Standardize with the z-score stats recorded in --distance-cache, so added "
+        "fingerprints only compute their own rows (D then differs from a fresh run)",
+    )
+    cluster_parser.add_argument(
+        "--workers", type=int, default=1, help="Processes for new distance rows (default: 1)"
+    )
+    cluster_parser.add_argument(
+        "--kmedoids",
+        choices=["alternate", "fasterpam"],
+        default="alternate",
+        help="k-medoids engine: alternate (v0.1 results) or fasterpam swaps (default: alternate)",
+    )
 
     # generate-gallery command
     gallery_parser = subparsers.add_parser(
@@ -491,10 +531,14 @@ def main() -> int:
         help="Generate gallery by copying trajectory plots per canonical mapping",
     )
     gallery_parser.add_argument(
-        "--index", required=True, help="Path to fingerprints/index.csv"
+        "--index", help="Path to fingerprints/index.csv"
     )
     gallery_parser.add_argument(
-        "--fingerprints-dir", required=True, help="Directory containing fingerprint JSONs"
+        "--fingerprints-dir", help="Directory containing fingerprint JSONs"
+    )
+    gallery_parser.add_argument(
+        "--fingerprint-store",
+        help="Path to fingerprints/fingerprints.npz (replaces --index/--fingerprints-dir)",
     )
     gallery_parser.add_argument(
         "--assignments", required=True, help="Path to assignments.csv from clustering"
@@ -505,29 +549,56 @@ def main() -> int:
 
     args = parser.parse_args()
 
+    if args.command in ("cluster", "generate-gallery") and not args.fingerprint_store:
+        if not (args.index and args.fingerprints_dir):
+            parser.error("--index and --fingerprints-dir are required without --fingerprint-store")
+
     if args.command == "emit-fingerprint":
         return cmd_emit_fingerprint(args)
     elif args.command == "batch-fingerprints":
         return cmd_batch_fingerprints(args)
     elif args.command == "cluster":
         # --- CLUSTERING PIPELINE ---
-        from trajectory_families.features import load_fingerprints, extract_feature_matrix, zscore_standardize, get_feature_keys
+        from trajectory_families.features import load_fingerprints, extract_feature_matrix, zscore_stats, zscore_standardize, get_feature_keys
         from trajectory_families.distance import pairwise_dtw
+        from trajectory_families.distance_store import DistanceMatrixStore, standardization_basis
+        from trajectory_families.fingerprint import compute_content_hash
         from trajectory_families.clustering import select_k, compute_silhouette
         from trajectory_families.naming import stable_family_ids, assign_family_ids
         import csv, json, time
         from pathlib import Path
         import numpy as np
 
-        index = Path(args.index)
-        fingerprints_dir = Path(args.fingerprints_dir)
         out_dir = Path(args.out_dir)
-        fingerprints = load_fingerprints(index, fingerprints_dir)
-        feature_keys = get_feature_keys(fingerprints)
-        X = extract_feature_matrix(fingerprints, feature_keys)
-        Xz = zscore_standardize(X)
-        D = pairwise_dtw(Xz)
-        k, labels, medoids = select_k(D, Xz, seed=42)
+        if args.fingerprint_store:
+            fingerprint_store = load_fingerprint_store(Path(args.fingerprint_store))
+            fingerprints = fingerprint_store.records()
+            feature_keys = fingerprint_store.feature_keys
+            X = fingerprint_store.features
+        else:
+            fingerprints = load_fingerprints(Path(args.index), Path(args.fingerprints_dir))
+            feature_keys = get_feature_keys(fingerprints)
+            X = extract_feature_matrix(fingerprints, feature_keys)
+        if args.distance_cache:
+            # D is read from the store (memory-mapped); only unseen fingerprints are computed
+            store = DistanceMatrixStore(Path(args.distance_cache))
+            store.load()
+            stats = zscore_stats(X)
+            frozen = store.meta.get("zscore")
+            if args.reuse_zscore and frozen and frozen["feature_keys"] == feature_keys:
+                stats = (np.array(frozen["mean"]), np.array(frozen["std"]))
+            Xz = zscore_standardize(X, stats)
+            content_hashes = [fp.get('content_hash') or compute_content_hash(fp) for fp in fingerprints]
+            meta = {'zscore': {'feature_keys': feature_keys, 'mean': stats[0].tolist(), 'std': stats[1].tolist()}}
+            update = store.update(content_hashes, Xz, standardization_basis(feature_keys, *stats),
+                                  workers=args.workers, meta=meta)
+            print(f"Distance store: {update['reused']} reused, {update['added']} added, "
+                  f"{update['computed_pairs']} pairs computed" + (" (rebuilt: z-score changed)" if update['rebuilt'] else ""))
+            D = store.distances(content_hashes)
+        else:
+            Xz = zscore_standardize(X)
+            D = pairwise_dtw(Xz)
+        k, labels, medoids = select_k(D, Xz, seed=42, method=args.kmedoids)
         sil_samples = compute_silhouette(D, labels)
         id_map = stable_family_ids(labels, medoids, fingerprints)
         assignments = assign_family_ids(labels, id_map, sil_samples)
@@ -567,11 +638,12 @@ def main() -> int:
         from trajectory_families.gallery import copy_gallery, copy_medoids
         import csv
         from pathlib import Path
-        index = Path(args.index)
-        fingerprints_dir = Path(args.fingerprints_dir)
         out_dir = Path(args.out_dir)
         assignments_path = Path(args.assignments)
-        fingerprints = load_fingerprints(index, fingerprints_dir)
+        if args.fingerprint_store:
+            fingerprints = load_fingerprint_store(Path(args.fingerprint_store)).records()
+        else:
+            fingerprints = load_fingerprints(Path(args.index), Path(args.fingerprints_dir))
         # Load assignments
         assignments = []
         with open(assignments_path, newline='') as f:
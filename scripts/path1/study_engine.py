@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Path 1 Study Engine (fused single-scan study SQL)
+
+Generates the per-(run, score) study script used by the Path 1 runners
+(`run_evidence_queue.py`, `run_evidence_range.py`).
+
+The four studies (overall distribution, distribution by outcome, quartile x
+outcome frequency, quartile outcome stats) read the same view, symbol and date
+window. Instead of four SELECTs that each re-evaluate the v_path1_evidence_*
+view stack, the script is a single statement: the filtered score/outcome slice
+is materialized once (`WITH slice AS MATERIALIZED`) and every study is computed
+from it.
+
+The fused statement returns one wide result set. Each study owns its own
+column group, named `s<k>__<column>`; a leading `study_id` column tags rows.
+The studies are stacked with FULL JOINs on never-matching study_ids rather
+than UNION ALL, so each column keeps the type of its own study's expression.
+`study_executor.expand_fused_result_set()` splits it back into the four result
+sets, so outputs/study_*.txt keep the exact four-block psql layout.
+`generate_study_psql_script()` emits the same studies as four SELECTs over a
+temp `slice` table, the form RUN.md uses to reproduce those outputs with psql.
+
+Study definitions are unchanged: the same filters, aggregates and ordering per
+study. Studies 3 and 4 rank different subsets (outcome_category vs outcome_ret
+non-null), so each keeps its own NTILE(4), now over the materialized slice
+instead of a fresh view scan.
+"""
+
+from __future__ import annotations
+
+from typing import List, Tuple
+
+from study_executor import bar_close_range_sql
+
+# (column alias, SQL expression) per study column, in output order. Expressions
+# match the original per-study SELECTs, so result types are unchanged.
+STUDY1_COLUMNS = [
+    ("score_version", "'{version_str}'"),
+    ("run_id", "'{run_id}'"),
+    ("n_observations", "COUNT(*)"),
+    ("mean_score", "AVG(score)"),
+    ("stddev_score", "STDDEV(score)"),
+    ("min_score", "MIN(score)"),
+    ("p25_score", "PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY score)"),
+    ("p50_score", "PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY score)"),
+    ("p75_score", "PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY score)"),
+    ("max_score", "MAX(score)"),
+]
+STUDY2_COLUMNS = [
+    ("outcome_category", "outcome_category"),
+] + STUDY1_COLUMNS[2:]
+STUDY3_COLUMNS = [
+    ("score_quartile", "score_quartile"),
+    ("outcome_category", "outcome_category"),
+    ("n_observations", "COUNT(*)"),
+    (
+        "pct_within_quartile",
+        "ROUND(100.0 * COUNT(*) / SUM(COUNT(*)) OVER (PARTITION BY score_quartile), 2)",
+    ),
+]
+STUDY4_COLUMNS = [
+    ("score_quartile", "score_quartile"),
+    ("n_observations", "COUNT(*)"),
+    ("mean_outcome_ret", "AVG(outcome_ret)"),
+    ("stddev_outcome_ret", "STDDEV(outcome_ret)"),
+    (
+        "median_outcome_ret",
+        "PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY outcome_ret)",
+    ),
+]
+
+STUDY_COLUMNS: List[List[Tuple[str, str]]] = [
+    STUDY1_COLUMNS,
+    STUDY2_COLUMNS,
+    STUDY3_COLUMNS,
+    STUDY4_COLUMNS,
+]
+
+
+def _study_select(columns: List[Tuple[str, str]], **fmt: str) -> str:
+    items = []
+    for alias, expr in columns:
+        expr = expr.format(**fmt)
+        items.append(expr if expr == alias else f"{expr} AS {alias}")
+    return ",\n        ".join(items)
+
+
+def _fused_select_list() -> str:
+    """Final select list: study_id plus every study's columns as s<k>__<column>."""
+    items = ["COALESCE(s1.study_id, s2.study_id, s3.study_id, s4.study_id) AS study_id"]
+    for k, columns in enumerate(STUDY_COLUMNS, start=1):
+        items.extend(f"s{k}.{alias} AS s{k}__{alias}" for alias, _ in columns)
+    return ",\n    ".join(items)
+
+
+def generate_study_sql(
+    run_id: str, symbol: str, date_start: str, date_end: str,
+    score_name: str, score_config: dict
+) -> str:
+    """Generate the fused single-scan study script for one (run, score)."""
+    version = score_config["version"]
+    column = score_config["column"]
+    view = score_config["view"]
+    version_str = f"{score_name}-{version}"
+    time_predicate = bar_close_range_sql(date_start, date_end)
+
+    study1 = _study_select(STUDY1_COLUMNS, version_str=version_str, run_id=run_id)
+    study2 = _study_select(STUDY2_COLUMNS)
+    study3 = _study_select(STUDY3_COLUMNS)
+    study4 = _study_select(STUDY4_COLUMNS)
+    fused_select = _fused_select_list()
+
+    return f"""-- =============================================================================
+-- Study: {version_str} Distributional Analysis (Run-Scoped)
+-- Run ID: {run_id} | Symbol: {symbol} | Dates: {date_start} to {date_end}
+-- Time predicate (UTC day bounds): {time_predicate}
+-- =============================================================================
+
+-- FROZEN SCORE VERSION: {version_str}
+-- SOURCE VIEW: {view}
+--
+-- Fused single-scan form: the filtered slice is materialized once and all four
+-- studies are computed from it. Columns are grouped per study (s<k>__*) and
+-- tagged by study_id; the runner splits them back into four result sets.
+
+WITH slice AS MATERIALIZED (
+    SELECT
+        {column} AS score,
+        outcome_category,
+        outcome_ret
+    FROM {view}
+    WHERE {column} IS NOT NULL
+      AND sym = '{symbol}'
+      AND {time_predicate}
+),
+-- -----------------------------------------------------------------------------
+-- Study 1: Overall {version_str} Score Distribution
+-- -----------------------------------------------------------------------------
+study1 AS (
+    SELECT
+        1 AS study_id,
+        {study1}
+    FROM slice
+),
+-- -----------------------------------------------------------------------------
+-- Study 2: {version_str} Score Distribution Conditioned on Outcome Category
+-- -----------------------------------------------------------------------------
+study2 AS (
+    SELECT
+        2 AS study_id,
+        {study2}
+    FROM slice
+    WHERE outcome_category IS NOT NULL
+    GROUP BY outcome_category
+),
+-- -----------------------------------------------------------------------------
+-- Study 3: Outcome Frequency Conditioned on {version_str} Score Quantiles
+-- -----------------------------------------------------------------------------
+score_quantiles_3 AS (
+    SELECT
+        score,
+        outcome_category,
+        NTILE(4) OVER (ORDER BY score) AS score_quartile
+    FROM slice
+    WHERE outcome_category IS NOT NULL
+),
+study3 AS (
+    SELECT
+        3 AS study_id,
+        {study3}
+    FROM score_quantiles_3
+    GROUP BY score_quartile, outcome_category
+),
+-- -----------------------------------------------------------------------------
+-- Study 4: Outcome Value Statistics by {version_str} Score Quantile
+-- -----------------------------------------------------------------------------
+score_quantiles_4 AS (
+    SELECT
+        score,
+        outcome_ret,
+        NTILE(4) OVER (ORDER BY score) AS score_quartile
+    FROM slice
+    WHERE outcome_ret IS NOT NULL
+),
+study4 AS (
+    SELECT
+        4 AS study_id,
+        {study4}
+    FROM score_quantiles_4
+    GROUP BY score_quartile
+)
+-- -----------------------------------------------------------------------------
+-- Stack the studies: study_ids never match, so every output row carries exactly
+-- one study's columns (FULL JOIN keeps each study's own column types).
+-- -----------------------------------------------------------------------------
+SELECT
+    {fused_select}
+FROM study1 s1
+FULL JOIN study2 s2 ON s2.study_id = s1.study_id
+FULL JOIN study3 s3 ON s3.study_id = COALESCE(s1.study_id, s2.study_id)
+FULL JOIN study4 s4 ON s4.study_id = COALESCE(s1.study_id, s2.study_id, s3.study_id)
+ORDER BY
+    study_id,
+    s2__outcome_category,
+    s3__score_quartile,
+    s3__outcome_category,
+    s4__score_quartile;
+"""
+
+
+def generate_study_psql_script(
+    run_id: str, symbol: str, date_start: str, date_end: str,
+    score_name: str, score_config: dict
+) -> str:
+    """
+    Generate the psql-reproducible form of the same studies.
+
+    The fused statement returns one wide result set that only the runner knows
+    how to split. This script materializes the same slice into a temp table and
+    runs the four studies as separate SELECTs, so
+    `psql -q -f <script>` prints the four-block layout of outputs/study_*.txt.
+    """
+    version = score_config["version"]
+    column = score_config["column"]
+    view = score_config["view"]
+    version_str = f"{score_name}-{version}"
+    time_predicate = bar_close_range_sql(date_start, date_end)
+
+    study1 = _study_select(STUDY1_COLUMNS, version_str=version_str, run_id=run_id)
+    study2 = _study_select(STUDY2_COLUMNS)
+    study3 = _study_select(STUDY3_COLUMNS)
+    study4 = _study_select(STUDY4_COLUMNS)
+
+    return f"""-- =============================================================================
+-- Study: {version_str} Distributional Analysis (Run-Scoped, psql form)
+-- Run ID: {run_id} | Symbol: {symbol} | Dates: {date_start} to {date_end}
+-- Time predicate (UTC day bounds): {time_predicate}
+-- =============================================================================
+
+-- FROZEN SCORE VERSION: {version_str}
+-- SOURCE VIEW: {view}
+--
+-- Reproduces outputs/study_*.txt with `psql -q -f`: same slice and studies as
+-- the fused statement, one SELECT per study.
+
+CREATE TEMP TABLE slice AS
+SELECT
+    {column} AS score,
+    outcome_category,
+    outcome_ret
+FROM {view}
+WHERE {column} IS NOT NULL
+  AND sym = '{symbol}'
+  AND {time_predicate};
+
+-- -----------------------------------------------------------------------------
+-- Study 1: Overall {version_str} Score Distribution
+-- -----------------------------------------------------------------------------
+SELECT
+    {study1}
+FROM slice;
+
+-- -----------------------------------------------------------------------------
+-- Study 2: {version_str} Score Distribution Conditioned on Outcome Category
+-- -----------------------------------------------------------------------------
+SELECT
+    {study2}
+FROM slice
+WHERE outcome_category IS NOT NULL
+GROUP BY outcome_category
+ORDER BY outcome_category;
+
+-- -----------------------------------------------------------------------------
+-- Study 3: Outcome Frequency Conditioned on {version_str} Score Quantiles
+-- -----------------------------------------------------------------------------
+WITH score_quantiles AS (
+    SELECT
+        score,
+        outcome_category,
+        NTILE(4) OVER (ORDER BY score) AS score_quartile
+    FROM slice
+    WHERE outcome_category IS NOT NULL
+)
+SELECT
+    {study3}
+FROM score_quantiles
+GROUP BY score_quartile, outcome_category
+ORDER BY score_quartile, outcome_category;
+
+-- -----------------------------------------------------------------------------
+-- Study 4: Outcome Value Statistics by {version_str} Score Quantile
+-- -----------------------------------------------------------------------------
+WITH score_quantiles AS (
+    SELECT
+        score,
+        outcome_ret,
+        NTILE(4) OVER (ORDER BY score) AS score_quartile
+    FROM slice
+    WHERE outcome_ret IS NOT NULL
+)
+SELECT
+    {study4}
+FROM score_quantiles
+GROUP BY score_quartile
+ORDER BY score_quartile;
+"""
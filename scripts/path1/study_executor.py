@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Path 1 Study Executor (in-process, psql-free)
+
+Runs Path 1 study SQL on a single psycopg2 connection and returns typed
+result sets. Results are rendered back into the psql "aligned" text format so
+`outputs/study_*.txt` keep the exact layout produced by `psql -f` in earlier
+runs (provenance files stay diffable across runners). Fused single-scan study
+results (study_engine.py) are split back into one result set per study.
+
+Usage:
+    from study_executor import StudyExecutor
+
+    with StudyExecutor(db_url) as executor:
+        n = executor.query_scalar("SELECT COUNT(*) FROM ...")
+        result_sets = executor.run_script(sql_text)
+        text = render_psql_aligned(result_sets)
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple
+
+DAY_MS = 24 * 60 * 60 * 1000
+
+# PostgreSQL type OIDs that psql right-aligns (int2/int4/int8/oid/float4/float8/numeric/money)
+NUMERIC_TYPE_OIDS = frozenset({20, 21, 23, 26, 700, 701, 790, 1700})
+
+
+class StudyExecutionError(RuntimeError):
+    """A study statement failed; `output` holds the text rendered up to the failure."""
+
+    def __init__(self, message: str, output: str):
+        super().__init__(message)
+        self.output = output
+
+
+@dataclass
+class ResultSet:
+    """One statement's result: column names, per-column alignment and typed rows."""
+
+    columns: List[str]
+    numeric: List[bool]
+    rows: List[Tuple[Any, ...]] = field(default_factory=list)
+
+    def as_dicts(self) -> List[dict]:
+        return [dict(zip(self.columns, row)) for row in self.rows]
+
+
+# ============================================================================
+# TIME PREDICATES
+# ============================================================================
+
+def utc_date_bounds_ms(date_start: str, date_end: str) -> Tuple[int, int]:
+    """
+    Half-open bar_close_ms bounds [start_ms, end_ms) for an inclusive UTC date range.
+
+    Equivalent to `to_timestamp(bar_close_ms/1000)::date BETWEEN date_start AND
+    date_end` on a UTC session, but sargable on a (sym, bar_close_ms) index.
+    """
+    start = datetime.combine(date.fromisoformat(date_start), datetime.min.time(), tzinfo=timezone.utc)
+    end = datetime.combine(date.fromisoformat(date_end), datetime.min.time(), tzinfo=timezone.utc)
+    return int(start.timestamp()) * 1000, int((end + timedelta(days=1)).timestamp()) * 1000
+
+
+def bar_close_range_sql(date_start: str, date_end: str, column: str = "bar_close_ms") -> str:
+    """Render the sargable bar_close_ms predicate for an inclusive UTC date range."""
+    start_ms, end_ms = utc_date_bounds_ms(date_start, date_end)
+    return f"{column} >= {start_ms} AND {column} < {end_ms}"
+
+
+def utc_day_of_ms(day_index: int) -> str:
+    """Format `bar_close_ms / 86400000` (UTC day number) as YYYY-MM-DD."""
+    return (date(1970, 1, 1) + timedelta(days=int(day_index))).isoformat()
+
+
+# ============================================================================
+# SQL SPLITTING
+# ============================================================================
+
+def split_sql_statements(sql_text: str) -> List[str]:
+    """
+    Split a generated study script into individual statements.
+
+    Study SQL is generated by this repo: statements end with `;` at end of
+    line and literals never contain semicolons, so a line-oriented split is
+    sufficient. Comment-only chunks are dropped.
+    """
+    statements = []
+    current: List[str] = []
+    for line in sql_text.splitlines():
+        current.append(line)
+        if line.rstrip().endswith(";"):
+            statements.append("\n".join(current))
+            current = []
+    if current:
+        statements.append("\n".join(current))
+
+    def has_code(chunk: str) -> bool:
+        return any(
+            ln.strip() and not ln.strip().startswith("--")
+            for ln in chunk.splitlines()
+        )
+
+    return [s.strip() for s in statements if has_code(s)]
+
+
+# ============================================================================
+# FUSED RESULT SETS
+# ============================================================================
+
+FUSED_TAG_COLUMN = "study_id"
+
+
+def expand_fused_result_set(result: ResultSet) -> List[ResultSet]:
+    """
+    Split a fused study result (see study_engine.py) into per-study result sets.
+
+    A fused result has a leading `study_id` column and column groups named
+    `s<k>__<column>`; rows tagged k belong to study k. Any other result set is
+    returned unchanged.
+    """
+    if not result.columns or result.columns[0] != FUSED_TAG_COLUMN:
+        return [result]
+
+    groups: dict = {}
+    for idx, name in enumerate(result.columns[1:], start=1):
+        prefix, sep, column = name.partition("__")
+        if not sep or not prefix.startswith("s") or not prefix[1:].isdigit():
+            raise ValueError(f"Unexpected fused column name: {name}")
+        groups.setdefault(int(prefix[1:]), []).append((idx, column))
+
+    expanded = []
+    for study_no in sorted(groups):
+        idxs = [idx for idx, _ in groups[study_no]]
+        expanded.append(
+            ResultSet(
+                columns=[column for _, column in groups[study_no]],
+                numeric=[result.numeric[idx] for idx in idxs],
+                rows=[
+                    tuple(row[idx] for idx in idxs)
+                    for row in result.rows
+                    if row[0] == study_no
+                ],
+            )
+        )
+    return expanded
+
+
+# ============================================================================
+# PSQL ALIGNED RENDERING
+# ============================================================================
+
+def format_pg_value(value: Any) -> str:
+    """Format a typed value the way PostgreSQL's text output would."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, float):
+        if math.isnan(value):
+            return "NaN"
+        if math.isinf(value):
+            return "Infinity" if value > 0 else "-Infinity"
+        text = repr(value)
+        mantissa, _, exponent = text.partition("e")
+        if not exponent:
+            # float8out uses fixed notation only for decimal exponents in [-4, 15)
+            if abs(value) >= 1e15:
+                digits = mantissa.replace("-", "").replace(".", "").rstrip("0")
+                sign = "-" if value < 0 else ""
+                exp = len(mantissa.replace("-", "").split(".")[0]) - 1
+                frac = digits[1:]
+                return f"{sign}{digits[0]}{'.' + frac if frac else ''}e+{exp:02d}"
+            return mantissa[:-2] if mantissa.endswith(".0") else mantissa
+        return text
+    if isinstance(value, Decimal):
+        if value.is_nan():
+            return "NaN"
+        return format(value, "f")
+    return str(value)
+
+
+def _render_result_set(result: ResultSet) -> List[str]:
+    cells = [[format_pg_value(v) for v in row] for row in result.rows]
+    widths = [len(name) for name in result.columns]
+    for row in cells:
+        for i, cell in enumerate(row):
+            widths[i] = max(widths[i], len(cell))
+
+    header_parts = []
+    for name, width in zip(result.columns, widths):
+        pad = width - len(name)
+        left = pad // 2
+        header_parts.append(" " * left + name + " " * (pad - left))
+    lines = [" " + " | ".join(header_parts) + " "]
+    lines.append("+".join("-" * (w + 2) for w in widths))
+
+    last = len(widths) - 1
+    for row in cells:
+        parts = []
+        for i, (cell, width) in enumerate(zip(row, widths)):
+            if result.numeric[i]:
+                parts.append(cell.rjust(width))
+            elif i == last:
+                parts.append(cell)
+            else:
+                parts.append(cell.ljust(width))
+        lines.append(" " + " | ".join(parts))
+
+    n = len(result.rows)
+    lines.append(f"({n} row)" if n == 1 else f"({n} rows)")
+    lines.append("")
+    return lines
+
+
+def render_psql_aligned(result_sets: Sequence[ResultSet]) -> str:
+    """Render result sets exactly as `psql -f` prints them in aligned mode."""
+    lines: List[str] = []
+    for result in result_sets:
+        lines.extend(_render_result_set(result))
+    return "\n".join(lines) + ("\n" if lines else "")
+
+
+# ============================================================================
+# EXECUTOR
+# ============================================================================
+
+class StudyExecutor:
+    """Read-only Path 1 query executor bound to one psycopg2 connection."""
+
+    def __init__(self, db_url: str, connection=None):
+        if connection is None:
+            import psycopg2
+
+            connection = psycopg2.connect(db_url)
+            connection.set_session(readonly=True, autocommit=True)
+        self.conn = connection
+
+    def __enter__(self) -> "StudyExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def query(self, sql: str, params: Optional[Sequence[Any]] = None) -> ResultSet:
+        with self.conn.cursor() as cur:
+            cur.execute(sql, params)
+            if cur.description is None:
+                return ResultSet(columns=[], numeric=[], rows=[])
+            columns = [d.name for d in cur.description]
+            numeric = [d.type_code in NUMERIC_TYPE_OIDS for d in cur.description]
+            return ResultSet(columns=columns, numeric=numeric, rows=[tuple(r) for r in cur.fetchall()])
+
+    def query_scalar(self, sql: str, params: Optional[Sequence[Any]] = None) -> Any:
+        result = self.query(sql, params)
+        if not result.rows:
+            return None
+        return result.rows[0][0]
+
+    def run_script(self, sql_text: str) -> List[ResultSet]:
+        """Execute every statement in a study script, in order (fused results are expanded)."""
+        import psycopg2
+
+        results: List[ResultSet] = []
+        for statement in split_sql_statements(sql_text):
+            try:
+                results.extend(expand_fused_result_set(self.query(statement)))
+            except psycopg2.Error as exc:
+                partial = render_psql_aligned(results)
+                message = (exc.pgerror or str(exc)).strip()
+                raise StudyExecutionError(message, partial + message + "\n") from exc
+        return results
+
+    def run_sql_file(self, sql_file: Path, output_file: Path) -> List[ResultSet]:
+        """Execute a study SQL file and write its psql-format rendering to output_file."""
+        sql_text = sql_file.read_text(encoding="utf-8")
+        try:
+            results = self.run_script(sql_text)
+        except StudyExecutionError as exc:
+            output_file.write_text(exc.output, encoding="utf-8", newline="\n")
+            raise
+        output_file.write_text(render_psql_aligned(results), encoding="utf-8", newline="\n")
+        return results
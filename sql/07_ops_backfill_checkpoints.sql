@@ -0,0 +1,25 @@
+-- OVC Backfill Checkpoint Journal (v0.1)
+-- Migration: 07_ops_backfill_checkpoints.sql
+-- Purpose: Slice-level journal for the checkpointed OANDA backfills
+--          (src/backfill_oanda_2h_checkpointed.py, src/backfill_oanda_m15_checkpointed.py).
+--          One row per completed NY-session-aligned slice; reruns skip covered
+--          slices and --fill-gaps refills holes between journaled slices.
+--
+-- Usage:
+--   psql $NEON_DSN -f sql/07_ops_backfill_checkpoints.sql
+
+create schema if not exists ops;
+
+create table if not exists ops.backfill_checkpoints (
+  dataset text not null,              -- 'blocks_2h' | 'candles_m15'
+  sym text not null,
+  slice_start_ms bigint not null,     -- inclusive, UTC epoch ms
+  slice_end_ms bigint not null,       -- exclusive, UTC epoch ms
+  candle_count integer not null,      -- OANDA candles fetched (H1 or M15)
+  row_count integer not null,         -- rows upserted into the target table
+  content_sha256 text not null,       -- sha256 over fetched candles
+  elapsed_ms integer,
+  run_id text,
+  completed_at timestamptz not null default now(),
+  primary key (dataset, sym, slice_start_ms, slice_end_ms)
+);
@@ -0,0 +1,22 @@
+-- OVC Path 1 bar_close_ms Index (v0.1)
+-- Migration: 08_path1_bar_close_index.sql
+-- Purpose: Support sargable time predicates in Path 1 study SQL.
+--          Study generators (scripts/path1/run_evidence_queue.py,
+--          scripts/path1/run_evidence_range.py) and the evidence pack builder
+--          filter on `sym = ... AND bar_close_ms >= <start_ms> AND bar_close_ms < <end_ms>`
+--          with UTC day bounds computed client-side, instead of the
+--          non-sargable `to_timestamp(bar_close_ms/1000)::date BETWEEN ...`.
+--          This index serves reads that filter the canonical blocks table
+--          directly (e.g. the pack builder's spine join). It does NOT make the
+--          study queries index-bounded on their own: the v_path1_evidence_*
+--          stack reads derived.v_ovc_c_outcomes_v0_1, whose LEAD windows are
+--          ordered by bar_close_ms, so Postgres cannot push the bar_close_ms
+--          bounds below them (only sym). Studies become index-bounded once
+--          09_derived_path1_base_v0_1.sql points the views at
+--          derived.path1_base_v0_1 and its idx_path1_base_v0_1_sym_bar_close.
+--
+-- Usage:
+--   psql $NEON_DSN -f sql/08_path1_bar_close_index.sql
+
+create index if not exists idx_ovc_min_sym_bar_close
+  on ovc.ovc_blocks_v01_1_min(sym, bar_close_ms);
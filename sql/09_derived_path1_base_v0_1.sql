@@ -0,0 +1,305 @@
+-- OVC Path 1 Materialized Base Table (v0.1)
+-- Migration: 09_derived_path1_base_v0_1.sql
+-- Purpose: Materialize the joined C1/C2 features, C3 passthrough and Option C
+--          forward outcomes that every Path 1 score and evidence view reads.
+--          Before this migration each study query re-evaluated the full view
+--          stack (C1 view joined twice, C2 and C3 windows, 18 LEADs in
+--          derived.v_ovc_c_outcomes_v0_1). The Path 1 views now read one
+--          indexed table instead.
+--
+-- Objects:
+--   derived.v_path1_base_source_v0_1    Live definition of one base row (plain view
+--                                       over the CANONICAL C1/C2/outcomes views).
+--                                       Refresh source and parity reference.
+--   derived.path1_base_v0_1             Materialized copy of the source view.
+--   derived.path1_base_watermarks_v0_1  Per-symbol refresh watermark (max bar_close_ms,
+--                                       row count and source max(ingest_ts)).
+--   derived.v_ovc_b_scores_*            Re-created as thin wrappers over the base table.
+--   derived.v_path1_evidence_*          Re-created as thin wrappers over the base table.
+--
+-- Canonical views are NOT modified: v_ovc_c1/c2/c3_features_v0_1 and
+-- v_ovc_c_outcomes_v0_1 remain the source of truth (CANONICAL LOCK).
+-- Score and evidence wrapper definitions are unchanged apart from their FROM
+-- clause (same columns, types, formulas and outcome mapping as
+-- sql/path1/db_patches/patch_create_*_views_20260120.sql).
+--
+-- The base table and watermarks are populated by this migration. Afterwards:
+-- Refresh (incremental per symbol, by bar_close_ms watermark):
+--   python scripts/path1/refresh_path1_base.py [--symbol SYM] [--full]
+-- Parity check (base table vs live source view):
+--   python scripts/path1/refresh_path1_base.py --check-parity [--symbol SYM]
+--
+-- Usage:
+--   psql $NEON_DSN -f sql/09_derived_path1_base_v0_1.sql
+--   (requires sql/derived/v_ovc_*.sql and the Path 1 db_patches to be deployed)
+
+BEGIN;
+
+CREATE SCHEMA IF NOT EXISTS derived;
+
+--------------------------------------------------------------------------------
+-- V_PATH1_BASE_SOURCE_V0_1: one row per C1/C2 block, outcomes left-joined
+--------------------------------------------------------------------------------
+-- Row set = base_data of the Path 1 score views (C1 JOIN C2, block_id not null).
+-- Outcome columns are NULL where v_ovc_c_outcomes_v0_1 has no anchor row,
+-- matching the LEFT JOIN in the evidence views.
+
+CREATE OR REPLACE VIEW derived.v_path1_base_source_v0_1 AS
+SELECT
+    c1.block_id,
+    c1.sym,
+    c2.bar_close_ms,
+
+    -- C1 score inputs
+    c1.body_ratio,
+    c1.rng AS c1_rng,
+    c1.upper_wick_ratio,
+    c1.lower_wick_ratio,
+
+    -- C3 passthrough (via Option C outcomes)
+    o.c3_volatility_regime,
+    o.c3_trend_bias,
+
+    -- Option C forward outcomes
+    o.fwd_ret_1,
+    o.fwd_ret_3,
+    o.fwd_ret_6,
+    o.mfe_3,
+    o.mfe_6,
+    o.mae_3,
+    o.mae_6,
+    o.rvol_6
+FROM derived.v_ovc_c1_features_v0_1 c1
+INNER JOIN derived.v_ovc_c2_features_v0_1 c2
+    ON c1.block_id = c2.block_id
+LEFT JOIN derived.v_ovc_c_outcomes_v0_1 o
+    ON c1.block_id = o.block_id
+    AND c1.sym = o.sym
+WHERE c1.block_id IS NOT NULL;
+
+COMMENT ON VIEW derived.v_path1_base_source_v0_1 IS
+'Path 1 base row definition (live). Refresh source and parity reference for derived.path1_base_v0_1.';
+
+--------------------------------------------------------------------------------
+-- PATH1_BASE_V0_1: materialized base rows
+--------------------------------------------------------------------------------
+-- Created from the source view so column names and types match it exactly
+-- (refresh and parity use SELECT * on both sides).
+
+CREATE TABLE IF NOT EXISTS derived.path1_base_v0_1 AS
+SELECT * FROM derived.v_path1_base_source_v0_1
+WITH NO DATA;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_path1_base_v0_1_block_id
+    ON derived.path1_base_v0_1(block_id);
+CREATE INDEX IF NOT EXISTS idx_path1_base_v0_1_sym_bar_close
+    ON derived.path1_base_v0_1(sym, bar_close_ms);
+
+--------------------------------------------------------------------------------
+-- PATH1_BASE_WATERMARKS_V0_1: per-symbol refresh state
+--------------------------------------------------------------------------------
+
+CREATE TABLE IF NOT EXISTS derived.path1_base_watermarks_v0_1 (
+    sym                 TEXT PRIMARY KEY,
+    watermark_ms        BIGINT NOT NULL,            -- max bar_close_ms materialized
+    row_count           BIGINT NOT NULL,            -- base rows for sym after refresh
+    source_ingest_ts    TIMESTAMPTZ,                -- max blocks ingest_ts at or before watermark_ms
+    refresh_mode        TEXT NOT NULL,              -- 'full' or 'incremental'
+    restated_from_ms    BIGINT,                     -- NULL for full refreshes
+    refreshed_at        TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- Added after the first deployment of this migration; a NULL forces the next
+-- refresh of that symbol to be full.
+ALTER TABLE derived.path1_base_watermarks_v0_1
+    ADD COLUMN IF NOT EXISTS source_ingest_ts TIMESTAMPTZ;
+
+--------------------------------------------------------------------------------
+-- Initial load: the views below read the base table as soon as this commits,
+-- so it is filled here rather than left for the first refresh. Symbols that
+-- already have a watermark (migration re-applied) are left to the refresh job.
+--------------------------------------------------------------------------------
+
+INSERT INTO derived.path1_base_v0_1
+SELECT s.*
+FROM derived.v_path1_base_source_v0_1 s
+WHERE NOT EXISTS (
+    SELECT 1 FROM derived.path1_base_watermarks_v0_1 w WHERE w.sym = s.sym
+);
+
+INSERT INTO derived.path1_base_watermarks_v0_1
+    (sym, watermark_ms, row_count, source_ingest_ts, refresh_mode, restated_from_ms)
+SELECT
+    w.sym,
+    w.watermark_ms,
+    w.row_count,
+    (SELECT MAX(b.ingest_ts)
+     FROM ovc.ovc_blocks_v01_1_min b
+     WHERE b.sym = w.sym AND b.bar_close_ms <= w.watermark_ms),
+    'full',
+    NULL
+FROM (
+    SELECT sym, MAX(bar_close_ms) AS watermark_ms, COUNT(*) AS row_count
+    FROM derived.path1_base_v0_1
+    GROUP BY sym
+) w
+ON CONFLICT (sym) DO NOTHING;
+
+--------------------------------------------------------------------------------
+-- Score views: thin wrappers (formulas unchanged, FROZEN)
+--------------------------------------------------------------------------------
+
+CREATE OR REPLACE VIEW derived.v_ovc_b_scores_dis_v1_1 AS
+SELECT
+    block_id,
+    sym,
+    bar_close_ms,
+    CASE
+        WHEN body_ratio IS NULL THEN NULL
+        ELSE CAST(body_ratio AS DOUBLE PRECISION)
+    END AS dis_score
+FROM derived.path1_base_v0_1;
+
+COMMENT ON VIEW derived.v_ovc_b_scores_dis_v1_1 IS
+'Path 1 Score: DIS-v1.1 (Displacement). Raw score = body_ratio. FROZEN. Reads derived.path1_base_v0_1.';
+
+CREATE OR REPLACE VIEW derived.v_ovc_b_scores_res_v1_0 AS
+WITH with_stats AS (
+    SELECT
+        sym,
+        AVG(c1_rng) AS mean_rng
+    FROM derived.path1_base_v0_1
+    WHERE c1_rng IS NOT NULL
+    GROUP BY sym
+)
+SELECT
+    b.block_id,
+    b.sym,
+    b.bar_close_ms,
+    CASE
+        WHEN b.c1_rng IS NULL THEN NULL
+        WHEN ws.mean_rng IS NULL OR ws.mean_rng = 0 THEN NULL
+        ELSE b.c1_rng / ws.mean_rng
+    END AS res_score
+FROM derived.path1_base_v0_1 b
+LEFT JOIN with_stats ws ON b.sym = ws.sym;
+
+COMMENT ON VIEW derived.v_ovc_b_scores_res_v1_0 IS
+'Path 1 Score: RES-v1.0 (Range Expansion). Raw score = range / mean_range per symbol. FROZEN. Reads derived.path1_base_v0_1.';
+
+CREATE OR REPLACE VIEW derived.v_ovc_b_scores_lid_v1_0 AS
+SELECT
+    block_id,
+    sym,
+    bar_close_ms,
+    CASE
+        WHEN upper_wick_ratio IS NULL OR lower_wick_ratio IS NULL THEN NULL
+        WHEN (upper_wick_ratio + lower_wick_ratio) = 0 THEN NULL
+        ELSE ABS(upper_wick_ratio - lower_wick_ratio) / (upper_wick_ratio + lower_wick_ratio)
+    END AS lid_score
+FROM derived.path1_base_v0_1;
+
+COMMENT ON VIEW derived.v_ovc_b_scores_lid_v1_0 IS
+'Path 1 Score: LID-v1.0 (Wick Imbalance). Raw score = |upper_wick - lower_wick| / (upper + lower). FROZEN. Reads derived.path1_base_v0_1.';
+
+--------------------------------------------------------------------------------
+-- Evidence views: thin wrappers (outcome mapping unchanged)
+--------------------------------------------------------------------------------
+
+CREATE OR REPLACE VIEW derived.v_path1_evidence_dis_v1_1 AS
+SELECT
+    s.block_id,
+    s.sym,
+    s.bar_close_ms,
+    s.dis_score AS dis_v1_1_raw,
+    CASE
+        WHEN o.fwd_ret_1 > 0 THEN 1
+        WHEN o.fwd_ret_1 < 0 THEN -1
+        ELSE 0
+    END AS outcome_dir,
+    NULL::double precision AS outcome_rng,
+    o.fwd_ret_1 AS outcome_ret,
+    CASE
+        WHEN o.fwd_ret_1 > 0.001 THEN 'UP'
+        WHEN o.fwd_ret_1 < -0.001 THEN 'DOWN'
+        ELSE 'FLAT'
+    END AS outcome_category,
+    NULL::text AS next_block_id,
+    NULL::bigint AS next_bar_close_ms
+FROM derived.v_ovc_b_scores_dis_v1_1 s
+LEFT JOIN derived.path1_base_v0_1 o
+    ON s.block_id = o.block_id
+    AND s.sym = o.sym;
+
+COMMENT ON VIEW derived.v_path1_evidence_dis_v1_1 IS
+'Path 1 Evidence: DIS-v1.1 score joined with Option C outcomes (materialized in derived.path1_base_v0_1). Read-only, no transformations.';
+
+CREATE OR REPLACE VIEW derived.v_path1_evidence_res_v1_0 AS
+SELECT
+    s.block_id,
+    s.sym,
+    s.bar_close_ms,
+    s.res_score AS res_v1_0_raw,
+    CASE
+        WHEN o.fwd_ret_1 > 0 THEN 1
+        WHEN o.fwd_ret_1 < 0 THEN -1
+        ELSE 0
+    END AS outcome_dir,
+    NULL::double precision AS outcome_rng,
+    o.fwd_ret_1 AS outcome_ret,
+    CASE
+        WHEN o.fwd_ret_1 > 0.001 THEN 'UP'
+        WHEN o.fwd_ret_1 < -0.001 THEN 'DOWN'
+        ELSE 'FLAT'
+    END AS outcome_category,
+    NULL::text AS next_block_id,
+    NULL::bigint AS next_bar_close_ms
+FROM derived.v_ovc_b_scores_res_v1_0 s
+LEFT JOIN derived.path1_base_v0_1 o
+    ON s.block_id = o.block_id
+    AND s.sym = o.sym;
+
+COMMENT ON VIEW derived.v_path1_evidence_res_v1_0 IS
+'Path 1 Evidence: RES-v1.0 score joined with Option C outcomes (materialized in derived.path1_base_v0_1). Read-only, no transformations.';
+
+CREATE OR REPLACE VIEW derived.v_path1_evidence_lid_v1_0 AS
+SELECT
+    s.block_id,
+    s.sym,
+    s.bar_close_ms,
+    s.lid_score AS lid_v1_0_raw,
+    CASE
+        WHEN o.fwd_ret_1 > 0 THEN 1
+        WHEN o.fwd_ret_1 < 0 THEN -1
+        ELSE 0
+    END AS outcome_dir,
+    NULL::double precision AS outcome_rng,
+    o.fwd_ret_1 AS outcome_ret,
+    CASE
+        WHEN o.fwd_ret_1 > 0.001 THEN 'UP'
+        WHEN o.fwd_ret_1 < -0.001 THEN 'DOWN'
+        ELSE 'FLAT'
+    END AS outcome_category,
+    NULL::text AS next_block_id,
+    NULL::bigint AS next_bar_close_ms
+FROM derived.v_ovc_b_scores_lid_v1_0 s
+LEFT JOIN derived.path1_base_v0_1 o
+    ON s.block_id = o.block_id
+    AND s.sym = o.sym;
+
+COMMENT ON VIEW derived.v_path1_evidence_lid_v1_0 IS
+'Path 1 Evidence: LID-v1.0 score joined with Option C outcomes (materialized in derived.path1_base_v0_1). Read-only, no transformations.';
+
+COMMIT;
+
+-- =============================================================================
+-- PARITY CHECK (base table vs live source; both counts must be 0)
+-- =============================================================================
+-- SELECT
+--     (SELECT COUNT(*) FROM (SELECT * FROM derived.path1_base_v0_1
+--                            EXCEPT ALL
+--                            SELECT * FROM derived.v_path1_base_source_v0_1) x) AS stale_rows,
+--     (SELECT COUNT(*) FROM (SELECT * FROM derived.v_path1_base_source_v0_1
+--                            EXCEPT ALL
+--                            SELECT * FROM derived.path1_base_v0_1) x) AS missing_rows;
+-- =============================================================================
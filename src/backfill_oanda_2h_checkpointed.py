@@ -1,12 +1,14 @@
 import argparse
 import os
 import sys
+import time as time_mod
 from datetime import datetime, time, timedelta, timezone
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
 import oandapyV20
 import oandapyV20.endpoints.instruments as instruments
+import numpy as np
 import pandas as pd
 import psycopg2
 from psycopg2.extras import Json
@@ -15,6 +17,14 @@ from psycopg2.extras import Json
 REPO_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(REPO_ROOT / "src"))
 
+from ovc_ops.backfill_checkpoint import (
+    DATASET_BLOCKS_2H,
+    CheckpointJournal,
+    candles_sha256,
+    frame_candle_records,
+    is_covered,
+    iter_session_slices,
+)
 from ovc_ops.run_artifact import RunWriter, detect_trigger
 
 # ---------- tiny .env loader ----------
@@ -69,6 +79,7 @@ BLOCK_LETTERS = "ABCDEFGHIJKL"
 BLOCK4H = ("AB", "CD", "EF", "GH", "IJ", "KL")
 
 DAYS_PER_RUN = int(os.environ.get("BACKFILL_DAYS_PER_RUN", "30"))
+SLICE_DAYS = int(os.environ.get("OANDA_SLICE_DAYS", "3"))
 BACKFILL_DATE_NY = os.environ.get("BACKFILL_DATE_NY")
 
 START_UTC_STR = os.environ.get("BACKFILL_START_UTC", "2005-01-01T00:00:00Z")
@@ -181,6 +192,45 @@ INSERT_COLUMNS = [
     "payload",
 ]
 
+# Columns that are constant for every backfilled MIN row.
+MIN_ROW_DEFAULTS = {
+    "tz": NY_TZ.key,
+    "ver": DEFAULT_VER,
+    "profile": DEFAULT_PROFILE,
+    "scheme_min": DEFAULT_SCHEME_MIN,
+    "state_tag": DEFAULT_TEXT,
+    "value_tag": DEFAULT_TEXT,
+    "event": DEFAULT_TEXT,
+    "tt": 0,
+    "cp_tag": DEFAULT_TEXT,
+    "tis": 0,
+    "rrc": 0.0,
+    "vrc": 0.0,
+    "trend_tag": DEFAULT_TEXT,
+    "struct_state": DEFAULT_TEXT,
+    "space_tag": DEFAULT_TEXT,
+    "htf_stack": DEFAULT_TEXT,
+    "with_htf": False,
+    "rd_state": DEFAULT_TEXT,
+    "regime_tag": DEFAULT_TEXT,
+    "trans_risk": DEFAULT_TEXT,
+    "bias_mode": DEFAULT_TEXT,
+    "bias_dir": "NEUTRAL",
+    "perm_state": DEFAULT_TEXT,
+    "rail_loc": DEFAULT_TEXT,
+    "tradeable": False,
+    "conf_l3": DEFAULT_TEXT,
+    "play": DEFAULT_TEXT,
+    "pred_dir": "NEUTRAL",
+    "pred_target": DEFAULT_TEXT,
+    "timebox": DEFAULT_TEXT,
+    "invalidation": DEFAULT_TEXT,
+    "source": SOURCE,
+    "build_id": DEFAULT_BUILD_ID,
+    "note": DEFAULT_TEXT,
+    "ready": True,
+}
+
 INSERT_SQL = f"""
 insert into ovc.ovc_blocks_v01_1_min (
   {", ".join(INSERT_COLUMNS)}, ingest_ts
@@ -221,6 +271,16 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="End date (NY, YYYY-MM-DD, inclusive). If set with --start_ny, overrides env vars.",
     )
+    parser.add_argument(
+        "--fill-gaps",
+        action="store_true",
+        help="Backfill holes between slices recorded in ops.backfill_checkpoints, then exit.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Refetch slices even if the checkpoint journal marks them complete.",
+    )
     return parser.parse_args()
 
 
@@ -247,31 +307,39 @@ def _format_export_value(value) -> str:
     return str(value)
 
 
-def _build_export_str(values: dict) -> str:
-    parts = [f"{key}={_format_export_value(values.get(key))}" for key in EXPORT_FIELDS]
-    return "|".join(parts)
+def _ohlc_violation(o, h, l, c) -> tuple[int, str] | None:
+    """Return (row position, reason) of the first insane OHLC row, or None."""
+    high_low = h < l
+    outside = (h < np.maximum(o, c)) | (l > np.minimum(o, c))
+    bad = np.flatnonzero(high_low | outside)
+    if bad.size == 0:
+        return None
+    i = int(bad[0])
+    return i, "high < low." if high_low[i] else "open/close outside range."
 
 
-def _ensure_ohlc_sane(o: float, h: float, l: float, c: float, label: str) -> None:
-    if h < l:
-        raise SystemExit(f"Invalid OHLC on {label}: high < low.")
-    if h < max(o, c) or l > min(o, c):
-        raise SystemExit(f"Invalid OHLC on {label}: open/close outside range.")
+def _bar_direction(o, c):
+    return np.where(c > o, 1, np.where(c < o, -1, 0))
 
 
-def _bar_direction(o: float, c: float) -> int:
-    if c > o:
-        return 1
-    if c < o:
-        return -1
-    return 0
+def _isoformat_series(ts: pd.Series) -> list[str]:
+    """Vectorized Timestamp.isoformat() for whole-second tz-aware timestamps."""
+    wall = ts.dt.tz_localize(None).to_numpy(dtype="datetime64[s]")
+    utc = ts.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy(dtype="datetime64[s]")
+    offset_min = ((wall - utc) // np.timedelta64(1, "m")).astype(np.int64)
+    suffix = {
+        m: f"{'-' if m < 0 else '+'}{abs(m) // 60:02d}:{abs(m) % 60:02d}"
+        for m in np.unique(offset_min).tolist()
+    }
+    base = np.datetime_as_string(wall, unit="s").tolist()
+    return [b + suffix[m] for b, m in zip(base, offset_min.tolist())]
 
 
 def _build_payload(
     *,
     values: dict,
-    ts_start_ny: datetime,
-    ts_end_ny: datetime,
+    ts_start_ny: str,
+    ts_end_ny: str,
 ) -> dict:
     return {
         "schema": DEFAULT_SCHEME_MIN,
@@ -282,8 +350,8 @@ def _build_payload(
             "granularity": "H1",
         },
         "normalized": {
-            "ts_start_ny": ts_start_ny.isoformat(),
-            "ts_end_ny": ts_end_ny.isoformat(),
+            "ts_start_ny": ts_start_ny,
+            "ts_end_ny": ts_end_ny,
         },
         "parsed": {
             "block_id": values.get("block_id"),
@@ -383,102 +451,120 @@ def resample_to_2h_ny(df_h1: pd.DataFrame) -> pd.DataFrame:
 
 
 def build_min_rows(df_2h: pd.DataFrame) -> list[tuple]:
+    """
+    Build insert-ready MIN rows from resampled 2H blocks.
+
+    OHLC sanity, block ids, bar_close_ms, dir, ret and export strings are
+    computed over whole columns; only the final tuple and payload assembly
+    touches individual rows. Output matches INSERT_COLUMNS order.
+    """
     if df_2h.empty:
         return []
 
-    symbol = SYMBOL_DB.upper()
-    rows = []
-
-    for row in df_2h.itertuples(index=False):
-        ts_start_ny = row.block_start_ny
-        ts_end_ny = ts_start_ny + timedelta(hours=2)
-        block_index = int(row.block_index)
-        if block_index < 0 or block_index > 11:
-            continue
+    df = df_2h[(df_2h["block_index"] >= 0) & (df_2h["block_index"] <= 11)]
+    if df.empty:
+        return []
 
-        block_letter = BLOCK_LETTERS[block_index]
-        block4h = BLOCK4H[block_index // 2]
-        date_ny = row.date_ny
-        block_id = f"{date_ny:%Y%m%d}-{block_letter}-{symbol}"
-        bar_close_ms = int(ts_end_ny.astimezone(timezone.utc).timestamp() * 1000)
-
-        o = float(row.open)
-        h = float(row.high)
-        l = float(row.low)
-        c = float(row.close)
-        _ensure_ohlc_sane(o, h, l, c, f"{block_id}")
-
-        rng = h - l
-        body = abs(c - o)
-        direction = _bar_direction(o, c)
-        ret = (c - o) / o if o else 0.0
-
-        values = {
-            "block_id": block_id,
-            "sym": symbol,
-            "tz": NY_TZ.key,
-            "date_ny": date_ny,
-            "bar_close_ms": bar_close_ms,
-            "block2h": block_letter,
-            "block4h": block4h,
-            "ver": DEFAULT_VER,
-            "profile": DEFAULT_PROFILE,
-            "scheme_min": DEFAULT_SCHEME_MIN,
-            "o": o,
-            "h": h,
-            "l": l,
-            "c": c,
-            "rng": float(rng),
-            "body": float(body),
-            "dir": direction,
-            "ret": float(ret),
-            "state_tag": DEFAULT_TEXT,
-            "value_tag": DEFAULT_TEXT,
-            "event": DEFAULT_TEXT,
-            "tt": 0,
-            "cp_tag": DEFAULT_TEXT,
-            "tis": 0,
-            "rrc": 0.0,
-            "vrc": 0.0,
-            "trend_tag": DEFAULT_TEXT,
-            "struct_state": DEFAULT_TEXT,
-            "space_tag": DEFAULT_TEXT,
-            "htf_stack": DEFAULT_TEXT,
-            "with_htf": False,
-            "rd_state": DEFAULT_TEXT,
-            "regime_tag": DEFAULT_TEXT,
-            "trans_risk": DEFAULT_TEXT,
-            "bias_mode": DEFAULT_TEXT,
-            "bias_dir": "NEUTRAL",
-            "perm_state": DEFAULT_TEXT,
-            "rail_loc": DEFAULT_TEXT,
-            "tradeable": False,
-            "conf_l3": DEFAULT_TEXT,
-            "play": DEFAULT_TEXT,
-            "pred_dir": "NEUTRAL",
-            "pred_target": DEFAULT_TEXT,
-            "timebox": DEFAULT_TEXT,
-            "invalidation": DEFAULT_TEXT,
-            "source": SOURCE,
-            "build_id": DEFAULT_BUILD_ID,
-            "note": DEFAULT_TEXT,
-            "ready": True,
-        }
+    symbol = SYMBOL_DB.upper()
+    block_index = df["block_index"].to_numpy(dtype=np.int64)
+    date_ny = df["date_ny"].tolist()
+
+    block2h = np.array(list(BLOCK_LETTERS), dtype=object)[block_index]
+    block4h = np.array(BLOCK4H, dtype=object)[block_index // 2]
+    date_key = np.char.replace(
+        np.datetime_as_string(np.array(date_ny, dtype="datetime64[D]")), "-", ""
+    ).astype(object)
+    block_id = date_key + "-" + block2h + f"-{symbol}"
+
+    o = df["open"].to_numpy(dtype=np.float64)
+    h = df["high"].to_numpy(dtype=np.float64)
+    l = df["low"].to_numpy(dtype=np.float64)
+    c = df["close"].to_numpy(dtype=np.float64)
+    violation = _ohlc_violation(o, h, l, c)
+    if violation is not None:
+        i, reason = violation
+        raise SystemExit(f"Invalid OHLC on {block_id[i]}: {reason}")
+
+    ts_start_ny = df["block_start_ny"]
+    ts_end_ny = ts_start_ny + pd.Timedelta(hours=2)
+    bar_close_ms = ((ts_end_ny - pd.Timestamp(0, tz="UTC")) // pd.Timedelta(milliseconds=1)).tolist()
+    ts_start_iso = _isoformat_series(ts_start_ny)
+    ts_end_iso = _isoformat_series(ts_end_ny)
+
+    delta = c - o
+    rng = (h - l).tolist()
+    body = np.abs(delta).tolist()
+    direction = _bar_direction(o, c).tolist()
+    ret = np.divide(delta, o, out=np.zeros_like(delta), where=o != 0).tolist()
+    block_id = block_id.tolist()
+    block2h = block2h.tolist()
+    block4h = block4h.tolist()
+    o, h, l, c = o.tolist(), h.tolist(), l.tolist(), c.tolist()
+
+    columns = {
+        "block_id": block_id,
+        "sym": symbol,
+        "date_ny": date_ny,
+        "bar_close_ms": bar_close_ms,
+        "block2h": block2h,
+        "block4h": block4h,
+        "o": o,
+        "h": h,
+        "l": l,
+        "c": c,
+        "rng": rng,
+        "body": body,
+        "dir": direction,
+        "ret": ret,
+        **MIN_ROW_DEFAULTS,
+    }
+    columns["state_key"] = _build_state_key(columns)
+
+    # export_str: constant fields are rendered into the template once.
+    template_parts = []
+    row_fields = []
+    for key in EXPORT_FIELDS:
+        value = columns[key]
+        if isinstance(value, list):
+            template_parts.append(f"{key}={{}}")
+            # Per-row columns hold str/int/float/date only, so str() matches _format_export_value.
+            row_fields.append(map(str, value))
+        else:
+            rendered = _format_export_value(value).replace("{", "{{").replace("}", "}}")
+            template_parts.append(f"{key}={rendered}")
+    template = "|".join(template_parts)
+    columns["export_str"] = [template.format(*fields) for fields in zip(*row_fields)]
 
-        state_key = _build_state_key(values)
-        values["state_key"] = state_key
-        values["export_str"] = _build_export_str(values)
-        values["payload"] = Json(
+    columns["payload"] = [
+        Json(
             _build_payload(
-                values=values,
-                ts_start_ny=ts_start_ny,
-                ts_end_ny=ts_end_ny,
+                values={
+                    "block_id": block_id[i],
+                    "sym": symbol,
+                    "date_ny": date_ny[i],
+                    "block2h": block2h[i],
+                    "block4h": block4h[i],
+                    "bar_close_ms": bar_close_ms[i],
+                    "o": o[i],
+                    "h": h[i],
+                    "l": l[i],
+                    "c": c[i],
+                    "source": SOURCE,
+                },
+                ts_start_ny=ts_start_iso[i],
+                ts_end_ny=ts_end_iso[i],
             )
         )
+        for i in range(len(block_id))
+    ]
 
-        rows.append(tuple(values[col] for col in INSERT_COLUMNS))
-
-    return rows
+    n = len(block_id)
+    return list(
+        zip(*[
+            columns[col] if isinstance(columns[col], list) else [columns[col]] * n
+            for col in INSERT_COLUMNS
+        ])
+    )
 
 
 def get_min_block_start() -> datetime | None:
@@ -521,6 +607,63 @@ def insert_blocks(rows: list[tuple]):
             cur.executemany(INSERT_SQL, rows)
 
 
+def run_slices(
+    journal: CheckpointJournal,
+    writer: RunWriter,
+    start_utc: datetime,
+    end_utc: datetime,
+    *,
+    newest_first: bool = False,
+    force: bool = False,
+) -> dict:
+    """
+    Fetch, build and insert [start_utc, end_utc) one journal slice at a time.
+
+    Slices already covered by the journal are skipped unless force is set. A
+    slice is journaled only after its rows are committed and only if it lies
+    fully in the past, so a crash loses at most the slice in flight.
+    """
+    slices = iter_session_slices(start_utc, end_utc, SLICE_DAYS)
+    done = [] if force else journal.completed_intervals(
+        int(start_utc.timestamp() * 1000),
+        int(end_utc.timestamp() * 1000),
+    )
+    if newest_first:
+        slices = slices[::-1]
+
+    totals = {"slices": len(slices), "skipped": 0, "h1": 0, "blocks": 0}
+    for s in slices:
+        if is_covered(s.start_ms, s.end_ms, done):
+            totals["skipped"] += 1
+            writer.log(f"SLICE SKIP (journaled): {s.label()}")
+            continue
+
+        t0 = time_mod.perf_counter()
+        df_h1 = fetch_oanda_h1(s.start_utc, s.end_utc)
+        df_2h = resample_to_2h_ny(df_h1)
+        rows = build_min_rows(df_2h)
+        insert_blocks(rows)
+        elapsed = time_mod.perf_counter() - t0
+
+        if s.end_utc <= datetime.now(timezone.utc):
+            journal.record(
+                s,
+                candle_count=len(df_h1),
+                row_count=len(rows),
+                content_sha256=candles_sha256(frame_candle_records(df_h1)),
+                elapsed_ms=int(elapsed * 1000),
+                run_id=writer.run_id,
+            )
+        totals["h1"] += len(df_h1)
+        totals["blocks"] += len(rows)
+        rate = len(df_h1) / elapsed if elapsed > 0 else 0.0
+        writer.log(
+            f"SLICE {s.label()}: H1={len(df_h1)} 2H={len(rows)} "
+            f"elapsed={elapsed:.2f}s rate={rate:.1f} candles/s"
+        )
+    return totals
+
+
 if __name__ == "__main__":
     args = parse_args()
     
@@ -533,7 +676,34 @@ if __name__ == "__main__":
     range_mode = False
     total_rows_written = 0
     
+    journal = None
     try:
+        journal = CheckpointJournal(NEON_DSN, DATASET_BLOCKS_2H, SYMBOL_DB)
+        journal.ensure_table()
+
+        # Gap-fill mode: refill holes between journaled slices
+        if args.fill_gaps:
+            gaps = journal.gaps()
+            writer.add_input(type="neon_table", ref="ops.backfill_checkpoints", range=f"gaps={len(gaps)}")
+            writer.log(f"FILL GAPS: {len(gaps)} gap(s) found in checkpoint journal")
+            for gap in gaps:
+                before = count_blocks_between(gap.start_utc, gap.end_utc)
+                totals = run_slices(journal, writer, gap.start_utc, gap.end_utc)
+                after = count_blocks_between(gap.start_utc, gap.end_utc)
+                total_rows_written += after - before
+                writer.log(f"GAP {gap.label()}: slices={totals['slices']} inserted_est={after - before}")
+
+            writer.log(f"GAP FILL COMPLETE: gaps={len(gaps)}, total_inserted_est={total_rows_written}")
+            writer.add_output(
+                type="neon_table",
+                ref="ovc.ovc_blocks_v01_1_min",
+                rows_written=total_rows_written
+            )
+            writer.check("oanda_fetch_success", "OANDA API fetch succeeded", "pass", [])
+            writer.check("rows_inserted", "Rows inserted to Neon", "pass", ["run.json:$.outputs[0].rows_written"])
+            writer.finish("success")
+            raise SystemExit(0)
+
         # CLI range mode (--start_ny + --end_ny) takes precedence
         if args.start_ny and args.end_ny:
             range_mode = True
@@ -549,30 +719,25 @@ if __name__ == "__main__":
                 range=f"{start_date_ny} to {end_date_ny}"
             )
             
-            # Process each day in range
-            current_date = start_date_ny
+            window_start_utc = datetime.combine(start_date_ny, time(17, 0), tzinfo=NY_TZ).astimezone(timezone.utc)
+            window_end_utc = (
+                datetime.combine(end_date_ny, time(17, 0), tzinfo=NY_TZ) + timedelta(hours=24)
+            ).astimezone(timezone.utc)
+            window_start_utc = max(window_start_utc, BACKFILL_START_UTC)
+
             total_inserted = 0
-            while current_date <= end_date_ny:
-                session_start_ny = datetime.combine(current_date, time(17, 0), tzinfo=NY_TZ)
-                day_start_utc = session_start_ny.astimezone(timezone.utc)
-                day_end_utc = (session_start_ny + timedelta(hours=24)).astimezone(timezone.utc)
-
-                if day_end_utc <= BACKFILL_START_UTC:
-                    writer.log(f"SKIP: {current_date} is before BACKFILL_START_UTC")
-                    current_date += timedelta(days=1)
-                    continue
-
-                before = count_blocks_between(day_start_utc, day_end_utc)
-                df_h1 = fetch_oanda_h1(day_start_utc, day_end_utc)
-                df_2h = resample_to_2h_ny(df_h1)
-                rows = build_min_rows(df_2h)
-                insert_blocks(rows)
-                after = count_blocks_between(day_start_utc, day_end_utc)
-                inserted_est = after - before
-                total_inserted += inserted_est
-                total_rows_written += inserted_est
-                writer.log(f"{current_date}: H1={len(df_h1)} 2H={len(df_2h)} inserted_est={inserted_est}")
-                current_date += timedelta(days=1)
+            if window_end_utc <= window_start_utc:
+                writer.log(f"SKIP: {start_date_ny} to {end_date_ny} is before BACKFILL_START_UTC")
+            else:
+                before = count_blocks_between(window_start_utc, window_end_utc)
+                totals = run_slices(journal, writer, window_start_utc, window_end_utc, force=args.force)
+                after = count_blocks_between(window_start_utc, window_end_utc)
+                total_inserted = after - before
+                total_rows_written = total_inserted
+                writer.log(
+                    f"SLICES: total={totals['slices']} skipped={totals['skipped']} "
+                    f"H1={totals['h1']} 2H={totals['blocks']} inserted_est={total_inserted}"
+                )
 
             writer.log(f"RANGE BACKFILL COMPLETE: {start_date_ny} to {end_date_ny}, total_inserted_est={total_inserted}")
             writer.add_output(
@@ -631,14 +796,10 @@ if __name__ == "__main__":
         writer.log(f"WINDOW: {start_utc.isoformat()} -> {end_utc.isoformat()} (days={DAYS_PER_RUN})")
 
         before = count_blocks_between(start_utc, end_utc)
-        df_h1 = fetch_oanda_h1(start_utc, end_utc)
-        writer.log(f"H1 candles fetched: {len(df_h1)}")
-
-        df_2h = resample_to_2h_ny(df_h1)
-        writer.log(f"2H blocks computed: {len(df_2h)}")
-
-        rows = build_min_rows(df_2h)
-        insert_blocks(rows)
+        totals = run_slices(journal, writer, start_utc, end_utc, newest_first=True, force=args.force)
+        writer.log(f"H1 candles fetched: {totals['h1']}")
+        writer.log(f"2H blocks computed: {totals['blocks']}")
+        writer.log(f"Slices: total={totals['slices']} skipped (journaled)={totals['skipped']}")
 
         after = count_blocks_between(start_utc, end_utc)
         inserted_est = after - before
@@ -664,3 +825,6 @@ if __name__ == "__main__":
         writer.check("execution_error", f"Execution failed: {type(e).__name__}", "fail", [])
         writer.finish("failed")
         raise
+    finally:
+        if journal is not None:
+            journal.close()
@@ -1,12 +1,14 @@
 import argparse
 import os
 import sys
+import time as time_mod
 from datetime import datetime, time, timedelta, timezone
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
 import oandapyV20
 import oandapyV20.endpoints.instruments as instruments
+import numpy as np
 import pandas as pd
 import psycopg2
 from psycopg2.extras import Json
@@ -15,6 +17,14 @@ from psycopg2.extras import Json
 REPO_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(REPO_ROOT / "src"))
 
+from ovc_ops.backfill_checkpoint import (
+    DATASET_CANDLES_M15,
+    CheckpointJournal,
+    candles_sha256,
+    frame_candle_records,
+    is_covered,
+    iter_session_slices,
+)
 from ovc_ops.run_artifact import RunWriter, detect_trigger
 
 # ---------- tiny .env loader ----------
@@ -63,6 +73,7 @@ SOURCE = "oanda"
 DEFAULT_BUILD_ID = os.environ.get("OANDA_BUILD_ID", "oanda_backfill_m15_v0.1")
 
 DAYS_PER_RUN = int(os.environ.get("BACKFILL_DAYS_PER_RUN", "30"))
+SLICE_DAYS = int(os.environ.get("OANDA_SLICE_DAYS", "3"))
 BACKFILL_DATE_NY = os.environ.get("BACKFILL_DATE_NY")
 
 START_UTC_STR = os.environ.get("BACKFILL_START_UTC", "2005-01-01T00:00:00Z")
@@ -172,22 +183,36 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Fetch and build rows but skip inserts.",
     )
+    parser.add_argument(
+        "--fill-gaps",
+        action="store_true",
+        help="Backfill holes between slices recorded in ops.backfill_checkpoints, then exit.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Refetch slices even if the checkpoint journal marks them complete.",
+    )
     return parser.parse_args()
 
 
-def _ensure_ohlc_sane(o: float, h: float, l: float, c: float, label: str) -> None:
-    if h < l:
-        raise SystemExit(f"Invalid OHLC on {label}: high < low.")
-    if h < max(o, c) or l > min(o, c):
-        raise SystemExit(f"Invalid OHLC on {label}: open/close outside range.")
+def _ohlc_violation(o, h, l, c) -> tuple[int, str] | None:
+    """Return (row position, reason) of the first insane OHLC row, or None."""
+    high_low = h < l
+    outside = (h < np.maximum(o, c)) | (l > np.minimum(o, c))
+    bad = np.flatnonzero(high_low | outside)
+    if bad.size == 0:
+        return None
+    i = int(bad[0])
+    return i, "high < low." if high_low[i] else "open/close outside range."
 
 
 def _build_payload(
     *,
     instrument: str,
     granularity: str,
-    ts_start_utc: datetime,
-    ts_close_utc: datetime,
+    ts_start_utc: str,
+    ts_close_utc: str,
     values: dict,
 ) -> dict:
     return {
@@ -197,8 +222,8 @@ def _build_payload(
             "granularity": granularity,
         },
         "normalized": {
-            "ts_start_utc": ts_start_utc.isoformat(),
-            "ts_close_utc": ts_close_utc.isoformat(),
+            "ts_start_utc": ts_start_utc,
+            "ts_close_utc": ts_close_utc,
             "bar_start_ms": values.get("bar_start_ms"),
             "bar_close_ms": values.get("bar_close_ms"),
         },
@@ -271,43 +296,58 @@ def build_rows(
     instrument: str,
     build_id: str,
 ) -> list[tuple]:
+    """
+    Build insert-ready M15 rows from a time-indexed OANDA candle frame.
+
+    OHLC sanity, bar_start_ms/bar_close_ms and the UTC timestamp strings are
+    computed over whole columns; only tuple and payload assembly is per-row.
+    """
     if df_m15.empty:
         return []
 
-    rows = []
     symbol = symbol.upper()
 
-    for row in df_m15.itertuples():
-        ts_start_utc = row.Index.to_pydatetime()
-        if ts_start_utc.tzinfo is None:
-            ts_start_utc = ts_start_utc.replace(tzinfo=timezone.utc)
-        ts_close_utc = ts_start_utc + timedelta(minutes=15)
-
-        bar_start_ms = int(ts_start_utc.timestamp() * 1000)
-        bar_close_ms = int(ts_close_utc.timestamp() * 1000)
-
-        o = float(row.open)
-        h = float(row.high)
-        l = float(row.low)
-        c = float(row.close)
-        _ensure_ohlc_sane(o, h, l, c, f"{symbol} {ts_start_utc.isoformat()}")
-
-        volume = row.volume
-        if pd.isna(volume):
-            volume = None
-        elif volume is not None:
-            volume = int(volume)
-
+    index = df_m15.index
+    if index.tz is None:
+        index = index.tz_localize("UTC")
+    bar_start = index.tz_convert("UTC").tz_localize(None).to_numpy(dtype="datetime64[us]")
+    bar_close = bar_start + np.timedelta64(15, "m")
+    bar_start_ms = (bar_start.astype(np.int64) // 1000).tolist()
+    bar_close_ms = (bar_close.astype(np.int64) // 1000).tolist()
+    # datetime.isoformat(): seconds precision unless microseconds are present.
+    unit = "s" if not (bar_start.astype(np.int64) % 1_000_000).any() else "us"
+    ts_start_iso = [f"{t}+00:00" for t in np.datetime_as_string(bar_start, unit=unit).tolist()]
+    ts_close_iso = [f"{t}+00:00" for t in np.datetime_as_string(bar_close, unit=unit).tolist()]
+
+    o = df_m15["open"].to_numpy(dtype=np.float64)
+    h = df_m15["high"].to_numpy(dtype=np.float64)
+    l = df_m15["low"].to_numpy(dtype=np.float64)
+    c = df_m15["close"].to_numpy(dtype=np.float64)
+    violation = _ohlc_violation(o, h, l, c)
+    if violation is not None:
+        i, reason = violation
+        raise SystemExit(f"Invalid OHLC on {symbol} {ts_start_iso[i]}: {reason}")
+    o, h, l, c = o.tolist(), h.tolist(), l.tolist(), c.tolist()
+
+    volume_missing = df_m15["volume"].isna().tolist()
+    volume = [
+        None if missing else int(v)
+        for v, missing in zip(df_m15["volume"].tolist(), volume_missing)
+    ]
+
+    tz = NY_TZ.key
+    rows = []
+    for i in range(len(o)):
         values = {
             "sym": symbol,
-            "tz": NY_TZ.key,
-            "bar_start_ms": bar_start_ms,
-            "bar_close_ms": bar_close_ms,
-            "o": o,
-            "h": h,
-            "l": l,
-            "c": c,
-            "volume": volume,
+            "tz": tz,
+            "bar_start_ms": bar_start_ms[i],
+            "bar_close_ms": bar_close_ms[i],
+            "o": o[i],
+            "h": h[i],
+            "l": l[i],
+            "c": c[i],
+            "volume": volume[i],
             "source": SOURCE,
             "build_id": build_id,
         }
@@ -315,8 +355,8 @@ def build_rows(
             _build_payload(
                 instrument=instrument,
                 granularity="M15",
-                ts_start_utc=ts_start_utc,
-                ts_close_utc=ts_close_utc,
+                ts_start_utc=ts_start_iso[i],
+                ts_close_utc=ts_close_iso[i],
                 values=values,
             )
         )
@@ -365,6 +405,68 @@ def insert_rows(rows: list[tuple]) -> None:
             cur.executemany(INSERT_SQL, rows)
 
 
+def run_slices(
+    journal: CheckpointJournal,
+    writer: RunWriter,
+    start_utc: datetime,
+    end_utc: datetime,
+    *,
+    instrument: str,
+    build_id: str,
+    dry_run: bool = False,
+    newest_first: bool = False,
+    force: bool = False,
+) -> dict:
+    """
+    Fetch, build and insert [start_utc, end_utc) one journal slice at a time.
+
+    Slices already covered by the journal are skipped unless force is set. A
+    slice is journaled only after its rows are committed and only if it lies
+    fully in the past, so a crash loses at most the slice in flight. Dry runs
+    never write to the journal.
+    """
+    slices = iter_session_slices(start_utc, end_utc, SLICE_DAYS)
+    done = [] if force else journal.completed_intervals(
+        int(start_utc.timestamp() * 1000),
+        int(end_utc.timestamp() * 1000),
+    )
+    if newest_first:
+        slices = slices[::-1]
+
+    totals = {"slices": len(slices), "skipped": 0, "m15": 0, "rows": 0}
+    for s in slices:
+        if is_covered(s.start_ms, s.end_ms, done):
+            totals["skipped"] += 1
+            writer.log(f"SLICE SKIP (journaled): {s.label()}")
+            continue
+
+        t0 = time_mod.perf_counter()
+        df_m15 = fetch_oanda_m15(s.start_utc, s.end_utc, instrument)
+        rows = build_rows(df_m15, journal.sym, instrument, build_id)
+        if not dry_run:
+            insert_rows(rows)
+        elapsed = time_mod.perf_counter() - t0
+
+        if not dry_run and s.end_utc <= datetime.now(timezone.utc):
+            journal.record(
+                s,
+                candle_count=len(df_m15),
+                row_count=len(rows),
+                content_sha256=candles_sha256(frame_candle_records(df_m15)),
+                elapsed_ms=int(elapsed * 1000),
+                run_id=writer.run_id,
+            )
+        totals["m15"] += len(df_m15)
+        totals["rows"] += len(rows)
+        rate = len(df_m15) / elapsed if elapsed > 0 else 0.0
+        prefix = "[DRY RUN] " if dry_run else ""
+        writer.log(
+            f"{prefix}SLICE {s.label()}: M15={len(df_m15)} rows={len(rows)} "
+            f"elapsed={elapsed:.2f}s rate={rate:.1f} candles/s"
+        )
+    return totals
+
+
 if __name__ == "__main__":
     args = parse_args()
 
@@ -382,7 +484,45 @@ if __name__ == "__main__":
     range_mode = False
     total_rows_written = 0
 
+    journal = None
     try:
+        journal = CheckpointJournal(DB_DSN, DATASET_CANDLES_M15, symbol_db)
+        journal.ensure_table()
+        slice_opts = {
+            "instrument": instrument,
+            "build_id": build_id,
+            "dry_run": dry_run,
+            "force": args.force,
+        }
+
+        # Gap-fill mode: refill holes between journaled slices
+        if args.fill_gaps:
+            gaps = journal.gaps()
+            writer.add_input(type="neon_table", ref="ops.backfill_checkpoints", range=f"gaps={len(gaps)}")
+            writer.log(f"FILL GAPS: {len(gaps)} gap(s) found in checkpoint journal")
+            for gap in gaps:
+                before = count_candles_between(gap.start_utc, gap.end_utc, symbol_db)
+                totals = run_slices(journal, writer, gap.start_utc, gap.end_utc, **slice_opts)
+                after = before if dry_run else count_candles_between(gap.start_utc, gap.end_utc, symbol_db)
+                total_rows_written += after - before
+                writer.log(f"GAP {gap.label()}: slices={totals['slices']} inserted_est={after - before}")
+
+            writer.log(f"GAP FILL COMPLETE: gaps={len(gaps)}, total_inserted_est={total_rows_written}")
+            writer.add_output(
+                type="neon_table",
+                ref="ovc.ovc_candles_m15_raw",
+                rows_written=total_rows_written,
+            )
+            writer.check("oanda_fetch_success", "OANDA API fetch succeeded", "pass", [])
+            writer.check(
+                "rows_inserted",
+                "Rows inserted to Neon",
+                "skip" if dry_run else "pass",
+                ["run.json:$.outputs[0].rows_written"],
+            )
+            writer.finish("success")
+            raise SystemExit(0)
+
         # UTC range mode (--start_utc + --end_utc) takes precedence
         if args.start_utc and args.end_utc:
             range_mode = True
@@ -394,14 +534,12 @@ if __name__ == "__main__":
             writer.add_input(type="oanda", ref=instrument, range=f"{start_utc} to {end_utc}")
 
             before = count_candles_between(start_utc, end_utc, symbol_db)
-            df_m15 = fetch_oanda_m15(start_utc, end_utc, instrument)
-            rows = build_rows(df_m15, symbol_db, instrument, build_id)
+            totals = run_slices(journal, writer, start_utc, end_utc, **slice_opts)
             if dry_run:
-                writer.log(f"[DRY RUN] UTC range would insert {len(rows)} rows")
+                writer.log(f"[DRY RUN] UTC range would insert {totals['rows']} rows")
                 after = before
                 inserted_est = 0
             else:
-                insert_rows(rows)
                 after = count_candles_between(start_utc, end_utc, symbol_db)
                 inserted_est = after - before
             total_rows_written = inserted_est
@@ -432,33 +570,28 @@ if __name__ == "__main__":
 
             writer.add_input(type="oanda", ref=instrument, range=f"{start_date_ny} to {end_date_ny}")
 
-            current_date = start_date_ny
+            window_start_utc = datetime.combine(start_date_ny, time(17, 0), tzinfo=NY_TZ).astimezone(timezone.utc)
+            window_end_utc = (
+                datetime.combine(end_date_ny, time(17, 0), tzinfo=NY_TZ) + timedelta(hours=24)
+            ).astimezone(timezone.utc)
+            window_start_utc = max(window_start_utc, BACKFILL_START_UTC)
+
             total_inserted = 0
-            while current_date <= end_date_ny:
-                session_start_ny = datetime.combine(current_date, time(17, 0), tzinfo=NY_TZ)
-                day_start_utc = session_start_ny.astimezone(timezone.utc)
-                day_end_utc = (session_start_ny + timedelta(hours=24)).astimezone(timezone.utc)
-
-                if day_end_utc <= BACKFILL_START_UTC:
-                    writer.log(f"SKIP: {current_date} is before BACKFILL_START_UTC")
-                    current_date += timedelta(days=1)
-                    continue
-
-                before = count_candles_between(day_start_utc, day_end_utc, symbol_db)
-                df_m15 = fetch_oanda_m15(day_start_utc, day_end_utc, instrument)
-                rows = build_rows(df_m15, symbol_db, instrument, build_id)
+            if window_end_utc <= window_start_utc:
+                writer.log(f"SKIP: {start_date_ny} to {end_date_ny} is before BACKFILL_START_UTC")
+            else:
+                before = count_candles_between(window_start_utc, window_end_utc, symbol_db)
+                totals = run_slices(journal, writer, window_start_utc, window_end_utc, **slice_opts)
                 if dry_run:
-                    writer.log(f"[DRY RUN] {current_date} would insert {len(rows)} rows")
-                    after = before
-                    inserted_est = 0
+                    writer.log(f"[DRY RUN] NY range would insert {totals['rows']} rows")
                 else:
-                    insert_rows(rows)
-                    after = count_candles_between(day_start_utc, day_end_utc, symbol_db)
-                    inserted_est = after - before
-                total_inserted += inserted_est
-                total_rows_written += inserted_est
-                writer.log(f"{current_date}: M15={len(df_m15)} inserted_est={inserted_est}")
-                current_date += timedelta(days=1)
+                    after = count_candles_between(window_start_utc, window_end_utc, symbol_db)
+                    total_inserted = after - before
+                total_rows_written = total_inserted
+                writer.log(
+                    f"SLICES: total={totals['slices']} skipped={totals['skipped']} "
+                    f"M15={totals['m15']} inserted_est={total_inserted}"
+                )
 
             writer.log(f"NY RANGE BACKFILL COMPLETE: {start_date_ny} to {end_date_ny}, total_inserted_est={total_inserted}")
             writer.add_output(
@@ -522,16 +655,15 @@ if __name__ == "__main__":
         writer.log(f"WINDOW: {start_utc.isoformat()} -> {end_utc.isoformat()} (days={DAYS_PER_RUN})")
 
         before = count_candles_between(start_utc, end_utc, symbol_db)
-        df_m15 = fetch_oanda_m15(start_utc, end_utc, instrument)
-        writer.log(f"M15 candles fetched: {len(df_m15)}")
+        totals = run_slices(journal, writer, start_utc, end_utc, newest_first=True, **slice_opts)
+        writer.log(f"M15 candles fetched: {totals['m15']}")
+        writer.log(f"Slices: total={totals['slices']} skipped (journaled)={totals['skipped']}")
 
-        rows = build_rows(df_m15, symbol_db, instrument, build_id)
         if dry_run:
-            writer.log(f"[DRY RUN] window would insert {len(rows)} rows")
+            writer.log(f"[DRY RUN] window would insert {totals['rows']} rows")
             after = before
             inserted_est = 0
         else:
-            insert_rows(rows)
             after = count_candles_between(start_utc, end_utc, symbol_db)
             inserted_est = after - before
         total_rows_written = inserted_est
@@ -560,3 +692,6 @@ if __name__ == "__main__":
         writer.check("execution_error", f"Execution failed: {type(e).__name__}", "fail", [])
         writer.finish("failed")
         raise
+    finally:
+        if journal is not None:
+            journal.close()
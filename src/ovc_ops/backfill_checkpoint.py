@@ -0,0 +1,316 @@
+"""
+OVC Backfill Checkpoint Journal v0.1
+
+Persistent slice-level journal for the checkpointed OANDA backfills
+(`backfill_oanda_2h_checkpointed.py`, `backfill_oanda_m15_checkpointed.py`).
+
+Each fetch window is cut into slices aligned to NY session boundaries
+(17:00 America/New_York) on a fixed grid of OANDA_SLICE_DAYS sessions, so a
+slice never splits a 2H block and the same slice keys are produced on every
+rerun. Every completed slice is recorded in `ops.backfill_checkpoints` with its
+candle count and a content hash. Reruns skip slices already covered by the
+journal, and gaps between journaled slices can be listed and refilled.
+
+Usage:
+    from ovc_ops.backfill_checkpoint import CheckpointJournal, iter_session_slices
+
+    journal = CheckpointJournal(dsn, dataset="blocks_2h", sym="GBPUSD")
+    journal.ensure_table()
+    done = journal.completed_intervals(start_ms, end_ms)
+    for s in iter_session_slices(start_utc, end_utc, slice_days=3):
+        if is_covered(s.start_ms, s.end_ms, done):
+            continue
+        ...
+        journal.record(s, candle_count=n, row_count=m, content_sha256=h, elapsed_ms=t)
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Iterable, Optional
+from zoneinfo import ZoneInfo
+
+NY_TZ = ZoneInfo("America/New_York")
+
+# Session-grid anchor: slice k covers sessions [ANCHOR + k*n, ANCHOR + (k+1)*n).
+SLICE_ANCHOR_DATE = date(2000, 1, 2)
+
+DATASET_BLOCKS_2H = "blocks_2h"
+DATASET_CANDLES_M15 = "candles_m15"
+
+CHECKPOINT_TABLE = "ops.backfill_checkpoints"
+
+CREATE_TABLE_SQL = """
+create table if not exists ops.backfill_checkpoints (
+  dataset text not null,
+  sym text not null,
+  slice_start_ms bigint not null,
+  slice_end_ms bigint not null,
+  candle_count integer not null,
+  row_count integer not null,
+  content_sha256 text not null,
+  elapsed_ms integer,
+  run_id text,
+  completed_at timestamptz not null default now(),
+  primary key (dataset, sym, slice_start_ms, slice_end_ms)
+);
+"""
+
+
+# ---------- Slices ----------
+
+@dataclass(frozen=True)
+class Slice:
+    """Half-open UTC interval [start_utc, end_utc) processed as one unit."""
+
+    start_utc: datetime
+    end_utc: datetime
+
+    @property
+    def start_ms(self) -> int:
+        return int(self.start_utc.timestamp() * 1000)
+
+    @property
+    def end_ms(self) -> int:
+        return int(self.end_utc.timestamp() * 1000)
+
+    def label(self) -> str:
+        return f"{self.start_utc.isoformat()} -> {self.end_utc.isoformat()}"
+
+
+def session_date_of(ts_utc: datetime) -> date:
+    """Return the NY session date (17:00 NY start) containing ts_utc."""
+    ts_ny = ts_utc.astimezone(NY_TZ)
+    if ts_ny.hour >= 17:
+        return ts_ny.date()
+    return ts_ny.date() - timedelta(days=1)
+
+
+def session_start_utc(session_date: date) -> datetime:
+    """Return the UTC start (17:00 NY) of the given session date."""
+    return datetime.combine(session_date, time(17, 0), tzinfo=NY_TZ).astimezone(timezone.utc)
+
+
+def iter_session_slices(
+    start_utc: datetime,
+    end_utc: datetime,
+    slice_days: int,
+) -> list[Slice]:
+    """
+    Cut [start_utc, end_utc) into session-aligned slices on a fixed grid.
+
+    Interior slices always span exactly `slice_days` NY sessions; the first and
+    last slice are clipped to the requested window.
+    """
+    if slice_days < 1:
+        raise ValueError(f"slice_days must be >= 1, got {slice_days}")
+    if end_utc <= start_utc:
+        return []
+
+    first_session = session_date_of(start_utc)
+    k = (first_session - SLICE_ANCHOR_DATE).days // slice_days
+
+    slices = []
+    while True:
+        grid_start = session_start_utc(SLICE_ANCHOR_DATE + timedelta(days=k * slice_days))
+        grid_end = session_start_utc(SLICE_ANCHOR_DATE + timedelta(days=(k + 1) * slice_days))
+        if grid_start >= end_utc:
+            break
+        s = max(grid_start, start_utc)
+        e = min(grid_end, end_utc)
+        if e > s:
+            slices.append(Slice(s, e))
+        k += 1
+    return slices
+
+
+# ---------- Interval arithmetic ----------
+
+def merge_intervals(intervals: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Merge overlapping or touching half-open intervals."""
+    merged: list[list[int]] = []
+    for s, e in sorted(intervals):
+        if merged and s <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], e)
+        else:
+            merged.append([s, e])
+    return [(s, e) for s, e in merged]
+
+
+def uncovered(start_ms: int, end_ms: int, intervals: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Return the parts of [start_ms, end_ms) not covered by intervals."""
+    missing = []
+    cursor = start_ms
+    for s, e in merge_intervals(intervals):
+        if e <= cursor:
+            continue
+        if s >= end_ms:
+            break
+        if s > cursor:
+            missing.append((cursor, s))
+        cursor = max(cursor, e)
+        if cursor >= end_ms:
+            break
+    if cursor < end_ms:
+        missing.append((cursor, end_ms))
+    return missing
+
+
+def is_covered(start_ms: int, end_ms: int, intervals: Iterable[tuple[int, int]]) -> bool:
+    return not uncovered(start_ms, end_ms, intervals)
+
+
+def find_gaps(intervals: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Return holes between the earliest and latest journaled intervals."""
+    merged = merge_intervals(intervals)
+    return [(merged[i][1], merged[i + 1][0]) for i in range(len(merged) - 1)]
+
+
+def ms_to_utc(ms: int) -> datetime:
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc)
+
+
+# ---------- Content hash ----------
+
+def candles_sha256(records: Iterable[tuple]) -> str:
+    """
+    SHA256 over fetched candles.
+
+    Each record is (bar_start_ms, o, h, l, c, volume); floats use repr so the
+    hash is stable for identical OANDA payloads.
+    """
+    h = hashlib.sha256()
+    for bar_start_ms, o, hi, lo, c, volume in records:
+        vol = "" if volume is None else str(int(volume))
+        h.update(f"{int(bar_start_ms)}|{o!r}|{hi!r}|{lo!r}|{c!r}|{vol}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def frame_candle_records(df) -> list[tuple]:
+    """Extract hash records from a time-indexed OANDA candle DataFrame."""
+    import pandas as pd
+
+    if df.empty:
+        return []
+    start_ms = ((df.index - pd.Timestamp(0, tz="UTC")) // pd.Timedelta(milliseconds=1)).tolist()
+    volumes = df["volume"].tolist()
+    return [
+        (ms, float(o), float(hi), float(lo), float(c), None if v is None or v != v else v)
+        for ms, o, hi, lo, c, v in zip(
+            start_ms,
+            df["open"].tolist(),
+            df["high"].tolist(),
+            df["low"].tolist(),
+            df["close"].tolist(),
+            volumes,
+        )
+    ]
+
+
+# ---------- Journal ----------
+
+class CheckpointJournal:
+    """
+    Slice journal stored in ops.backfill_checkpoints (one row per completed slice).
+
+    One connection is opened on first use and held until close(); each call
+    commits its own transaction. Usable as a context manager.
+    """
+
+    def __init__(self, dsn: str, dataset: str, sym: str):
+        self.dsn = dsn
+        self.dataset = dataset
+        self.sym = sym
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None or self._conn.closed:
+            import psycopg2
+
+            self._conn = psycopg2.connect(self.dsn)
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> "CheckpointJournal":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def ensure_table(self) -> None:
+        with self._connect() as conn:
+            with conn.cursor() as cur:
+                cur.execute("create schema if not exists ops;")
+                cur.execute(CREATE_TABLE_SQL)
+
+    def completed_intervals(
+        self,
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None,
+    ) -> list[tuple[int, int]]:
+        """Return journaled [start_ms, end_ms) intervals, optionally limited to a window."""
+        sql = """
+        SELECT slice_start_ms, slice_end_ms
+        FROM ops.backfill_checkpoints
+        WHERE dataset=%s
+          AND sym=%s
+          AND (%s::bigint IS NULL OR slice_end_ms > %s::bigint)
+          AND (%s::bigint IS NULL OR slice_start_ms < %s::bigint)
+        ORDER BY slice_start_ms;
+        """
+        with self._connect() as conn:
+            with conn.cursor() as cur:
+                cur.execute(sql, (self.dataset, self.sym, start_ms, start_ms, end_ms, end_ms))
+                return [(int(s), int(e)) for s, e in cur.fetchall()]
+
+    def gaps(self) -> list[Slice]:
+        """Return uncovered holes between the first and last journaled slice."""
+        return [Slice(ms_to_utc(s), ms_to_utc(e)) for s, e in find_gaps(self.completed_intervals())]
+
+    def record(
+        self,
+        s: Slice,
+        *,
+        candle_count: int,
+        row_count: int,
+        content_sha256: str,
+        elapsed_ms: Optional[int] = None,
+        run_id: Optional[str] = None,
+    ) -> None:
+        sql = """
+        INSERT INTO ops.backfill_checkpoints (
+          dataset, sym, slice_start_ms, slice_end_ms,
+          candle_count, row_count, content_sha256, elapsed_ms, run_id, completed_at
+        )
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, now())
+        ON CONFLICT (dataset, sym, slice_start_ms, slice_end_ms)
+        DO UPDATE SET
+          candle_count = excluded.candle_count,
+          row_count = excluded.row_count,
+          content_sha256 = excluded.content_sha256,
+          elapsed_ms = excluded.elapsed_ms,
+          run_id = excluded.run_id,
+          completed_at = now();
+        """
+        with self._connect() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    sql,
+                    (
+                        self.dataset,
+                        self.sym,
+                        s.start_ms,
+                        s.end_ms,
+                        int(candle_count),
+                        int(row_count),
+                        content_sha256,
+                        elapsed_ms,
+                        run_id,
+                    ),
+                )
@@ -0,0 +1,185 @@
+"""
+Tests for the backfill checkpoint journal helpers (no database required).
+"""
+
+import sys
+import types
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = REPO_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from ovc_ops.backfill_checkpoint import (  # noqa: E402
+    CheckpointJournal,
+    candles_sha256,
+    find_gaps,
+    frame_candle_records,
+    is_covered,
+    iter_session_slices,
+    merge_intervals,
+    uncovered,
+)
+
+NY_TZ = ZoneInfo("America/New_York")
+
+
+def ny(y, m, d, hh=17):
+    return datetime(y, m, d, hh, 0, tzinfo=NY_TZ).astimezone(timezone.utc)
+
+
+class TestSessionSlices:
+    def test_slices_tile_window(self):
+        start, end = ny(2024, 1, 1), ny(2024, 1, 31)
+        slices = iter_session_slices(start, end, 3)
+        assert slices[0].start_utc == start
+        assert slices[-1].end_utc == end
+        for a, b in zip(slices, slices[1:]):
+            assert a.end_utc == b.start_utc
+
+    def test_slice_boundaries_are_ny_17(self):
+        # Window spans the 2024-03-10 spring-forward transition
+        slices = iter_session_slices(ny(2024, 3, 1), ny(2024, 3, 20), 3)
+        for s in slices:
+            assert s.start_utc.astimezone(NY_TZ).hour == 17
+            assert s.end_utc.astimezone(NY_TZ).hour == 17
+
+    def test_grid_is_stable_across_windows(self):
+        a = iter_session_slices(ny(2024, 1, 1), ny(2024, 2, 1), 3)
+        b = iter_session_slices(ny(2024, 1, 10), ny(2024, 2, 1), 3)
+        interior_a = {(s.start_ms, s.end_ms) for s in a[1:-1]}
+        interior_b = {(s.start_ms, s.end_ms) for s in b[1:-1]}
+        assert interior_b <= interior_a
+
+    def test_window_is_clipped(self):
+        start = ny(2024, 1, 1) + timedelta(hours=5)
+        slices = iter_session_slices(start, ny(2024, 1, 10), 3)
+        assert slices[0].start_utc == start
+
+    def test_empty_and_invalid(self):
+        assert iter_session_slices(ny(2024, 1, 2), ny(2024, 1, 1), 3) == []
+        with pytest.raises(ValueError):
+            iter_session_slices(ny(2024, 1, 1), ny(2024, 1, 2), 0)
+
+
+class TestIntervals:
+    def test_merge_touching(self):
+        assert merge_intervals([(5, 10), (0, 5), (12, 15)]) == [(0, 10), (12, 15)]
+
+    def test_uncovered(self):
+        assert uncovered(0, 20, [(0, 5), (8, 12)]) == [(5, 8), (12, 20)]
+        assert uncovered(0, 10, []) == [(0, 10)]
+
+    def test_is_covered_by_union(self):
+        assert is_covered(2, 9, [(0, 5), (5, 10)])
+        assert not is_covered(2, 11, [(0, 5), (5, 10)])
+
+    def test_find_gaps(self):
+        assert find_gaps([(0, 5), (5, 10), (20, 30), (40, 50)]) == [(10, 20), (30, 40)]
+        assert find_gaps([(0, 5)]) == []
+
+
+class TestContentHash:
+    def _frame(self, volume=(100, 200)):
+        idx = pd.to_datetime(["2024-01-02T00:00:00Z", "2024-01-02T00:15:00Z"], utc=True)
+        return pd.DataFrame(
+            {
+                "open": [1.25, 1.26],
+                "high": [1.27, 1.28],
+                "low": [1.24, 1.25],
+                "close": [1.26, 1.27],
+                "volume": list(volume),
+            },
+            index=idx,
+        )
+
+    def test_records_use_epoch_ms(self):
+        records = frame_candle_records(self._frame())
+        assert records[0][0] == 1704153600000
+        assert records[1][0] - records[0][0] == 15 * 60 * 1000
+
+    def test_hash_is_deterministic_and_content_sensitive(self):
+        h1 = candles_sha256(frame_candle_records(self._frame()))
+        h2 = candles_sha256(frame_candle_records(self._frame()))
+        h3 = candles_sha256(frame_candle_records(self._frame(volume=(100, 201))))
+        assert h1 == h2
+        assert h1 != h3
+
+    def test_missing_volume(self):
+        records = frame_candle_records(self._frame(volume=(None, 5)))
+        assert records[0][5] is None
+        candles_sha256(records)
+
+
+class _FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.conn.executed.append(sql)
+
+    def fetchall(self):
+        return [(0, 10), (10, 20)]
+
+
+class _FakeConnection:
+    def __init__(self):
+        self.closed = 0
+        self.commits = 0
+        self.executed = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.commits += 1
+        return False
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+    def close(self):
+        self.closed = 1
+
+
+class TestCheckpointJournalConnection:
+    @pytest.fixture
+    def connections(self, monkeypatch):
+        opened = []
+
+        def connect(dsn):
+            opened.append(_FakeConnection())
+            return opened[-1]
+
+        monkeypatch.setitem(sys.modules, "psycopg2", types.SimpleNamespace(connect=connect))
+        return opened
+
+    def test_calls_share_one_connection(self, connections):
+        journal = CheckpointJournal("dsn", "blocks_2h", "GBPUSD")
+        journal.ensure_table()
+        assert journal.completed_intervals() == [(0, 10), (10, 20)]
+        for s in iter_session_slices(ny(2024, 1, 1), ny(2024, 1, 7), 3):
+            journal.record(s, candle_count=1, row_count=1, content_sha256="x")
+        assert len(connections) == 1
+        assert connections[0].commits == 5
+        journal.close()
+        assert connections[0].closed
+
+    def test_context_manager_closes_and_reopens(self, connections):
+        with CheckpointJournal("dsn", "blocks_2h", "GBPUSD") as journal:
+            journal.gaps()
+        assert connections[0].closed
+        journal.gaps()
+        assert len(connections) == 2
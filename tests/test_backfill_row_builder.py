@@ -0,0 +1,138 @@
+"""
+Golden-output tests for the columnar backfill row builders.
+
+Expected strings were captured from the original per-row builders; the
+columnar builders must reproduce them exactly.
+"""
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("oandapyV20")
+pytest.importorskip("psycopg2")
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_script(monkeypatch, name: str, filename: str):
+    for key in ("NEON_DSN", "DATABASE_URL", "OANDA_API_TOKEN"):
+        monkeypatch.setenv(key, "test")
+    monkeypatch.setenv("OANDA_ENV", "practice")
+    monkeypatch.syspath_prepend(str(REPO_ROOT / "src"))
+    spec = importlib.util.spec_from_file_location(name, REPO_ROOT / "src" / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def backfill_2h(monkeypatch):
+    return load_script(monkeypatch, "backfill_2h_under_test", "backfill_oanda_2h_checkpointed.py")
+
+
+@pytest.fixture
+def backfill_m15(monkeypatch):
+    return load_script(monkeypatch, "backfill_m15_under_test", "backfill_oanda_m15_checkpointed.py")
+
+
+def h1_frame_dst_fallback() -> pd.DataFrame:
+    # 2023-11-05 fall-back: the E block starts at EDT and ends at EST
+    idx = pd.to_datetime(
+        ["2023-11-05T04:00:00Z", "2023-11-05T05:00:00Z", "2023-11-05T06:00:00Z", "2023-11-05T07:00:00Z"],
+        utc=True,
+    )
+    return pd.DataFrame(
+        {
+            "open": [1.25, 1.2512, 1.2509, 1.2501],
+            "high": [1.2515, 1.2518, 1.2511, 1.2507],
+            "low": [1.2497, 1.2505, 1.2499, 1.2495],
+            "close": [1.2512, 1.2509, 1.2501, 1.2501],
+            "volume": [1, 2, 3, 4],
+        },
+        index=idx,
+    )
+
+
+EXPECTED_EXPORT_STR = (
+    "ver=ovc_v0.1.0|profile=MIN|scheme_min=export_contract_v0.1_min_r1|block_id=20231104-E-GBPUSD"
+    "|sym=GBPUSD|tz=America/New_York|date_ny=2023-11-04|bar_close_ms=1699167600000|block2h=E"
+    "|block4h=EF|o=1.2512|h=1.2518|l=1.2499|c=1.2501|rng=0.0019000000000000128"
+    "|body=0.001100000000000101|dir=-1|ret=-0.0008791560102302596|state_tag=UNKNOWN"
+    "|value_tag=UNKNOWN|event=UNKNOWN|tt=0|cp_tag=UNKNOWN|tis=0|rrc=0.0|vrc=0.0|trend_tag=UNKNOWN"
+    "|struct_state=UNKNOWN|space_tag=UNKNOWN|htf_stack=UNKNOWN|with_htf=0|rd_state=UNKNOWN"
+    "|regime_tag=UNKNOWN|trans_risk=UNKNOWN|bias_mode=UNKNOWN|bias_dir=NEUTRAL|perm_state=UNKNOWN"
+    "|rail_loc=UNKNOWN|tradeable=0|conf_l3=UNKNOWN|play=UNKNOWN|pred_dir=NEUTRAL"
+    "|pred_target=UNKNOWN|timebox=UNKNOWN|invalidation=UNKNOWN|source=oanda"
+    "|build_id=oanda_backfill_v0.1|note=UNKNOWN|ready=1"
+)
+
+EXPECTED_PAYLOAD = (
+    '{"schema": "export_contract_v0.1_min_r1", "contract_version": "0.1.1", '
+    '"ingest_mode": "oanda_backfill_2h", "oanda": {"instrument": "GBP_USD", "granularity": "H1"}, '
+    '"normalized": {"ts_start_ny": "2023-11-05T01:00:00-04:00", "ts_end_ny": "2023-11-05T02:00:00-05:00"}, '
+    '"parsed": {"block_id": "20231104-E-GBPUSD", "sym": "GBPUSD", "date_ny": "2023-11-04", '
+    '"block2h": "E", "block4h": "EF", "bar_close_ms": 1699167600000, "o": 1.2512, "h": 1.2518, '
+    '"l": 1.2499, "c": 1.2501, "source": "oanda"}}'
+)
+
+
+class TestBuildMinRows:
+    def test_golden_row_across_dst(self, backfill_2h):
+        rows = backfill_2h.build_min_rows(backfill_2h.resample_to_2h_ny(h1_frame_dst_fallback()))
+        assert len(rows) == 1
+        row = dict(zip(backfill_2h.INSERT_COLUMNS, rows[0]))
+        assert row["export_str"] == EXPECTED_EXPORT_STR
+        assert json.dumps(row["payload"].adapted) == EXPECTED_PAYLOAD
+        assert row["state_key"] == "UNKNOWN|UNKNOWN|UNKNOWN|UNKNOWN|NEUTRAL|UNKNOWN|UNKNOWN|NEUTRAL|UNKNOWN"
+        assert type(row["bar_close_ms"]) is int
+        assert type(row["dir"]) is int
+        assert type(row["ret"]) is float
+
+    def test_insane_ohlc_reports_first_block(self, backfill_2h):
+        df = h1_frame_dst_fallback()
+        df.iloc[1:3, df.columns.get_loc("low")] = 1.2510
+        with pytest.raises(SystemExit, match=r"20231104-E-GBPUSD: open/close outside range"):
+            backfill_2h.build_min_rows(backfill_2h.resample_to_2h_ny(df))
+
+    def test_empty(self, backfill_2h):
+        assert backfill_2h.build_min_rows(pd.DataFrame()) == []
+
+
+class TestBuildM15Rows:
+    def test_golden_rows(self, backfill_m15):
+        idx = pd.to_datetime(["2024-01-02T00:00:00Z", "2024-01-02T00:15:00Z"], utc=True)
+        df = pd.DataFrame(
+            {
+                "open": [1.27, 1.2705],
+                "high": [1.2711, 1.2707],
+                "low": [1.2698, 1.27],
+                "close": [1.2705, 1.2701],
+                "volume": [42, None],
+            },
+            index=idx,
+        )
+        rows = backfill_m15.build_rows(df, "gbpusd", "GBP_USD", "build_x")
+        first = dict(zip(backfill_m15.INSERT_COLUMNS, rows[0]))
+        second = dict(zip(backfill_m15.INSERT_COLUMNS, rows[1]))
+
+        assert first["sym"] == "GBPUSD"
+        assert first["bar_start_ms"] == 1704153600000
+        assert first["bar_close_ms"] == 1704154500000
+        assert first["volume"] == 42 and type(first["volume"]) is int
+        assert second["volume"] is None
+        assert first["payload"].adapted["normalized"] == {
+            "ts_start_utc": "2024-01-02T00:00:00+00:00",
+            "ts_close_utc": "2024-01-02T00:15:00+00:00",
+            "bar_start_ms": 1704153600000,
+            "bar_close_ms": 1704154500000,
+        }
+
+    def test_insane_ohlc(self, backfill_m15):
+        idx = pd.to_datetime(["2024-01-02T00:00:00Z"], utc=True)
+        df = pd.DataFrame({"open": [1.0], "high": [0.9], "low": [1.1], "close": [1.0], "volume": [1]}, index=idx)
+        with pytest.raises(SystemExit, match=r"GBPUSD 2024-01-02T00:00:00\+00:00: high < low"):
+            backfill_m15.build_rows(df, "GBPUSD", "GBP_USD", "build_x")
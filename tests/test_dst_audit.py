@@ -8,7 +8,7 @@ Validates:
 """
 
 import sys
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -343,3 +343,134 @@ class TestRunDstAudit:
         assert result["continuity_failures"] == 0
         # Note: aggregation may pass or fail depending on exact values
         # Session boundary will fail since our test block doesn't align with real NY 17:00
+
+
+class TestDstTransitionWindows:
+    """DST windows derived from the requested date range."""
+
+    def test_2023_windows_match_legacy_ranges(self):
+        windows = builder.dst_transition_windows("2023-01-01", "2023-12-31")
+        assert windows == {
+            "spring": {"2023-03-12": builder.DST_RANGES["spring"]},
+            "fall": {"2023-11-05": builder.DST_RANGES["fall"]},
+        }
+
+    def test_every_transition_in_multi_year_range(self):
+        windows = builder.dst_transition_windows("2020-01-01", "2025-12-31")
+        assert sorted(windows["spring"]) == [
+            "2020-03-08", "2021-03-14", "2022-03-13", "2023-03-12", "2024-03-10", "2025-03-09",
+        ]
+        assert sorted(windows["fall"]) == [
+            "2020-11-01", "2021-11-07", "2022-11-06", "2023-11-05", "2024-11-03", "2025-11-02",
+        ]
+
+    def test_window_overlapping_range_edge_is_included(self):
+        # 2024-03-10 transition; its window reaches back to 2024-03-08
+        transitions, dates = builder.dst_audit_target_dates("spring", "2024-03-12", "2024-03-31")
+        assert transitions == ["2024-03-10"]
+        assert dates == ["2024-03-08", "2024-03-09", "2024-03-10", "2024-03-11", "2024-03-12"]
+        assert builder.dst_audit_target_dates("all", "2024-04-01", "2024-04-30") == ([], [])
+
+    def test_without_dates_uses_legacy_ranges(self):
+        transitions, dates = builder.dst_audit_target_dates("fall")
+        assert transitions == ["2023-11-05"]
+        assert dates == builder.DST_RANGES["fall"]
+
+
+def _session_blocks(first_date_ny, n_days):
+    """Aligned blocks and M15 rows for n_days NY sessions starting at first_date_ny."""
+    blocks, m15 = [], []
+    px = 1.25
+    for d in range(n_days):
+        date_ny = (datetime.strptime(first_date_ny, "%Y-%m-%d") + timedelta(days=d)).strftime("%Y-%m-%d")
+        session_ms = builder.ny_17_to_epoch_ms(date_ny)
+        for k, letter in enumerate("ABCDEFGHIJKL"):
+            start_ms = session_ms + k * builder.TWO_H_MS
+            rows = []
+            for j in range(8):
+                o, c = px, px + (0.0003 if (d + k + j) % 3 else -0.0002)
+                rows.append({
+                    "bar_start_ms": start_ms + j * builder.M15_STEP_MS,
+                    "bar_close_ms": start_ms + (j + 1) * builder.M15_STEP_MS,
+                    "o": o, "h": max(o, c) + 0.0001, "l": min(o, c) - 0.0001, "c": c, "volume": None,
+                })
+                px = c
+            m15.extend(rows)
+            blocks.append({
+                "block_id": f"{date_ny.replace('-', '')}-{letter}-GBPUSD",
+                "sym": "GBPUSD",
+                "date_ny": date_ny,
+                "bar_close_ms": start_ms + builder.TWO_H_MS,
+                "o": rows[0]["o"],
+                "h": max(r["h"] for r in rows),
+                "l": min(r["l"] for r in rows),
+                "c": rows[-1]["c"],
+            })
+    return blocks, m15
+
+
+class TestColumnarDstAudit:
+    """The columnwise screen reports exactly what the scalar validators report."""
+
+    def _defective_pack(self):
+        blocks, m15 = _session_blocks("2023-02-10", 5)
+        by_close = {b["bar_close_ms"]: b for b in blocks}
+        strips = {b["block_id"]: [r for r in m15 if 0 < b["bar_close_ms"] - r["bar_start_ms"] <= builder.TWO_H_MS]
+                  for b in blocks}
+        ids = [b["block_id"] for b in blocks]
+        strips[ids[3]].pop(2)                                        # strip count
+        strips[ids[7]][4] = dict(strips[ids[7]][4], bar_start_ms=strips[ids[7]][4]["bar_start_ms"] + 60_000)
+        strips[ids[11]][5] = dict(strips[ids[11]][5], h=float("nan"))
+        by_close[blocks[20]["bar_close_ms"]]["h"] += 0.01            # aggregation mismatch
+        blocks[30]["o"] = float("nan")
+        del blocks[40]                                               # session block count
+        rows = sorted((r for rs in strips.values() for r in rs), key=lambda r: r["bar_start_ms"])
+        return blocks, strips, rows
+
+    def _scalar_reference(self, blocks, strips):
+        anomalies, worst = [], None
+        for block in sorted(blocks, key=lambda b: (b["date_ny"], b["bar_close_ms"], b["block_id"])):
+            rows = strips.get(block["block_id"], [])
+            _, issues = builder.validate_strip_integrity(rows, block["block_id"], block["bar_close_ms"])
+            for issue in issues:
+                issue["date_ny"] = block["date_ny"]
+            anomalies.extend(issues)
+            if len(rows) == 8:
+                spine = {k: block[k] for k in ("o", "h", "l", "c")}
+                _, deviation, anomaly = builder.validate_aggregation_match(rows, spine, block["block_id"], 1e-6)
+                if worst is None or deviation["value"] > worst["value"]:
+                    worst = deviation
+                if anomaly:
+                    anomaly["date_ny"] = block["date_ny"]
+                    anomalies.append(anomaly)
+        return anomalies, worst
+
+    def test_matches_scalar_validators(self):
+        blocks, strips, rows = self._defective_pack()
+        reference_anomalies, reference_worst = self._scalar_reference(blocks, strips)
+
+        qc_report = {key: [] for key in ("candle_count", "continuity", "ohlc_sanity", "aggregation_match", "context")}
+        plan = builder.plan_strips(blocks, builder.M15Frame.from_rows(rows), 1e-6, qc_report)
+        for m15_by_block in (strips, plan.m15_by_block_all):
+            result = builder.run_dst_audit(blocks, m15_by_block, 1e-6)
+            audited = [a for a in result["anomalies"] if a["type"] != "session_boundary"]
+            assert repr(audited) == repr(reference_anomalies)
+            assert repr(result["worst_aggregation_deviation"]) == repr(reference_worst)
+            assert result["blocks_checked"] == len(blocks)
+            assert (result["strip_count_failures"], result["continuity_failures"], result["aggregation_failures"]) == (
+                1, 2, 1,
+            )
+            assert result["session_boundary_failures"] == 1
+
+    def test_all_range_covers_transition_windows(self):
+        blocks, m15 = _session_blocks("2023-11-01", 10)
+        strips = {b["block_id"]: [r for r in m15 if 0 < b["bar_close_ms"] - r["bar_start_ms"] <= builder.TWO_H_MS]
+                  for b in blocks}
+        result = builder.run_dst_audit(blocks, strips, 1e-6, "all", "2023-11-04", "2023-11-30")
+
+        assert result["dst_transitions"] == ["2023-11-05"]
+        assert result["dates_tested"] == builder.DST_RANGES["fall"]
+        assert result["missing_dates"] is None
+        assert result["blocks_checked"] == 60
+        assert result["session_boundary_failures"] == 0
+        assert result["anomalies"] == []
@@ -1,6 +1,8 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "scripts" / "path1"))
@@ -143,3 +145,66 @@ def test_data_manifest_only_includes_data_files(tmp_path):
         "meta.json",
         "qc_report.json",
     }
+
+
+def write_sample_pack(pack_root: Path, writer=None) -> None:
+    files = {
+        "meta.json": '{"version":"0.2"}\n',
+        "qc_report.json": '{"summary":{}}\n',
+        "backbone_2h.csv": "block_id,bar_close_ms\n",
+        "strips/2h/block.csv": "idx,time_utc\r\n1,0\r\n",
+        "context/4h/AB_2022-01-01.csv": "idx,time_utc\r\n1,0\r\n",
+    }
+    for rel_path, text in files.items():
+        newline = "" if rel_path.endswith(".csv") and "\r\n" in text else None
+        if writer is not None:
+            writer.write_text(rel_path, text, newline=newline)
+        else:
+            path = pack_root / rel_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("w", encoding="utf-8", newline=newline) as handle:
+                handle.write(text)
+
+
+def test_pack_writer_manifests_match_reread(tmp_path, monkeypatch):
+    """Hash-while-writing manifests equal the read-back manifests, without reading files."""
+    reread_root = tmp_path / "reread"
+    write_sample_pack(reread_root)
+    reread = builder.write_manifest_files(reread_root)
+
+    written_root = tmp_path / "written"
+    writer = builder.PackWriter(written_root)
+    write_sample_pack(written_root, writer)
+
+    def no_reads(path):
+        raise AssertionError(f"unexpected read of {path}")
+
+    monkeypatch.setattr(builder, "compute_file_sha256", no_reads)
+    written = builder.write_manifest_files(written_root, writer=writer)
+    monkeypatch.undo()
+
+    assert written == reread
+    for name in builder.MANIFEST_EXCLUDE:
+        assert (written_root / name).read_bytes() == (reread_root / name).read_bytes()
+    builder.verify_manifest_files(written_root, written)
+
+
+def test_pack_writer_rehashes_files_changed_after_write(tmp_path):
+    pack_root = tmp_path / "pack"
+    writer = builder.PackWriter(pack_root)
+    write_sample_pack(pack_root, writer)
+    (pack_root / "meta.json").write_text('{"version":"0.3"}\n', encoding="utf-8")
+    (pack_root / "extra.txt").write_text("not written by the writer\n", encoding="utf-8")
+
+    assert builder.build_manifest(pack_root, writer=writer) == builder.build_manifest(pack_root)
+
+
+def test_verify_detects_tampering(tmp_path):
+    pack_root = tmp_path / "pack"
+    writer = builder.PackWriter(pack_root)
+    write_sample_pack(pack_root, writer)
+    hashes = builder.write_manifest_files(pack_root, writer=writer, verify=True)
+
+    (pack_root / "strips" / "2h" / "block.csv").write_text("idx,time_utc\n2,0\n", encoding="utf-8")
+    with pytest.raises(RuntimeError, match="strips/2h/block.csv"):
+        builder.verify_manifest_files(pack_root, hashes)
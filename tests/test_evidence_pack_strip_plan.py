@@ -0,0 +1,235 @@
+"""
+Tests for the evidence pack v0.2 strip/context QC pass and parallel file emission.
+
+The columnar QC pass must report exactly what the per-block scalar checks
+report, and strip/context bytes must not depend on the writer thread count.
+"""
+
+import csv
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts" / "path1"))
+
+import build_evidence_pack_v0_2 as builder  # noqa: E402
+
+BASE_START_MS = 1672596000000  # 2023-01-01T18:00:00Z
+LETTERS = "ABCDEFGHIJKL"
+
+
+def empty_qc_report():
+    return {key: [] for key in ("candle_count", "continuity", "ohlc_sanity", "aggregation_match", "context")}
+
+
+def synthetic_blocks(seed: int, n_blocks: int = 120):
+    """Blocks plus M15 rows with injected gaps, bad candles, NaNs and spine mismatches."""
+    rnd = random.Random(seed)
+    blocks, m15 = [], []
+    px = 1.25
+    for k in range(n_blocks):
+        start_ms = BASE_START_MS + k * builder.TWO_H_MS
+        rows = []
+        for j in range(8):
+            o = px
+            c = o + rnd.gauss(0, 5e-4)
+            h = max(o, c) + abs(rnd.gauss(0, 2e-4))
+            l = min(o, c) - abs(rnd.gauss(0, 2e-4))
+            px = c
+            bar_start_ms = start_ms + j * builder.M15_STEP_MS
+            rows.append(
+                {
+                    "bar_start_ms": bar_start_ms,
+                    "bar_close_ms": bar_start_ms + builder.M15_STEP_MS,
+                    "o": o, "h": h, "l": l, "c": c,
+                    "volume": rnd.choice([None, rnd.randint(1, 999)]),
+                }
+            )
+        spine = {
+            "o": rows[0]["o"],
+            "h": max(r["h"] for r in rows),
+            "l": min(r["l"] for r in rows),
+            "c": rows[-1]["c"],
+        }
+        kind = k % 10
+        if kind == 1:
+            rows.pop(4)
+        elif kind == 3:
+            rows[3]["h"] = rows[3]["l"] - 1e-4
+        elif kind == 5:
+            rows[2]["bar_close_ms"] += 60_000
+        elif kind == 7:
+            rows[5]["o"] = float("nan")
+        elif kind == 8:
+            spine["h"] += 1e-3
+        m15.extend(rows)
+        day, letter = divmod(k, 12)
+        pair = LETTERS[letter // 2 * 2:letter // 2 * 2 + 2]
+        blocks.append(
+            {
+                "block_id": f"202301{day + 1:02d}-{LETTERS[letter]}-TEST",
+                "sym": "TEST",
+                "bar_close_ms": start_ms + builder.TWO_H_MS,
+                "date_ny": f"2023-01-{day + 1:02d}",
+                "block4h": pair,
+                **spine,
+            }
+        )
+    return blocks, m15
+
+
+def scalar_reference(blocks, m15, tolerance):
+    """Per-block scalar QC for every block (the pre-columnar behavior)."""
+    qc_report = empty_qc_report()
+    for block in blocks:
+        close_ms = int(block["bar_close_ms"])
+        rows = [r for r in m15 if close_ms - builder.TWO_H_MS < r["bar_close_ms"] <= close_ms]
+        if len(rows) != 8:
+            qc_report["candle_count"].append(
+                {"scope": "2h", "block_id": block["block_id"], "expected": 8, "actual": len(rows)}
+            )
+            continue
+        builder.qc_strip_block(block, rows, tolerance, qc_report)
+    return qc_report
+
+
+def test_render_matches_csv_writer(tmp_path):
+    _, m15 = synthetic_blocks(0, n_blocks=2)
+    legacy_path = tmp_path / "legacy.csv"
+    with legacy_path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(builder.CANDLE_COLUMNS)
+        for idx, row in enumerate(m15[:8], start=1):
+            writer.writerow(
+                [idx, builder.format_time_utc(row["bar_start_ms"]), row["bar_start_ms"], row["bar_close_ms"],
+                 row["o"], row["h"], row["l"], row["c"], "" if row["volume"] is None else row["volume"]]
+            )
+    assert builder.render_candles_csv(m15[:8]).encode("utf-8") == legacy_path.read_bytes()
+
+
+def test_m15_frame_round_trips_rows():
+    _, m15 = synthetic_blocks(0, n_blocks=10)
+    frame = builder.M15Frame.from_rows(m15)
+
+    assert len(frame) == len(m15)
+    assert repr(frame.rows(0, len(frame))) == repr(m15)
+    assert any(row["volume"] is None for row in m15) and any(row["o"] != row["o"] for row in m15)
+
+    span = frame.span(8, 16)
+    assert len(span) == 8
+    assert repr(list(span)) == repr(m15[8:16])
+    assert repr(span[-1]) == repr(m15[15]) and repr(span[2:4]) == repr(m15[10:12])
+    assert builder.render_candles_csv(span) == builder.render_candles_csv(m15[8:16])
+
+
+def test_fetch_m15_range_builds_frame():
+    rows = [(0, 900_000, 1.5, 2.0, 1.0, 1.75, None), (900_000, 1_800_000, 1.75, 2.5, 1.25, 2.0, 42)]
+
+    class Cursor:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def execute(self, sql, params):
+            self.params = params
+
+        def fetchall(self):
+            return rows
+
+    class Conn:
+        def cursor(self):
+            return Cursor()
+
+    frame = builder.fetch_m15_range(Conn(), "TEST", 0, 1_800_000)
+    assert frame.rows(0, 2) == [dict(zip(builder.M15_CONTENT_KEYS, row)) for row in rows]
+    assert frame.bar_close_ms.dtype == np.int64 and frame.o.dtype == np.float64
+    assert builder.M15Frame.from_records([]).rows(0, 0) == []
+
+
+def test_columnar_qc_matches_scalar_checks():
+    for seed in range(3):
+        blocks, m15 = synthetic_blocks(seed)
+        qc_report = empty_qc_report()
+        plan = builder.plan_strips(blocks, builder.M15Frame.from_rows(m15), 1e-6, qc_report)
+        reference = scalar_reference(blocks, m15, 1e-6)
+
+        for key in ("candle_count", "continuity", "ohlc_sanity", "aggregation_match"):
+            assert repr(qc_report[key]) == repr(reference[key]), key
+        assert qc_report["ohlc_sanity"] and qc_report["aggregation_match"] and qc_report["continuity"]
+        assert len(plan.jobs) == len(blocks) - len(reference["candle_count"])
+        assert [row["strip_path"] != "" for row in plan.backbone_rows] == [
+            len(plan.m15_by_block_all[b["block_id"]]) == 8 for b in blocks
+        ]
+
+
+def test_emission_independent_of_worker_count(tmp_path):
+    blocks, m15 = synthetic_blocks(1)
+    manifests = []
+    for workers in (1, 4):
+        pack_dir = tmp_path / f"pack_{workers}"
+        qc_report = empty_qc_report()
+        strip_plan = builder.plan_strips(blocks, builder.M15Frame.from_rows(m15), 1e-6, qc_report)
+        context_plan = builder.plan_context(blocks, strip_plan.m15_by_block, qc_report)
+        assert context_plan.jobs
+        builder.write_candle_files(builder.PackWriter(pack_dir), strip_plan.jobs + context_plan.jobs, workers=workers)
+        manifests.append(builder.build_manifest(pack_dir, data_only=True))
+    assert manifests[0] == manifests[1]
+    assert len(manifests[0]["files"]) == len(strip_plan.jobs) + len(context_plan.jobs)
+
+
+def build_strips(blocks, m15, pack_dir, cache=None):
+    qc_report = empty_qc_report()
+    plan = builder.plan_strips(blocks, builder.M15Frame.from_rows(m15), 1e-6, qc_report, cache=cache)
+    builder.write_candle_files(builder.PackWriter(pack_dir), plan.jobs, workers=2, cache=cache)
+    return qc_report, builder.build_manifest(pack_dir, data_only=True)
+
+
+def test_strip_cache_reuses_strips_and_qc(tmp_path):
+    blocks, m15 = synthetic_blocks(2)
+    reference = build_strips(blocks, m15, tmp_path / "uncached")
+
+    cache = builder.StripCache(tmp_path / "cache")
+    # Overlapping range: the first half is cached, the rest is new
+    build_strips(blocks[:60], m15, tmp_path / "half", cache=cache)
+    warm = builder.StripCache(tmp_path / "cache")
+    qc_report, manifest = build_strips(blocks, m15, tmp_path / "full", cache=warm)
+
+    assert manifest == reference[1]
+    assert repr(qc_report) == repr(reference[0])
+    strips = len(manifest["files"])
+    assert warm.hits + warm.misses == strips and 0 < warm.misses < strips
+
+    rerun = builder.StripCache(tmp_path / "cache")
+    assert build_strips(blocks, m15, tmp_path / "rerun", cache=rerun)[1] == reference[1]
+    assert (rerun.hits, rerun.misses) == (strips, 0)
+
+
+def test_strip_cache_key_tracks_inputs(tmp_path):
+    blocks, m15 = synthetic_blocks(3, n_blocks=1)
+    cache = builder.StripCache(tmp_path / "cache")
+    build_strips(blocks, m15, tmp_path / "first", cache=cache)
+
+    changed = [dict(row) for row in m15]
+    changed[4]["c"] += 1e-5
+    respined = [dict(blocks[0], h=blocks[0]["h"] + 1e-3)]
+    for block_list, rows in ((blocks, changed), (respined, m15)):
+        probe = builder.StripCache(tmp_path / "cache")
+        build_strips(block_list, rows, tmp_path / "probe", cache=probe)
+        assert (probe.hits, probe.misses) == (0, 1)
+
+
+def test_corrupt_strip_cache_entry_is_a_miss(tmp_path):
+    blocks, m15 = synthetic_blocks(4, n_blocks=1)
+    cache = builder.StripCache(tmp_path / "cache")
+    reference = build_strips(blocks, m15, tmp_path / "first", cache=cache)
+
+    (entry_path,) = (tmp_path / "cache").rglob("*.json")
+    entry_path.write_text(entry_path.read_text(encoding="utf-8").replace("1.2", "9.2", 1), encoding="utf-8")
+    probe = builder.StripCache(tmp_path / "cache")
+    assert build_strips(blocks, m15, tmp_path / "second", cache=probe) == reference
+    assert (probe.hits, probe.misses) == (0, 1)
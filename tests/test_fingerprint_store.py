@@ -0,0 +1,114 @@
+"""
+Unit tests for the columnar fingerprint store.
+Path 1 (Observation & Cataloging Only)
+"""
+
+import copy
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add repo root to path
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from trajectory_families.features import FEATURE_VECTOR_KEYS, compute_feature_vector
+from trajectory_families.fingerprint_store import (
+    FingerprintStore,
+    open_fingerprint_store,
+    sync_fingerprint_store,
+)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def golden_fingerprint():
+    with open(FIXTURES_DIR / "golden_fingerprint_v0_1.json") as f:
+        return json.load(f)
+
+
+def write_fingerprints(root: Path, days, content_tag: str = ""):
+    """Write one fingerprint JSON per (symbol, date_ny); return index rows."""
+    base = golden_fingerprint()
+    rows = []
+    for symbol, date_ny in days:
+        fp = copy.deepcopy(base)
+        fp["symbol"] = symbol
+        fp["date_ny"] = date_ny
+        fp["fingerprint_id"] = f"{symbol}_{date_ny}"
+        fp["content_hash"] = f"{symbol}{date_ny}{content_tag}"
+        rel_path = f"fingerprints/{symbol}/{date_ny}.json"
+        (root / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel_path).write_text(json.dumps(fp), encoding="utf-8")
+        rows.append({
+            "fingerprint_id": fp["fingerprint_id"],
+            "content_hash": fp["content_hash"],
+            "fingerprint_json_path": rel_path,
+        })
+    return rows
+
+
+class TestComputeFeatureVector:
+    def test_matches_golden_feature_vector(self):
+        features = compute_feature_vector(golden_fingerprint())
+        assert list(features) == FEATURE_VECTOR_KEYS
+        golden_fv = np.load(FIXTURES_DIR / "golden_feature_vector.npy")
+        np.testing.assert_array_almost_equal([features[k] for k in FEATURE_VECTOR_KEYS], golden_fv, decimal=6)
+        assert features["start_quadrant_enc"] == 0.333 and features["end_quadrant_enc"] == 0.333
+
+    def test_null_blocks(self):
+        fp = golden_fingerprint()
+        fp["quadrants"][11] = None
+        fp["points"][0]["x"] = None
+        features = compute_feature_vector(fp)
+        assert features["end_quadrant_enc"] == 0.5
+        # Trend is over the compacted non-null values, not their block indices
+        x_vals = [p["x"] for p in fp["points"][1:]]
+        assert features["x_trend"] == pytest.approx(np.polyfit(np.arange(11), x_vals, 1)[0])
+        assert features["x_range"] == pytest.approx(max(x_vals) - min(x_vals))
+
+
+class TestFingerprintStore:
+    def test_sync_adds_keeps_and_removes(self, tmp_path):
+        store_path = tmp_path / "fingerprints" / "fingerprints.npz"
+        rows = write_fingerprints(tmp_path, [("SPY", "2025-01-03"), ("QQQ", "2025-01-02"), ("SPY", "2025-01-02")])
+        assert sync_fingerprint_store(rows, tmp_path, store_path) == {"kept": 0, "added": 3, "updated": 0, "removed": 0}
+
+        changed = write_fingerprints(tmp_path, [("SPY", "2025-01-03")], content_tag="v2")
+        added = write_fingerprints(tmp_path, [("IWM", "2025-01-06")])
+        stats = sync_fingerprint_store(rows[1:2] + changed + added, tmp_path, store_path)
+        assert stats == {"kept": 1, "added": 1, "updated": 1, "removed": 1}
+
+        store = open_fingerprint_store(store_path)
+        assert store.columns["fingerprint_id"].tolist() == ["QQQ_2025-01-02", "SPY_2025-01-03", "IWM_2025-01-06"]
+        assert store.columns["content_hash"][1] == "SPY2025-01-03v2"
+
+    def test_records_match_feature_vector(self, tmp_path):
+        rows = write_fingerprints(tmp_path, [("SPY", "2025-01-02"), ("QQQ", "2025-01-02")])
+        sync_fingerprint_store(rows, tmp_path, tmp_path / "fingerprints.npz")
+        records = open_fingerprint_store(tmp_path / "fingerprints.npz").records()
+        expected = compute_feature_vector(golden_fingerprint())
+        assert [r["symbol"] for r in records] == ["QQQ", "SPY"]
+        for record in records:
+            assert record["features"] == expected
+            assert record["trajectory_plot_path"] == golden_fingerprint()["source_artifacts"]["trajectory_png"]
+
+    def test_unchanged_sync_does_not_rewrite(self, tmp_path):
+        store_path = tmp_path / "fingerprints.npz"
+        rows = write_fingerprints(tmp_path, [("SPY", "2025-01-02")])
+        sync_fingerprint_store(rows, tmp_path, store_path)
+        mtime = store_path.stat().st_mtime_ns
+        (tmp_path / rows[0]["fingerprint_json_path"]).unlink()
+        assert sync_fingerprint_store(rows, tmp_path, store_path) == {"kept": 1, "added": 0, "updated": 0, "removed": 0}
+        assert store_path.stat().st_mtime_ns == mtime
+
+    def test_unreadable_store_is_ignored(self, tmp_path):
+        store_path = tmp_path / "fingerprints.npz"
+        assert open_fingerprint_store(store_path) is None
+        store_path.write_bytes(b"not an npz")
+        assert open_fingerprint_store(store_path) is None
+        store = FingerprintStore(store_path)
+        assert not store.load() and len(store) == 0
@@ -304,6 +304,126 @@ def test_displacement_threshold_stability():
     print("PASS: Test D - Displacement threshold stability")
 
 
+def test_rolling_median_matches_statistics_median():
+    """
+    Test the rolling median primitive against statistics.median.
+
+    - Random series with repeated values, odd and even windows
+    - Assert every window median is bit-identical
+    """
+    import random
+    from statistics import median
+
+    rnd = random.Random(11)
+    values = [round(rnd.uniform(0, 0.002), 4) for _ in range(300)]
+    for window in (1, 2, 3, 5, 20, 300):
+        expected = [median(values[j:j + window]) for j in range(len(values) - window + 1)]
+        assert overlays_v0_3.rolling_median(values, window) == expected, window
+    assert overlays_v0_3.rolling_median(values[:5], 20) == []
+
+    print("PASS: Test D2 - Rolling median matches statistics.median")
+
+
+def test_displacement_matches_per_candle_median():
+    """
+    Test displacement events against a per-candle statistics.median reference.
+
+    - Random walk with occasional wide-range candles
+    - Assert quantized events (and so event IDs) are identical
+    """
+    import random
+    from statistics import median
+
+    rnd = random.Random(5)
+    base_ms = 1670000000000
+    px = 1.21
+    candles = []
+    for i in range(400):
+        o = px
+        c = o + rnd.gauss(0, 0.0004) * (4 if rnd.random() < 0.05 else 1)
+        candles.append(make_candle(base_ms + i * 900000, o, max(o, c) + 0.0001, min(o, c) - 0.0001, c))
+        px = c
+
+    expected = []
+    for i in range(20, len(candles)):
+        rolling = median([x["h"] - x["l"] for x in candles[i - 20:i]])
+        current_range = candles[i]["h"] - candles[i]["l"]
+        if rolling > 0 and current_range > 2.0 * rolling:
+            expected.append((candles[i]["bar_start_ms"], overlays_v0_3.quantize(current_range),
+                             overlays_v0_3.quantize(rolling),
+                             overlays_v0_3.quantize(current_range / rolling, precision=2)))
+
+    displacements = overlays_v0_3.detect_displacement_candles(candles, window=20, threshold=2.0)
+    assert expected
+    assert [(d["bar_start_ms"], d["range"], d["rolling_median"], d["ratio"]) for d in displacements] == expected
+
+    print("PASS: Test D3 - Displacement matches per-candle median")
+
+
+def test_mitigation_index_matches_full_scan():
+    """
+    Test FVG mitigation against a scan of every candle after formation.
+
+    - Random walk with jumps that skip clean across gap zones
+    - Assert mitigation flags and bars are identical, including unmitigated gaps
+    """
+    import copy
+    import random
+
+    rnd = random.Random(3)
+    base_ms = 1670000000000
+    px = 1.21
+    candles = []
+    for i in range(600):
+        o = px + (rnd.choice([-0.004, 0.004]) if rnd.random() < 0.03 else 0.0)
+        c = o + rnd.gauss(0, 0.0005)
+        candles.append(make_candle(base_ms + i * 900000, o, max(o, c) + 0.0001, min(o, c) - 0.0001, c))
+        px = c
+
+    fvgs = overlays_v0_3.detect_fair_value_gaps(candles)
+    expected = copy.deepcopy(fvgs)
+    for fvg in expected:
+        for candle in candles:
+            if candle["bar_start_ms"] > fvg["end_bar_ms"] and candle["l"] <= fvg["gap_high"] and candle["h"] >= fvg["gap_low"]:
+                fvg["mitigated"] = True
+                fvg["mitigation_bar_ms"] = candle["bar_start_ms"]
+                break
+
+    mitigated = overlays_v0_3.detect_mitigation_events(fvgs, candles)
+    assert mitigated == expected
+    assert any(fvg["mitigated"] for fvg in expected) and not all(fvg["mitigated"] for fvg in expected)
+
+    print("PASS: Test D4 - FVG mitigation index matches full scan")
+
+
+def test_rolling_extremes_match_window_slices():
+    """
+    Test the monotonic-deque rolling max/min against max()/min() of slices.
+
+    - Random series with repeated values, fixed and expanding windows
+    - Assert sweeps built on them match a slice-based reference
+    """
+    import random
+
+    rnd = random.Random(13)
+    values = [round(rnd.uniform(1.1, 1.102), 4) for _ in range(200)]
+    for window in (1, 3, 5, 200, None):
+        lo = (lambda j: 0) if window is None else (lambda j: max(0, j - window + 1))
+        assert overlays_v0_3.rolling_max(values, window) == [max(values[lo(j):j + 1]) for j in range(len(values))]
+        assert overlays_v0_3.rolling_min(values, window) == [min(values[lo(j):j + 1]) for j in range(len(values))]
+
+    candles = [make_candle(1670000000000 + i * 900000, v, v + 0.0003, v - 0.0003, v) for i, v in enumerate(values)]
+    expected = []
+    for i in range(3, len(candles)):
+        prior_high = max(c["h"] for c in candles[i - 3:i])
+        prior_low = min(c["l"] for c in candles[i - 3:i])
+        if candles[i]["h"] > prior_high or candles[i]["l"] < prior_low:
+            expected.append(candles[i]["bar_start_ms"])
+    assert [sweep["bar_start_ms"] for sweep in overlays_v0_3.detect_sweeps(candles, lookback=3)] == expected
+
+    print("PASS: Test D5 - Rolling extremes match window slices")
+
+
 # ============================================================================
 # Test E — Liquidity gradient stability
 # ============================================================================
@@ -361,6 +481,10 @@ def run_all_tests():
     test_sweep_determinism()
     test_fvg_generation_and_mitigation()
     test_displacement_threshold_stability()
+    test_rolling_median_matches_statistics_median()
+    test_displacement_matches_per_candle_median()
+    test_mitigation_index_matches_full_scan()
+    test_rolling_extremes_match_window_slices()
     test_liquidity_gradient_stability()
 
     print("=" * 70)
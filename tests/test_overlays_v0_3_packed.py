@@ -0,0 +1,121 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts" / "path1"))
+
+import overlays_v0_3
+
+
+M15_STEP_MS = 15 * 60 * 1000
+TWO_H_MS = 2 * 60 * 60 * 1000
+
+
+def synthetic_inputs():
+    blocks = []
+    m15_by_block = {}
+    all_m15 = []
+    base_start_ms = 1672531200000  # 2023-01-01T00:00:00Z
+    # Deliberately out of block_id order: packed output must sort.
+    for idx, block_id in enumerate(["20230101-C-TEST", "20230101-A-TEST", "20230101-B-TEST"]):
+        block_start_ms = base_start_ms + idx * TWO_H_MS
+        base_price = 1.1 + idx * 0.001
+        rows = []
+        for bar in range(8):
+            o = base_price + (bar % 3) * 0.0002 - bar * 0.00005
+            rows.append({
+                "bar_start_ms": block_start_ms + bar * M15_STEP_MS,
+                "bar_close_ms": block_start_ms + (bar + 1) * M15_STEP_MS,
+                "o": o,
+                "h": o + 0.0004 + bar * 0.00001,
+                "l": o - 0.0003,
+                "c": o + (0.0001 if bar % 2 else -0.0001),
+                "volume": 1000 + bar,
+            })
+        blocks.append({
+            "block_id": block_id,
+            "bar_open_ms": block_start_ms,
+            "bar_close_ms": block_start_ms + TWO_H_MS,
+        })
+        m15_by_block[block_id] = rows
+        all_m15.extend(rows)
+    all_m15.sort(key=lambda row: row["bar_start_ms"])
+    return blocks, m15_by_block, all_m15
+
+
+def overlay_files(pack_root: Path) -> dict:
+    root = pack_root / "overlays_v0_3"
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in sorted(root.rglob("*"))
+        if path.is_file()
+    }
+
+
+def write_pack(pack_root: Path, layout: str) -> dict:
+    pack_root.mkdir(parents=True)
+    blocks, m15_by_block, all_m15 = synthetic_inputs()
+    return overlays_v0_3.write_overlay_outputs(pack_root, blocks, m15_by_block, all_m15, layout=layout)
+
+
+def test_packed_layout_is_sorted_and_indexed(tmp_path):
+    counts = write_pack(tmp_path / "packed", "packed")
+    assert counts == write_pack(tmp_path / "files", "files")
+
+    overlays_root = tmp_path / "packed" / "overlays_v0_3"
+    jsonl_path, index_path = overlays_v0_3.packed_paths(overlays_root, "v0.3-A")
+    assert jsonl_path == overlays_root / "micro" / "2h.jsonl"
+    assert not (overlays_root / "micro" / "2h").exists()
+
+    index = json.loads(index_path.read_text(encoding="utf-8"))
+    block_ids = [entry[0] for entry in index["records"]]
+    assert block_ids == sorted(block_ids) and len(block_ids) == 3
+
+    data = jsonl_path.read_bytes()
+    for block_id, offset, length in index["records"]:
+        assert json.loads(data[offset:offset + length])["block_id"] == block_id
+
+
+def test_reader_random_access_matches_files_layout(tmp_path):
+    write_pack(tmp_path / "packed", "packed")
+    write_pack(tmp_path / "files", "files")
+
+    for module in overlays_v0_3.PER_BLOCK_MODULE_DIRS:
+        with overlays_v0_3.PackedOverlayReader(tmp_path / "packed", module) as reader:
+            assert len(reader) == 3
+            for block_id in reversed(reader.block_ids()):
+                expected = overlays_v0_3.read_block_overlay(tmp_path / "files", module, block_id)
+                assert reader.get(block_id) == expected
+                assert overlays_v0_3.read_block_overlay(tmp_path / "packed", module, block_id) == expected
+            assert "20230101-Z-TEST" not in reader
+            with pytest.raises(KeyError):
+                reader.get("20230101-Z-TEST")
+
+
+def test_converters_round_trip_byte_identical(tmp_path):
+    write_pack(tmp_path / "packed", "packed")
+    write_pack(tmp_path / "files", "files")
+    files_layout = overlay_files(tmp_path / "files")
+    packed_layout = overlay_files(tmp_path / "packed")
+
+    overlays_v0_3.unpack_overlay_outputs(tmp_path / "packed", remove_packed=True)
+    assert overlay_files(tmp_path / "packed") == files_layout
+
+    overlays_v0_3.pack_overlay_outputs(tmp_path / "packed", remove_files=True)
+    assert overlay_files(tmp_path / "packed") == packed_layout
+
+
+def test_unknown_layout_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        write_pack(tmp_path / "pack", "tar")
+
+
+def test_meta_records_only_non_default_layout():
+    assert "layout" not in overlays_v0_3.build_overlay_metadata(enabled=True, counts={})
+    assert "layout" not in overlays_v0_3.build_overlay_metadata(enabled=True, counts={}, layout="files")
+    meta = overlays_v0_3.build_overlay_metadata(enabled=True, counts={}, layout="packed")
+    assert meta["layout"] == "packed"
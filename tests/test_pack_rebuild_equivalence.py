@@ -33,7 +33,9 @@ def make_m15_block(block_start_ms: int, base_price: float):
     return rows
 
 
-def build_synthetic_pack(pack_dir: Path, *, overlays_enabled: bool, meta_generated_at: str) -> dict:
+def build_synthetic_pack(
+    pack_dir: Path, *, overlays_enabled: bool, meta_generated_at: str, overlay_workers: int = 1
+) -> dict:
     blocks = []
     m15_by_block = {}
     all_m15 = []
@@ -103,6 +105,7 @@ def build_synthetic_pack(pack_dir: Path, *, overlays_enabled: bool, meta_generat
             blocks=blocks,
             m15_by_block=m15_by_block,
             all_m15_candles=all_m15,
+            workers=overlay_workers,
         )
 
     hashes = builder.write_manifest_files(pack_dir)
@@ -178,3 +181,37 @@ def test_pack_rebuild_equivalence(tmp_path):
     assert overlay_files_b1 == overlay_files_b2
     for rel_path in overlay_files_b1:
         assert (pack_b1 / rel_path).read_bytes() == (pack_b2 / rel_path).read_bytes()
+
+
+def test_pack_rebuild_equivalence_parallel_overlays(tmp_path):
+    pack_serial = tmp_path / "pack_serial"
+    pack_parallel = tmp_path / "pack_parallel"
+    hashes_serial = build_synthetic_pack(
+        pack_serial, overlays_enabled=True, meta_generated_at="2026-01-22T10:00:00Z"
+    )
+    hashes_parallel = build_synthetic_pack(
+        pack_parallel, overlays_enabled=True, meta_generated_at="2026-01-22T10:00:00Z", overlay_workers=2
+    )
+
+    assert hashes_serial == hashes_parallel
+    assert (pack_serial / "meta.json").read_bytes() == (pack_parallel / "meta.json").read_bytes()
+    overlay_files = collect_overlay_files(pack_serial)
+    assert overlay_files and overlay_files == collect_overlay_files(pack_parallel)
+    for rel_path in overlay_files:
+        assert (pack_serial / rel_path).read_bytes() == (pack_parallel / rel_path).read_bytes()
+
+
+def test_parallel_overlay_timing_recorded_in_meta(tmp_path):
+    timing = {}
+    blocks = [{"block_id": "20230101-A-TEST", "bar_open_ms": 1672531200000, "bar_close_ms": 1672538400000}]
+    m15_by_block = {"20230101-A-TEST": make_m15_block(1672531200000, 1.1)}
+    counts = overlays_v0_3.write_overlay_outputs(
+        tmp_path, blocks, m15_by_block, m15_by_block["20230101-A-TEST"], workers=4, timing=timing
+    )
+
+    meta = overlays_v0_3.build_overlay_metadata(enabled=True, counts=counts, timing=timing)
+    assert meta["per_block_compute"]["workers"] == 1  # capped at the block count
+    assert set(meta["per_block_compute"]) == {
+        "workers", "wall_seconds", "worker_seconds", "parallel_efficiency_estimate"
+    }
+    assert "per_block_compute" not in overlays_v0_3.build_overlay_metadata(enabled=True, counts=counts)
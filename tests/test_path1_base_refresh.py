@@ -0,0 +1,257 @@
+"""
+Tests for the Path 1 materialized base table refresh.
+
+Refresh planning is tested against a scripted fake cursor; no database access
+required. The parity test runs only when NEON_DSN or DATABASE_URL is set and
+migration 09_derived_path1_base_v0_1.sql has been applied.
+"""
+
+import os
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts" / "path1"))
+
+import refresh_path1_base as rpb  # noqa: E402
+
+MIGRATION = REPO_ROOT / "sql" / "09_derived_path1_base_v0_1.sql"
+SCORE_PATCH = REPO_ROOT / "sql" / "path1" / "db_patches" / "patch_create_score_views_20260120.sql"
+EVIDENCE_PATCH = REPO_ROOT / "sql" / "path1" / "db_patches" / "patch_create_evidence_views_20260120.sql"
+
+WRAPPED_VIEWS = [
+    "derived.v_ovc_b_scores_dis_v1_1",
+    "derived.v_ovc_b_scores_res_v1_0",
+    "derived.v_ovc_b_scores_lid_v1_0",
+    "derived.v_path1_evidence_dis_v1_1",
+    "derived.v_path1_evidence_res_v1_0",
+    "derived.v_path1_evidence_lid_v1_0",
+]
+
+
+class _ScriptedCursor:
+    """Returns queued fetchone() rows and records executed SQL."""
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.executed = []
+        self.rowcount = 0
+
+    def execute(self, sql, params=None):
+        self.executed.append((" ".join(sql.split()), params))
+        if sql.lstrip().startswith("INSERT"):
+            self.rowcount = 42
+
+    def fetchone(self):
+        return self.rows.pop(0)
+
+
+INGEST_TS = "2026-01-20T00:00:00+00:00"
+WATERMARK = (1000, 10, INGEST_TS)
+
+
+class TestDecideRefresh:
+    def test_no_watermark_is_full(self):
+        plan = rpb.decide_refresh("GBPUSD", None, 1000, 0, None, None)
+        assert plan.mode == "full"
+
+    def test_forced_full(self):
+        plan = rpb.decide_refresh("GBPUSD", WATERMARK, 2000, 10, INGEST_TS, 900, force_full=True)
+        assert plan.mode == "full"
+
+    def test_up_to_date_is_noop(self):
+        plan = rpb.decide_refresh("GBPUSD", WATERMARK, 1000, 10, INGEST_TS, 900)
+        assert plan.mode == "noop"
+
+    def test_new_blocks_restate_outcome_horizon(self):
+        plan = rpb.decide_refresh("GBPUSD", WATERMARK, 2000, 10, INGEST_TS, 900)
+        assert plan.mode == "incremental"
+        assert plan.restate_from_ms == 900
+
+    def test_late_backfill_forces_full(self):
+        plan = rpb.decide_refresh("GBPUSD", WATERMARK, 2000, 11, INGEST_TS, 900)
+        assert plan.mode == "full"
+        assert "10 -> 11" in plan.reason
+
+    def test_reingested_history_forces_full(self):
+        # ON CONFLICT DO UPDATE corrections keep the row count but bump ingest_ts
+        plan = rpb.decide_refresh("GBPUSD", WATERMARK, 1000, 10, "2026-02-01T00:00:00+00:00", 900)
+        assert plan.mode == "full"
+        assert "re-ingested" in plan.reason
+
+    def test_missing_ingest_marker_forces_full(self):
+        plan = rpb.decide_refresh("GBPUSD", (1000, 10, None), 1000, 10, INGEST_TS, 900)
+        assert plan.mode == "full"
+
+    def test_short_history_is_full(self):
+        plan = rpb.decide_refresh("GBPUSD", (1000, 3, INGEST_TS), 2000, 3, INGEST_TS, None)
+        assert plan.mode == "full"
+
+
+class TestPlanAndApply:
+    def test_plan_reads_restate_point_at_outcome_horizon(self):
+        cur = _ScriptedCursor([WATERMARK, (2000,), (10,), (INGEST_TS,), (900,)])
+        plan = rpb.plan_refresh(cur, "GBPUSD")
+
+        assert plan.mode == "incremental"
+        assert plan.restate_from_ms == 900
+        sql, params = cur.executed[-1]
+        assert "ORDER BY bar_close_ms DESC OFFSET %s LIMIT 1" in sql
+        assert params == ("GBPUSD", rpb.OUTCOME_HORIZON_BARS - 1)
+
+    def test_plan_compares_source_view_rows_with_base_rows(self):
+        cur = _ScriptedCursor([WATERMARK, (2000,), (10,), (INGEST_TS,), (900,)])
+        rpb.plan_refresh(cur, "GBPUSD")
+
+        count_sql, count_params = cur.executed[2]
+        assert count_sql.startswith(f"SELECT COUNT(*) FROM {rpb.SOURCE_VIEW}")
+        assert count_params == ("GBPUSD", 1000)
+        ingest_sql, _ = cur.executed[3]
+        assert ingest_sql.startswith(f"SELECT MAX(ingest_ts) FROM {rpb.BLOCKS_TABLE}")
+
+    def test_incremental_restates_tail_only(self):
+        cur = _ScriptedCursor([])
+        plan = rpb.RefreshPlan("GBPUSD", "incremental", "new blocks", restate_from_ms=900)
+        assert rpb.apply_refresh(cur, plan) == 42
+
+        (delete_sql, delete_params), (insert_sql, insert_params) = cur.executed
+        assert delete_sql.startswith(f"DELETE FROM {rpb.BASE_TABLE}")
+        assert "bar_close_ms >= %s" in delete_sql and delete_params == ("GBPUSD", 900)
+        assert f"SELECT * FROM {rpb.SOURCE_VIEW}" in insert_sql
+        assert "bar_close_ms >= %s" in insert_sql and insert_params == ("GBPUSD", 900)
+
+    def test_full_rebuilds_symbol(self):
+        cur = _ScriptedCursor([])
+        rpb.apply_refresh(cur, rpb.RefreshPlan("GBPUSD", "full", "forced"))
+        assert [params for _, params in cur.executed] == [("GBPUSD",), ("GBPUSD",)]
+        assert all("bar_close_ms" not in sql for sql, _ in cur.executed)
+
+    def test_noop_writes_nothing(self):
+        cur = _ScriptedCursor([])
+        assert rpb.apply_refresh(cur, rpb.RefreshPlan("GBPUSD", "noop", "up to date")) == 0
+        assert cur.executed == []
+
+
+class _RegclassCursor(_ScriptedCursor):
+    """Answers to_regclass() lookups for the given existing relations."""
+
+    def __init__(self, existing):
+        super().__init__([])
+        self.existing = set(existing)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        super().execute(sql, params)
+        self.rows.append((params[0] if params[0] in self.existing else None,))
+
+
+class _CursorConnection:
+    def __init__(self, cur):
+        self.cur = cur
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def cursor(self):
+        return self.cur
+
+
+class TestMissingRelations:
+    def test_unapplied_migration_reports_both_tables(self):
+        conn = _CursorConnection(_RegclassCursor([]))
+        assert rpb.missing_relations(conn) == [rpb.BASE_TABLE, rpb.WATERMARK_TABLE]
+
+    def test_applied_migration_reports_nothing(self):
+        conn = _CursorConnection(_RegclassCursor([rpb.BASE_TABLE, rpb.WATERMARK_TABLE]))
+        assert rpb.missing_relations(conn) == []
+
+
+def _view_columns(sql_text, view):
+    """Output column names of the outermost SELECT of a CREATE [OR REPLACE] VIEW."""
+    match = re.search(
+        rf"CREATE (?:OR REPLACE )?VIEW {re.escape(view)} AS\n(.*?);\n", sql_text, re.S
+    )
+    assert match, view
+    body = re.sub(r"--[^\n]*", "", match.group(1))
+    select_list = body[body.rindex("SELECT"):body.rindex("FROM")]
+    columns = []
+    for line in select_list.splitlines():
+        line = line.strip().rstrip(",")
+        if line in ("SELECT", "CASE"):
+            continue
+        if re.match(r"^(END AS |[\w.]+( AS \w+)?$|NULL::)", line):
+            columns.append(re.split(r"\s+AS\s+|\.", line)[-1])
+    return columns
+
+
+class TestMigration:
+    @pytest.mark.parametrize("view", WRAPPED_VIEWS)
+    def test_wrappers_keep_view_columns(self, view):
+        migration = MIGRATION.read_text(encoding="utf-8")
+        patch = (SCORE_PATCH if "scores" in view else EVIDENCE_PATCH).read_text(encoding="utf-8")
+        assert _view_columns(migration, view) == _view_columns(patch, view)
+
+    def test_only_source_view_reads_live_outcomes(self):
+        migration = MIGRATION.read_text(encoding="utf-8")
+        code = re.sub(r"--[^\n]*", "", migration)
+        assert code.count("derived.v_ovc_c_outcomes_v0_1") == 1
+
+    def test_migration_populates_base_before_views_switch(self):
+        code = re.sub(r"--[^\n]*", "", MIGRATION.read_text(encoding="utf-8"))
+        load = code.index("INSERT INTO derived.path1_base_v0_1")
+        assert load < code.index("INSERT INTO derived.path1_base_watermarks_v0_1")
+        assert load < code.index("CREATE OR REPLACE VIEW derived.v_ovc_b_scores_dis_v1_1")
+
+    @pytest.mark.parametrize(
+        "workflow", ["main.yml", "path1_evidence.yml", "path1_evidence_queue.yml"]
+    )
+    def test_evidence_workflows_refresh_base(self, workflow):
+        text = (REPO_ROOT / ".github" / "workflows" / workflow).read_text(encoding="utf-8")
+        refresh = text.index("refresh_path1_base.py --skip-if-missing")
+        assert refresh < text.index("python scripts/path1/run_evidence_")
+
+    def test_migration_registered(self):
+        import json
+
+        registry = json.loads((REPO_ROOT / "schema" / "applied_migrations.json").read_text(encoding="utf-8"))
+        assert "sql/09_derived_path1_base_v0_1.sql" in [m["file"] for m in registry["migrations"]]
+
+
+def _dsn():
+    return os.environ.get("NEON_DSN") or os.environ.get("DATABASE_URL")
+
+
+@pytest.mark.skipif(not _dsn(), reason="NEON_DSN or DATABASE_URL not set")
+def test_base_table_matches_live_source():
+    psycopg2 = pytest.importorskip("psycopg2")
+    conn = psycopg2.connect(_dsn())
+    try:
+        with conn, conn.cursor() as cur:
+            cur.execute("SELECT to_regclass(%s)", (rpb.WATERMARK_TABLE,))
+            if cur.fetchone()[0] is None:
+                pytest.skip("migration 09_derived_path1_base_v0_1.sql not applied")
+            # Symbols with blocks past their watermark are awaiting refresh, not broken.
+            cur.execute(
+                f"SELECT w.sym FROM {rpb.WATERMARK_TABLE} w "
+                f"WHERE NOT EXISTS (SELECT 1 FROM {rpb.BLOCKS_TABLE} b "
+                f"WHERE b.sym = w.sym AND b.bar_close_ms > w.watermark_ms) ORDER BY w.sym"
+            )
+            symbols = [row[0] for row in cur.fetchall()]
+        if not symbols:
+            pytest.skip("no refreshed, up-to-date symbols in the base table")
+        for sym in symbols:
+            result = rpb.check_parity(conn, sym)
+            assert result.ok, result
+    finally:
+        conn.close()
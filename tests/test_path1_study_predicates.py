@@ -0,0 +1,138 @@
+"""
+Tests for sargable Path 1 study time predicates.
+
+Unit tests need no database. The EXPLAIN regression test runs only when
+NEON_DSN or DATABASE_URL is set and migration 09_derived_path1_base_v0_1.sql has
+been applied.
+"""
+
+import json
+import os
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts" / "path1"))
+
+from study_executor import bar_close_range_sql, utc_date_bounds_ms, utc_day_of_ms  # noqa: E402
+
+STUDY_DATES = [
+    ("2024-01-08", "2024-01-12"),
+    ("2023-03-06", "2023-03-17"),  # spans US DST start
+    ("2022-12-30", "2023-01-02"),  # spans year end
+]
+
+
+def legacy_date_of(bar_close_ms):
+    """Python model of to_timestamp(bar_close_ms/1000)::date on a UTC session."""
+    return datetime.fromtimestamp(bar_close_ms // 1000, tz=timezone.utc).date().isoformat()
+
+
+class TestBounds:
+    @pytest.mark.parametrize("date_start,date_end", STUDY_DATES)
+    def test_bounds_match_legacy_date_predicate(self, date_start, date_end):
+        start_ms, end_ms = utc_date_bounds_ms(date_start, date_end)
+        for ms in (start_ms - 1, start_ms, start_ms + 7_200_000, end_ms - 1, end_ms):
+            in_legacy = date_start <= legacy_date_of(ms) <= date_end
+            assert (start_ms <= ms < end_ms) == in_legacy
+
+    def test_predicate_text(self):
+        assert bar_close_range_sql("2024-01-08", "2024-01-08") == (
+            "bar_close_ms >= 1704672000000 AND bar_close_ms < 1704758400000"
+        )
+        assert bar_close_range_sql("2024-01-08", "2024-01-08", column="e.bar_close_ms").startswith(
+            "e.bar_close_ms >= "
+        )
+
+    def test_utc_day_of_ms(self):
+        assert utc_day_of_ms(1704672000000 // 86_400_000) == "2024-01-08"
+
+    def test_pack_builder_uses_same_bounds(self):
+        import build_evidence_pack_v0_2 as builder
+
+        assert builder.utc_date_bounds_ms is utc_date_bounds_ms
+
+
+class TestGeneratedSql:
+    @pytest.mark.parametrize("module_name", ["run_evidence_queue", "run_evidence_range"])
+    def test_study_sql_is_sargable(self, module_name):
+        module = __import__(module_name)
+        for score_name, score_config in module.SCORE_CONFIGS.items():
+            sql = module.generate_study_sql(
+                "p1_test", "GBPUSD", "2024-01-08", "2024-01-12", score_name, score_config
+            )
+            assert "to_timestamp" not in sql
+            assert bar_close_range_sql("2024-01-08", "2024-01-12") in sql
+
+    def test_psql_script_runs_four_studies_over_one_slice(self):
+        import run_evidence_queue
+        import study_engine
+
+        config = run_evidence_queue.SCORE_CONFIGS["DIS"]
+        sql = study_engine.generate_study_psql_script(
+            "p1_test", "GBPUSD", "2024-01-08", "2024-01-12", "DIS", config
+        )
+        statements = [s for s in sql.split(";") if "SELECT" in s]
+        assert len(statements) == 5
+        assert "CREATE TEMP TABLE slice AS" in statements[0]
+        assert all("FROM slice" in s for s in statements[1:])
+        assert sql.count(f"FROM {config['view']}") == 1
+        assert bar_close_range_sql("2024-01-08", "2024-01-12") in sql
+
+
+def _dsn():
+    return os.environ.get("NEON_DSN") or os.environ.get("DATABASE_URL")
+
+
+def _plan_nodes(node):
+    yield node
+    for child in node.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+BASE_INDEX = "idx_path1_base_v0_1_sym_bar_close"
+
+
+@pytest.mark.skipif(not _dsn(), reason="NEON_DSN or DATABASE_URL not set")
+@pytest.mark.parametrize("score_name", ["DIS", "RES", "LID"])
+def test_explain_study_sql_uses_base_index(score_name):
+    """
+    EXPLAIN the generated study statement itself. Before migration 09 the
+    evidence views sit on LEAD windows ordered by bar_close_ms, which block
+    pushdown of the time bounds, so the index the predicate reaches is the
+    base table's (sym, bar_close_ms) index.
+    """
+    psycopg2 = pytest.importorskip("psycopg2")
+    import run_evidence_queue
+
+    sql = run_evidence_queue.generate_study_sql(
+        "p1_explain", "GBPUSD", "2024-01-08", "2024-01-12",
+        score_name, run_evidence_queue.SCORE_CONFIGS[score_name],
+    )
+    conn = psycopg2.connect(_dsn())
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1 FROM pg_indexes WHERE schemaname = 'derived' AND indexname = %s", (BASE_INDEX,))
+            if cur.fetchone() is None:
+                pytest.skip("migration 09_derived_path1_base_v0_1.sql not applied")
+            # Small tables favour seq scans; disable them so the plan shows whether
+            # the predicate can drive an index at all.
+            cur.execute("SET LOCAL enable_seqscan = off")
+            cur.execute("EXPLAIN (FORMAT JSON)\n" + sql)
+            plan = cur.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+    finally:
+        conn.rollback()
+        conn.close()
+
+    index_conds = [
+        node.get("Index Cond", "")
+        for node in _plan_nodes(plan[0]["Plan"])
+        if node.get("Index Name") == BASE_INDEX
+    ]
+    assert index_conds, f"expected {BASE_INDEX} in plan"
+    assert any("bar_close_ms" in cond for cond in index_conds)
@@ -0,0 +1,174 @@
+"""
+Tests for the Path 1 queue runner: substitute-range resolver and --parallel mode
+(no database required).
+"""
+
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts" / "path1"))
+
+import run_evidence_queue  # noqa: E402
+from study_executor import ResultSet, utc_date_bounds_ms  # noqa: E402
+
+
+def utc_day(day):
+    """UTC day number, as returned by `bar_close_ms / 86400000`."""
+    return (date.fromisoformat(day) - date(1970, 1, 1)).days
+
+
+def daily_counts_for(days, n=12):
+    return {d.strftime("%Y-%m-%d"): n for d in days}
+
+
+class _FakeExecutor:
+    def __init__(self, daily_counts):
+        self.daily_counts = daily_counts
+        self.queries = []
+
+    def query(self, sql, params=None):
+        self.queries.append(sql)
+        rows = [
+            (utc_day(day), n) for day, n in sorted(self.daily_counts.items())
+        ]
+        return ResultSet(columns=["utc_day", "n"], numeric=[True, True], rows=rows)
+
+
+class TestSubstituteCandidates:
+    def test_candidates_are_five_weekdays_nearest_first(self):
+        candidates = run_evidence_queue.substitute_candidates("2026-02-02")
+        assert candidates[0] == ("2026-01-20", "2026-01-26")
+        assert len(candidates) == 52
+        for start, end in candidates:
+            days = [
+                date.fromisoformat(start) + timedelta(days=i)
+                for i in range((date.fromisoformat(end) - date.fromisoformat(start)).days + 1)
+            ]
+            assert sum(d.weekday() < 5 for d in days) == 5
+        ends = [end for _, end in candidates]
+        assert ends == sorted(ends, reverse=True)
+
+
+class TestPickSubstitute:
+    def test_skips_empty_and_overlapping_windows(self):
+        candidates = run_evidence_queue.substitute_candidates("2026-02-02")
+        data_days = [date(2026, 1, 5) + timedelta(days=i) for i in range(21)]
+        counts = daily_counts_for(data_days)
+        existing = [("2026-01-19", "2026-01-23")]
+
+        start, end, n = run_evidence_queue.pick_substitute_range(candidates, counts, existing)
+        assert (start, end) == ("2026-01-06", "2026-01-12")
+        assert n == 12 * 7
+
+    def test_no_data(self):
+        candidates = run_evidence_queue.substitute_candidates("2026-02-02")
+        assert run_evidence_queue.pick_substitute_range(candidates, {}, []) == (None, None, 0)
+
+    def test_single_grouped_query(self):
+        counts = daily_counts_for([date(2025, 6, 2) + timedelta(days=i) for i in range(5)])
+        executor = _FakeExecutor(counts)
+        start, end, n = run_evidence_queue.find_substitute_range(
+            executor, "GBPUSD", "2026-02-02", "2026-02-06", []
+        )
+        assert len(executor.queries) == 1
+        assert "GROUP BY" in executor.queries[0]
+        assert start <= "2025-06-06" and end >= "2025-06-02"
+        assert n > 0
+
+
+INDEX_TEMPLATE = """# Path 1 Evidence Runs Index
+
+**Last Updated:** 2026-01-22
+
+---
+
+## Completed Runs
+
+| Run ID | Date Range | Symbol(s) | n | Status | Link |
+|--------|------------|-----------|---|--------|------|
+
+---
+"""
+
+
+class _FakeStudyExecutor:
+    """Stands in for StudyExecutor: fixed counts, studies write a stub output."""
+
+    def __init__(self, db_url=None, connection=None):
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.closed = True
+
+    def query_scalar(self, sql, params=None):
+        # Requested 2020 ranges are empty; everything else has data
+        return 0 if str(utc_date_bounds_ms("2020-01-06", "2020-01-10")[0]) in sql else 60
+
+    def query(self, sql, params=None):
+        return ResultSet(columns=["utc_day", "n"], numeric=[True, True], rows=[(utc_day("2019-12-02"), 12)])
+
+    def run_sql_file(self, sql_file, output_file):
+        output_file.write_text(" n \n---\n 1\n(1 row)\n\n", encoding="utf-8")
+        return []
+
+
+def _queue(n):
+    runs = [
+        {"run_id": f"p1_test_{i:03d}", "symbol": "GBPUSD",
+         "date_start": f"2024-0{i + 1}-01", "date_end": f"2024-0{i + 1}-05"}
+        for i in range(n)
+    ]
+    runs.append({"run_id": "p1_test_sub", "symbol": "GBPUSD",
+                 "date_start": "2020-01-06", "date_end": "2020-01-10"})
+    return runs
+
+
+def _index_rows(repo_root):
+    text = (repo_root / "reports" / "path1" / "evidence" / "INDEX.md").read_text(encoding="utf-8")
+    return [line for line in text.splitlines() if line.startswith("| p1_")]
+
+
+def _repo(tmp_path):
+    index_dir = tmp_path / "reports" / "path1" / "evidence"
+    index_dir.mkdir(parents=True)
+    (index_dir / "INDEX.md").write_text(INDEX_TEMPLATE, encoding="utf-8")
+    return tmp_path
+
+
+class TestParallelQueue:
+    def test_parallel_matches_sequential_ledger(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(run_evidence_queue, "StudyExecutor", _FakeStudyExecutor)
+        runs = _queue(5)
+
+        seq_root = _repo(tmp_path / "seq")
+        seq_results = []
+        seq_ranges = []
+        for spec in runs:
+            result = run_evidence_queue.execute_single_run(
+                "db", _FakeStudyExecutor(), seq_root, spec["run_id"], spec["symbol"],
+                spec["date_start"], spec["date_end"], seq_ranges,
+            )
+            seq_results.append((spec["run_id"],) + tuple(result))
+
+        par_root = _repo(tmp_path / "par")
+        par_results = run_evidence_queue.execute_runs_parallel(
+            "db", _FakeStudyExecutor(), par_root, runs, [], parallel=3,
+        )
+
+        assert _index_rows(par_root) == _index_rows(seq_root)
+        assert [r[0] for r in par_results] == [s["run_id"] for s in runs]
+        assert [(r[0], r[6], r[7], r[8]) for r in par_results] == [
+            (r[0], r[4], r[5], r[6]) for r in seq_results
+        ]
+        # Substituted run resolves to the same window in both modes
+        assert par_results[-1][6] != "2020-01-06"
+        for spec in runs:
+            assert (par_root / "reports" / "path1" / "evidence" / "runs" / spec["run_id"] / "RUN.md").exists()
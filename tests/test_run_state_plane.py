@@ -0,0 +1,119 @@
+"""
+Tests for the Path 1 state plane range engine (no database required).
+"""
+
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts" / "path1"))
+
+import run_state_plane  # noqa: E402
+
+
+def state_plane_rows(days):
+    rows = []
+    for k, day in enumerate(days):
+        for b, letter in enumerate("ABCDEFGHIJKL"):
+            rows.append({
+                "block_id": f"{day:%Y%m%d}-{letter}-GBPUSD",
+                "sym": "GBPUSD",
+                "date_ny": day,
+                "block2h": letter,
+                "bar_close_ms": k * 100_000_000 + b,
+                "x_energy": None if (k + b) % 7 == 0 else (b + 1) / 13,
+                "y_shift": ((k * 12 + b) % 9 - 4) / 5,
+                "quadrant_id": f"Q{(k + b) % 4 + 1}",
+                "quadrant_name": "quadrant",
+                "threshold_pack_id": "STATE_PLANE_v0_2",
+                "threshold_pack_version": 1,
+                "threshold_pack_hash": "deadbeef",
+            })
+    return rows
+
+
+class _FakeConn:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def cursor(self, cursor_factory=None):
+        return _FakeCursor(self)
+
+
+class _FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.result = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params):
+        if "ovc_cfg.threshold_pack" in sql:
+            self.conn.queries.append("thresholds")
+            self.result = [{"config_json": {"thresholds": {"E_hi": 0.6, "S_hi": 0.4}}}]
+        else:
+            self.conn.queries.append("state_plane")
+            _, date_from, date_to = params
+            self.result = [r for r in self.conn.rows if date_from <= str(r["date_ny"]) <= date_to]
+
+    def fetchall(self):
+        return self.result
+
+    def fetchone(self):
+        return self.result[0] if self.result else None
+
+
+def run_files(runs_root: Path):
+    # RUN.md, run.json and the seal carry generated_at/created_utc
+    sealed = {"RUN.md", "run.json", "manifest.json", "MANIFEST.sha256"}
+    return {
+        path.relative_to(runs_root).as_posix(): path.read_bytes()
+        for path in sorted(runs_root.rglob("*"))
+        if path.is_file() and path.name not in sealed
+    }
+
+
+def test_allocate_run_ids_single_scan(tmp_path):
+    today = datetime.utcnow().strftime("%Y%m%d")
+    (tmp_path / f"p1_{today}_004").mkdir()
+    (tmp_path / "p1_19990101_009").mkdir()
+    assert run_state_plane.allocate_run_ids(tmp_path, 3) == [
+        f"p1_{today}_005", f"p1_{today}_006", f"p1_{today}_007"
+    ]
+    assert run_state_plane.next_run_id(tmp_path / "missing") == f"p1_{today}_001"
+
+
+def test_range_engine_queries_once_and_matches_worker_count(tmp_path, capsys):
+    days = [date(2026, 1, 5) + timedelta(days=k) for k in range(5)]
+    rows = [r for r in state_plane_rows(days) if r["date_ny"] != days[2]]
+    date_list = [d.isoformat() for d in days]
+
+    outputs = []
+    for workers in (1, 3):
+        repo_root = tmp_path / f"repo_{workers}"
+        conn = _FakeConn(rows)
+        run_ids = run_state_plane.run_range(conn, repo_root, "GBPUSD", date_list, workers=workers)
+        assert conn.queries == ["state_plane", "thresholds"]
+        assert len(run_ids) == 4 and run_ids == sorted(run_ids)
+        outputs.append(run_files(repo_root / "reports" / "path1" / "evidence" / "runs"))
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[2] == f"WARNING: No rows for GBPUSD on {date_list[2]}"
+        assert [line.split()[2] for line in lines if line.startswith("Run complete")] == run_ids
+
+    assert outputs[0] == outputs[1]
+    assert len(outputs[0]) == 4 * 4
+
+
+def test_single_day_fetch_uses_range_query():
+    days = [date(2026, 1, 5), date(2026, 1, 6)]
+    conn = _FakeConn(state_plane_rows(days))
+    points = run_state_plane.fetch_state_plane_blocks(conn, "GBPUSD", "2026-01-06")
+    assert conn.queries == ["state_plane"]
+    assert [p["block_id"] for p in points] == [f"20260106-{letter}-GBPUSD" for letter in "ABCDEFGHIJKL"]
+    assert run_state_plane.fetch_state_plane_blocks(conn, "GBPUSD", "2026-01-07") == []
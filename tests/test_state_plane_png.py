@@ -0,0 +1,86 @@
+"""
+Tests for the state plane trajectory PNG renderer (no database required).
+"""
+
+import struct
+import sys
+import zlib
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts" / "path1"))
+
+import state_plane_png  # noqa: E402
+
+
+def bresenham_walk(x0, y0, x1, y1):
+    """The integer err = dx - dy walk the closed form must reproduce."""
+    dx, dy = abs(x1 - x0), abs(y1 - y0)
+    sx = 1 if x0 < x1 else -1
+    sy = 1 if y0 < y1 else -1
+    err = dx - dy
+    x, y = x0, y0
+    pixels = []
+    while True:
+        pixels.append((x, y))
+        if x == x1 and y == y1:
+            return pixels
+        e2 = 2 * err
+        if e2 > -dy:
+            err -= dy
+            x += sx
+        if e2 < dx:
+            err += dx
+            y += sy
+
+
+def decode_png(data: bytes) -> np.ndarray:
+    width, height = struct.unpack(">II", data[16:24])
+    length = struct.unpack(">I", data[33:37])[0]
+    assert data[37:41] == b"IDAT"
+    raw = np.frombuffer(zlib.decompress(data[41:41 + length]), dtype=np.uint8).reshape(height, width * 3 + 1)
+    rows = np.zeros((height, width * 3), dtype=np.uint8)
+    for y in range(height):
+        assert raw[y, 0] in (0, 2)
+        rows[y] = raw[y, 1:] + (rows[y - 1] if raw[y, 0] == 2 else 0)
+    return rows.reshape(height, width, 3)
+
+
+def trajectory():
+    return [
+        {"x_energy": 0.1, "y_shift": -0.5},
+        {"x_energy": 0.35, "y_shift": 0.8},
+        {"x_energy": None, "y_shift": 0.2},
+        {"x_energy": 0.9, "y_shift": 0.1},
+        {"x_energy": 1.2, "y_shift": -1.4},  # off-canvas: clipped
+        {"x_energy": 0.5, "y_shift": 0.0},
+    ]
+
+
+def test_line_pixels_match_bresenham_walk():
+    for dx in range(-40, 41):
+        for dy in range(-40, 41):
+            xs, ys = state_plane_png.line_pixels(3, 4, 3 + dx, 4 + dy)
+            assert list(zip(xs.tolist(), ys.tolist())) == bresenham_walk(3, 4, 3 + dx, 4 + dy)
+
+
+def test_render_paints_in_order_and_encodes_losslessly(tmp_path):
+    points = trajectory()
+    image = state_plane_png.render_trajectory(points, 0.6, 0.4)
+
+    last = state_plane_png.to_pixel(0.5, 0.0)
+    assert tuple(image[last[1], last[0]]) == state_plane_png.POINT_COLOR
+    first = state_plane_png.to_pixel(0.1, -0.5)
+    xs, ys = state_plane_png.line_pixels(*first, *state_plane_png.to_pixel(0.35, 0.8))
+    assert tuple(image[ys[5], xs[5]]) == state_plane_png.PATH_COLOR
+    assert not state_plane_png.background(0.6, 0.4).flags.writeable
+
+    path = tmp_path / "out" / "trajectory.png"
+    state_plane_png.render_trajectory_png(points, path, 0.6, 0.4)
+    data = path.read_bytes()
+    assert np.array_equal(decode_png(data), image)
+
+    state_plane_png.render_trajectory_png(points, tmp_path / "again.png", 0.6, 0.4)
+    assert (tmp_path / "again.png").read_bytes() == data
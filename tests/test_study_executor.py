@@ -0,0 +1,245 @@
+"""
+Tests for the in-process Path 1 study executor.
+
+Uses committed study outputs from earlier psql runs as golden renderings and a
+fake DB-API connection. No database access required.
+"""
+
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts" / "path1"))
+
+from study_executor import (  # noqa: E402
+    ResultSet,
+    StudyExecutionError,
+    StudyExecutor,
+    expand_fused_result_set,
+    format_pg_value,
+    render_psql_aligned,
+    split_sql_statements,
+)
+
+GOLDEN_OUTPUT = (
+    REPO_ROOT / "reports" / "path1" / "evidence" / "runs" / "p1_20260120_003"
+    / "outputs" / "study_dis_v1_1.txt"
+)
+
+
+class _Column:
+    def __init__(self, name, type_code):
+        self.name = name
+        self.type_code = type_code
+
+
+class _FakeCursor:
+    def __init__(self, responses):
+        self._responses = responses
+        self.description = None
+        self._rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        response = self._responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        columns, rows = response
+        self.description = [_Column(name, oid) for name, oid in columns]
+        self._rows = rows
+
+    def fetchall(self):
+        return list(self._rows)
+
+
+class _FakeConnection:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.closed = False
+
+    def cursor(self):
+        return _FakeCursor(self.responses)
+
+    def close(self):
+        self.closed = True
+
+
+STUDY1_COLUMNS = [
+    ("score_version", 25),
+    ("run_id", 25),
+    ("n_observations", 20),
+    ("mean_score", 701),
+    ("stddev_score", 701),
+    ("min_score", 701),
+    ("p25_score", 701),
+    ("p50_score", 701),
+    ("p75_score", 701),
+    ("max_score", 701),
+]
+STUDY1_ROW = (
+    "DIS-v1.1", "p1_20260120_003", 60,
+    0.4795389519050805, 0.2687233628714461, 0.01886792452842441, 0.2926548089591218,
+    0.49058937666744284, 0.6666044776119779, 0.9916897506925276,
+)
+
+STUDY3_COLUMNS = [
+    ("score_quartile", 23),
+    ("outcome_category", 25),
+    ("n_observations", 20),
+    ("pct_within_quartile", 1700),
+]
+STUDY3_ROWS = [
+    (1, "DOWN", 3, Decimal("20.00")),
+    (1, "FLAT", 9, Decimal("60.00")),
+    (1, "UP", 3, Decimal("20.00")),
+    (2, "DOWN", 7, Decimal("46.67")),
+    (2, "FLAT", 6, Decimal("40.00")),
+    (2, "UP", 2, Decimal("13.33")),
+    (3, "DOWN", 2, Decimal("13.33")),
+    (3, "FLAT", 8, Decimal("53.33")),
+    (3, "UP", 5, Decimal("33.33")),
+    (4, "FLAT", 14, Decimal("93.33")),
+    (4, "UP", 1, Decimal("6.67")),
+]
+
+
+def golden_blocks():
+    """Split a psql output file into per-result-set blocks (each ends with a blank line)."""
+    text = GOLDEN_OUTPUT.read_text(encoding="utf-8")
+    return [block + "\n\n" for block in text.rstrip("\n").split("\n\n")]
+
+
+class TestSplitStatements:
+    def test_generated_study_sql_is_one_fused_statement(self):
+        import run_evidence_queue
+
+        sql = run_evidence_queue.generate_study_sql(
+            "p1_test", "GBPUSD", "2026-01-05", "2026-01-09",
+            "DIS", run_evidence_queue.SCORE_CONFIGS["DIS"],
+        )
+        statements = split_sql_statements(sql)
+        assert len(statements) == 1
+        assert statements[0].endswith(";")
+        assert "AS MATERIALIZED" in statements[0]
+        assert statements[0].count("FROM derived.v_path1_evidence_dis_v1_1") == 1
+
+    def test_comment_only_chunks_dropped(self):
+        sql = "-- header\n-- more\nSELECT 1;\n\n-- trailing comment\n"
+        assert split_sql_statements(sql) == ["-- header\n-- more\nSELECT 1;"]
+
+
+class TestRendering:
+    def test_format_pg_value(self):
+        assert format_pg_value(None) == ""
+        assert format_pg_value(True) == "t"
+        assert format_pg_value(2.0) == "2"
+        assert format_pg_value(-4.883528414789192e-05) == "-4.883528414789192e-05"
+        assert format_pg_value(1e15) == "1e+15"
+        assert format_pg_value(Decimal("6.70")) == "6.70"
+
+    def test_matches_psql_golden_output(self):
+        blocks = golden_blocks()
+        study1 = ResultSet(
+            columns=[c for c, _ in STUDY1_COLUMNS],
+            numeric=[oid != 25 for _, oid in STUDY1_COLUMNS],
+            rows=[STUDY1_ROW],
+        )
+        study3 = ResultSet(
+            columns=[c for c, _ in STUDY3_COLUMNS],
+            numeric=[oid != 25 for _, oid in STUDY3_COLUMNS],
+            rows=STUDY3_ROWS,
+        )
+        assert render_psql_aligned([study1]) == blocks[0]
+        assert render_psql_aligned([study3]) == blocks[2]
+
+
+def fused_columns_and_rows():
+    """Study 1 and study 3 stacked the way study_engine's fused statement returns them."""
+    columns = [("study_id", 23)]
+    columns += [(f"s1__{name}", oid) for name, oid in STUDY1_COLUMNS]
+    columns += [(f"s3__{name}", oid) for name, oid in STUDY3_COLUMNS]
+    pad1 = (None,) * len(STUDY1_COLUMNS)
+    pad3 = (None,) * len(STUDY3_COLUMNS)
+    rows = [(1,) + STUDY1_ROW + pad3] + [(3,) + pad1 + row for row in STUDY3_ROWS]
+    return columns, rows
+
+
+class TestFusedResults:
+    def test_expand_fused_result_set(self):
+        columns, rows = fused_columns_and_rows()
+        fused = ResultSet(
+            columns=[name for name, _ in columns],
+            numeric=[oid != 25 for _, oid in columns],
+            rows=rows,
+        )
+        study1, study3 = expand_fused_result_set(fused)
+        assert study1.columns == [name for name, _ in STUDY1_COLUMNS]
+        assert study1.rows == [STUDY1_ROW]
+        assert study3.rows == STUDY3_ROWS
+        blocks = golden_blocks()
+        assert render_psql_aligned([study1, study3]) == blocks[0] + blocks[2]
+
+    def test_plain_result_set_unchanged(self):
+        plain = ResultSet(columns=["n"], numeric=[True], rows=[(1,)])
+        assert expand_fused_result_set(plain) == [plain]
+
+    def test_executor_expands_fused_statement(self, tmp_path):
+        conn = _FakeConnection([fused_columns_and_rows()])
+        sql_file = tmp_path / "study.sql"
+        sql_file.write_text("WITH slice AS MATERIALIZED (SELECT 1)\nSELECT 1;\n", encoding="utf-8")
+        output_file = tmp_path / "study.txt"
+
+        result_sets = StudyExecutor("unused", connection=conn).run_sql_file(sql_file, output_file)
+
+        assert len(result_sets) == 2
+        blocks = golden_blocks()
+        assert output_file.read_text(encoding="utf-8") == blocks[0] + blocks[2]
+
+
+class TestExecutor:
+    def test_run_sql_file_writes_psql_format(self, tmp_path):
+        conn = _FakeConnection([
+            (STUDY1_COLUMNS, [STUDY1_ROW]),
+            (STUDY3_COLUMNS, STUDY3_ROWS),
+        ])
+        sql_file = tmp_path / "study.sql"
+        sql_file.write_text("SELECT 1;\nSELECT 2;\n", encoding="utf-8")
+        output_file = tmp_path / "study.txt"
+
+        with StudyExecutor("unused", connection=conn) as executor:
+            result_sets = executor.run_sql_file(sql_file, output_file)
+
+        blocks = golden_blocks()
+        assert output_file.read_text(encoding="utf-8") == blocks[0] + blocks[2]
+        assert result_sets[0].as_dicts()[0]["n_observations"] == 60
+        assert conn.closed
+
+    def test_failure_keeps_partial_output(self, tmp_path):
+        psycopg2 = pytest.importorskip("psycopg2")
+        conn = _FakeConnection([
+            (STUDY1_COLUMNS, [STUDY1_ROW]),
+            psycopg2.Error("relation does not exist"),
+        ])
+        sql_file = tmp_path / "study.sql"
+        sql_file.write_text("SELECT 1;\nSELECT 2;\n", encoding="utf-8")
+        output_file = tmp_path / "study.txt"
+
+        executor = StudyExecutor("unused", connection=conn)
+        with pytest.raises(StudyExecutionError):
+            executor.run_sql_file(sql_file, output_file)
+
+        text = output_file.read_text(encoding="utf-8")
+        assert text.startswith(golden_blocks()[0])
+        assert "relation does not exist" in text
+
+    def test_query_scalar(self):
+        conn = _FakeConnection([([("count", 20)], [(42,)])])
+        assert StudyExecutor("unused", connection=conn).query_scalar("SELECT COUNT(*);") == 42
@@ -0,0 +1,107 @@
+"""
+Unit tests for trajectory family k-medoids clustering.
+Path 1 (Observation & Cataloging Only)
+"""
+
+import csv
+import sys
+from itertools import product
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add repo root to path
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from trajectory_families.clustering import FasterPAM, MedoidSweep, compute_silhouette, select_k
+from trajectory_families.distance import pairwise_dtw
+from trajectory_families.features import zscore_standardize
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(scope="module")
+def fixture_distances():
+    X = np.loadtxt(FIXTURES_DIR / "cluster_features_v0_1.csv", delimiter=",", skiprows=1)
+    return pairwise_dtw(zscore_standardize(X)), X
+
+
+def load_golden_assignments():
+    with open(FIXTURES_DIR / "golden_cluster_assignments.csv", newline="") as f:
+        rows = list(csv.DictReader(f))
+    labels = np.array([int(r["label"]) for r in rows])
+    medoids = {int(r["label"]): int(r["row"]) for r in rows if r["is_medoid"] == "Y"}
+    return labels, np.array([medoids[slot] for slot in range(len(medoids))])
+
+
+def total_deviation(D, medoids):
+    return D[medoids].min(axis=0).sum()
+
+
+class TestSelectK:
+    def test_default_matches_golden_assignments(self, fixture_distances):
+        D, X = fixture_distances
+        golden_labels, golden_medoids = load_golden_assignments()
+        k, labels, medoids = select_k(D, X, seed=42)
+        assert k == len(golden_medoids)
+        assert np.array_equal(labels, golden_labels)
+        assert np.array_equal(medoids, golden_medoids)
+
+    def test_fasterpam_is_deterministic(self, fixture_distances):
+        D, X = fixture_distances
+        first = select_k(D, X, seed=7, method="fasterpam")
+        second = select_k(D, X, seed=7, method="fasterpam")
+        assert first[0] == second[0]
+        assert np.array_equal(first[1], second[1]) and np.array_equal(first[2], second[2])
+
+    def test_unknown_method_rejected(self, fixture_distances):
+        D, X = fixture_distances
+        with pytest.raises(ValueError):
+            select_k(D, X, method="kmeans")
+
+
+class TestFasterPAM:
+    def test_no_single_swap_improves(self, fixture_distances):
+        D, _ = fixture_distances
+        pam = FasterPAM(D, 6, seed=42).fit()
+        loss = total_deviation(D, pam.medoids)
+        assert pam.loss == pytest.approx(loss)
+        for slot, candidate in product(range(6), range(D.shape[0])):
+            if candidate in pam.medoids:
+                continue
+            swapped = pam.medoids.copy()
+            swapped[slot] = candidate
+            assert total_deviation(D, swapped) >= loss - 1e-9
+
+    def test_labels_are_nearest_medoid(self, fixture_distances):
+        D, _ = fixture_distances
+        pam = FasterPAM(D, 5, seed=3).fit()
+        assert np.array_equal(pam.labels, np.argmin(D[pam.medoids], axis=0))
+
+    def test_not_worse_than_alternating_fit(self, fixture_distances):
+        D, X = fixture_distances
+        _, golden_medoids = load_golden_assignments()
+        pam = FasterPAM(D, len(golden_medoids), seed=42).fit()
+        assert pam.loss <= total_deviation(D, golden_medoids) + 1e-9
+
+
+class TestSilhouette:
+    def test_matches_sklearn_exactly(self, fixture_distances):
+        metrics = pytest.importorskip("sklearn.metrics")
+        D, _ = fixture_distances
+        labels = np.random.default_rng(0).integers(0, 7, size=D.shape[0])
+        assert compute_silhouette(D, labels).tobytes() == metrics.silhouette_samples(D, labels, metric="precomputed").tobytes()
+        assert MedoidSweep(D).silhouette_score(labels) == metrics.silhouette_score(D, labels, metric="precomputed")
+
+    def test_asymmetric_matrix_uses_column_sums(self):
+        metrics = pytest.importorskip("sklearn.metrics")
+        D = np.random.default_rng(1).random((30, 30))
+        np.fill_diagonal(D, 0.0)
+        labels = np.arange(30) % 4
+        assert np.array_equal(compute_silhouette(D, labels), metrics.silhouette_samples(D, labels, metric="precomputed"))
+
+    def test_single_cluster_rejected(self):
+        with pytest.raises(ValueError):
+            compute_silhouette(np.zeros((4, 4)), np.zeros(4, dtype=int))
@@ -0,0 +1,97 @@
+"""
+Unit tests for trajectory family DTW distances.
+Path 1 (Observation & Cataloging Only)
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add repo root to path
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from trajectory_families.distance import (
+    dtw_batch,
+    dtw_distance,
+    keogh_envelopes,
+    lb_keogh,
+    pairwise_dtw,
+)
+
+
+def dtw_loop(x, y, window=None):
+    """Reference double-loop DTW (unconstrained unless window is given)."""
+    n, m = len(x), len(y)
+    radius = None if window is None else max(window, abs(n - m))
+    dtw = np.full((n + 1, m + 1), np.inf)
+    dtw[0, 0] = 0.0
+    for i in range(1, n + 1):
+        for j in range(1, m + 1):
+            if radius is not None and abs(i - j) > radius:
+                continue
+            cost = abs(x[i - 1] - y[j - 1])
+            dtw[i, j] = cost + min(dtw[i - 1, j], dtw[i, j - 1], dtw[i - 1, j - 1])
+    return float(dtw[n, m])
+
+
+class TestDtwDistance:
+    def test_matches_double_loop_exactly(self):
+        rng = np.random.default_rng(3)
+        for _ in range(100):
+            n, m = rng.integers(1, 12, size=2)
+            x = rng.standard_normal(n)
+            y = rng.standard_normal(m)
+            assert dtw_distance(x, y) == dtw_loop(x, y)
+
+    def test_window_matches_banded_loop(self):
+        rng = np.random.default_rng(4)
+        for _ in range(100):
+            n, m = rng.integers(1, 12, size=2)
+            window = int(rng.integers(0, 4))
+            x = rng.standard_normal(n)
+            y = rng.standard_normal(m)
+            assert dtw_distance(x, y, window=window) == dtw_loop(x, y, window)
+
+    def test_max_dist_abandons_only_above_threshold(self):
+        rng = np.random.default_rng(5)
+        x = rng.standard_normal(20)
+        y = rng.standard_normal(20)
+        full = dtw_distance(x, y)
+        assert dtw_distance(x, y, max_dist=full) == full
+        assert dtw_distance(x, y, max_dist=full * 0.5) == np.inf
+        assert np.all(dtw_batch(np.stack([x, y]), np.stack([y, y]), max_dist=0.0) == [np.inf, 0.0])
+
+
+class TestPairwiseDtw:
+    def test_matches_pairwise_loop_exactly(self):
+        rng = np.random.default_rng(6)
+        X = rng.standard_normal((30, 26))
+        D = pairwise_dtw(X, batch_size=50)
+        expected = np.zeros((30, 30))
+        for i in range(30):
+            for j in range(i + 1, 30):
+                expected[i, j] = expected[j, i] = dtw_loop(X[i], X[j])
+        assert D.tobytes() == expected.tobytes()
+
+    def test_lb_keogh_bounds_banded_dtw(self):
+        rng = np.random.default_rng(7)
+        X = rng.standard_normal((25, 16))
+        for window in (None, 0, 2):
+            lower, upper = keogh_envelopes(X, window)
+            bound = lb_keogh(X[:, None, :], lower[None, :, :], upper[None, :, :])
+            assert np.all(bound <= pairwise_dtw(X, window=window) + 1e-12)
+
+    def test_cutoff_keeps_exact_values_within_cutoff(self):
+        rng = np.random.default_rng(8)
+        X = rng.standard_normal((25, 16))
+        for window in (None, 0, 2):
+            full = pairwise_dtw(X, window=window)
+            cutoff = float(np.quantile(full[np.triu_indices(25, 1)], 0.3))
+            expected = np.where(full <= cutoff, full, np.inf)
+            np.fill_diagonal(expected, 0.0)
+            assert np.array_equal(pairwise_dtw(X, window=window, cutoff=cutoff, batch_size=40), expected)
+
+    def test_single_sample(self):
+        assert pairwise_dtw(np.ones((1, 5))).tolist() == [[0.0]]
@@ -0,0 +1,75 @@
+"""
+Unit tests for the on-disk trajectory DTW distance store.
+Path 1 (Observation & Cataloging Only)
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add repo root to path
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from trajectory_families.distance import pairwise_dtw
+from trajectory_families.distance_store import DistanceMatrixStore, standardization_basis
+from trajectory_families.features import zscore_stats
+
+
+def sample(n: int, seed: int = 11):
+    X = np.random.default_rng(seed).standard_normal((n, 12))
+    return [f"hash{i:03d}" for i in range(n)], X
+
+
+class TestDistanceMatrixStore:
+    def test_incremental_update_matches_full_matrix(self, tmp_path):
+        ids, X = sample(40)
+        store = DistanceMatrixStore(tmp_path)
+        store.load()
+        first = store.update(ids[:25], X[:25], "basis")
+        assert first == {"reused": 0, "added": 25, "computed_pairs": 300, "rebuilt": 0}
+
+        reopened = DistanceMatrixStore(tmp_path)
+        reopened.load()
+        second = reopened.update(ids, X, "basis", workers=2)
+        assert second == {"reused": 25, "added": 15, "computed_pairs": sum(range(25, 40)), "rebuilt": 0}
+
+        D = reopened.distances(ids)
+        assert isinstance(D, np.memmap)
+        assert D.tobytes() == pairwise_dtw(X).tobytes()
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["distances_2.npy", "index.json", "vectors_2.npy"]
+
+    def test_unchanged_ids_compute_nothing(self, tmp_path):
+        ids, X = sample(10)
+        store = DistanceMatrixStore(tmp_path)
+        store.update(ids, X, "basis")
+        stats = store.update(ids, X, "basis")
+        assert stats["added"] == 0 and stats["computed_pairs"] == 0
+        assert store.generation == 1
+
+    def test_subset_and_reorder_are_copies(self, tmp_path):
+        ids, X = sample(15)
+        store = DistanceMatrixStore(tmp_path)
+        store.update(ids, X, "basis")
+        order = [7, 2, 11]
+        D = store.distances([ids[i] for i in order])
+        assert not isinstance(D, np.memmap)
+        assert np.array_equal(D, pairwise_dtw(X)[np.ix_(order, order)])
+
+    def test_basis_change_rebuilds(self, tmp_path):
+        ids, X = sample(12)
+        store = DistanceMatrixStore(tmp_path)
+        store.update(ids[:8], X[:8], standardization_basis(["a"], *zscore_stats(X[:8])))
+        stats = store.update(ids, X, standardization_basis(["a"], *zscore_stats(X)))
+        assert stats["rebuilt"] == 1 and stats["added"] == 12
+        assert store.distances(ids).tobytes() == pairwise_dtw(X).tobytes()
+
+    def test_inconsistent_index_is_ignored(self, tmp_path):
+        ids, X = sample(6)
+        store = DistanceMatrixStore(tmp_path)
+        store.update(ids, X, "basis")
+        (tmp_path / "distances_1.npy").unlink()
+        reopened = DistanceMatrixStore(tmp_path)
+        reopened.load()
+        assert len(reopened) == 0 and reopened.basis is None
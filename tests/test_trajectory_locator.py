@@ -0,0 +1,68 @@
+"""
+Unit tests for the trajectory CSV locator index.
+Path 1 (Observation & Cataloging Only)
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add repo root to path
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from trajectory_families import TrajectoryIndex, default_index_path, open_trajectory_index
+from trajectory_families.locator import TRAJECTORY_REL_PATH
+
+
+def write_run(evidence_dir: Path, run_id: str, block_id: str) -> Path:
+    path = evidence_dir / run_id / TRAJECTORY_REL_PATH
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        "block2h,block_id,x_energy,y_shift,quadrant_id,quadrant_name\n"
+        f"A,{block_id},0.5,0.1,Q1,expansion\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+class TestTrajectoryIndex:
+    def test_newest_run_wins_and_unmatched_rows_skipped(self, tmp_path):
+        evidence = tmp_path / "runs"
+        write_run(evidence, "p1_20260120_001", "20260116-A-GBPUSD")
+        newest = write_run(evidence, "p1_20260122_002", "20260116-A-GBPUSD")
+        write_run(evidence, "p1_20260122_003", "20260117-A-EURUSD")
+        write_run(evidence, "p1_20260122_004", "")
+        (evidence / "p1_20260122_005").mkdir()
+        (evidence / "notes.txt").write_text("not a run", encoding="utf-8")
+
+        index = open_trajectory_index(evidence)
+        assert index.find("GBPUSD", "2026-01-16") == newest
+        assert index.find("EURUSD", "2026-01-17") == evidence / "p1_20260122_003" / TRAJECTORY_REL_PATH
+        assert index.find("GBPUSD", "2026-01-17") is None
+        assert len(index) == 2
+
+    def test_refresh_rereads_only_changed_runs(self, tmp_path):
+        evidence = tmp_path / "runs"
+        index_path = default_index_path(evidence, tmp_path / "cache")
+        write_run(evidence, "p1_20260120_001", "20260116-A-GBPUSD")
+        rewritten = write_run(evidence, "p1_20260120_002", "20260117-A-GBPUSD")
+        open_trajectory_index(evidence, index_path)
+        assert index_path.exists()
+
+        write_run(evidence, "p1_20260121_001", "20260118-A-GBPUSD")
+        rewritten.write_text(
+            "block2h,block_id,x_energy,y_shift,quadrant_id,quadrant_name\n"
+            "A,20260119-A-GBPUSD,0.5,0.1,Q1,expansion\n",
+            encoding="utf-8",
+        )
+        stat = rewritten.stat()
+        os.utime(rewritten, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        index = TrajectoryIndex(evidence, index_path)
+        index.load()
+        stats = index.refresh()
+        assert stats == {"scanned": 3, "reread": 2, "removed": 0}
+        assert index.find("GBPUSD", "2026-01-19") == rewritten
+        assert index.find("GBPUSD", "2026-01-17") is None
+        assert index.find("GBPUSD", "2026-01-18") is not None
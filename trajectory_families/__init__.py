@@ -28,6 +28,11 @@ from .fingerprint import (
     safe_std,
     write_fingerprint_json,
 )
+from .locator import (
+    TrajectoryIndex,
+    default_index_path,
+    open_trajectory_index,
+)
 from .schema import (
     SCHEMA_VERSION,
     ValidationError,
@@ -58,6 +63,10 @@ __all__ = [
     "load_params",
     "load_trajectory_csv",
     "write_fingerprint_json",
+    # Trajectory lookup
+    "TrajectoryIndex",
+    "default_index_path",
+    "open_trajectory_index",
     # Schema
     "SCHEMA_VERSION",
     "ValidationError",
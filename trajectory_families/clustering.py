@@ -1,8 +1,9 @@
 import numpy as np
 from typing import List, Dict, Tuple
-from sklearn.metrics import silhouette_score
 import random
 
+KMEDOIDS_METHODS = ("alternate", "fasterpam")
+
 class PAMClustering:
     def __init__(self, D: np.ndarray, k: int, seed: int = 42):
         self.D = D
@@ -43,15 +44,169 @@ class PAMClustering:
     def get_medoids(self):
         return self.medoids
 
-def select_k(D: np.ndarray, X: np.ndarray, k_range=range(5,16), seed=42) -> Tuple[int, np.ndarray, np.ndarray]:
+def _is_symmetric(D: np.ndarray, block: int = 256) -> bool:
+    """Exact D == D.T, compared in cache-sized tiles."""
+    N = D.shape[0]
+    return all(
+        np.array_equal(D[i:i + block, j:j + block], D[j:j + block, i:i + block].T)
+        for i in range(0, N, block)
+        for j in range(i, N, block)
+    )
+
+class MedoidSweep:
+    """
+    D-derived state shared by every k of a select_k sweep.
+
+    Holds D as contiguous float64 plus its transpose (D itself when
+    symmetric), so per-cluster distance sums are row additions in column
+    order -- the same sequence as sklearn's per-row bincount, which makes
+    silhouettes identical to silhouette_samples.
+    """
+    def __init__(self, D: np.ndarray):
+        self.D = np.ascontiguousarray(D, dtype=float)
+        self.DT = self.D if _is_symmetric(self.D) else np.ascontiguousarray(self.D.T)
+        self.N = self.D.shape[0]
+
+    def cluster_sums(self, labels: np.ndarray, n_clusters: int) -> np.ndarray:
+        """(N, n_clusters) sums of D[i, j] over j in each cluster (labels 0..n_clusters-1)."""
+        sums = np.zeros((n_clusters, self.N))
+        for j, label in enumerate(labels.tolist()):
+            sums[label] += self.DT[j]
+        return sums.T
+
+    def silhouette_samples(self, labels: np.ndarray) -> np.ndarray:
+        _, labels = np.unique(labels, return_inverse=True)
+        freqs = np.bincount(labels)
+        if not 2 <= len(freqs) <= self.N - 1:
+            raise ValueError(f"Number of labels is {len(freqs)}. Valid values are 2 to n_samples - 1 (inclusive)")
+        sums = self.cluster_sums(labels, len(freqs))
+        own = (np.arange(self.N), labels)
+        intra = sums[own]
+        sums[own] = np.inf
+        inter = (sums / freqs).min(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            intra = intra / (freqs - 1).take(labels)
+            sil = (inter - intra) / np.maximum(intra, inter)
+        return np.nan_to_num(sil)
+
+    def silhouette_score(self, labels: np.ndarray) -> float:
+        return float(np.mean(self.silhouette_samples(labels)))
+
+    def grow_medoids(self, medoids: np.ndarray, k: int) -> np.ndarray:
+        """Extend medoids to k by repeatedly adding the point farthest from its nearest medoid."""
+        medoids = list(medoids)
+        nearest = self.D[medoids].min(axis=0)
+        while len(medoids) < k:
+            far = int(np.argmax(nearest))
+            medoids.append(far)
+            nearest = np.minimum(nearest, self.D[far])
+        return np.array(medoids)
+
+def _nearest_two(Dm: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per point: nearest medoid slot, its distance and the second-nearest distance."""
+    order = np.argsort(Dm, axis=0, kind='stable')
+    cols = np.arange(Dm.shape[1])
+    second = Dm[order[1], cols] if Dm.shape[0] > 1 else np.full(Dm.shape[1], np.inf)
+    return order[0], Dm[order[0], cols], second
+
+class FasterPAM:
+    """
+    k-medoids by FasterPAM swaps (Schubert & Rousseeuw, 2021).
+
+    Caches each point's nearest and second-nearest medoid, so one candidate
+    scores the swap against all k medoids in O(N); the first improving swap is
+    applied (eager) and candidates are scanned in index order until a full
+    pass finds none. Deterministic for a given seed / initial medoids.
+    """
+    def __init__(self, D: np.ndarray, k: int, seed: int = 42, medoids: np.ndarray = None, max_passes: int = 100):
+        self.D = np.ascontiguousarray(D, dtype=float)
+        self.k = k
+        self.seed = seed
+        self.init_medoids = medoids
+        self.max_passes = max_passes
+        self.medoids = None
+        self.labels = None
+        self.loss = None
+
+    def fit(self):
+        N = self.D.shape[0]
+        if self.init_medoids is not None:
+            medoids = np.array(self.init_medoids, dtype=int)
+        else:
+            medoids = np.random.RandomState(self.seed).choice(N, self.k, replace=False)
+        k = len(medoids)
+        Dm = self.D[medoids]
+        nearest, d_near, d_second = _nearest_two(Dm)
+        removal = np.bincount(nearest, weights=d_second - d_near, minlength=k)
+        is_medoid = np.zeros(N, dtype=bool)
+        is_medoid[medoids] = True
+
+        candidate, since_swap, examined = 0, 0, 0
+        while since_swap < N and examined < self.max_passes * N:
+            if not is_medoid[candidate]:
+                d = self.D[candidate]
+                closer = d < d_near
+                between = ~closer & (d < d_second)
+                delta = (
+                    removal
+                    + np.bincount(nearest[closer], weights=(d_near - d_second)[closer], minlength=k)
+                    + np.bincount(nearest[between], weights=(d - d_second)[between], minlength=k)
+                )
+                slot = int(np.argmin(delta))
+                if delta[slot] + (d - d_near)[closer].sum() < 0:
+                    is_medoid[medoids[slot]] = False
+                    is_medoid[candidate] = True
+                    medoids[slot] = candidate
+                    Dm[slot] = d
+                    nearest, d_near, d_second = _nearest_two(Dm)
+                    removal = np.bincount(nearest, weights=d_second - d_near, minlength=k)
+                    since_swap = 0
+            since_swap += 1
+            examined += 1
+            candidate = (candidate + 1) % N
+
+        self.medoids = medoids
+        self.labels = nearest
+        self.loss = float(d_near.sum())
+        return self
+
+    def get_assignments(self):
+        return self.labels
+
+    def get_medoids(self):
+        return self.medoids
+
+def select_k(
+    D: np.ndarray,
+    X: np.ndarray,
+    k_range=range(5,16),
+    seed=42,
+    method: str = "alternate",
+) -> Tuple[int, np.ndarray, np.ndarray]:
+    """
+    Best k in k_range by silhouette, with its labels and medoids.
+
+    method="alternate" is PAMClustering (the v0.1 results); "fasterpam" runs
+    FasterPAM, starting each larger k from the previous medoids plus the
+    farthest points. Silhouettes for every k come from one MedoidSweep.
+    """
+    if method not in KMEDOIDS_METHODS:
+        raise ValueError(f"Unknown k-medoids method {method!r}; expected one of {KMEDOIDS_METHODS}")
+    sweep = MedoidSweep(D)
     best_k = None
     best_score = -np.inf
     best_labels = None
     best_medoids = None
+    previous = None
     for k in k_range:
-        pam = PAMClustering(D, k, seed=seed).fit()
+        if method == "fasterpam":
+            init = sweep.grow_medoids(previous, k) if previous is not None and len(previous) < k else None
+            pam = FasterPAM(sweep.D, k, seed=seed, medoids=init).fit()
+            previous = pam.get_medoids()
+        else:
+            pam = PAMClustering(sweep.D, k, seed=seed).fit()
         labels = pam.get_assignments()
-        score = silhouette_score(D, labels, metric='precomputed')
+        score = sweep.silhouette_score(labels)
         if score > best_score:
             best_score = score
             best_k = k
@@ -60,5 +215,4 @@ def select_k(D: np.ndarray, X: np.ndarray, k_range=range(5,16), seed=42) -> Tupl
     return best_k, best_labels, best_medoids
 
 def compute_silhouette(D: np.ndarray, labels: np.ndarray) -> np.ndarray:
-    from sklearn.metrics import silhouette_samples
-    return silhouette_samples(D, labels, metric='precomputed')
+    return MedoidSweep(D).silhouette_samples(labels)
@@ -1,25 +1,198 @@
 import numpy as np
-from typing import List
-
-def dtw_distance(x: np.ndarray, y: np.ndarray) -> float:
-    """Compute DTW distance between two 1D arrays (deterministic, no window)."""
-    n, m = len(x), len(y)
-    dtw = np.full((n+1, m+1), np.inf)
-    dtw[0, 0] = 0.0
-    for i in range(1, n+1):
-        for j in range(1, m+1):
-            cost = abs(x[i-1] - y[j-1])
-            dtw[i, j] = cost + min(dtw[i-1, j],    # insertion
-                                   dtw[i, j-1],    # deletion
-                                   dtw[i-1, j-1])  # match
-    return float(dtw[n, m])
-
-def pairwise_dtw(X: np.ndarray) -> np.ndarray:
-    """Compute full pairwise DTW distance matrix for N samples."""
+from typing import List, Optional, Tuple
+
+# Pairs per vectorized DP batch in pairwise_dtw (larger batches fall out of cache)
+DTW_BATCH_SIZE = 2048
+
+
+def _diagonal_span(d: int, n: int, m: int, window: Optional[int]) -> Tuple[int, int]:
+    """Row range [lo, hi] of DP cells (i, d - i), 1 <= i <= n, 1 <= j <= m, inside the band."""
+    lo = max(1, d - m)
+    hi = min(n, d - 1)
+    if window is not None:
+        # |i - j| = |2i - d| <= radius
+        radius = max(int(window), abs(n - m))
+        lo = max(lo, (d - radius + 1) // 2)
+        hi = min(hi, (d + radius) // 2)
+    return lo, hi
+
+
+def dtw_batch(
+    x: np.ndarray,
+    y: np.ndarray,
+    window: Optional[int] = None,
+    max_dist: Optional[float] = None,
+) -> np.ndarray:
+    """
+    DTW distances between rows x[b] and y[b] for a batch of B pairs.
+
+    The DP runs over anti-diagonals i + j = d, stored by row i so the cells of
+    one diagonal and their insertion/deletion/match neighbours on the previous
+    two are contiguous slices. Every cell is still
+    cost + min(insertion, deletion, match), so unconstrained results equal
+    the double loop exactly.
+
+    Args:
+        x: (B, n) array
+        y: (B, m) array
+        window: Sakoe-Chiba band radius (cells with |i - j| > radius are
+            unreachable); None = unconstrained
+        max_dist: Early-abandon threshold; pairs whose distance exceeds it
+            are returned as inf (stops once every pair has exceeded it)
+
+    Returns:
+        (B,) distances
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    B, n = x.shape
+    m = y.shape[1]
+    y_rev = y[:, ::-1]
+
+    # diagonals[d % 3][:, i] = DP cell (i, d - i); row 0 / column 0 are inf except (0, 0)
+    diagonals = np.full((3, B, n + 1), np.inf)
+    diagonals[0, :, 0] = 0.0
+    previous_floor = None
+    for d in range(2, n + m + 1):
+        current = diagonals[d % 3]
+        current.fill(np.inf)
+        lo, hi = _diagonal_span(d, n, m, window)
+        if lo > hi:
+            continue
+        last = diagonals[(d - 1) % 3]
+        before = diagonals[(d - 2) % 3]
+        # y[d - i - 1] for i = lo..hi is an ascending slice of reversed y
+        cost = np.abs(x[:, lo - 1:hi] - y_rev[:, m - d + lo:m - d + hi + 1])
+        step = np.minimum(np.minimum(last[:, lo - 1:hi], last[:, lo:hi + 1]), before[:, lo - 1:hi])
+        np.add(cost, step, out=current[:, lo:hi + 1])
+        if max_dist is not None:
+            # Every warping path crosses one of two consecutive anti-diagonals
+            # and costs are non-negative, so their minimum is a lower bound
+            floor = current[:, lo:hi + 1].min(axis=1)
+            if previous_floor is not None and np.all(np.minimum(floor, previous_floor) > max_dist):
+                return np.full(B, np.inf)
+            previous_floor = floor
+
+    result = diagonals[(n + m) % 3][:, n].copy()
+    if max_dist is not None:
+        result[result > max_dist] = np.inf
+    return result
+
+
+def dtw_distance(
+    x: np.ndarray,
+    y: np.ndarray,
+    window: Optional[int] = None,
+    max_dist: Optional[float] = None,
+) -> float:
+    """Compute DTW distance between two 1D arrays (deterministic, no window by default)."""
+    return float(dtw_batch(np.asarray(x)[None, :], np.asarray(y)[None, :], window=window, max_dist=max_dist)[0])
+
+
+def keogh_envelopes(X: np.ndarray, window: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-row (lower, upper) LB_Keogh envelopes: min/max of X[:, t - window:t + window + 1]."""
+    X = np.asarray(X, dtype=float)
+    length = X.shape[1]
+    radius = length - 1 if window is None else min(int(window), length - 1)
+    padded_hi = np.pad(X, ((0, 0), (radius, radius)), constant_values=-np.inf)
+    padded_lo = np.pad(X, ((0, 0), (radius, radius)), constant_values=np.inf)
+    span = 2 * radius + 1
+    upper = np.lib.stride_tricks.sliding_window_view(padded_hi, span, axis=1).max(axis=2)
+    lower = np.lib.stride_tricks.sliding_window_view(padded_lo, span, axis=1).min(axis=2)
+    return lower, upper
+
+
+def lb_keogh(x: np.ndarray, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+    """
+    LB_Keogh lower bound of DTW (absolute-difference cost) for x against envelopes.
+
+    Every x[t] is matched to some in-band y value, which costs at least its
+    distance to that band's [lower, upper] range. Broadcasts over leading axes.
+    """
+    return (np.maximum(x - upper, 0.0) + np.maximum(lower - x, 0.0)).sum(axis=-1)
+
+
+def dtw_pairs(
+    X: np.ndarray,
+    i: np.ndarray,
+    j: np.ndarray,
+    window: Optional[int] = None,
+    cutoff: Optional[float] = None,
+    batch_size: int = DTW_BATCH_SIZE,
+    envelopes: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+) -> np.ndarray:
+    """
+    DTW distances dtw(X[i[p]], X[j[p]]) for index pairs, in vectorized batches.
+
+    With a cutoff, pairs whose LB_Keogh bound exceeds it are skipped and the
+    rest are early-abandoned; both come back as inf. envelopes may pass
+    precomputed keogh_envelopes(X, window).
+    """
+    X = np.asarray(X, dtype=float)
+    i = np.asarray(i, dtype=np.int64)
+    j = np.asarray(j, dtype=np.int64)
+    d = np.full(len(i), np.inf)
+    if cutoff is not None:
+        lower, upper = envelopes if envelopes is not None else keogh_envelopes(X, window)
+    for start in range(0, len(i), batch_size):
+        bi = i[start:start + batch_size]
+        bj = j[start:start + batch_size]
+        keep = np.ones(len(bi), dtype=bool)
+        if cutoff is not None:
+            bound = np.maximum(lb_keogh(X[bi], lower[bj], upper[bj]), lb_keogh(X[bj], lower[bi], upper[bi]))
+            keep = bound <= cutoff
+        if keep.any():
+            d[start:start + batch_size][keep] = dtw_batch(X[bi[keep]], X[bj[keep]], window=window, max_dist=cutoff)
+    return d
+
+
+def pairwise_dtw(
+    X: np.ndarray,
+    window: Optional[int] = None,
+    cutoff: Optional[float] = None,
+    batch_size: int = DTW_BATCH_SIZE,
+) -> np.ndarray:
+    """
+    Compute full pairwise DTW distance matrix for N samples.
+
+    Upper-triangle pairs (i < j) are evaluated with dtw_pairs. The defaults
+    (no band, no cutoff) give the exact unconstrained matrix.
+
+    Args:
+        X: (N, L) samples
+        window: Optional Sakoe-Chiba band radius
+        cutoff: Optional distance cutoff; pairs whose LB_Keogh bound exceeds
+            it are skipped and pairs whose DTW exceeds it are early-abandoned,
+            both stored as inf
+        batch_size: Pairs per vectorized batch
+
+    Returns:
+        (N, N) symmetric distance matrix with zero diagonal
+    """
+    X = np.asarray(X, dtype=float)
     N = X.shape[0]
     D = np.zeros((N, N))
-    for i in range(N):
-        for j in range(i+1, N):
-            d = dtw_distance(X[i], X[j])
-            D[i, j] = D[j, i] = d
+    if N < 2:
+        return D
+    envelopes = keogh_envelopes(X, window) if cutoff is not None else None
+
+    def run(rows: List[np.ndarray], cols: List[np.ndarray]) -> None:
+        i = np.concatenate(rows)
+        j = np.concatenate(cols)
+        d = dtw_pairs(X, i, j, window=window, cutoff=cutoff, batch_size=batch_size, envelopes=envelopes)
+        D[i, j] = d
+        D[j, i] = d
+
+    # Whole rows per call, flushed once at least a batch is pending
+    rows, cols, pending = [], [], 0
+    for i in range(N - 1):
+        j = np.arange(i + 1, N)
+        rows.append(np.full(len(j), i))
+        cols.append(j)
+        pending += len(j)
+        if pending >= batch_size:
+            run(rows, cols)
+            rows, cols, pending = [], [], 0
+    if pending:
+        run(rows, cols)
     return D
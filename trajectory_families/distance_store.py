@@ -0,0 +1,221 @@
+"""
+Distance Matrix Store v0.1
+==========================
+Path 1 (Observation & Cataloging Only)
+
+On-disk pairwise DTW matrix for the cluster command, keyed by fingerprint
+content_hash:
+
+    <cache_dir>/index.json             # version, basis, generation, ids, meta
+    <cache_dir>/distances_<gen>.npy    # (n, n) float64 in ids order, read via mmap
+    <cache_dir>/vectors_<gen>.npy      # (n, L) standardized rows the distances were computed from
+
+The basis is a digest of everything a distance depends on besides the two
+rows (feature keys, standardization stats, DTW window); a different basis
+starts the store over. Within a basis, new ids are appended and only their
+pairs are computed: for each new position r, dtw(X[c], X[r]) for c < r (the
+same orientation as pairwise_dtw), split into interleaved row blocks over a
+process pool. The grown matrix is written as a new generation and index.json
+is replaced last, so an interrupted update leaves the previous store intact.
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .distance import dtw_pairs
+
+STORE_VERSION = "distance_store_v1"
+INDEX_FILE = "index.json"
+SHARDS_PER_WORKER = 4  # row blocks per worker, so uneven rows still balance
+COPY_ROWS = 1024  # rows per chunk when copying the previous matrix
+
+
+def standardization_basis(
+    feature_keys: Sequence[str],
+    mean: np.ndarray,
+    std: np.ndarray,
+    window: Optional[int] = None,
+) -> str:
+    """Digest of feature keys, exact z-score stats and DTW window."""
+    h = hashlib.sha256()
+    h.update(json.dumps({"feature_keys": list(feature_keys), "window": window}, sort_keys=True).encode("utf-8"))
+    h.update(np.ascontiguousarray(mean, dtype=np.float64).tobytes())
+    h.update(np.ascontiguousarray(std, dtype=np.float64).tobytes())
+    return h.hexdigest()
+
+
+def _distance_rows(args: Tuple) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Worker: pairs (c, r), c < r, for each row r of a block -> (c, r, distances)."""
+    vectors, rows, window = args
+    i = np.concatenate([np.arange(r) for r in rows]) if len(rows) else np.empty(0, dtype=np.int64)
+    j = np.repeat(rows, rows)
+    return i, j, dtw_pairs(vectors, i, j, window=window)
+
+
+class DistanceMatrixStore:
+    """
+    Incrementally grown DTW distance matrix for one cache directory.
+
+    Usage:
+        store = DistanceMatrixStore(cache_dir)
+        store.load()
+        stats = store.update(content_hashes, Xz, basis, workers=4)
+        D = store.distances(content_hashes)  # read-only mmap when ids match
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self.basis: Optional[str] = None
+        self.ids: List[str] = []
+        self.meta: Dict = {}
+        self.generation = 0
+        self._positions: Dict[str, int] = {}
+
+    @property
+    def matrix_path(self) -> Path:
+        return self.cache_dir / f"distances_{self.generation}.npy"
+
+    @property
+    def vectors_path(self) -> Path:
+        return self.cache_dir / f"vectors_{self.generation}.npy"
+
+    def load(self) -> None:
+        """Load the persisted index (ignored if missing, stale-format, corrupt or inconsistent)."""
+        try:
+            data = json.loads((self.cache_dir / INDEX_FILE).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("version") != STORE_VERSION:
+            return
+        self.generation = int(data["generation"])
+        ids = list(data["ids"])
+        try:
+            shape = np.load(self.matrix_path, mmap_mode="r").shape
+        except (OSError, ValueError):
+            self.generation = 0
+            return
+        if shape != (len(ids), len(ids)):
+            self.generation = 0
+            return
+        self.basis = data["basis"]
+        self.ids = ids
+        self.meta = data.get("meta", {})
+        self._positions = {h: pos for pos, h in enumerate(self.ids)}
+
+    def matrix(self) -> np.ndarray:
+        """Read-only memory-mapped (n, n) matrix in self.ids order."""
+        if not self.ids:
+            return np.zeros((0, 0))
+        return np.load(self.matrix_path, mmap_mode="r")
+
+    def update(
+        self,
+        ids: Sequence[str],
+        X: np.ndarray,
+        basis: str,
+        window: Optional[int] = None,
+        workers: int = 1,
+        meta: Optional[Dict] = None,
+    ) -> Dict[str, int]:
+        """
+        Add ids (rows of X, same order) not yet in the store and persist.
+
+        A basis different from the stored one discards the stored ids first.
+        Duplicate ids use their first row.
+
+        Returns:
+            Dict with reused, added and computed_pairs counts and rebuilt (0/1)
+        """
+        X = np.asarray(X, dtype=float)
+        rebuilt = int(self.basis is not None and basis != self.basis)
+        if basis != self.basis:
+            self.ids = []
+            self._positions = {}
+        new_ids, new_rows = [], []
+        for row, h in enumerate(ids):
+            if h not in self._positions and h not in new_ids:
+                new_ids.append(h)
+                new_rows.append(row)
+        stats = {"reused": len(set(ids)) - len(new_ids), "added": len(new_ids), "computed_pairs": 0, "rebuilt": rebuilt}
+        if not new_ids and basis == self.basis:
+            if meta is not None and meta != self.meta:
+                self.meta = meta
+                self._save_index()
+            return stats
+
+        n_old = len(self.ids)
+        old_matrix = self.matrix()
+        old_vectors = np.load(self.vectors_path) if n_old else np.zeros((0, X.shape[1]))
+        vectors = np.vstack([old_vectors, X[new_rows]])
+        n = len(vectors)
+
+        previous = (self.matrix_path, self.vectors_path) if self.basis is not None else ()
+        self.generation += 1
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        out = np.lib.format.open_memmap(self.matrix_path, mode="w+", dtype=np.float64, shape=(n, n))
+        for start in range(0, n_old, COPY_ROWS):
+            stop = min(start + COPY_ROWS, n_old)
+            out[start:stop, :n_old] = old_matrix[start:stop]
+        del old_matrix
+
+        rows = np.arange(n_old, n)
+        if workers > 1 and len(rows) > 1:
+            shards = min(len(rows), workers * SHARDS_PER_WORKER)
+            tasks = [(vectors, rows[s::shards], window) for s in range(shards)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_distance_rows, tasks))
+        else:
+            results = [_distance_rows((vectors, rows, window))]
+        for i, j, d in results:
+            out[i, j] = d
+            out[j, i] = d
+            stats["computed_pairs"] += len(d)
+        out[rows, rows] = 0.0
+        out.flush()
+        del out
+        np.save(self.vectors_path, vectors)
+
+        self.basis = basis
+        self.ids = self.ids + new_ids
+        self._positions = {h: pos for pos, h in enumerate(self.ids)}
+        if meta is not None:
+            self.meta = meta
+        self._save_index()
+        for path in previous:
+            path.unlink(missing_ok=True)
+        return stats
+
+    def _save_index(self) -> None:
+        payload = {
+            "version": STORE_VERSION,
+            "basis": self.basis,
+            "generation": self.generation,
+            "ids": self.ids,
+            "meta": self.meta,
+        }
+        index_path = self.cache_dir / INDEX_FILE
+        tmp_path = index_path.with_name(f"{INDEX_FILE}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, index_path)
+
+    def distances(self, ids: Sequence[str]) -> np.ndarray:
+        """
+        (len(ids), len(ids)) distances in ids order.
+
+        The memory-mapped matrix itself when ids equal the stored order (the
+        usual case when fingerprints are only appended); otherwise a copy.
+        """
+        positions = [self._positions[h] for h in ids]
+        matrix = self.matrix()
+        if positions == list(range(len(self.ids))):
+            return matrix
+        return np.asarray(matrix[np.ix_(positions, positions)])
+
+    def __len__(self) -> int:
+        return len(self.ids)
@@ -1,4 +1,5 @@
 import json
+import math
 import numpy as np
 from pathlib import Path
 from typing import List, Dict, Tuple
@@ -18,16 +19,98 @@ def load_fingerprints(index_csv: Path, fingerprints_dir: Path) -> List[Dict]:
             fingerprints.append(fp)
     return fingerprints
 
+QUADRANT_ENCODING = {"Q1": 0.0, "Q2": 0.333, "Q3": 0.667, "Q4": 1.0}
+MISSING_QUADRANT_ENCODING = 0.5
+PATH_GEOMETRY_FEATURES = [
+    "path_length", "net_displacement", "efficiency", "turning", "jump_count",
+    "energy_mean", "energy_std", "shift_mean", "shift_std",
+]
+FEATURE_VECTOR_KEYS = PATH_GEOMETRY_FEATURES + [
+    "q1_proportion", "q2_proportion", "q3_proportion", "q4_proportion",
+    "q_entropy", "q_runs_max_norm", "transition_entropy",
+    "self_transition_rate", "adjacent_trans_rate", "diagonal_trans_rate", "stability_index",
+    "start_quadrant_enc", "end_quadrant_enc", "x_trend", "y_trend", "x_range", "y_range",
+]
+ADJACENT_TRANSITIONS = ["Q1_Q2", "Q2_Q1", "Q1_Q3", "Q3_Q1", "Q2_Q4", "Q4_Q2", "Q3_Q4", "Q4_Q3"]
+DIAGONAL_TRANSITIONS = ["Q1_Q4", "Q4_Q1", "Q2_Q3", "Q3_Q2"]
+
+def encode_quadrant(q) -> float:
+    """Ordinal quadrant encoding (spec 8.4); null/unknown quadrants encode as 0.5."""
+    return QUADRANT_ENCODING.get(q, MISSING_QUADRANT_ENCODING)
+
+def compute_trend_slope(values: List[float]) -> float:
+    """Least-squares slope of values over positions 0..n-1 (spec 3.3); 0.0 for n < 2."""
+    n = len(values)
+    if n < 2:
+        return 0.0
+    x_mean = (n - 1) / 2
+    y_mean = sum(values) / n
+    numerator = sum((i - x_mean) * (v - y_mean) for i, v in enumerate(values))
+    denominator = sum((i - x_mean) ** 2 for i in range(n))
+    return numerator / denominator if denominator > 0 else 0.0
+
+def compute_transition_entropy(q_transitions: Dict) -> float:
+    """Shannon entropy (bits) of the 16 Q-to-Q transition counts (spec 3.3)."""
+    counts = [q_transitions.get(f"Q{i}_Q{j}", 0) for i in range(1, 5) for j in range(1, 5)]
+    total = sum(counts)
+    if total == 0:
+        return 0.0
+    return -sum(c / total * math.log2(c / total) for c in counts if c > 0)
+
+def compute_feature_vector(fingerprint: Dict) -> Dict[str, float]:
+    """
+    26-d clustering features of a DayFingerprint, keyed by FEATURE_VECTOR_KEYS
+    (spec 8.4, values in spec 3.4 order).
+
+    Start/end quadrants are quadrants[0] and quadrants[11]; trends and ranges
+    use the non-null x/y values, compacted (null blocks dropped, not skipped).
+    """
+    geometry = fingerprint["path_geometry"]
+    dynamics = fingerprint["quadrant_dynamics"]
+    q_counts = dynamics["q_counts"]
+    q_transitions = dynamics["q_transitions"]
+    quadrants = fingerprint["quadrants"]
+    features = {name: float(geometry[name]) for name in PATH_GEOMETRY_FEATURES}
+    for q in ("Q1", "Q2", "Q3", "Q4"):
+        features[f"{q.lower()}_proportion"] = q_counts[q] / 12.0
+    features["q_entropy"] = float(dynamics["q_entropy"])
+    features["q_runs_max_norm"] = dynamics["q_runs_max"] / 12.0
+    features["transition_entropy"] = compute_transition_entropy(q_transitions)
+
+    total = sum(q_transitions.values())
+
+    def rate(keys: List[str]) -> float:
+        return sum(q_transitions.get(k, 0) for k in keys) / total if total > 0 else 0.0
+
+    features["self_transition_rate"] = rate([f"Q{i}_Q{i}" for i in range(1, 5)])
+    features["adjacent_trans_rate"] = rate(ADJACENT_TRANSITIONS)
+    features["diagonal_trans_rate"] = rate(DIAGONAL_TRANSITIONS)
+    features["stability_index"] = (dynamics["q_runs_max"] / 12.0) * (1.0 - dynamics["q_entropy"] / 2.0)
+
+    features["start_quadrant_enc"] = encode_quadrant(quadrants[0])
+    features["end_quadrant_enc"] = encode_quadrant(quadrants[11])
+    values = {axis: [float(p[axis]) for p in fingerprint["points"] if p[axis] is not None] for axis in ("x", "y")}
+    for axis in ("x", "y"):
+        features[f"{axis}_trend"] = compute_trend_slope(values[axis])
+    for axis in ("x", "y"):
+        features[f"{axis}_range"] = max(values[axis]) - min(values[axis]) if values[axis] else 0.0
+    return features
+
 def extract_feature_matrix(fingerprints: List[Dict], feature_keys: List[str]) -> np.ndarray:
     """Extract feature matrix (N x D) from fingerprints."""
     X = np.array([[fp['features'][k] for k in feature_keys] for fp in fingerprints], dtype=float)
     return X
 
-def zscore_standardize(X: np.ndarray) -> np.ndarray:
-    """Z-score standardize features (column-wise, stable)."""
+def zscore_stats(X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Column-wise (mean, std) for z-scoring (zero std replaced by 1)."""
     mean = X.mean(axis=0)
     std = X.std(axis=0, ddof=0)
     std[std == 0] = 1.0
+    return mean, std
+
+def zscore_standardize(X: np.ndarray, stats: Tuple[np.ndarray, np.ndarray] = None) -> np.ndarray:
+    """Z-score standardize features (column-wise, stable); stats defaults to zscore_stats(X)."""
+    mean, std = stats if stats is not None else zscore_stats(X)
     return (X - mean) / std
 
 def get_feature_keys(fingerprints: List[Dict]) -> List[str]:
@@ -0,0 +1,177 @@
+"""
+Fingerprint Store v0.1
+======================
+Path 1 (Observation & Cataloging Only)
+
+Columnar copy of the emitted fingerprints, kept next to index.csv
+(<output_dir>/v0.1/fingerprints/fingerprints.npz) so clustering and gallery
+runs load one file instead of parsing a JSON per day.
+
+The NPZ holds string columns (fingerprint_id, symbol, date_ny, content_hash,
+trajectory_png), feature_keys and an (N, 26) float64 feature matrix in
+feature_keys order; no pickled objects. Rows follow index.csv order
+(date_ny, symbol, then fingerprint_id). A sync reads index.csv rows and only
+parses the JSONs of fingerprints that are new or whose content_hash changed;
+rows no longer in the index are dropped. The file is rewritten atomically.
+"""
+
+import os
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .features import compute_feature_vector
+from .fingerprint import load_fingerprint_json
+
+STORE_VERSION = "fingerprint_store_v2"  # v2: feature vector follows spec 8.4 exactly
+STORE_FILENAME = "fingerprints.npz"
+STRING_COLUMNS = ("fingerprint_id", "symbol", "date_ny", "content_hash", "trajectory_png")
+
+
+def fingerprint_features(fingerprint: Dict) -> Dict[str, float]:
+    """Feature dict of a fingerprint: its "features" entry if present, else the spec 26-d vector."""
+    if "features" in fingerprint:
+        return {k: float(v) for k, v in fingerprint["features"].items()}
+    return compute_feature_vector(fingerprint)
+
+
+class FingerprintStore:
+    """
+    Columnar fingerprint table backed by one NPZ file.
+
+    Usage:
+        store = FingerprintStore(index_csv.parent / STORE_FILENAME)
+        store.load()
+        store.sync(index_rows, output_dir / "v0.1")
+        store.save()
+        X = store.features
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.columns: Dict[str, np.ndarray] = {name: np.array([], dtype=str) for name in STRING_COLUMNS}
+        self.feature_keys: List[str] = []
+        self.features = np.zeros((0, 0))
+
+    def load(self) -> bool:
+        """Load the NPZ; False (store left empty) if missing, stale-format or corrupt."""
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                if str(data["version"]) != STORE_VERSION:
+                    return False
+                columns = {name: data[name] for name in STRING_COLUMNS}
+                feature_keys = data["feature_keys"].tolist()
+                features = data["features"]
+        except (OSError, EOFError, KeyError, ValueError, zipfile.BadZipFile):
+            return False
+        self.columns = columns
+        self.feature_keys = feature_keys
+        self.features = features
+        return True
+
+    def sync(self, index_rows: Iterable[Dict], json_root: Path) -> Dict[str, int]:
+        """
+        Match the store to index.csv rows (fingerprint_id, content_hash, fingerprint_json_path).
+
+        Returns:
+            Dict with kept, added (new ids), updated (content_hash changed) and
+            removed (ids no longer in the index) row counts
+        """
+        existing = {
+            fp_id: (content_hash, row)
+            for row, (fp_id, content_hash) in enumerate(zip(self.columns["fingerprint_id"], self.columns["content_hash"]))
+        }
+        stats = {"kept": 0, "added": 0, "updated": 0, "removed": 0}
+        records = []
+        seen = set()
+        for index_row in index_rows:
+            fp_id = index_row["fingerprint_id"]
+            seen.add(fp_id)
+            known = existing.get(fp_id)
+            if known is not None and known[0] == index_row.get("content_hash", ""):
+                row = known[1]
+                records.append((
+                    {name: str(self.columns[name][row]) for name in STRING_COLUMNS},
+                    self.features[row],
+                ))
+                stats["kept"] += 1
+                continue
+            fingerprint = load_fingerprint_json(Path(json_root) / index_row["fingerprint_json_path"])
+            features = fingerprint_features(fingerprint)
+            if not self.feature_keys:
+                self.feature_keys = sorted(features)
+            if sorted(features) != self.feature_keys:
+                raise ValueError(f"Feature keys of {fp_id} differ from the store's {len(self.feature_keys)} keys")
+            records.append((
+                {
+                    "fingerprint_id": fp_id,
+                    "symbol": fingerprint["symbol"],
+                    "date_ny": fingerprint["date_ny"],
+                    "content_hash": fingerprint["content_hash"],
+                    "trajectory_png": fingerprint.get("source_artifacts", {}).get("trajectory_png", ""),
+                },
+                np.array([features[k] for k in self.feature_keys], dtype=float),
+            ))
+            stats["updated" if known is not None else "added"] += 1
+        stats["removed"] = sum(1 for fp_id in existing if fp_id not in seen)
+
+        records.sort(key=lambda r: (r[0]["date_ny"], r[0]["symbol"], r[0]["fingerprint_id"]))
+        self.columns = {name: np.array([r[0][name] for r in records], dtype=str) for name in STRING_COLUMNS}
+        self.features = np.array([r[1] for r in records], dtype=float).reshape(len(records), len(self.feature_keys))
+        return stats
+
+    def save(self) -> None:
+        """Write the NPZ atomically (temp file + replace)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                version=np.array(STORE_VERSION),
+                feature_keys=np.array(self.feature_keys, dtype=str),
+                features=self.features,
+                **self.columns,
+            )
+        os.replace(tmp_path, self.path)
+
+    def records(self) -> List[Dict]:
+        """
+        Per-row dicts in the shape the clustering/gallery code expects: symbol,
+        date_ny, fingerprint_id, content_hash, trajectory_plot_path and a
+        features dict of Python floats.
+        """
+        feature_rows = self.features.tolist()
+        return [
+            {
+                "fingerprint_id": fp_id,
+                "symbol": symbol,
+                "date_ny": date_ny,
+                "content_hash": content_hash,
+                "trajectory_plot_path": trajectory_png,
+                "features": dict(zip(self.feature_keys, values)),
+            }
+            for fp_id, symbol, date_ny, content_hash, trajectory_png, values in zip(
+                *(self.columns[name].tolist() for name in STRING_COLUMNS), feature_rows
+            )
+        ]
+
+    def __len__(self) -> int:
+        return len(self.columns["fingerprint_id"])
+
+
+def sync_fingerprint_store(index_rows: Iterable[Dict], json_root: Path, store_path: Path) -> Dict[str, int]:
+    """Load, sync against index rows and save the store at store_path (only if it changed)."""
+    store = FingerprintStore(store_path)
+    loaded = store.load()
+    stats = store.sync(index_rows, json_root)
+    if stats["added"] or stats["updated"] or stats["removed"] or not loaded:
+        store.save()
+    return stats
+
+
+def open_fingerprint_store(store_path: Path) -> Optional[FingerprintStore]:
+    """Loaded FingerprintStore, or None if the file is missing or unreadable."""
+    store = FingerprintStore(store_path)
+    return store if store.load() else None
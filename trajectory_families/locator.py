@@ -0,0 +1,160 @@
+"""
+Trajectory CSV Locator v0.1
+===========================
+Path 1 (Observation & Cataloging Only)
+
+Persistent (symbol, date_ny) -> trajectory.csv index over the state plane
+evidence runs (reports/path1/evidence/runs/<run_id>/outputs/state_plane_v0_2/).
+
+The index records, per run folder, the (symbol, date) read from the first
+trajectory row plus the run folder and trajectory.csv mtimes. A refresh is one
+directory scan: unchanged runs are reused, new or modified runs are re-read and
+removed runs are dropped. When several runs cover the same day, the run with
+the greatest folder name wins (the newest p1_<YYYYMMDD>_<seq> run).
+"""
+
+import csv
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+INDEX_VERSION = "trajectory_locator_v1"
+TRAJECTORY_REL_PATH = Path("outputs") / "state_plane_v0_2" / "trajectory.csv"
+DEFAULT_INDEX_DIR = Path(".cache") / "path1" / "trajectory_families" / "locator"
+
+
+def default_index_path(evidence_dir: Path, index_dir: Path = DEFAULT_INDEX_DIR) -> Path:
+    """Index file for an evidence directory (one file per resolved directory)."""
+    digest = hashlib.sha256(str(Path(evidence_dir).resolve()).encode("utf-8")).hexdigest()
+    return Path(index_dir) / f"{digest[:16]}.json"
+
+
+def read_trajectory_key(trajectory_path: Path) -> Optional[Tuple[str, str]]:
+    """
+    (symbol, YYYYMMDD) from the first data row's block_id (YYYYMMDD-X-SYMBOL).
+
+    Returns None if the file is unreadable or the first row has no usable
+    block_id.
+    """
+    try:
+        with open(trajectory_path, "r", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                parts = (row.get("block_id") or "").split("-")
+                if len(parts) >= 3:
+                    return parts[2], parts[0]
+                return None
+    except Exception:
+        return None
+    return None
+
+
+class TrajectoryIndex:
+    """
+    (symbol, date_ny) -> trajectory.csv lookup for one evidence directory.
+
+    Usage:
+        index = open_trajectory_index(evidence_dir, default_index_path(evidence_dir))
+        path = index.find("GBPUSD", "2026-01-16")
+    """
+
+    def __init__(self, evidence_dir: Path, index_path: Optional[Path] = None):
+        self.evidence_dir = Path(evidence_dir)
+        self.index_path = Path(index_path) if index_path is not None else None
+        self.runs: Dict[str, Dict] = {}
+        self._lookup: Dict[Tuple[str, str], str] = {}
+
+    def load(self) -> None:
+        """Load persisted run entries (ignored if missing, stale-format or corrupt)."""
+        if self.index_path is None or not self.index_path.exists():
+            return
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("version") == INDEX_VERSION and data.get("evidence_dir") == str(self.evidence_dir.resolve()):
+            self.runs = data.get("runs", {})
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Bring entries up to date with one scan of the evidence directory.
+
+        Returns:
+            Dict with scanned, reread and removed run counts
+        """
+        stats = {"scanned": 0, "reread": 0, "removed": 0}
+        current = {}
+        if self.evidence_dir.exists():
+            for run_dir in self.evidence_dir.iterdir():
+                if not run_dir.is_dir():
+                    continue
+                stats["scanned"] += 1
+                trajectory_path = run_dir / TRAJECTORY_REL_PATH
+                try:
+                    traj_mtime_ns = trajectory_path.stat().st_mtime_ns
+                except OSError:
+                    traj_mtime_ns = None
+                run_mtime_ns = run_dir.stat().st_mtime_ns
+
+                entry = self.runs.get(run_dir.name)
+                if entry and entry["run_mtime_ns"] == run_mtime_ns and entry["trajectory_mtime_ns"] == traj_mtime_ns:
+                    current[run_dir.name] = entry
+                    continue
+                stats["reread"] += 1
+                key = read_trajectory_key(trajectory_path) if traj_mtime_ns is not None else None
+                current[run_dir.name] = {
+                    "run_mtime_ns": run_mtime_ns,
+                    "trajectory_mtime_ns": traj_mtime_ns,
+                    "key": list(key) if key else None,
+                }
+        stats["removed"] = len(set(self.runs) - set(current))
+        self.runs = current
+        self._rebuild_lookup()
+        return stats
+
+    def _rebuild_lookup(self) -> None:
+        self._lookup = {}
+        for run_name in sorted(self.runs):  # later (greater) names overwrite
+            key = self.runs[run_name]["key"]
+            if key:
+                self._lookup[tuple(key)] = run_name
+
+    def save(self) -> bool:
+        """Persist entries atomically; False if there is no index path or the write fails."""
+        if self.index_path is None:
+            return False
+        payload = {
+            "version": INDEX_VERSION,
+            "evidence_dir": str(self.evidence_dir.resolve()),
+            "runs": {name: self.runs[name] for name in sorted(self.runs)},
+        }
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            return False
+        return True
+
+    def find(self, symbol: str, date_ny: str) -> Optional[Path]:
+        """trajectory.csv for symbol on date_ny (YYYY-MM-DD), or None."""
+        run_name = self._lookup.get((symbol, date_ny.replace("-", "")))
+        if run_name is None:
+            return None
+        return self.evidence_dir / run_name / TRAJECTORY_REL_PATH
+
+    def __len__(self) -> int:
+        return len(self._lookup)
+
+
+def open_trajectory_index(evidence_dir: Path, index_path: Optional[Path] = None) -> TrajectoryIndex:
+    """Load (if index_path is given), refresh and persist a TrajectoryIndex."""
+    index = TrajectoryIndex(evidence_dir, index_path)
+    index.load()
+    stats = index.refresh()
+    if stats["reread"] or stats["removed"] or (index_path is not None and not Path(index_path).exists()):
+        index.save()
+    return index